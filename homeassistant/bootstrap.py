@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import asyncio
+from collections.abc import Callable, Iterable
 import contextlib
 from datetime import datetime
 import logging
@@ -47,12 +48,14 @@ ERROR_LOG_FILENAME = "home-assistant.log"
 # hass.data key for logging information.
 DATA_LOGGING = "logging"
 
+# hass.data key for the integrations that bounded the setup time.
+DATA_SETUP_CRITICAL_PATH = "setup_critical_path"
+
 LOG_SLOW_STARTUP_INTERVAL = 60
 SLOW_STARTUP_CHECK_INTERVAL = 1
 SIGNAL_BOOTSTRAP_INTEGRATONS = "bootstrap_integrations"
 
-STAGE_1_TIMEOUT = 120
-STAGE_2_TIMEOUT = 300
+SETUP_TIMEOUT = 420
 WRAP_UP_TIMEOUT = 300
 COOLDOWN_TIME = 60
 
@@ -445,6 +448,143 @@ async def async_setup_multi_components(
         )
 
 
+def _get_setup_graph(
+    domains: set[str],
+    stage_1_domains: set[str],
+    integrations: dict[str, loader.Integration],
+) -> dict[str, set[str]]:
+    """Return the domains that have to be set up before each domain starts."""
+    graph = {}
+    for domain in domains:
+        if (integration := integrations.get(domain)) is None:
+            graph[domain] = set()
+            continue
+        wait_for = set(integration.dependencies)
+        if domain not in stage_1_domains:
+            wait_for.update(integration.after_dependencies)
+        graph[domain] = wait_for & domains
+    return graph
+
+
+async def _async_setup_component_timed(
+    hass: core.HomeAssistant,
+    domain: str,
+    config: dict[str, Any],
+    timeline: dict[str, tuple[float, float]],
+) -> bool:
+    """Set up a domain and record when its setup started and finished."""
+    started = monotonic()
+    try:
+        return await async_setup_component(hass, domain, config)
+    finally:
+        timeline[domain] = (started, monotonic())
+
+
+async def async_setup_graph(
+    hass: core.HomeAssistant,
+    graph: dict[str, set[str]],
+    config: dict[str, Any],
+    priority: set[str],
+    timeline: dict[str, tuple[float, float]],
+    priority_done: Callable[[set[str]], None] | None = None,
+) -> None:
+    """Set up each domain as soon as the domains it waits for are set up.
+
+    The graph maps each domain to the domains it waits for. Domains in
+    priority are started first when several become ready at once. Once all
+    priority domains are set up, priority_done is called with the domains
+    whose setup did not finish yet. Start and finish times are recorded in
+    the timeline. Log on failure.
+    """
+    waiting = {domain: set(wait_for) for domain, wait_for in graph.items()}
+    priority_pending = priority & graph.keys()
+    dependents: dict[str, list[str]] = {}
+    for domain, wait_for in graph.items():
+        for dependency in wait_for:
+            dependents.setdefault(dependency, []).append(domain)
+    running: dict[asyncio.Future, str] = {}
+
+    def start(domains: Iterable[str]) -> None:
+        for domain in sorted(
+            domains, key=lambda domain: (domain not in priority, domain)
+        ):
+            del waiting[domain]
+            future = hass.async_create_task(
+                _async_setup_component_timed(hass, domain, config, timeline)
+            )
+            running[future] = domain
+
+    def check_priority_done() -> None:
+        nonlocal priority_done
+        if priority_done is None or priority_pending:
+            return
+        pending = {domain for future, domain in running.items() if not future.done()}
+        priority_done(pending.union(waiting))
+        priority_done = None
+
+    check_priority_done()
+    start([domain for domain, wait_for in waiting.items() if not wait_for])
+
+    while waiting or running:
+        if not running:
+            # Only domains waiting on each other are left
+            _LOGGER.warning(
+                "Setting up integrations with circular after dependencies: %s",
+                ", ".join(sorted(waiting)),
+            )
+            start(list(waiting))
+            continue
+
+        done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+        ready = []
+        for future in done:
+            domain = running.pop(future)
+            priority_pending.discard(domain)
+            if (exception := future.exception()) is not None:
+                _LOGGER.error(
+                    "Error setting up integration %s - received exception",
+                    domain,
+                    exc_info=(type(exception), exception, exception.__traceback__),
+                )
+            for dependent in dependents.get(domain, ()):
+                if dependent not in waiting:
+                    continue
+                waiting[dependent].discard(domain)
+                if not waiting[dependent]:
+                    ready.append(dependent)
+        check_priority_done()
+        start(ready)
+
+
+def _critical_path(
+    graph: dict[str, set[str]], timeline: dict[str, tuple[float, float]]
+) -> list[dict[str, Any]]:
+    """Return the chain of setups that bounded the total setup time.
+
+    The chain ends with the setup that finished last and walks back through
+    the domain each setup waited on the longest.
+    """
+    origin = min(started for started, _ in timeline.values())
+    domain: str | None = max(timeline, key=lambda domain: timeline[domain][1])
+    path = []
+    while domain is not None:
+        started, finished = timeline[domain]
+        path.append(
+            {
+                "domain": domain,
+                "start": round(started - origin, 3),
+                "seconds": round(finished - started, 3),
+            }
+        )
+        domain = max(
+            (dep for dep in graph.get(domain, ()) if dep in timeline),
+            key=lambda dep: timeline[dep][1],
+            default=None,
+        )
+    path.reverse()
+    return path
+
+
 async def _async_set_up_integrations(
     hass: core.HomeAssistant, config: dict[str, Any]
 ) -> None:
@@ -507,7 +647,8 @@ async def _async_set_up_integrations(
         _LOGGER.debug("Setting up debuggers: %s", debuggers)
         await async_setup_multi_components(hass, debuggers, config)
 
-    # calculate what components to setup in what stage
+    # Stage 1 integrations are started first and do not wait for their
+    # after dependencies
     stage_1_domains = set()
 
     # Find all dependencies of any dependency of any stage 1 integration that
@@ -529,6 +670,11 @@ async def _async_set_up_integrations(
             deps_promotion.update(dep_itg.all_dependencies)
 
     stage_2_domains = domains_to_setup - logging_domains - debuggers - stage_1_domains
+    graph = _get_setup_graph(
+        domains_to_setup - logging_domains - debuggers,
+        stage_1_domains,
+        integration_cache,
+    )
 
     # Load the registries
     await asyncio.gather(
@@ -537,29 +683,33 @@ async def _async_set_up_integrations(
         area_registry.async_load(hass),
     )
 
-    # Start setup
-    if stage_1_domains:
-        _LOGGER.info("Setting up stage 1: %s", stage_1_domains)
-        try:
-            async with hass.timeout.async_timeout(
-                STAGE_1_TIMEOUT, cool_down=COOLDOWN_TIME
-            ):
-                await async_setup_multi_components(hass, stage_1_domains, config)
-        except asyncio.TimeoutError:
-            _LOGGER.warning("Setup timed out for stage 1 - moving forward")
+    @core.callback
+    def async_stage_1_done(pending: set[str]) -> None:
+        """Enable after dependencies once stage 1 is set up.
 
-    # Enables after dependencies
-    async_set_domains_to_be_loaded(hass, stage_2_domains)
+        Stage 1 integrations do not wait for their after dependencies, the
+        graph orders the stage 2 integrations which were started before.
+        """
+        async_set_domains_to_be_loaded(
+            hass, (stage_2_domains & pending) - hass.config.components
+        )
 
-    if stage_2_domains:
-        _LOGGER.info("Setting up stage 2: %s", stage_2_domains)
+    # Start setup
+    timeline: dict[str, tuple[float, float]] = {}
+    if graph:
+        _LOGGER.info("Setting up integrations: %s", set(graph))
+        setup_task = hass.async_create_task(
+            async_setup_graph(
+                hass, graph, config, stage_1_domains, timeline, async_stage_1_done
+            )
+        )
         try:
             async with hass.timeout.async_timeout(
-                STAGE_2_TIMEOUT, cool_down=COOLDOWN_TIME
+                SETUP_TIMEOUT, cool_down=COOLDOWN_TIME
             ):
-                await async_setup_multi_components(hass, stage_2_domains, config)
+                await asyncio.shield(setup_task)
         except asyncio.TimeoutError:
-            _LOGGER.warning("Setup timed out for stage 2 - moving forward")
+            _LOGGER.warning("Setup timed out for integrations - moving forward")
 
     # Wrap up startup
     _LOGGER.debug("Waiting for startup to wrap up")
@@ -581,3 +731,14 @@ async def _async_set_up_integrations(
             )
         },
     )
+
+    if timeline:
+        critical_path = hass.data[DATA_SETUP_CRITICAL_PATH] = _critical_path(
+            graph, timeline
+        )
+        _LOGGER.info(
+            "Integration setup critical path: %s",
+            " -> ".join(
+                f"{step['domain']} ({step['seconds']:.2f}s)" for step in critical_path
+            ),
+        )
@@ -1,14 +1,16 @@
 """Provide pre-made queries on top of the recorder component."""
 from __future__ import annotations
 
+import asyncio
 from collections.abc import Iterable
 from datetime import datetime as dt, timedelta
 from http import HTTPStatus
 import logging
 import time
-from typing import cast
+from typing import NamedTuple, cast
 
 from aiohttp import web
+from aiohttp.hdrs import CONTENT_TYPE
 from sqlalchemy import not_, or_
 import voluptuous as vol
 
@@ -20,7 +22,13 @@ from homeassistant.components.recorder.statistics import (
     statistics_during_period,
 )
 from homeassistant.components.recorder.util import session_scope
-from homeassistant.const import CONF_DOMAINS, CONF_ENTITIES, CONF_EXCLUDE, CONF_INCLUDE
+from homeassistant.const import (
+    CONF_DOMAINS,
+    CONF_ENTITIES,
+    CONF_EXCLUDE,
+    CONF_INCLUDE,
+    CONTENT_TYPE_JSON,
+)
 from homeassistant.core import HomeAssistant
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.deprecation import deprecated_class, deprecated_function
@@ -28,6 +36,7 @@ from homeassistant.helpers.entityfilter import (
     CONF_ENTITY_GLOBS,
     INCLUDE_EXCLUDE_BASE_FILTER_SCHEMA,
 )
+from homeassistant.helpers.json import json_dumps
 import homeassistant.util.dt as dt_util
 
 # mypy: allow-untyped-defs, no-check-untyped-defs
@@ -37,6 +46,9 @@ _LOGGER = logging.getLogger(__name__)
 DOMAIN = "history"
 CONF_ORDER = "use_include_order"
 
+# Bytes of json collected before they are written to a streamed response
+STREAM_CHUNK_SIZE = 65536
+
 GLOB_TO_SQL_CHARS = {
     42: "%",  # *
     46: "_",  # .
@@ -97,6 +109,7 @@ async def async_setup(hass, config):
     use_include_order = conf.get(CONF_ORDER)
 
     hass.http.register_view(HistoryPeriodView(filters, use_include_order))
+    hass.http.register_view(HistoryPeriodStreamView(filters, use_include_order))
     hass.components.frontend.async_register_built_in_panel(
         "history", "history", "hass:chart-box"
     )
@@ -175,6 +188,18 @@ async def ws_get_list_statistic_ids(
     connection.send_result(msg["id"], statistic_ids)
 
 
+class _PeriodQuery(NamedTuple):
+    """The parsed parameters of a history period request."""
+
+    hass: HomeAssistant
+    start_time: dt
+    end_time: dt
+    entity_ids: list[str] | None
+    include_start_time_state: bool
+    significant_changes_only: bool
+    minimal_response: bool
+
+
 class HistoryPeriodView(HomeAssistantView):
     """Handle history period requests."""
 
@@ -191,6 +216,32 @@ class HistoryPeriodView(HomeAssistantView):
         self, request: web.Request, datetime: str | None = None
     ) -> web.Response:
         """Return history over a period of time."""
+        query = self._parse_period_query(request, datetime)
+        if isinstance(query, web.Response):
+            return query
+
+        return cast(
+            web.Response,
+            await query.hass.async_add_executor_job(
+                self._sorted_significant_states_json,
+                query.hass,
+                query.start_time,
+                query.end_time,
+                query.entity_ids,
+                query.include_start_time_state,
+                query.significant_changes_only,
+                query.minimal_response,
+            ),
+        )
+
+    def _parse_period_query(
+        self, request: web.Request, datetime: str | None
+    ) -> _PeriodQuery | web.Response:
+        """Parse the period and query parameters of a history request.
+
+        Returns the response to send instead when the parameters are invalid
+        or no states can match them.
+        """
         datetime_ = None
         if datetime and (datetime_ := dt_util.parse_datetime(datetime)) is None:
             return self.json_message("Invalid datetime", HTTPStatus.BAD_REQUEST)
@@ -233,18 +284,14 @@ class HistoryPeriodView(HomeAssistantView):
         ):
             return self.json([])
 
-        return cast(
-            web.Response,
-            await hass.async_add_executor_job(
-                self._sorted_significant_states_json,
-                hass,
-                start_time,
-                end_time,
-                entity_ids,
-                include_start_time_state,
-                significant_changes_only,
-                minimal_response,
-            ),
+        return _PeriodQuery(
+            hass,
+            start_time,
+            end_time,
+            entity_ids,
+            include_start_time_state,
+            significant_changes_only,
+            minimal_response,
         )
 
     def _sorted_significant_states_json(
@@ -294,6 +341,120 @@ class HistoryPeriodView(HomeAssistantView):
         return self.json(result)
 
 
+class HistoryPeriodStreamView(HistoryPeriodView):
+    """Stream history period requests as chunked JSON.
+
+    Takes the same parameters as HistoryPeriodView, entities are ordered by
+    entity_id. Numeric states can be downsampled with either max_points per
+    entity or a resolution in seconds.
+    """
+
+    url = "/api/history/stream"
+    name = "api:history:stream-period"
+    extra_urls = ["/api/history/stream/{datetime}"]
+
+    async def get(
+        self, request: web.Request, datetime: str | None = None
+    ) -> web.StreamResponse:
+        """Stream history over a period of time."""
+        query = self._parse_period_query(request, datetime)
+        if isinstance(query, web.Response):
+            return query
+
+        bucket_width = None
+        try:
+            if resolution := request.query.get("resolution"):
+                bucket_width = timedelta(seconds=float(resolution))
+            elif max_points := request.query.get("max_points"):
+                bucket_width = (query.end_time - query.start_time) / int(max_points)
+        except (ValueError, ZeroDivisionError):
+            return self.json_message(
+                "Invalid resolution or max_points", HTTPStatus.BAD_REQUEST
+            )
+        if bucket_width is not None and bucket_width <= timedelta(0):
+            return self.json_message(
+                "Invalid resolution or max_points", HTTPStatus.BAD_REQUEST
+            )
+
+        response = web.StreamResponse(headers={CONTENT_TYPE: CONTENT_TYPE_JSON})
+        response.enable_chunked_encoding()
+        response.enable_compression()
+        await response.prepare(request)
+        await query.hass.async_add_executor_job(
+            self._stream_significant_states_json,
+            query.hass,
+            response,
+            query.start_time,
+            query.end_time,
+            query.entity_ids,
+            query.include_start_time_state,
+            query.significant_changes_only,
+            query.minimal_response,
+            bucket_width,
+        )
+        await response.write_eof()
+        return response
+
+    def _stream_significant_states_json(
+        self,
+        hass,
+        response,
+        start_time,
+        end_time,
+        entity_ids,
+        include_start_time_state,
+        significant_changes_only,
+        minimal_response,
+        bucket_width,
+    ):
+        """Fetch significant states from the database and write them as json."""
+        timer_start = time.perf_counter()
+        buffer: list[str] = []
+        buffered = count = 0
+
+        def flush():
+            """Write the buffered json and wait until the transport took it."""
+            nonlocal buffered
+            asyncio.run_coroutine_threadsafe(
+                response.write("".join(buffer).encode("UTF-8")), hass.loop
+            ).result()
+            buffer.clear()
+            buffered = 0
+
+        encode = json_dumps
+        with session_scope(hass=hass) as session:
+            buffer.append("[")
+            for entity_index, (_, states) in enumerate(
+                history.stream_significant_states_with_session(
+                    hass,
+                    session,
+                    start_time,
+                    end_time,
+                    entity_ids,
+                    self.filters,
+                    include_start_time_state,
+                    significant_changes_only,
+                    minimal_response,
+                    bucket_width,
+                )
+            ):
+                buffer.append(",[" if entity_index else "[")
+                for state_index, state in enumerate(states):
+                    data = encode(state)
+                    buffer.append("," + data if state_index else data)
+                    buffered += len(data)
+                    count += 1
+                    if buffered >= STREAM_CHUNK_SIZE:
+                        flush()
+                buffer.append("]")
+            buffer.append("]")
+            flush()
+
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            elapsed = time.perf_counter() - timer_start
+            _LOGGER.debug("Streamed %d states in %fs", count, elapsed)
+
+
 def sqlalchemy_filter_from_include_exclude_conf(conf):
     """Build a sql filter from config."""
     filters = Filters()
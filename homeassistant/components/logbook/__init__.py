@@ -1,21 +1,30 @@
 """Event parser and human readable log generator."""
+from __future__ import annotations
+
+import asyncio
 from contextlib import suppress
-from datetime import timedelta
+from datetime import datetime as dt, timedelta
 from http import HTTPStatus
 from itertools import groupby
-import json
+import logging
 import re
+import threading
+from typing import NamedTuple
 
+from lru import LRU  # pylint: disable=no-name-in-module
 import sqlalchemy
 from sqlalchemy.orm import aliased
 from sqlalchemy.sql.expression import literal
 import voluptuous as vol
 
+from homeassistant.components import websocket_api
 from homeassistant.components.automation import EVENT_AUTOMATION_TRIGGERED
 from homeassistant.components.history import sqlalchemy_filter_from_include_exclude_conf
 from homeassistant.components.http import HomeAssistantView
+from homeassistant.components.recorder.const import DATA_INSTANCE
 from homeassistant.components.recorder.models import (
     Events,
+    StateAttributes,
     States,
     process_timestamp_to_utc_isoformat,
 )
@@ -28,6 +37,7 @@ from homeassistant.const import (
     ATTR_ICON,
     ATTR_NAME,
     ATTR_SERVICE,
+    ATTR_UNIT_OF_MEASUREMENT,
     EVENT_CALL_SERVICE,
     EVENT_HOMEASSISTANT_START,
     EVENT_HOMEASSISTANT_STOP,
@@ -42,11 +52,16 @@ from homeassistant.helpers.entityfilter import (
     convert_include_exclude_filter,
     generate_filter,
 )
+from homeassistant.helpers.event import async_track_point_in_utc_time
 from homeassistant.helpers.integration_platform import (
     async_process_integration_platforms,
 )
+from homeassistant.helpers.json import json_dumps
 from homeassistant.loader import bind_hass
 import homeassistant.util.dt as dt_util
+from homeassistant.util.json import json_loads
+
+_LOGGER = logging.getLogger(__name__)
 
 ENTITY_ID_JSON_TEMPLATE = '"entity_id":"{}"'
 ENTITY_ID_JSON_EXTRACT = re.compile('"entity_id": ?"([^"]+)"')
@@ -58,6 +73,16 @@ CONTINUOUS_DOMAINS = ["proximity", "sensor"]
 
 DOMAIN = "logbook"
 
+LOGBOOK_FILTERS = "logbook_filters"
+LOGBOOK_ENTITIES_FILTER = "logbook_entities_filter"
+
+# Number of historical entries sent per logbook/event_stream message
+STREAM_CHUNK_SIZE = 250
+# Number of events kept to look up the context of live entries
+MAX_LIVE_CONTEXT_LOOKUP = 2048
+# Seconds to wait for the recorder to commit the events fired before streaming
+RECORDER_COMMIT_TIMEOUT = 10
+
 GROUP_BY_MINUTES = 15
 
 EMPTY_JSON_OBJECT = "{}"
@@ -158,7 +183,11 @@ async def async_setup(hass, config):
         filters = None
         entities_filter = None
 
+    hass.data[LOGBOOK_FILTERS] = filters
+    hass.data[LOGBOOK_ENTITIES_FILTER] = entities_filter
+
     hass.http.register_view(LogbookView(conf, filters, entities_filter))
+    websocket_api.async_register_command(hass, ws_event_stream)
 
     hass.services.async_register(DOMAIN, "log", log_message, schema=LOG_MESSAGE_SCHEMA)
 
@@ -249,6 +278,294 @@ class LogbookView(HomeAssistantView):
         return await hass.async_add_executor_job(json_events)
 
 
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "logbook/event_stream",
+        vol.Required("start_time"): str,
+        vol.Optional("end_time"): str,
+        vol.Optional("entity_ids"): cv.entity_ids,
+        vol.Optional("entity_matches_only", default=False): bool,
+        vol.Optional("context_id"): str,
+    }
+)
+@websocket_api.async_response
+async def ws_event_stream(hass, connection, msg):
+    """Stream the logbook entries since start_time.
+
+    The historical entries are sent in chunks as they are read from the
+    database, the last historical message has partial set to False. Unless
+    end_time is in the past, the live entries matching the same filters are
+    sent as they are fired until end_time or until unsubscribed.
+    """
+    msg_id = msg["id"]
+    if (start_time := dt_util.parse_datetime(msg["start_time"])) is None:
+        connection.send_error(msg_id, "invalid_start_time", "Invalid start_time")
+        return
+    end_time = None
+    if "end_time" in msg:
+        if (end_time := dt_util.parse_datetime(msg["end_time"])) is None:
+            connection.send_error(msg_id, "invalid_end_time", "Invalid end_time")
+            return
+    entity_ids = msg.get("entity_ids")
+    entity_matches_only = msg["entity_matches_only"]
+    context_id = msg.get("context_id")
+    if entity_ids and context_id:
+        connection.send_error(
+            msg_id, "invalid_request", "Can't combine entity_ids with context_id"
+        )
+        return
+
+    start_time = dt_util.as_utc(start_time)
+    utc_now = dt_util.utcnow()
+    live = end_time is None or dt_util.as_utc(end_time) > utc_now
+    filters = hass.data[LOGBOOK_FILTERS]
+    entities_filter = hass.data[LOGBOOK_ENTITIES_FILTER]
+    stop_streaming = threading.Event()
+    unsubs = []
+    # Live events are buffered until the historical entries have been sent
+    live_buffer = []
+
+    @callback
+    def _async_unsubscribe():
+        stop_streaming.set()
+        while unsubs:
+            unsubs.pop()()
+
+    @callback
+    def _async_end_of_stream(_now):
+        _async_unsubscribe()
+
+    connection.subscriptions[msg_id] = _async_unsubscribe
+
+    if live:
+        live_processor = LiveEventProcessor(
+            hass, entity_ids, entities_filter, entity_matches_only, context_id
+        )
+
+        @callback
+        def _async_forward_event(event):
+            if live_buffer is not None:
+                live_buffer.append(event)
+            elif entries := live_processor.humanify(event):
+                connection.send_message(
+                    websocket_api.event_message(msg_id, {"events": entries})
+                )
+
+        for event_type in (*ALL_EVENT_TYPES, *hass.data[DOMAIN]):
+            unsubs.append(hass.bus.async_listen(event_type, _async_forward_event))
+        if end_time is not None:
+            unsubs.append(
+                async_track_point_in_utc_time(
+                    hass, _async_end_of_stream, dt_util.as_utc(end_time)
+                )
+            )
+        end_time = utc_now
+
+    connection.send_result(msg_id)
+
+    # Make sure the events fired before subscribing are in the database
+    instance = hass.data[DATA_INSTANCE]
+    if instance.is_alive():
+        try:
+            await asyncio.wait_for(
+                instance.async_block_till_done(), timeout=RECORDER_COMMIT_TIMEOUT
+            )
+        except asyncio.TimeoutError:
+            _LOGGER.warning(
+                "The recorder did not commit within %s seconds, "
+                "the most recent logbook entries may be missing",
+                RECORDER_COMMIT_TIMEOUT,
+            )
+    last_chunk = await hass.async_add_executor_job(
+        _stream_events,
+        hass,
+        connection,
+        msg_id,
+        stop_streaming,
+        start_time,
+        end_time,
+        entity_ids,
+        filters,
+        entities_filter,
+        entity_matches_only,
+        context_id,
+    )
+    if stop_streaming.is_set():
+        return
+
+    if live:
+        last_chunk.extend(
+            entry for event in live_buffer for entry in live_processor.humanify(event)
+        )
+    live_buffer = None
+    connection.send_message(
+        websocket_api.event_message(msg_id, {"events": last_chunk, "partial": False})
+    )
+
+
+def _stream_events(
+    hass,
+    connection,
+    msg_id,
+    stop_streaming,
+    start_day,
+    end_day,
+    entity_ids,
+    filters,
+    entities_filter,
+    entity_matches_only,
+    context_id,
+):
+    """Send the historical logbook entries in chunks.
+
+    The messages are encoded here instead of in the event loop. Returns the
+    last, incomplete, chunk of entries.
+    """
+    entries = _iter_events(
+        hass,
+        start_day,
+        end_day,
+        entity_ids,
+        filters,
+        entities_filter,
+        entity_matches_only,
+        context_id,
+    )
+    chunk = []
+    try:
+        for entry in entries:
+            chunk.append(entry)
+            if len(chunk) < STREAM_CHUNK_SIZE:
+                continue
+            if stop_streaming.is_set():
+                break
+            message = websocket_api.messages.message_to_json(
+                websocket_api.event_message(msg_id, {"events": chunk, "partial": True})
+            )
+            hass.loop.call_soon_threadsafe(connection.send_message, message)
+            chunk = []
+    finally:
+        entries.close()
+    return chunk
+
+
+class EventAsRow(NamedTuple):
+    """A live event in the shape of a logbook database row."""
+
+    event_type: str
+    event_data: str
+    time_fired: dt
+    context_id: str
+    context_user_id: str | None
+    context_parent_id: str | None
+    state: str | None = None
+    entity_id: str | None = None
+    domain: str | None = None
+    attributes: str | None = None
+    shared_attrs: str | None = None
+
+
+class LiveEventProcessor:
+    """Humanify live events with the filters of the logbook queries."""
+
+    def __init__(
+        self, hass, entity_ids, entities_filter, entity_matches_only, context_id
+    ):
+        """Init the processor."""
+        self._hass = hass
+        self._recorder = hass.data[DATA_INSTANCE]
+        self._entity_ids = entity_ids
+        if entity_ids is not None:
+            entities_filter = generate_filter([], entity_ids, [], [])
+        self._entities_filter = entities_filter
+        self._entity_matches_only = entity_matches_only
+        self._context_id = context_id
+        self._entity_attr_cache = EntityAttributeCache(hass)
+        self._context_lookup = LRU(MAX_LIVE_CONTEXT_LOOKUP)
+
+    def humanify(self, event):
+        """Return the logbook entries of an event."""
+        if event.event_type in self._recorder.exclude_t:
+            return []
+        if self._context_id is not None and event.context.id != self._context_id:
+            return []
+
+        if event.event_type == EVENT_STATE_CHANGED:
+            if (row := self._state_changed_row(event)) is None:
+                return []
+        else:
+            event_data = json_dumps(event.data)
+            if (
+                self._entity_ids is not None
+                and self._entity_matches_only
+                and not any(
+                    ENTITY_ID_JSON_TEMPLATE.format(entity_id) in event_data
+                    for entity_id in self._entity_ids
+                )
+            ):
+                return []
+            row = EventAsRow(
+                event.event_type,
+                event_data,
+                event.time_fired,
+                event.context.id,
+                event.context.user_id,
+                event.context.parent_id,
+            )
+
+        lazy_event = LazyEventPartialState(row)
+        if lazy_event.context_id not in self._context_lookup:
+            self._context_lookup[lazy_event.context_id] = lazy_event
+        if event.event_type == EVENT_CALL_SERVICE or (
+            event.event_type != EVENT_STATE_CHANGED
+            and not _keep_event(self._hass, lazy_event, self._entities_filter)
+        ):
+            return []
+        return list(
+            humanify(
+                self._hass,
+                (lazy_event,),
+                self._entity_attr_cache,
+                self._context_lookup,
+            )
+        )
+
+    def _state_changed_row(self, event):
+        """Return a row for a state change the logbook shows, or None."""
+        old_state = event.data.get("old_state")
+        new_state = event.data.get("new_state")
+        # Same as the filters of the database queries: skip added and removed
+        # entities, attribute changes and continuous sensors
+        if old_state is None or new_state is None or old_state.state == new_state.state:
+            return None
+        entity_id = new_state.entity_id
+        if (
+            new_state.domain in CONTINUOUS_DOMAINS
+            and ATTR_UNIT_OF_MEASUREMENT in new_state.attributes
+        ):
+            return None
+        if not self._recorder.entity_filter(entity_id):
+            return None
+        if self._entity_ids is not None:
+            if entity_id not in self._entity_ids:
+                return None
+        elif self._entities_filter is not None and not self._entities_filter(entity_id):
+            return None
+        return EventAsRow(
+            EVENT_STATE_CHANGED,
+            EMPTY_JSON_OBJECT,
+            event.time_fired,
+            event.context.id,
+            event.context.user_id,
+            event.context.parent_id,
+            new_state.state,
+            entity_id,
+            new_state.domain,
+            None,
+            json_dumps(new_state.attributes),
+        )
+
+
 def humanify(hass, events, entity_attr_cache, context_lookup):
     """Generate a converted list of events into Entry objects.
 
@@ -413,6 +730,34 @@ def _get_events(
     context_id=None,
 ):
     """Get events for a period of time."""
+    return list(
+        _iter_events(
+            hass,
+            start_day,
+            end_day,
+            entity_ids,
+            filters,
+            entities_filter,
+            entity_matches_only,
+            context_id,
+        )
+    )
+
+
+def _iter_events(
+    hass,
+    start_day,
+    end_day,
+    entity_ids=None,
+    filters=None,
+    entities_filter=None,
+    entity_matches_only=False,
+    context_id=None,
+):
+    """Yield the logbook entries for a period of time as they are humanified.
+
+    The database session stays open until the generator is exhausted or closed.
+    """
     assert not (
         entity_ids and context_id
     ), "can't pass in both entity_ids and context_id"
@@ -473,8 +818,8 @@ def _get_events(
 
         query = query.order_by(Events.time_fired)
 
-        return list(
-            humanify(hass, yield_events(query), entity_attr_cache, context_lookup)
+        yield from humanify(
+            hass, yield_events(query), entity_attr_cache, context_lookup
         )
 
 
@@ -485,6 +830,7 @@ def _generate_events_query(session):
         States.entity_id,
         States.domain,
         States.attributes,
+        StateAttributes.shared_attrs,
     )
 
 
@@ -495,6 +841,7 @@ def _generate_events_query_without_states(session):
         literal(value=None, type_=sqlalchemy.String).label("entity_id"),
         literal(value=None, type_=sqlalchemy.String).label("domain"),
         literal(value=None, type_=sqlalchemy.Text).label("attributes"),
+        literal(value=None, type_=sqlalchemy.Text).label("shared_attrs"),
     )
 
 
@@ -503,6 +850,9 @@ def _generate_states_query(session, start_day, end_day, old_state, entity_ids):
         _generate_events_query(session)
         .outerjoin(Events, (States.event_id == Events.event_id))
         .outerjoin(old_state, (States.old_state_id == old_state.state_id))
+        .outerjoin(
+            StateAttributes, (States.attributes_id == StateAttributes.attributes_id)
+        )
         .filter(_missing_state_matcher(old_state))
         .filter(_continuous_entity_matcher())
         .filter((States.last_updated > start_day) & (States.last_updated < end_day))
@@ -517,6 +867,9 @@ def _apply_events_types_and_states_filter(hass, query, old_state):
     events_query = (
         query.outerjoin(States, (Events.event_id == States.event_id))
         .outerjoin(old_state, (States.old_state_id == old_state.state_id))
+        .outerjoin(
+            StateAttributes, (States.attributes_id == StateAttributes.attributes_id)
+        )
         .filter(
             (Events.event_type != EVENT_STATE_CHANGED)
             | _missing_state_matcher(old_state)
@@ -544,9 +897,15 @@ def _continuous_entity_matcher():
     # Prefilter out continuous domains that have
     # ATTR_UNIT_OF_MEASUREMENT as its much faster in sql.
     #
+    # Attributes are either in the shared state_attributes table or, for rows
+    # written before schema version 25, inline in the states table.
     return sqlalchemy.or_(
         sqlalchemy.not_(States.domain.in_(CONTINUOUS_DOMAINS)),
-        sqlalchemy.not_(States.attributes.contains(UNIT_OF_MEASUREMENT_JSON)),
+        sqlalchemy.not_(
+            sqlalchemy.func.coalesce(
+                StateAttributes.shared_attrs, States.attributes, ""
+            ).contains(UNIT_OF_MEASUREMENT_JSON)
+        ),
     )
 
 
@@ -670,6 +1029,7 @@ class LazyEventPartialState:
         "_event_data",
         "_time_fired_isoformat",
         "_attributes",
+        "_attributes_json",
         "event_type",
         "entity_id",
         "state",
@@ -686,6 +1046,7 @@ class LazyEventPartialState:
         self._event_data = None
         self._time_fired_isoformat = None
         self._attributes = None
+        self._attributes_json = self._row.shared_attrs or self._row.attributes
         self.event_type = self._row.event_type
         self.entity_id = self._row.entity_id
         self.state = self._row.state
@@ -701,7 +1062,7 @@ class LazyEventPartialState:
         if self._attributes:
             return self._attributes.get(ATTR_ICON)
 
-        result = ICON_JSON_EXTRACT.search(self._row.attributes)
+        result = ICON_JSON_EXTRACT.search(self._attributes_json)
         return result and result.group(1)
 
     @property
@@ -727,12 +1088,12 @@ class LazyEventPartialState:
         """State attributes."""
         if not self._attributes:
             if (
-                self._row.attributes is None
-                or self._row.attributes == EMPTY_JSON_OBJECT
+                self._attributes_json is None
+                or self._attributes_json == EMPTY_JSON_OBJECT
             ):
                 self._attributes = {}
             else:
-                self._attributes = json.loads(self._row.attributes)
+                self._attributes = json_loads(self._attributes_json)
         return self._attributes
 
     @property
@@ -742,7 +1103,7 @@ class LazyEventPartialState:
             if self._row.event_data == EMPTY_JSON_OBJECT:
                 self._event_data = {}
             else:
-                self._event_data = json.loads(self._row.event_data)
+                self._event_data = json_loads(self._row.event_data)
         return self._event_data
 
     @property
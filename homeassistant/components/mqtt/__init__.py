@@ -3,14 +3,16 @@ from __future__ import annotations
 
 from ast import literal_eval
 import asyncio
+from collections import deque
 from dataclasses import dataclass
 import datetime as dt
-from functools import lru_cache, partial, wraps
+from functools import partial, wraps
 import inspect
 from itertools import groupby
 import logging
 from operator import attrgetter
 import ssl
+import threading
 import time
 from typing import Any, Awaitable, Callable, Union, cast
 import uuid
@@ -90,6 +92,7 @@ from .models import (
     ReceiveMessage,
     ReceivePayloadType,
 )
+from .topic_trie import TopicTrie
 from .util import _VALID_QOS_SCHEMA, valid_publish_topic, valid_subscribe_topic
 
 _LOGGER = logging.getLogger(__name__)
@@ -126,6 +129,11 @@ CONNECTION_FAILED_RECOVERABLE = "connection_failed_recoverable"
 DISCOVERY_COOLDOWN = 2
 TIMEOUT_ACK = 10
 
+# Maximum number of received messages dispatched in one event loop iteration
+MAX_MESSAGE_BATCH = 500
+# Window over which the received messages per second are computed
+MESSAGE_RATE_WINDOW = 10
+
 PLATFORMS = [
     "alarm_control_panel",
     "binary_sensor",
@@ -639,12 +647,59 @@ class Subscription:
     """Class to hold data about an active subscription."""
 
     topic: str = attr.ib()
-    matcher: Any = attr.ib()
     job: HassJob = attr.ib()
     qos: int = attr.ib(default=0)
     encoding: str | None = attr.ib(default="utf-8")
 
 
+@attr.s(slots=True)
+class MessageIngestMetrics:
+    """Statistics about the batches of received messages."""
+
+    messages: int = attr.ib(default=0)
+    batches: int = attr.ib(default=0)
+    last_batch_size: int = attr.ib(default=0)
+    max_batch_size: int = attr.ib(default=0)
+    last_dispatch_latency: float = attr.ib(default=0.0)
+    max_dispatch_latency: float = attr.ib(default=0.0)
+    messages_per_second: float = attr.ib(default=0.0)
+    _window_start: float | None = attr.ib(default=None)
+    _window_messages: int = attr.ib(default=0)
+
+    def record_batch(self, batch_size: int, latency: float, now: float) -> None:
+        """Record a dispatched batch.
+
+        The latency is the time the oldest message of the batch waited between
+        being received by the network thread and being dispatched.
+        """
+        self.messages += batch_size
+        self.batches += 1
+        self.last_batch_size = batch_size
+        self.max_batch_size = max(self.max_batch_size, batch_size)
+        self.last_dispatch_latency = latency
+        self.max_dispatch_latency = max(self.max_dispatch_latency, latency)
+
+        if self._window_start is None:
+            self._window_start = now
+        self._window_messages += batch_size
+        if (elapsed := now - self._window_start) >= MESSAGE_RATE_WINDOW:
+            self.messages_per_second = self._window_messages / elapsed
+            self._window_start = now
+            self._window_messages = 0
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the metrics as a dictionary."""
+        return {
+            "messages": self.messages,
+            "batches": self.batches,
+            "messages_per_second": round(self.messages_per_second, 1),
+            "last_batch_size": self.last_batch_size,
+            "max_batch_size": self.max_batch_size,
+            "last_dispatch_latency": round(self.last_dispatch_latency, 6),
+            "max_dispatch_latency": round(self.max_dispatch_latency, 6),
+        }
+
+
 class MQTT:
     """Home Assistant MQTT client."""
 
@@ -663,6 +718,7 @@ class MQTT:
         self.config_entry = config_entry
         self.conf = conf
         self.subscriptions: list[Subscription] = []
+        self._subscription_trie: TopicTrie[Subscription] = TopicTrie()
         self.connected = False
         self._ha_started = asyncio.Event()
         self._last_subscribe = time.time()
@@ -671,6 +727,12 @@ class MQTT:
 
         self._pending_operations: dict[str, asyncio.Event] = {}
 
+        # Messages received by the paho network thread waiting to be dispatched
+        self._pending_messages: deque[tuple[Any, float]] = deque()
+        self._pending_messages_lock = threading.Lock()
+        self._drain_scheduled = False
+        self.ingest_metrics = MessageIngestMetrics()
+
         if self.hass.state == CoreState.running:
             self._ha_started.set()
         else:
@@ -834,11 +896,9 @@ class MQTT:
         if not isinstance(topic, str):
             raise HomeAssistantError("Topic needs to be a string!")
 
-        subscription = Subscription(
-            topic, _matcher_for_topic(topic), HassJob(msg_callback), qos, encoding
-        )
+        subscription = Subscription(topic, HassJob(msg_callback), qos, encoding)
         self.subscriptions.append(subscription)
-        self._matching_subscriptions.cache_clear()
+        self._subscription_trie.add(topic, subscription)
 
         # Only subscribe if currently connected.
         if self.connected:
@@ -848,12 +908,13 @@ class MQTT:
         @callback
         def async_remove() -> None:
             """Remove subscription."""
-            if subscription not in self.subscriptions:
-                raise HomeAssistantError("Can't remove subscription twice")
+            try:
+                remaining = self._subscription_trie.remove(topic, subscription)
+            except ValueError as err:
+                raise HomeAssistantError("Can't remove subscription twice") from err
             self.subscriptions.remove(subscription)
-            self._matching_subscriptions.cache_clear()
 
-            if any(other.topic == topic for other in self.subscriptions):
+            if remaining:
                 # Other subscriptions on topic remaining - don't unsubscribe.
                 return
 
@@ -941,36 +1002,71 @@ class MQTT:
             )
 
     def _mqtt_on_message(self, _mqttc, _userdata, msg) -> None:
-        """Message received callback."""
-        self.hass.add_job(self._mqtt_handle_message, msg)
+        """Message received callback.
+
+        Messages are buffered and handed to the event loop in batches, so a
+        flood of messages wakes up the event loop once instead of per message.
+        """
+        self._pending_messages.append((msg, time.monotonic()))
+        with self._pending_messages_lock:
+            if self._drain_scheduled:
+                return
+            self._drain_scheduled = True
+        self.hass.loop.call_soon_threadsafe(self._async_drain_messages)
+
+    @callback
+    def _async_drain_messages(self) -> None:
+        """Dispatch a batch of buffered messages.
 
-    @lru_cache(2048)
-    def _matching_subscriptions(self, topic):
-        subscriptions = []
-        for subscription in self.subscriptions:
-            if subscription.matcher(topic):
-                subscriptions.append(subscription)
-        return subscriptions
+        At most MAX_MESSAGE_BATCH messages are dispatched per event loop
+        iteration so floods of retained messages don't stall the event loop.
+        """
+        with self._pending_messages_lock:
+            self._drain_scheduled = False
+
+        pending = self._pending_messages
+        if not (batch_size := min(len(pending), MAX_MESSAGE_BATCH)):
+            return
+
+        now = time.monotonic()
+        self.ingest_metrics.record_batch(batch_size, now - pending[0][1], now)
+        timestamp = dt_util.utcnow()
+        for _ in range(batch_size):
+            self._mqtt_handle_message(pending.popleft()[0], timestamp)
+
+        if not pending:
+            return
+        with self._pending_messages_lock:
+            if self._drain_scheduled:
+                return
+            self._drain_scheduled = True
+        self.hass.loop.call_soon(self._async_drain_messages)
 
     @callback
-    def _mqtt_handle_message(self, msg) -> None:
+    def _mqtt_handle_message(self, msg, timestamp: dt.datetime | None = None) -> None:
         _LOGGER.debug(
             "Received message on %s%s: %s",
             msg.topic,
             " (retained)" if msg.retain else "",
             msg.payload[0:8192],
         )
-        timestamp = dt_util.utcnow()
+        if timestamp is None:
+            timestamp = dt_util.utcnow()
 
-        subscriptions = self._matching_subscriptions(msg.topic)
+        subscriptions = self._subscription_trie.matches(msg.topic)
+        # Decode the payload once per encoding, not once per subscription
+        decoded: dict[str, SubscribePayloadType | None] = {}
 
         for subscription in subscriptions:
 
-            payload: SubscribePayloadType = msg.payload
-            if subscription.encoding is not None:
-                try:
-                    payload = msg.payload.decode(subscription.encoding)
-                except (AttributeError, UnicodeDecodeError):
+            payload: SubscribePayloadType | None = msg.payload
+            if (encoding := subscription.encoding) is not None:
+                if encoding not in decoded:
+                    try:
+                        decoded[encoding] = msg.payload.decode(encoding)
+                    except (AttributeError, UnicodeDecodeError):
+                        decoded[encoding] = None
+                if (payload := decoded[encoding]) is None:
                     _LOGGER.warning(
                         "Can't decode payload %s on %s with encoding %s (for %s)",
                         msg.payload[0:8192],
@@ -1062,16 +1158,6 @@ def _raise_on_error(result_code: int | None) -> None:
         )
 
 
-def _matcher_for_topic(subscription: str) -> Any:
-    # pylint: disable=import-outside-toplevel
-    from paho.mqtt.matcher import MQTTMatcher
-
-    matcher = MQTTMatcher()
-    matcher[subscription] = True
-
-    return lambda topic: next(matcher.iter_match(topic), False)
-
-
 @websocket_api.websocket_command(
     {vol.Required("type"): "mqtt/device/debug_info", vol.Required("device_id"): str}
 )
@@ -1080,6 +1166,7 @@ async def websocket_mqtt_info(hass, connection, msg):
     """Get MQTT debug info for device."""
     device_id = msg["device_id"]
     mqtt_info = await debug_info.info_for_device(hass, device_id)
+    mqtt_info["ingest"] = hass.data[DATA_MQTT].ingest_metrics.as_dict()
 
     connection.send_result(msg["id"], mqtt_info)
 
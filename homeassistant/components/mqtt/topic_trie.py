@@ -0,0 +1,109 @@
+"""Topic trie to match MQTT topics against subscribed topic filters."""
+from __future__ import annotations
+
+from collections.abc import Iterator
+from typing import Generic, TypeVar
+
+_T = TypeVar("_T")
+
+SINGLE_LEVEL_WILDCARD = "+"
+MULTI_LEVEL_WILDCARD = "#"
+
+
+class _TopicNode(Generic[_T]):
+    """A level of a topic filter."""
+
+    __slots__ = ("children", "values")
+
+    def __init__(self) -> None:
+        """Initialize the node."""
+        self.children: dict[str, _TopicNode[_T]] = {}
+        self.values: list[_T] = []
+
+
+class TopicTrie(Generic[_T]):
+    """Index values by MQTT topic filter.
+
+    Matching a topic walks the trie level by level, so the cost depends on
+    the depth of the topic and not on the number of subscribed filters.
+    Wildcard semantics follow the MQTT specification and paho's matcher:
+    `+` matches a single level, `#` matches the parent level and everything
+    below it, and wildcards at the first level never match topics starting
+    with `$`.
+    """
+
+    __slots__ = ("_root",)
+
+    def __init__(self) -> None:
+        """Initialize the trie."""
+        self._root: _TopicNode[_T] = _TopicNode()
+
+    def add(self, topic_filter: str, value: _T) -> None:
+        """Add a value for a topic filter."""
+        node = self._root
+        for level in topic_filter.split("/"):
+            if (child := node.children.get(level)) is None:
+                child = node.children[level] = _TopicNode()
+            node = child
+        node.values.append(value)
+
+    def remove(self, topic_filter: str, value: _T) -> bool:
+        """Remove a value for a topic filter.
+
+        Returns True if other values remain for the same topic filter.
+        Raises ValueError if the value is not indexed for the topic filter.
+        """
+        path: list[tuple[_TopicNode[_T], str]] = []
+        node = self._root
+        for level in topic_filter.split("/"):
+            if (child := node.children.get(level)) is None:
+                raise ValueError(f"{value} is not subscribed to {topic_filter}")
+            path.append((node, level))
+            node = child
+        node.values.remove(value)
+        if node.values:
+            return True
+        # Prune the levels that no longer lead to any value
+        for parent, level in reversed(path):
+            if node.values or node.children:
+                break
+            del parent.children[level]
+            node = parent
+        return False
+
+    def __contains__(self, topic_filter: object) -> bool:
+        """Return True if values are indexed for the exact topic filter."""
+        if not isinstance(topic_filter, str):
+            return False
+        node = self._root
+        for level in topic_filter.split("/"):
+            if (child := node.children.get(level)) is None:
+                return False
+            node = child
+        return bool(node.values)
+
+    def matches(self, topic: str) -> list[_T]:
+        """Return the values of all topic filters matching a topic."""
+        return list(self._iter_match(self._root, topic.split("/"), 0, topic[:1] != "$"))
+
+    def _iter_match(
+        self, node: _TopicNode[_T], levels: list[str], index: int, normal: bool
+    ) -> Iterator[_T]:
+        """Yield the values below a node matching the remaining levels."""
+        children = node.children
+        wildcards_allowed = normal or index > 0
+        if index == len(levels):
+            yield from node.values
+        else:
+            if (child := children.get(levels[index])) is not None:
+                yield from self._iter_match(child, levels, index + 1, normal)
+            if (
+                wildcards_allowed
+                and (child := children.get(SINGLE_LEVEL_WILDCARD)) is not None
+            ):
+                yield from self._iter_match(child, levels, index + 1, normal)
+        if (
+            wildcards_allowed
+            and (child := children.get(MULTI_LEVEL_WILDCARD)) is not None
+        ):
+            yield from child.values
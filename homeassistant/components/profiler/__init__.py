@@ -30,6 +30,7 @@ SERVICE_STOP_LOG_OBJECTS = "stop_log_objects"
 SERVICE_DUMP_LOG_OBJECTS = "dump_log_objects"
 SERVICE_LOG_THREAD_FRAMES = "log_thread_frames"
 SERVICE_LOG_EVENT_LOOP_SCHEDULED = "log_event_loop_scheduled"
+SERVICE_LOG_EXECUTOR_STATISTICS = "log_executor_statistics"
 
 
 SERVICES = (
@@ -40,6 +41,7 @@ SERVICES = (
     SERVICE_DUMP_LOG_OBJECTS,
     SERVICE_LOG_THREAD_FRAMES,
     SERVICE_LOG_EVENT_LOOP_SCHEDULED,
+    SERVICE_LOG_EXECUTOR_STATISTICS,
 )
 
 DEFAULT_SCAN_INTERVAL = timedelta(seconds=30)
@@ -128,6 +130,34 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             arepr.max_string = original_maxstring
             arepr.max_other = original_maxother
 
+    async def _async_dump_executor_statistics(call: ServiceCall) -> None:
+        """Log the job statistics of the executors."""
+        for name, executor in hass.async_get_executors().items():
+            _LOGGER.critical(
+                "Executor [%s]: %s max workers, %s queued jobs",
+                name,
+                executor.max_workers,
+                executor.queued_jobs,
+            )
+            job_statistics = executor.job_statistics()
+            for owner in sorted(
+                job_statistics,
+                key=lambda owner: job_statistics[owner].total_run,
+                reverse=True,
+            ):
+                stats = job_statistics[owner]
+                _LOGGER.critical(
+                    "Executor [%s] jobs of %s: %s jobs, %.3fs run (max %.3fs), "
+                    "%.3fs waiting (max %.3fs)",
+                    name,
+                    owner,
+                    stats.jobs,
+                    stats.total_run,
+                    stats.max_run,
+                    stats.total_wait,
+                    stats.max_wait,
+                )
+
     async_register_admin_service(
         hass,
         DOMAIN,
@@ -191,6 +221,13 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         _async_dump_scheduled,
     )
 
+    async_register_admin_service(
+        hass,
+        DOMAIN,
+        SERVICE_LOG_EXECUTOR_STATISTICS,
+        _async_dump_executor_statistics,
+    )
+
     return True
 
 
@@ -12,8 +12,9 @@ import queue
 import sqlite3
 import threading
 import time
-from typing import Any
+from typing import Any, NamedTuple
 
+from lru import LRU  # pylint: disable=no-name-in-module
 from sqlalchemy import create_engine, event as sqlalchemy_event, exc, func, select
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import scoped_session, sessionmaker
@@ -32,7 +33,7 @@ from homeassistant.const import (
     EVENT_TIME_CHANGED,
     MATCH_ALL,
 )
-from homeassistant.core import CoreState, HomeAssistant, callback
+from homeassistant.core import CALLBACK_TYPE, CoreState, HomeAssistant, callback
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.entityfilter import (
     INCLUDE_EXCLUDE_BASE_FILTER_SCHEMA,
@@ -65,7 +66,9 @@ from .models import (
     Base,
     Events,
     RecorderRuns,
+    StateAttributes,
     States,
+    StatesCheckpoints,
     StatisticsRuns,
     process_timestamp,
 )
@@ -122,9 +125,13 @@ DEFAULT_DB_RETRY_WAIT = 3
 DEFAULT_COMMIT_INTERVAL = 1
 KEEPALIVE_TIME = 30
 
-# Controls how often we clean up
-# States and Events objects
-EXPIRE_AFTER_COMMITS = 120
+# The number of attribute ids to cache in memory
+#
+# Based on:
+# - The number of overlapping attributes
+# - How frequently states with overlapping attributes will change
+# - How much memory our low end hardware has
+STATE_ATTRIBUTES_ID_CACHE_SIZE = 2048
 
 DB_LOCK_TIMEOUT = 30
 DB_LOCK_QUEUE_CHECK_TIMEOUT = 1
@@ -278,6 +285,8 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
 async def _process_recorder_platform(hass, domain, platform):
     """Process a recorder platform."""
     hass.data[DOMAIN][domain] = platform
+    if hasattr(platform, "record_state_change"):
+        hass.data[DATA_INSTANCE].async_add_state_change_platform(platform)
 
 
 @callback
@@ -371,7 +380,9 @@ class PurgeTask(RecorderTask):
 
     def run(self, instance: Recorder) -> None:
         """Purge the database."""
-        if purge.purge_old_data(
+        # pylint: disable-next=[protected-access]
+        instance._commit_event_session_or_retry()
+        if purge.purge_old_data_within_budget(
             instance, self.purge_before, self.repack, self.apply_filter
         ):
             # We always need to do the db cleanups after a purge
@@ -391,6 +402,8 @@ class PurgeEntitiesTask(RecorderTask):
 
     def run(self, instance: Recorder) -> None:
         """Purge entities from the database."""
+        # pylint: disable-next=[protected-access]
+        instance._commit_event_session_or_retry()
         if purge.purge_entity_data(instance, self.entity_filter):
             return
         # Schedule a new purge task if this one didn't finish
@@ -414,6 +427,9 @@ class StatisticsTask(RecorderTask):
 
     def run(self, instance: Recorder) -> None:
         """Run statistics task."""
+        # The statistics are compiled from the states queued before the task
+        # pylint: disable-next=[protected-access]
+        instance._commit_event_session_or_retry()
         if statistics.compile_statistics(instance, self.start):
             return
         # Schedule a new statistics task if this one didn't finish
@@ -457,6 +473,40 @@ class DatabaseLockTask(RecorderTask):
         instance._lock_database(self)  # pylint: disable=[protected-access]
 
 
+@dataclass
+class CommitTask(RecorderTask):
+    """Commit the event session."""
+
+    def run(self, instance: Recorder) -> None:
+        """Handle the task."""
+        # pylint: disable-next=[protected-access]
+        instance._commit_event_session_or_retry()
+
+
+@dataclass
+class SynchronizeTask(RecorderTask):
+    """Commit the event session and notify the waiting coroutine."""
+
+    event: asyncio.Event
+
+    def run(self, instance: Recorder) -> None:
+        """Handle the task."""
+        # pylint: disable-next=[protected-access]
+        instance._commit_event_session_or_retry()
+        instance.hass.loop.call_soon_threadsafe(self.event.set)
+
+
+@dataclass
+class KeepAliveTask(RecorderTask):
+    """A keep alive to be sent."""
+
+    def run(self, instance: Recorder) -> None:
+        """Handle the task."""
+        # pylint: disable=[protected-access]
+        instance._keep_alive_queued = False
+        instance._send_keep_alive()
+
+
 @dataclass
 class StopTask(RecorderTask):
     """An object to insert into the recorder queue to stop the event handler."""
@@ -466,6 +516,14 @@ class StopTask(RecorderTask):
         instance.stop_requested = True
 
 
+class PendingEvent(NamedTuple):
+    """An event waiting to be inserted at the next commit."""
+
+    event_row: dict[str, Any]
+    state_row: dict[str, Any] | None
+    shared_attrs: str | None
+
+
 @dataclass
 class EventTask(RecorderTask):
     """An object to insert into the recorder queue to stop the event handler."""
@@ -516,11 +574,14 @@ class Recorder(threading.Thread):
         self.entity_filter = entity_filter
         self.exclude_t = exclude_t
 
-        self._timechanges_seen = 0
-        self._commits_without_expire = 0
-        self._keepalive_count = 0
-        self._old_states: dict[str, States] = {}
-        self._pending_expunge: list[States] = []
+        # entity_id -> state_id of the last recorded state
+        self._old_states: dict[str, int] = {}
+        # entity_id -> state_id of the last recorded state, including deleted
+        # states, written to the states_checkpoints table every hour
+        self._checkpoint_state_ids: dict[str, int] = {}
+        self._next_checkpoint: datetime | None = None
+        self._state_attributes_ids: LRU = LRU(STATE_ATTRIBUTES_ID_CACHE_SIZE)
+        self._pending_events: list[PendingEvent] = []
         self.event_session = None
         self.get_session = None
         self._completed_first_database_setup = None
@@ -528,8 +589,14 @@ class Recorder(threading.Thread):
         self.async_migration_event = asyncio.Event()
         self.migration_in_progress = False
         self._queue_watcher = None
+        self._commit_listener: CALLBACK_TYPE | None = None
+        self._keep_alive_listener: CALLBACK_TYPE | None = None
+        self._keep_alive_queued = False
         self._db_supports_row_number = True
         self._database_lock_task: DatabaseLockTask | None = None
+        self.purge_progress: purge.PurgeProgress | None = None
+        # Platforms keeping track of recorded state changes
+        self._state_change_platforms: tuple[Any, ...] = ()
 
         self.enabled = True
 
@@ -547,6 +614,14 @@ class Recorder(threading.Thread):
             self.hass, self._async_check_queue, timedelta(minutes=10)
         )
 
+    @callback
+    def async_add_state_change_platform(self, platform: Any) -> None:
+        """Add a recorder platform to call for each recorded state change.
+
+        The platform's record_state_change is called from the recorder thread.
+        """
+        self._state_change_platforms = (*self._state_change_platforms, platform)
+
     @callback
     def _async_check_queue(self, *_):
         """Periodic check of the queue size to ensure we do not exaust memory.
@@ -569,6 +644,12 @@ class Recorder(threading.Thread):
         if self._queue_watcher:
             self._queue_watcher()
             self._queue_watcher = None
+        if self._commit_listener:
+            self._commit_listener()
+            self._commit_listener = None
+        if self._keep_alive_listener:
+            self._keep_alive_listener()
+            self._keep_alive_listener = None
         if self._event_listener:
             self._event_listener()
             self._event_listener = None
@@ -576,7 +657,7 @@ class Recorder(threading.Thread):
     @callback
     def _async_event_filter(self, event) -> bool:
         """Filter events."""
-        if event.event_type in self.exclude_t:
+        if event.event_type == EVENT_TIME_CHANGED or event.event_type in self.exclude_t:
             return False
 
         if (entity_id := event.data.get(ATTR_ENTITY_ID)) is None:
@@ -692,6 +773,21 @@ class Recorder(threading.Thread):
         else:
             self.queue.put(PerodicCleanupTask())
 
+    @callback
+    def _async_commit(self, now):
+        """Queue a commit of the event session."""
+        self.queue.put(CommitTask())
+
+    @callback
+    def _async_keep_alive(self, now):
+        """Queue a keep alive."""
+        # The timer can fire faster than the keep alives are sent, when the
+        # recorder falls behind or the clock jumps
+        if self._keep_alive_queued:
+            return
+        self._keep_alive_queued = True
+        self.queue.put(KeepAliveTask())
+
     @callback
     def async_periodic_statistics(self, now):
         """Trigger the hourly statistics run."""
@@ -720,6 +816,16 @@ class Recorder(threading.Thread):
             # Home Assistant is shutting down
             return
 
+        self._keep_alive_listener = async_track_time_interval(
+            self.hass, self._async_keep_alive, timedelta(seconds=KEEPALIVE_TIME)
+        )
+
+        # Without a commit interval every event is committed right away
+        if self.commit_interval:
+            self._commit_listener = async_track_time_interval(
+                self.hass, self._async_commit, timedelta(seconds=self.commit_interval)
+            )
+
         # Run nightly tasks at 4:12am
         async_track_time_change(
             self.hass, self.async_nightly_tasks, hour=4, minute=12, second=0
@@ -889,56 +995,40 @@ class Recorder(threading.Thread):
         )
 
     def _process_one_event(self, event):
-        if event.event_type == EVENT_TIME_CHANGED:
-            self._keepalive_count += 1
-            if self._keepalive_count >= KEEPALIVE_TIME:
-                self._keepalive_count = 0
-                self._send_keep_alive()
-            if self.commit_interval:
-                self._timechanges_seen += 1
-                if self._timechanges_seen >= self.commit_interval:
-                    self._timechanges_seen = 0
-                    self._commit_event_session_or_retry()
-            return
-
         if not self.enabled:
             return
 
         try:
             if event.event_type == EVENT_STATE_CHANGED:
-                dbevent = Events.from_event(event, event_data="{}")
+                event_row = Events.row_from_event(event, event_data="{}")
             else:
-                dbevent = Events.from_event(event)
-            dbevent.created = event.time_fired
-            self.event_session.add(dbevent)
+                event_row = Events.row_from_event(event)
         except (TypeError, ValueError):
             _LOGGER.warning("Event is not JSON serializable: %s", event)
             return
 
+        state_row = shared_attrs = None
         if event.event_type == EVENT_STATE_CHANGED:
             try:
-                dbstate = States.from_event(event)
-                has_new_state = event.data.get("new_state")
-                if dbstate.entity_id in self._old_states:
-                    old_state = self._old_states.pop(dbstate.entity_id)
-                    if old_state.state_id:
-                        dbstate.old_state_id = old_state.state_id
-                    else:
-                        dbstate.old_state = old_state
-                if not has_new_state:
-                    dbstate.state = None
-                dbstate.event = dbevent
-                dbstate.created = event.time_fired
-                self.event_session.add(dbstate)
-                if has_new_state:
-                    self._old_states[dbstate.entity_id] = dbstate
-                    self._pending_expunge.append(dbstate)
+                shared_attrs = StateAttributes.shared_attrs_from_event(event)
+                state_row = States.row_from_event(event)
             except (TypeError, ValueError):
                 _LOGGER.warning(
                     "State is not JSON serializable: %s",
                     event.data.get("new_state"),
                 )
 
+        # Rows are inserted in bulk when the event session is committed
+        self._pending_events.append(PendingEvent(event_row, state_row, shared_attrs))
+
+        # Platforms only track the state changes which are recorded
+        if state_row is not None:
+            for platform in self._state_change_platforms:
+                try:
+                    platform.record_state_change(self.hass, event)
+                except Exception:  # pylint: disable=broad-except
+                    _LOGGER.exception("Error processing state change: %s", event)
+
         # If they do not have a commit interval
         # than we commit right away
         if not self.commit_interval:
@@ -956,7 +1046,11 @@ class Recorder(threading.Thread):
 
     def _commit_event_session_or_retry(self):
         """Commit the event session if there is work to do."""
-        if not self.event_session.new and not self.event_session.dirty:
+        if (
+            not self._pending_events
+            and not self.event_session.new
+            and not self.event_session.dirty
+        ):
             return
         tries = 1
         while tries <= self.db_max_retries:
@@ -973,28 +1067,173 @@ class Recorder(threading.Thread):
                 if tries == self.db_max_retries:
                     raise
 
+                # The pending rows are kept, start over with a clean transaction
+                self.event_session.rollback()
                 tries += 1
                 time.sleep(self.db_retry_wait)
 
     def _commit_event_session(self):
-        self._commits_without_expire += 1
-
-        if self._pending_expunge:
-            self.event_session.flush()
-            for dbstate in self._pending_expunge:
-                # Expunge the state so its not expired
-                # until we use it later for dbstate.old_state
-                if dbstate in self.event_session:
-                    self.event_session.expunge(dbstate)
-            self._pending_expunge = []
+        (
+            old_states,
+            state_ids,
+            state_attributes_ids,
+            next_checkpoint,
+        ) = self._insert_pending_events()
         self.event_session.commit()
+        self._pending_events = []
+        self._checkpoint_state_ids.update(state_ids)
+        self._next_checkpoint = next_checkpoint
+
+        # Only remember the ids once they have been committed, a rollback
+        # would otherwise leave us with ids that do not exist
+        for entity_id, state_id in old_states.items():
+            if state_id is None:
+                self._old_states.pop(entity_id, None)
+            else:
+                self._old_states[entity_id] = state_id
+        for shared_attrs, attributes_id in state_attributes_ids.items():
+            self._state_attributes_ids[shared_attrs] = attributes_id
+
+    def _insert_pending_events(
+        self,
+    ) -> tuple[dict[str, int | None], dict[str, int], dict[str, int], datetime | None]:
+        """Insert the events and states queued since the last commit.
+
+        All events are inserted with a single executemany in arrival order so
+        event_id keeps following the order the events were fired in. The ids
+        of the new rows are read back to link the states to their events. The
+        states are inserted with executemany as well, starting a new batch
+        when an entity already has a state in the current batch, since
+        old_state_id needs the id of that state. A states checkpoint is
+        inserted before the first state of a new hour.
+
+        Returns the entity_id -> old state_id, entity_id -> state_id and
+        shared_attrs -> attributes_id mappings created by this batch and the
+        start of the next checkpoint.
+        """
+        old_states: dict[str, int | None] = {}
+        state_ids: dict[str, int] = {}
+        state_attributes_ids: dict[str, int] = {}
+        next_checkpoint = self._next_checkpoint
+        if not self._pending_events:
+            return old_states, state_ids, state_attributes_ids, next_checkpoint
+
+        event_ids = self._insert_rows(
+            Events.__table__, [pending.event_row for pending in self._pending_events]
+        )
+
+        state_rows: list[dict[str, Any]] = []
+        batch_entity_ids: set[str] = set()
+
+        def insert_state_rows() -> None:
+            """Insert the batched states and remember their ids."""
+            if not state_rows:
+                return
+            for row, state_id in zip(
+                state_rows, self._insert_rows(States.__table__, state_rows)
+            ):
+                entity_id = row["entity_id"]
+                # Deleted states do not become the old state of the next state
+                old_states[entity_id] = None if row["state"] is None else state_id
+                state_ids[entity_id] = state_id
+            state_rows.clear()
+            batch_entity_ids.clear()
+
+        for (_, state_row, shared_attrs), event_id in zip(
+            self._pending_events, event_ids
+        ):
+            if state_row is None:
+                continue
+            entity_id = state_row["entity_id"]
+            checkpoint_due = (
+                next_checkpoint is not None
+                and state_row["last_updated"] >= next_checkpoint
+            )
+            if entity_id in batch_entity_ids or checkpoint_due:
+                insert_state_rows()
+            if checkpoint_due:
+                checkpoint_start = state_row["last_updated"].replace(
+                    minute=0, second=0, microsecond=0
+                )
+                self._insert_states_checkpoint(
+                    checkpoint_start, {**self._checkpoint_state_ids, **state_ids}
+                )
+                next_checkpoint = checkpoint_start + timedelta(hours=1)
+            if entity_id in old_states:
+                old_state_id = old_states[entity_id]
+            else:
+                old_state_id = self._old_states.get(entity_id)
+            attributes_id = state_attributes_ids.get(
+                shared_attrs
+            ) or self._state_attributes_ids.get(shared_attrs)
+            if attributes_id is None:
+                attributes_id = self._find_or_insert_state_attributes(shared_attrs)
+                state_attributes_ids[shared_attrs] = attributes_id
+            state_rows.append(
+                {
+                    **state_row,
+                    "event_id": event_id,
+                    "old_state_id": old_state_id,
+                    "attributes_id": attributes_id,
+                }
+            )
+            batch_entity_ids.add(entity_id)
+
+        insert_state_rows()
 
-        # Expire is an expensive operation (frequently more expensive
-        # than the flush and commit itself) so we only
-        # do it after EXPIRE_AFTER_COMMITS commits
-        if self._commits_without_expire == EXPIRE_AFTER_COMMITS:
-            self._commits_without_expire = 0
-            self.event_session.expire_all()
+        return old_states, state_ids, state_attributes_ids, next_checkpoint
+
+    def _insert_rows(self, table: Any, rows: list[dict[str, Any]]) -> list[int]:
+        """Insert rows and return their primary keys in the order of rows.
+
+        SQLAlchemy 1.4 only supports RETURNING with executemany for
+        psycopg2. On SQLite the rows are inserted with one executemany while
+        the transaction holds the write lock of the database, so they get
+        consecutive rowids ending at last_insert_rowid(). Other databases
+        insert the rows one by one and read each primary key from the cursor.
+        """
+        session = self.event_session
+        (id_column,) = table.primary_key.columns
+        dialect = self.engine.dialect
+        if dialect.insert_executemany_returning:
+            return list(
+                session.execute(table.insert().returning(id_column), rows).scalars()
+            )
+        if dialect.name == "sqlite":
+            session.execute(table.insert(), rows)
+            last_id = session.execute(select(func.last_insert_rowid())).scalar()
+            return list(range(last_id - len(rows) + 1, last_id + 1))
+        return [
+            session.execute(table.insert(), row).inserted_primary_key[0] for row in rows
+        ]
+
+    def _insert_states_checkpoint(
+        self, start: datetime, state_ids: dict[str, int]
+    ) -> None:
+        """Insert the last recorded state of each entity before start."""
+        if not state_ids:
+            return
+        self.event_session.execute(
+            StatesCheckpoints.__table__.insert(),
+            [
+                {"start": start, "entity_id": entity_id, "state_id": state_id}
+                for entity_id, state_id in state_ids.items()
+            ],
+        )
+
+    def _find_or_insert_state_attributes(self, shared_attrs: str) -> int:
+        """Return the id of the state_attributes row, inserting it if missing."""
+        attr_hash = StateAttributes.hash_shared_attrs(shared_attrs)
+        if attributes := self.event_session.execute(
+            select(StateAttributes.attributes_id)
+            .where(StateAttributes.hash == attr_hash)
+            .where(StateAttributes.shared_attrs == shared_attrs)
+        ).first():
+            return attributes[0]
+        return self.event_session.execute(
+            StateAttributes.__table__.insert(),
+            {"hash": attr_hash, "shared_attrs": shared_attrs},
+        ).inserted_primary_key[0]
 
     def _handle_sqlite_corruption(self):
         """Handle the sqlite3 database being corrupt."""
@@ -1007,6 +1246,12 @@ class Recorder(threading.Thread):
     def _close_event_session(self):
         """Close the event session."""
         self._old_states = {}
+        # A checkpoint without the states recorded before closing the session
+        # would be incomplete, the next run starts over
+        self._checkpoint_state_ids = {}
+        self._next_checkpoint = None
+        self._state_attributes_ids.clear()
+        self._pending_events = []
 
         if not self.event_session:
             return
@@ -1055,6 +1300,12 @@ class Recorder(threading.Thread):
         self.queue.put(WaitTask())
         self._queue_watch.wait()
 
+    async def async_block_till_done(self) -> None:
+        """Wait until the events queued so far are committed to the database."""
+        event = asyncio.Event()
+        self.queue.put(SynchronizeTask(event))
+        await event.wait()
+
     async def lock_database(self) -> bool:
         """Lock database so it can be backed up safely."""
         if self._database_lock_task:
@@ -1151,6 +1402,9 @@ class Recorder(threading.Thread):
             self._schedule_compile_missing_statistics(session)
 
         self._open_event_session()
+        # Checkpoints are written at the start of each hour of the run
+        hour_start = start.replace(minute=0, second=0, microsecond=0)
+        self._next_checkpoint = hour_start + timedelta(hours=1)
 
     def _schedule_compile_missing_statistics(self, session: Session) -> None:
         """Add tasks for missing statistics runs."""
@@ -4,16 +4,24 @@ from __future__ import annotations
 from collections import defaultdict
 from itertools import groupby
 import logging
+import math
 import time
 
-from sqlalchemy import and_, bindparam, func
+from sqlalchemy import and_, bindparam, func, select, union_all
 from sqlalchemy.ext import baked
 
 from homeassistant.components import recorder
 from homeassistant.core import split_entity_id
 import homeassistant.util.dt as dt_util
 
-from .models import LazyState, States, process_timestamp_to_utc_isoformat
+from .models import (
+    LazyState,
+    StateAttributes,
+    States,
+    StatesCheckpoints,
+    process_timestamp,
+    process_timestamp_to_utc_isoformat,
+)
 from .util import execute, session_scope
 
 # mypy: allow-untyped-defs, no-check-untyped-defs
@@ -22,6 +30,11 @@ _LOGGER = logging.getLogger(__name__)
 
 STATE_KEY = "state"
 LAST_CHANGED_KEY = "last_changed"
+ATTR_MIN = "min"
+ATTR_MAX = "max"
+
+# Rows fetched per round trip when streaming states
+STREAM_YIELD_PER = 1000
 
 SIGNIFICANT_DOMAINS = (
     "climate",
@@ -44,6 +57,7 @@ QUERY_STATES = [
     States.entity_id,
     States.state,
     States.attributes,
+    StateAttributes.shared_attrs,
     States.last_changed,
     States.last_updated,
 ]
@@ -51,6 +65,13 @@ QUERY_STATES = [
 HISTORY_BAKERY = "recorder_history_bakery"
 
 
+def _query_states_with_attributes(session):
+    """Query the states table joined with the shared attributes table."""
+    return session.query(*QUERY_STATES).outerjoin(
+        StateAttributes, States.attributes_id == StateAttributes.attributes_id
+    )
+
+
 def async_setup(hass):
     """Set up the history hooks."""
     hass.data[HISTORY_BAKERY] = baked.bakery()
@@ -87,10 +108,210 @@ def get_significant_states_with_session(
     """
     timer_start = time.perf_counter()
 
-    baked_query = hass.data[HISTORY_BAKERY](
-        lambda session: session.query(*QUERY_STATES)
+    baked_query = _significant_states_baked_query(
+        hass, end_time, entity_ids, filters, significant_changes_only
+    )
+
+    states = execute(
+        baked_query(session).params(
+            start_time=start_time, end_time=end_time, entity_ids=entity_ids
+        )
     )
 
+    if _LOGGER.isEnabledFor(logging.DEBUG):
+        elapsed = time.perf_counter() - timer_start
+        _LOGGER.debug("get_significant_states took %fs", elapsed)
+
+    return _sorted_states_to_dict(
+        hass,
+        session,
+        states,
+        start_time,
+        entity_ids,
+        filters,
+        include_start_time_state,
+        minimal_response,
+    )
+
+
+def stream_significant_states_with_session(
+    hass,
+    session,
+    start_time,
+    end_time=None,
+    entity_ids=None,
+    filters=None,
+    include_start_time_state=True,
+    significant_changes_only=True,
+    minimal_response=False,
+    bucket_width=None,
+):
+    """
+    Yield (entity_id, states) pairs for the UTC period start_time - end_time.
+
+    This is the streaming counterpart of get_significant_states_with_session.
+    Rows are fetched in batches of STREAM_YIELD_PER and each states iterator
+    must be consumed before advancing to the next entity, so memory does not
+    grow with the length of the period. Entities are yielded ordered by
+    entity_id.
+
+    When bucket_width is given numeric states are reduced to one point per
+    bucket carrying the mean as state, along with the min and max.
+    """
+    initial_states = {}
+    if include_start_time_state:
+        run = recorder.run_information_from_instance(hass, start_time)
+        for state in _get_states_with_session(
+            hass, session, start_time, entity_ids, run=run, filters=filters
+        ):
+            state.last_changed = start_time
+            state.last_updated = start_time
+            initial_states[state.entity_id] = state
+
+    baked_query = _significant_states_baked_query(
+        hass, end_time, entity_ids, filters, significant_changes_only
+    )
+    rows = (
+        baked_query(session)
+        .params(start_time=start_time, end_time=end_time, entity_ids=entity_ids)
+        .with_post_criteria(lambda q: q.yield_per(STREAM_YIELD_PER))
+    )
+
+    pending_initial = sorted(initial_states, reverse=True)
+    for ent_id, group in groupby(rows, lambda row: row.entity_id):
+        while pending_initial and pending_initial[-1] < ent_id:
+            initial_ent_id = pending_initial.pop()
+            yield initial_ent_id, iter((initial_states[initial_ent_id],))
+        if pending_initial and pending_initial[-1] == ent_id:
+            pending_initial.pop()
+
+        initial_state = initial_states.get(ent_id)
+        if bucket_width is not None:
+            yield ent_id, _downsampled_states(
+                initial_state, group, start_time, bucket_width
+            )
+        elif (
+            minimal_response
+            and split_entity_id(ent_id)[0] not in NEED_ATTRIBUTE_DOMAINS
+        ):
+            yield ent_id, _minimal_states(initial_state, group)
+        else:
+            yield ent_id, _full_states(initial_state, group)
+
+    while pending_initial:
+        initial_ent_id = pending_initial.pop()
+        yield initial_ent_id, iter((initial_states[initial_ent_id],))
+
+
+def _full_states(initial_state, group):
+    """Yield a LazyState for every row."""
+    if initial_state is not None:
+        yield initial_state
+    for db_state in group:
+        yield LazyState(db_state)
+
+
+def _minimal_states(initial_state, group):
+    """Yield the minimal response for the rows of one entity.
+
+    Matches _sorted_states_to_dict, the first and last state are full states
+    and all in-between only provide the state and last_changed.
+    """
+    if (prev_state := initial_state) is None:
+        if (first_row := next(group, None)) is None:
+            return
+        prev_state = first_row
+
+    # Called in a tight loop so cache the function
+    # here
+    _process_timestamp_to_utc_isoformat = process_timestamp_to_utc_isoformat
+
+    yield prev_state if prev_state is initial_state else LazyState(prev_state)
+    changed = None
+    for db_state in group:
+        if db_state.state == prev_state.state:
+            continue
+        if changed is not None:
+            yield {
+                STATE_KEY: changed.state,
+                LAST_CHANGED_KEY: _process_timestamp_to_utc_isoformat(
+                    changed.last_changed
+                ),
+            }
+        changed = prev_state = db_state
+
+    if changed is not None:
+        yield LazyState(changed)
+
+
+def _downsampled_states(initial_state, group, start_time, bucket_width):
+    """Yield the rows of one entity reduced to one point per time bucket.
+
+    Numeric states falling in the same bucket are reduced to their mean, min
+    and max. Non numeric states, like unavailable, are passed through with
+    only state and last_changed so gaps in a graph are kept.
+    """
+    if initial_state is not None:
+        yield initial_state
+
+    _process_timestamp_to_utc_isoformat = process_timestamp_to_utc_isoformat
+    width = bucket_width.total_seconds()
+    start = start_time.timestamp()
+
+    bucket = None
+    count = total = minimum = maximum = 0.0
+
+    def _bucket_point():
+        """Return the point for the current bucket."""
+        return {
+            STATE_KEY: total / count,
+            ATTR_MIN: minimum,
+            ATTR_MAX: maximum,
+            LAST_CHANGED_KEY: _process_timestamp_to_utc_isoformat(
+                dt_util.utc_from_timestamp(start + bucket * width)
+            ),
+        }
+
+    for db_state in group:
+        last_changed = process_timestamp(db_state.last_changed)
+        try:
+            value = float(db_state.state)
+        except (TypeError, ValueError):
+            if bucket is not None:
+                yield _bucket_point()
+                bucket = None
+            yield {
+                STATE_KEY: db_state.state,
+                LAST_CHANGED_KEY: _process_timestamp_to_utc_isoformat(last_changed),
+            }
+            continue
+
+        if not math.isfinite(value):
+            continue
+
+        state_bucket = int((last_changed.timestamp() - start) // width)
+        if state_bucket != bucket:
+            if bucket is not None:
+                yield _bucket_point()
+            bucket = state_bucket
+            count = total = 0.0
+            minimum = maximum = value
+
+        count += 1
+        total += value
+        minimum = min(minimum, value)
+        maximum = max(maximum, value)
+
+    if bucket is not None:
+        yield _bucket_point()
+
+
+def _significant_states_baked_query(
+    hass, end_time, entity_ids, filters, significant_changes_only
+):
+    """Bake the query for significant states ordered by entity_id."""
+    baked_query = hass.data[HISTORY_BAKERY](_query_states_with_attributes)
+
     if significant_changes_only:
         baked_query += lambda q: q.filter(
             (
@@ -116,34 +337,13 @@ def get_significant_states_with_session(
 
     baked_query += lambda q: q.order_by(States.entity_id, States.last_updated)
 
-    states = execute(
-        baked_query(session).params(
-            start_time=start_time, end_time=end_time, entity_ids=entity_ids
-        )
-    )
-
-    if _LOGGER.isEnabledFor(logging.DEBUG):
-        elapsed = time.perf_counter() - timer_start
-        _LOGGER.debug("get_significant_states took %fs", elapsed)
-
-    return _sorted_states_to_dict(
-        hass,
-        session,
-        states,
-        start_time,
-        entity_ids,
-        filters,
-        include_start_time_state,
-        minimal_response,
-    )
+    return baked_query
 
 
 def state_changes_during_period(hass, start_time, end_time=None, entity_id=None):
     """Return states changes during UTC period start_time - end_time."""
     with session_scope(hass=hass) as session:
-        baked_query = hass.data[HISTORY_BAKERY](
-            lambda session: session.query(*QUERY_STATES)
-        )
+        baked_query = hass.data[HISTORY_BAKERY](_query_states_with_attributes)
 
         baked_query += lambda q: q.filter(
             (States.last_changed == States.last_updated)
@@ -156,7 +356,9 @@ def state_changes_during_period(hass, start_time, end_time=None, entity_id=None)
             )
 
         if entity_id is not None:
-            baked_query += lambda q: q.filter_by(entity_id=bindparam("entity_id"))
+            baked_query += lambda q: q.filter(
+                States.entity_id == bindparam("entity_id")
+            )
             entity_id = entity_id.lower()
 
         baked_query += lambda q: q.order_by(States.entity_id, States.last_updated)
@@ -177,13 +379,13 @@ def get_last_state_changes(hass, number_of_states, entity_id):
     start_time = dt_util.utcnow()
 
     with session_scope(hass=hass) as session:
-        baked_query = hass.data[HISTORY_BAKERY](
-            lambda session: session.query(*QUERY_STATES)
-        )
+        baked_query = hass.data[HISTORY_BAKERY](_query_states_with_attributes)
         baked_query += lambda q: q.filter(States.last_changed == States.last_updated)
 
         if entity_id is not None:
-            baked_query += lambda q: q.filter_by(entity_id=bindparam("entity_id"))
+            baked_query += lambda q: q.filter(
+                States.entity_id == bindparam("entity_id")
+            )
             entity_id = entity_id.lower()
 
         baked_query += lambda q: q.order_by(
@@ -243,9 +445,21 @@ def _get_states_with_session(
 
     # We have more than one entity to look at so we need to do a query on states
     # since the last recorder run started.
-    query = session.query(*QUERY_STATES)
+    query = _query_states_with_attributes(session)
 
-    if entity_ids:
+    most_recent_state_ids = _most_recent_state_ids_from_checkpoint(
+        session, utc_point_in_time, entity_ids, run
+    )
+    if most_recent_state_ids is not None:
+        query = query.join(
+            most_recent_state_ids,
+            States.state_id == most_recent_state_ids.c.max_state_id,
+        )
+        if not entity_ids:
+            query = query.filter(~States.domain.in_(IGNORE_DOMAINS))
+            if filters:
+                query = filters.apply(query)
+    elif entity_ids:
         # We got an include-list of entities, accelerate the query by filtering already
         # in the inner query.
         most_recent_state_ids = (
@@ -305,12 +519,63 @@ def _get_states_with_session(
     return [LazyState(row) for row in execute(query)]
 
 
+def _most_recent_state_ids_from_checkpoint(session, utc_point_in_time, entity_ids, run):
+    """Return a subquery of the state_id of each entity at a point in time.
+
+    The states are looked up in the last states checkpoint of the run before
+    utc_point_in_time and the states recorded after the checkpoint, instead
+    of grouping all states of the run. Returns None if there is no checkpoint.
+    """
+    checkpoint_start = (
+        session.query(func.max(StatesCheckpoints.start))
+        .filter(StatesCheckpoints.start >= run.start)
+        .filter(StatesCheckpoints.start <= utc_point_in_time)
+        .scalar()
+    )
+    if checkpoint_start is None:
+        return None
+
+    # The last state recorded before the checkpoint is the most recent state of
+    # its entity, so it has the highest state_id in the checkpoint
+    last_checkpoint_state_id = (
+        session.query(func.max(StatesCheckpoints.state_id))
+        .filter(StatesCheckpoints.start == checkpoint_start)
+        .scalar()
+    )
+    if last_checkpoint_state_id is None:
+        return None
+
+    checkpoint_state_ids = select(
+        StatesCheckpoints.entity_id.label("entity_id"),
+        StatesCheckpoints.state_id.label("state_id"),
+    ).where(StatesCheckpoints.start == checkpoint_start)
+    recent_state_ids = (
+        select(
+            States.entity_id.label("entity_id"),
+            func.max(States.state_id).label("state_id"),
+        )
+        .where(States.state_id > last_checkpoint_state_id)
+        .where(States.last_updated < utc_point_in_time)
+        .group_by(States.entity_id)
+    )
+    if entity_ids:
+        checkpoint_state_ids = checkpoint_state_ids.where(
+            StatesCheckpoints.entity_id.in_(entity_ids)
+        )
+        recent_state_ids = recent_state_ids.where(States.entity_id.in_(entity_ids))
+
+    state_ids = union_all(checkpoint_state_ids, recent_state_ids).subquery()
+    return (
+        session.query(func.max(state_ids.c.state_id).label("max_state_id"))
+        .group_by(state_ids.c.entity_id)
+        .subquery()
+    )
+
+
 def _get_single_entity_states_with_session(hass, session, utc_point_in_time, entity_id):
     # Use an entirely different (and extremely fast) query if we only
     # have a single entity id
-    baked_query = hass.data[HISTORY_BAKERY](
-        lambda session: session.query(*QUERY_STATES)
-    )
+    baked_query = hass.data[HISTORY_BAKERY](_query_states_with_attributes)
     baked_query += lambda q: q.filter(
         States.last_updated < bindparam("utc_point_in_time"),
         States.entity_id == bindparam("entity_id"),
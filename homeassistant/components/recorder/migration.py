@@ -20,12 +20,14 @@ from .models import (
     Base,
     SchemaChanges,
     Statistics,
+    StatisticsDaily,
     StatisticsMeta,
+    StatisticsMonthly,
     StatisticsRuns,
     StatisticsShortTerm,
     process_timestamp,
 )
-from .statistics import delete_duplicates, get_start_time
+from .statistics import delete_duplicates, get_start_time, rebuild_period_statistics
 from .util import session_scope
 
 _LOGGER = logging.getLogger(__name__)
@@ -471,7 +473,7 @@ def _apply_update(instance, session, new_version, old_version):  # noqa: C901
     elif new_version == 18:
         # Recreate the statistics and statistics meta tables.
         #
-        # Order matters! Statistics and StatisticsShortTerm have a relation with
+        # Order matters! All statistics tables have a relation with
         # StatisticsMeta, so statistics need to be deleted before meta (or in pair
         # depending on the SQL backend); and meta needs to be created before statistics.
         Base.metadata.drop_all(
@@ -479,6 +481,8 @@ def _apply_update(instance, session, new_version, old_version):  # noqa: C901
             tables=[
                 StatisticsShortTerm.__table__,
                 Statistics.__table__,
+                StatisticsDaily.__table__,
+                StatisticsMonthly.__table__,
                 StatisticsMeta.__table__,
             ],
         )
@@ -486,6 +490,8 @@ def _apply_update(instance, session, new_version, old_version):  # noqa: C901
         StatisticsMeta.__table__.create(engine)
         StatisticsShortTerm.__table__.create(engine)
         Statistics.__table__.create(engine)
+        StatisticsDaily.__table__.create(engine)
+        StatisticsMonthly.__table__.create(engine)
     elif new_version == 19:
         # This adds the statistic runs table, insert a fake run to prevent duplicating
         # statistics.
@@ -536,6 +542,8 @@ def _apply_update(instance, session, new_version, old_version):  # noqa: C901
                 tables=[
                     StatisticsShortTerm.__table__,
                     Statistics.__table__,
+                    StatisticsDaily.__table__,
+                    StatisticsMonthly.__table__,
                     StatisticsMeta.__table__,
                     StatisticsRuns.__table__,
                 ],
@@ -545,6 +553,8 @@ def _apply_update(instance, session, new_version, old_version):  # noqa: C901
             StatisticsMeta.__table__.create(engine)
             StatisticsShortTerm.__table__.create(engine)
             Statistics.__table__.create(engine)
+            StatisticsDaily.__table__.create(engine)
+            StatisticsMonthly.__table__.create(engine)
 
         # Block 5-minute statistics for one hour from the last run, or it will overlap
         # with existing hourly statistics. Don't block on a database with no existing
@@ -603,7 +613,24 @@ def _apply_update(instance, session, new_version, old_version):  # noqa: C901
             "statistics_short_term",
             "ix_statistics_short_term_statistic_id_start",
         )
-
+    elif new_version == 25:
+        # The state_attributes table is created by create_all, link it to
+        # the states table. Existing rows keep their inline attributes.
+        big_int = "INTEGER(20)" if engine.dialect.name == "mysql" else "INTEGER"
+        _add_columns(connection, "states", [f"attributes_id {big_int}"])
+        _create_index(connection, "states", "ix_states_attributes_id")
+    elif new_version == 26:
+        # The statistics_daily and statistics_monthly tables are created by
+        # create_all, roll up the existing hourly statistics into them.
+        _LOGGER.warning(
+            "Rolling up daily and monthly statistics. Note: this can take several "
+            "minutes on large databases and slow computers. Please be patient!"
+        )
+        rebuild_period_statistics(session)
+    elif new_version == 27:
+        # The states_checkpoints table is created by create_all, states at a
+        # point in time before the first checkpoint are found without it.
+        pass
     else:
         raise ValueError(f"No schema migration defined for version {new_version}")
 
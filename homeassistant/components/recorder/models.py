@@ -2,11 +2,12 @@
 from __future__ import annotations
 
 from datetime import datetime, timedelta
-import json
 import logging
-from typing import TypedDict, overload
+from typing import Any, TypedDict, overload
+import zlib
 
 from sqlalchemy import (
+    BigInteger,
     Boolean,
     Column,
     DateTime,
@@ -33,14 +34,15 @@ from homeassistant.const import (
     MAX_LENGTH_STATE_STATE,
 )
 from homeassistant.core import Context, Event, EventOrigin, State, split_entity_id
-from homeassistant.helpers.json import JSONEncoder
+from homeassistant.helpers.json import json_dumps
 import homeassistant.util.dt as dt_util
+from homeassistant.util.json import json_loads
 
 # SQLAlchemy Schema
 # pylint: disable=invalid-name
 Base = declarative_base()
 
-SCHEMA_VERSION = 24
+SCHEMA_VERSION = 27
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -48,15 +50,21 @@ DB_TIMEZONE = "+00:00"
 
 TABLE_EVENTS = "events"
 TABLE_STATES = "states"
+TABLE_STATE_ATTRIBUTES = "state_attributes"
+TABLE_STATES_CHECKPOINTS = "states_checkpoints"
 TABLE_RECORDER_RUNS = "recorder_runs"
 TABLE_SCHEMA_CHANGES = "schema_changes"
 TABLE_STATISTICS = "statistics"
 TABLE_STATISTICS_META = "statistics_meta"
 TABLE_STATISTICS_RUNS = "statistics_runs"
 TABLE_STATISTICS_SHORT_TERM = "statistics_short_term"
+TABLE_STATISTICS_DAILY = "statistics_daily"
+TABLE_STATISTICS_MONTHLY = "statistics_monthly"
 
 ALL_TABLES = [
     TABLE_STATES,
+    TABLE_STATE_ATTRIBUTES,
+    TABLE_STATES_CHECKPOINTS,
     TABLE_EVENTS,
     TABLE_RECORDER_RUNS,
     TABLE_SCHEMA_CHANGES,
@@ -64,6 +72,8 @@ ALL_TABLES = [
     TABLE_STATISTICS_META,
     TABLE_STATISTICS_RUNS,
     TABLE_STATISTICS_SHORT_TERM,
+    TABLE_STATISTICS_DAILY,
+    TABLE_STATISTICS_MONTHLY,
 ]
 
 DATETIME_TYPE = DateTime(timezone=True).with_variant(
@@ -111,8 +121,7 @@ class Events(Base):  # type: ignore
         """Create an event database object from a native event."""
         return Events(
             event_type=event.event_type,
-            event_data=event_data
-            or json.dumps(event.data, cls=JSONEncoder, separators=(",", ":")),
+            event_data=event_data or json_dumps(event.data),
             origin=str(event.origin.value),
             time_fired=event.time_fired,
             context_id=event.context.id,
@@ -120,6 +129,20 @@ class Events(Base):  # type: ignore
             context_parent_id=event.context.parent_id,
         )
 
+    @staticmethod
+    def row_from_event(event, event_data=None) -> dict[str, Any]:
+        """Create an events table row for a bulk insert from a native event."""
+        return {
+            "event_type": event.event_type,
+            "event_data": event_data or json_dumps(event.data),
+            "origin": str(event.origin.value),
+            "time_fired": event.time_fired,
+            "created": event.time_fired,
+            "context_id": event.context.id,
+            "context_user_id": event.context.user_id,
+            "context_parent_id": event.context.parent_id,
+        }
+
     def to_native(self, validate_entity_id=True):
         """Convert to a native HA Event."""
         context = Context(
@@ -130,7 +153,7 @@ class Events(Base):  # type: ignore
         try:
             return Event(
                 self.event_type,
-                json.loads(self.event_data),
+                json_loads(self.event_data),
                 EventOrigin(self.origin),
                 process_timestamp(self.time_fired),
                 context=context,
@@ -163,8 +186,12 @@ class States(Base):  # type: ignore
     last_updated = Column(DATETIME_TYPE, default=dt_util.utcnow, index=True)
     created = Column(DATETIME_TYPE, default=dt_util.utcnow)
     old_state_id = Column(Integer, ForeignKey("states.state_id"), index=True)
+    attributes_id = Column(
+        Integer, ForeignKey("state_attributes.attributes_id"), index=True
+    )
     event = relationship("Events", uselist=False)
     old_state = relationship("States", remote_side=[state_id])
+    state_attributes = relationship("StateAttributes")
 
     def __repr__(self) -> str:
         """Return string representation of instance for debugging."""
@@ -173,7 +200,7 @@ class States(Base):  # type: ignore
             f"id={self.state_id}, domain='{self.domain}', entity_id='{self.entity_id}', "
             f"state='{self.state}', event_id='{self.event_id}', "
             f"last_updated='{self.last_updated.isoformat(sep=' ', timespec='seconds')}', "
-            f"old_state_id={self.old_state_id}"
+            f"old_state_id={self.old_state_id}, attributes_id={self.attributes_id}"
             f")>"
         )
 
@@ -195,21 +222,52 @@ class States(Base):  # type: ignore
         else:
             dbstate.domain = state.domain
             dbstate.state = state.state
-            dbstate.attributes = json.dumps(
-                dict(state.attributes), cls=JSONEncoder, separators=(",", ":")
-            )
+            dbstate.attributes = json_dumps(state.attributes)
             dbstate.last_changed = state.last_changed
             dbstate.last_updated = state.last_updated
 
         return dbstate
 
+    @staticmethod
+    def row_from_event(event) -> dict[str, Any]:
+        """Create a states table row for a bulk insert from a state_changed event.
+
+        The attributes are stored in the state_attributes table and the
+        event_id, old_state_id and attributes_id are filled in by the recorder
+        when the row is inserted.
+        """
+        entity_id = event.data["entity_id"]
+        # State got deleted
+        if (state := event.data.get("new_state")) is None:
+            return {
+                "entity_id": entity_id,
+                "domain": split_entity_id(entity_id)[0],
+                "state": None,
+                "attributes": None,
+                "last_changed": event.time_fired,
+                "last_updated": event.time_fired,
+                "created": event.time_fired,
+            }
+        return {
+            "entity_id": entity_id,
+            "domain": state.domain,
+            "state": state.state,
+            "attributes": None,
+            "last_changed": state.last_changed,
+            "last_updated": state.last_updated,
+            "created": event.time_fired,
+        }
+
     def to_native(self, validate_entity_id=True):
         """Convert to an HA state object."""
+        attributes = self.attributes
+        if attributes is None and self.state_attributes is not None:
+            attributes = self.state_attributes.shared_attrs
         try:
             return State(
                 self.entity_id,
                 self.state,
-                json.loads(self.attributes),
+                json_loads(attributes) if attributes else {},
                 process_timestamp(self.last_changed),
                 process_timestamp(self.last_updated),
                 # Join the events table on event_id to get the context instead
@@ -223,6 +281,94 @@ class States(Base):  # type: ignore
             return None
 
 
+class StateAttributes(Base):  # type: ignore
+    """State attribute change history.
+
+    Attributes are stored once per distinct JSON blob and shared by all
+    states rows with identical attributes.
+    """
+
+    __table_args__ = (
+        {"mysql_default_charset": "utf8mb4", "mysql_collate": "utf8mb4_unicode_ci"},
+    )
+    __tablename__ = TABLE_STATE_ATTRIBUTES
+    attributes_id = Column(Integer, Identity(), primary_key=True)
+    hash = Column(BigInteger, index=True)
+    # Note that this is not named attributes to avoid confusion with the states table
+    shared_attrs = Column(Text().with_variant(mysql.LONGTEXT, "mysql"))
+
+    def __repr__(self) -> str:
+        """Return string representation of instance for debugging."""
+        return (
+            f"<recorder.StateAttributes("
+            f"id={self.attributes_id}, hash='{self.hash}', attributes='{self.shared_attrs}'"
+            f")>"
+        )
+
+    @staticmethod
+    def from_event(event):
+        """Create object from a state_changed event."""
+        shared_attrs = StateAttributes.shared_attrs_from_event(event)
+        return StateAttributes(
+            shared_attrs=shared_attrs,
+            hash=StateAttributes.hash_shared_attrs(shared_attrs),
+        )
+
+    @staticmethod
+    def shared_attrs_from_event(event) -> str:
+        """Create shared_attrs from a state_changed event."""
+        state = event.data.get("new_state")
+        # State got deleted
+        if state is None:
+            return "{}"
+        return json_dumps(state.attributes)
+
+    @staticmethod
+    def hash_shared_attrs(shared_attrs: str) -> int:
+        """Return the hash of json encoded shared attributes."""
+        return zlib.crc32(shared_attrs.encode("utf-8"))
+
+    def to_native(self):
+        """Convert to an HA state object."""
+        try:
+            return json_loads(self.shared_attrs)
+        except ValueError:
+            # When json.loads fails
+            _LOGGER.exception("Error converting row to state attributes: %s", self)
+            return {}
+
+
+class StatesCheckpoints(Base):  # type: ignore
+    """The last recorded state of each entity at the start of an hour.
+
+    The recorder writes a checkpoint for the entities it has recorded a state
+    for during the current run when the first state of a new hour is
+    committed. Finding the states at a point in time then only has to look
+    at the states recorded since the checkpoint.
+    """
+
+    __table_args__ = (
+        Index("ix_states_checkpoints_start_entity_id", "start", "entity_id"),
+        {"mysql_default_charset": "utf8mb4", "mysql_collate": "utf8mb4_unicode_ci"},
+    )
+    __tablename__ = TABLE_STATES_CHECKPOINTS
+    checkpoint_id = Column(Integer, Identity(), primary_key=True)
+    start = Column(DATETIME_TYPE)
+    entity_id = Column(String(MAX_LENGTH_STATE_ENTITY_ID))
+    state_id = Column(
+        Integer, ForeignKey("states.state_id", ondelete="CASCADE"), index=True
+    )
+
+    def __repr__(self) -> str:
+        """Return string representation of instance for debugging."""
+        return (
+            f"<recorder.StatesCheckpoints("
+            f"id={self.checkpoint_id}, start='{self.start}', "
+            f"entity_id='{self.entity_id}', state_id={self.state_id}"
+            f")>"
+        )
+
+
 class StatisticResult(TypedDict):
     """Statistic result data class.
 
@@ -311,6 +457,44 @@ class StatisticsShortTerm(Base, StatisticsBase):  # type: ignore
     __tablename__ = TABLE_STATISTICS_SHORT_TERM
 
 
+class StatisticsDaily(Base, StatisticsBase):  # type: ignore
+    """Long term statistics reduced per local day.
+
+    The rows are rolled up from the hourly statistics, start is the UTC time
+    of local midnight. Days are not a fixed duration because of DST.
+    """
+
+    __table_args__ = (
+        # Used for fetching statistics for a certain entity at a specific time
+        Index(
+            "ix_statistics_daily_statistic_id_start",
+            "metadata_id",
+            "start",
+            unique=True,
+        ),
+    )
+    __tablename__ = TABLE_STATISTICS_DAILY
+
+
+class StatisticsMonthly(Base, StatisticsBase):  # type: ignore
+    """Long term statistics reduced per local month.
+
+    The rows are rolled up from the hourly statistics, start is the UTC time
+    of local midnight on the first day of the month.
+    """
+
+    __table_args__ = (
+        # Used for fetching statistics for a certain entity at a specific time
+        Index(
+            "ix_statistics_monthly_statistic_id_start",
+            "metadata_id",
+            "start",
+            unique=True,
+        ),
+    )
+    __tablename__ = TABLE_STATISTICS_MONTHLY
+
+
 class StatisticMetaData(TypedDict):
     """Statistic meta data class."""
 
@@ -495,8 +679,12 @@ class LazyState(State):
     def attributes(self):
         """State attributes."""
         if not self._attributes:
+            # Attributes are stored in the shared state_attributes table for
+            # new rows and inline in the states table for rows written before
+            # schema version 25
+            source = getattr(self._row, "shared_attrs", None) or self._row.attributes
             try:
-                self._attributes = json.loads(self._row.attributes)
+                self._attributes = json_loads(source) if source else {}
             except ValueError:
                 # When json.loads fails
                 _LOGGER.exception("Error converting row to state: %s", self._row)
@@ -1,17 +1,28 @@
 """Purge old data helper."""
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass, field
 from datetime import datetime
+from itertools import islice
 import logging
-from typing import TYPE_CHECKING
+import time
+from typing import TYPE_CHECKING, Any
 
 from sqlalchemy import func
 from sqlalchemy.orm.session import Session
 from sqlalchemy.sql.expression import distinct
 
 from .const import MAX_ROWS_TO_PURGE
-from .models import Events, RecorderRuns, States, StatisticsRuns, StatisticsShortTerm
+from .models import (
+    Events,
+    RecorderRuns,
+    StateAttributes,
+    States,
+    StatesCheckpoints,
+    StatisticsRuns,
+    StatisticsShortTerm,
+)
 from .repack import repack_database
 from .util import retryable_database_job, session_scope
 
@@ -20,42 +31,137 @@ if TYPE_CHECKING:
 
 _LOGGER = logging.getLogger(__name__)
 
+# Time a purge task may spend on purge slices before it is rescheduled
+PURGE_TIME_BUDGET = 1.0
+# Time a single purge slice should take, the chunk size is adapted to it
+PURGE_SLICE_TARGET = 0.25
+MIN_PURGE_CHUNK_SIZE = 100
+MAX_PURGE_CHUNK_SIZE = 20000
+
+
+@dataclass
+class PurgeProgress:
+    """Progress of purging data older than purge_before.
+
+    The rows are rows of the events table, the states and statistics are
+    purged along with them.
+    """
+
+    purge_before: datetime
+    rows_remaining: int
+    rows_deleted: int = 0
+    chunk_size: int = MAX_ROWS_TO_PURGE
+    finished: bool = False
+    started: float = field(default_factory=time.monotonic)
+
+    def record_slice(self, rows_deleted: int, duration: float) -> None:
+        """Record a purge slice and adapt the chunk size to its duration."""
+        self.rows_deleted += rows_deleted
+        self.rows_remaining = max(self.rows_remaining - rows_deleted, 0)
+        if duration > PURGE_SLICE_TARGET:
+            self.chunk_size = max(self.chunk_size // 2, MIN_PURGE_CHUNK_SIZE)
+        elif duration < PURGE_SLICE_TARGET / 2 and rows_deleted >= self.chunk_size:
+            self.chunk_size = min(self.chunk_size * 2, MAX_PURGE_CHUNK_SIZE)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a dictionary representation of the progress."""
+        elapsed = time.monotonic() - self.started
+        rate = self.rows_deleted / elapsed if elapsed else 0.0
+        eta = None
+        if self.finished:
+            eta = 0.0
+        elif rate:
+            eta = round(self.rows_remaining / rate, 1)
+        return {
+            "purge_before": self.purge_before.isoformat(),
+            "rows_deleted": self.rows_deleted,
+            "rows_remaining": 0 if self.finished else self.rows_remaining,
+            "rate": round(rate, 1),
+            "eta": eta,
+            "chunk_size": self.chunk_size,
+            "finished": self.finished,
+        }
+
+
+def purge_old_data_within_budget(
+    instance: Recorder, purge_before: datetime, repack: bool, apply_filter: bool
+) -> bool:
+    """Purge events and states older than purge_before in slices.
+
+    Slices are purged until the purge is done, the time budget is spent, or
+    other tasks are waiting in the recorder queue. Returns False if the purge
+    needs to be rescheduled after the waiting tasks.
+    """
+    progress = instance.purge_progress
+    if progress is None or progress.finished or progress.purge_before != purge_before:
+        with session_scope(session=instance.get_session()) as session:  # type: ignore
+            rows_remaining = _count_events_to_purge(session, purge_before)
+        progress = instance.purge_progress = PurgeProgress(purge_before, rows_remaining)
+
+    deadline = time.monotonic() + PURGE_TIME_BUDGET
+    while not purge_old_data(
+        instance, purge_before, repack, apply_filter, progress=progress
+    ):
+        if not instance.queue.empty() or time.monotonic() >= deadline:
+            return False
+    progress.finished = True
+    return True
+
 
 @retryable_database_job("purge")
 def purge_old_data(
-    instance: Recorder, purge_before: datetime, repack: bool, apply_filter: bool = False
+    instance: Recorder,
+    purge_before: datetime,
+    repack: bool,
+    apply_filter: bool = False,
+    progress: PurgeProgress | None = None,
 ) -> bool:
     """Purge events and states older than purge_before.
 
-    Cleans up an timeframe of an hour, based on the oldest record.
+    Cleans up a chunk of the oldest events, the chunk size is taken from
+    progress if given. The events and short term statistics are deleted by
+    primary key range.
     """
     _LOGGER.debug(
         "Purging states and events before target %s",
         purge_before.isoformat(sep=" ", timespec="seconds"),
     )
+    slice_start = time.monotonic()
+    max_rows = progress.chunk_size if progress else MAX_ROWS_TO_PURGE
 
     with session_scope(session=instance.get_session()) as session:  # type: ignore
-        # Purge a max of MAX_ROWS_TO_PURGE, based on the oldest states or events record
-        event_ids = _select_event_ids_to_purge(session, purge_before)
-        state_ids = _select_state_ids_to_purge(session, purge_before, event_ids)
+        # Purge a chunk of max_rows, based on the oldest states or events record
+        event_id_range = _select_event_id_range_to_purge(
+            session, purge_before, max_rows
+        )
+        state_ids = _select_state_ids_to_purge(session, purge_before, event_id_range)
         statistics_runs = _select_statistics_runs_to_purge(session, purge_before)
-        short_term_statistics = _select_short_term_statistics_to_purge(
-            session, purge_before
+        short_term_statistics_range = _select_short_term_statistics_range_to_purge(
+            session, purge_before, max_rows
         )
 
-        if state_ids:
-            _purge_state_ids(instance, session, state_ids)
+        # Keep the number of bound parameters below the limit of the database
+        for state_ids_chunk in _chunked(state_ids, MAX_ROWS_TO_PURGE):
+            _purge_state_ids(instance, session, state_ids_chunk)
 
-        if event_ids:
-            _purge_event_ids(session, event_ids)
+        deleted_events = 0
+        if event_id_range:
+            deleted_events = _purge_event_id_range(
+                session, purge_before, event_id_range
+            )
 
         if statistics_runs:
             _purge_statistics_runs(session, statistics_runs)
 
-        if short_term_statistics:
-            _purge_short_term_statistics(session, short_term_statistics)
+        if short_term_statistics_range:
+            _purge_short_term_statistics_range(
+                session, purge_before, short_term_statistics_range
+            )
 
-        if event_ids or statistics_runs or short_term_statistics:
+        if progress:
+            progress.record_slice(deleted_events, time.monotonic() - slice_start)
+
+        if event_id_range or statistics_runs or short_term_statistics_range:
             # Return false, as we might not be done yet.
             _LOGGER.debug("Purging hasn't fully completed yet")
             return False
@@ -64,34 +170,60 @@ def purge_old_data(
             _LOGGER.debug("Cleanup filtered data hasn't fully completed yet")
             return False
 
+        _purge_old_states_checkpoints(session, purge_before)
         _purge_old_recorder_runs(instance, session, purge_before)
     if repack:
         repack_database(instance)
     return True
 
 
-def _select_event_ids_to_purge(session: Session, purge_before: datetime) -> list[int]:
-    """Return a list of event ids to purge."""
-    events = (
-        session.query(Events.event_id)
+def _chunked(ids: Iterable[int], chunk_size: int) -> Iterator[set[int]]:
+    """Split ids in sets of at most chunk_size ids."""
+    iterator = iter(ids)
+    while chunk := set(islice(iterator, chunk_size)):
+        yield chunk
+
+
+def _count_events_to_purge(session: Session, purge_before: datetime) -> int:
+    """Return the number of events to purge."""
+    return int(
+        session.query(func.count(Events.event_id))
         .filter(Events.time_fired < purge_before)
-        .limit(MAX_ROWS_TO_PURGE)
-        .all()
+        .scalar()
     )
-    _LOGGER.debug("Selected %s event ids to remove", len(events))
-    return [event.event_id for event in events]
+
+
+def _select_event_id_range_to_purge(
+    session: Session, purge_before: datetime, max_rows: int
+) -> tuple[int, int] | None:
+    """Return the lowest and highest id of the oldest events to purge.
+
+    The events are selected in event_id order, so no other event to purge
+    falls in the range and deleting the range deletes at most max_rows events.
+    """
+    event_ids = [
+        event_id
+        for (event_id,) in session.query(Events.event_id)
+        .filter(Events.time_fired < purge_before)
+        .order_by(Events.event_id)
+        .limit(max_rows)
+    ]
+    _LOGGER.debug("Selected %s event ids to remove", len(event_ids))
+    if not event_ids:
+        return None
+    return min(event_ids), max(event_ids)
 
 
 def _select_state_ids_to_purge(
-    session: Session, purge_before: datetime, event_ids: list[int]
+    session: Session, purge_before: datetime, event_id_range: tuple[int, int] | None
 ) -> set[int]:
     """Return a list of state ids to purge."""
-    if not event_ids:
+    if not event_id_range:
         return set()
     states = (
         session.query(States.state_id)
         .filter(States.last_updated < purge_before)
-        .filter(States.event_id.in_(event_ids))
+        .filter(States.event_id.between(*event_id_range))
         .all()
     )
     _LOGGER.debug("Selected %s state ids to remove", len(states))
@@ -119,22 +251,36 @@ def _select_statistics_runs_to_purge(
     return statistic_runs_list
 
 
-def _select_short_term_statistics_to_purge(
-    session: Session, purge_before: datetime
-) -> list[int]:
-    """Return a list of short term statistics to purge."""
-    statistics = (
-        session.query(StatisticsShortTerm.id)
+def _select_short_term_statistics_range_to_purge(
+    session: Session, purge_before: datetime, max_rows: int
+) -> tuple[int, int] | None:
+    """Return the lowest and highest id of the short term statistics to purge.
+
+    The rows are selected in id order, so deleting the range deletes at most
+    max_rows rows.
+    """
+    statistic_ids = [
+        statistic_id
+        for (statistic_id,) in session.query(StatisticsShortTerm.id)
         .filter(StatisticsShortTerm.start < purge_before)
-        .limit(MAX_ROWS_TO_PURGE)
-        .all()
-    )
-    _LOGGER.debug("Selected %s short term statistics to remove", len(statistics))
-    return [statistic.id for statistic in statistics]
+        .order_by(StatisticsShortTerm.id)
+        .limit(max_rows)
+    ]
+    _LOGGER.debug("Selected %s short term statistics to remove", len(statistic_ids))
+    if not statistic_ids:
+        return None
+    return min(statistic_ids), max(statistic_ids)
 
 
 def _purge_state_ids(instance: Recorder, session: Session, state_ids: set[int]) -> None:
     """Disconnect states and delete by state id."""
+    attributes_ids = {
+        attributes_id
+        for (attributes_id,) in session.query(States.attributes_id)
+        .filter(States.state_id.in_(state_ids))
+        .distinct()
+        if attributes_id is not None
+    }
 
     # Update old_state_id to NULL before deleting to ensure
     # the delete does not fail due to a foreign key constraint
@@ -147,6 +293,15 @@ def _purge_state_ids(instance: Recorder, session: Session, state_ids: set[int])
     )
     _LOGGER.debug("Updated %s states to remove old_state_id", disconnected_rows)
 
+    # The checkpoints of entities which did not change since the purged state
+    # are newer than the state, delete them before the state
+    deleted_rows = (
+        session.query(StatesCheckpoints)
+        .filter(StatesCheckpoints.state_id.in_(state_ids))
+        .delete(synchronize_session=False)
+    )
+    _LOGGER.debug("Deleted %s states checkpoints", deleted_rows)
+
     deleted_rows = (
         session.query(States)
         .filter(States.state_id.in_(state_ids))
@@ -157,6 +312,49 @@ def _purge_state_ids(instance: Recorder, session: Session, state_ids: set[int])
     # Evict eny entries in the old_states cache referring to a purged state
     _evict_purged_states_from_old_states_cache(instance, state_ids)
 
+    if attributes_ids:
+        _purge_unused_attributes_ids(instance, session, attributes_ids)
+
+
+def _purge_unused_attributes_ids(
+    instance: Recorder, session: Session, attributes_ids: set[int]
+) -> None:
+    """Delete the attributes which are no longer referenced by any state."""
+    still_used_ids = {
+        attributes_id
+        for (attributes_id,) in session.query(States.attributes_id)
+        .filter(States.attributes_id.in_(attributes_ids))
+        .distinct()
+    }
+    if not (unused_ids := attributes_ids - still_used_ids):
+        return
+
+    deleted_rows = (
+        session.query(StateAttributes)
+        .filter(StateAttributes.attributes_id.in_(unused_ids))
+        .delete(synchronize_session=False)
+    )
+    _LOGGER.debug("Deleted %s attribute states", deleted_rows)
+
+    # Evict any entries in the state attributes ids cache referring to a purged row
+    _evict_purged_attributes_from_attributes_cache(instance, unused_ids)
+
+
+def _evict_purged_attributes_from_attributes_cache(
+    instance: Recorder, purged_attributes_ids: set[int]
+) -> None:
+    """Evict purged attribute ids from the attribute ids cache."""
+    state_attributes_ids = (
+        instance._state_attributes_ids  # pylint: disable=protected-access
+    )
+    purged_shared_attrs = [
+        shared_attrs
+        for shared_attrs, attributes_id in state_attributes_ids.items()
+        if attributes_id in purged_attributes_ids
+    ]
+    for shared_attrs in purged_shared_attrs:
+        state_attributes_ids.pop(shared_attrs, None)
+
 
 def _evict_purged_states_from_old_states_cache(
     instance: Recorder, purged_state_ids: set[int]
@@ -165,15 +363,21 @@ def _evict_purged_states_from_old_states_cache(
     # Make a map from old_state_id to entity_id
     old_states = instance._old_states  # pylint: disable=protected-access
     old_state_reversed = {
-        old_state.state_id: entity_id
-        for entity_id, old_state in old_states.items()
-        if old_state.state_id
+        old_state_id: entity_id for entity_id, old_state_id in old_states.items()
     }
 
     # Evict any purged state from the old states cache
     for purged_state_id in purged_state_ids.intersection(old_state_reversed):
         old_states.pop(old_state_reversed[purged_state_id], None)
 
+    # The next checkpoint must not refer to a purged state either
+    checkpoint_state_ids = (
+        instance._checkpoint_state_ids  # pylint: disable=protected-access
+    )
+    for entity_id, state_id in list(checkpoint_state_ids.items()):
+        if state_id in purged_state_ids:
+            del checkpoint_state_ids[entity_id]
+
 
 def _purge_statistics_runs(session: Session, statistics_runs: list[int]) -> None:
     """Delete by run_id."""
@@ -185,18 +389,33 @@ def _purge_statistics_runs(session: Session, statistics_runs: list[int]) -> None
     _LOGGER.debug("Deleted %s statistic runs", deleted_rows)
 
 
-def _purge_short_term_statistics(
-    session: Session, short_term_statistics: list[int]
+def _purge_short_term_statistics_range(
+    session: Session, purge_before: datetime, id_range: tuple[int, int]
 ) -> None:
-    """Delete by id."""
+    """Delete by id range."""
     deleted_rows = (
         session.query(StatisticsShortTerm)
-        .filter(StatisticsShortTerm.id.in_(short_term_statistics))
+        .filter(StatisticsShortTerm.id.between(*id_range))
+        .filter(StatisticsShortTerm.start < purge_before)
         .delete(synchronize_session=False)
     )
     _LOGGER.debug("Deleted %s short term statistics", deleted_rows)
 
 
+def _purge_event_id_range(
+    session: Session, purge_before: datetime, event_id_range: tuple[int, int]
+) -> int:
+    """Delete by event id range, return the number of deleted events."""
+    deleted_rows: int = (
+        session.query(Events)
+        .filter(Events.event_id.between(*event_id_range))
+        .filter(Events.time_fired < purge_before)
+        .delete(synchronize_session=False)
+    )
+    _LOGGER.debug("Deleted %s events", deleted_rows)
+    return deleted_rows
+
+
 def _purge_event_ids(session: Session, event_ids: list[int]) -> None:
     """Delete by event id."""
     deleted_rows = (
@@ -207,6 +426,16 @@ def _purge_event_ids(session: Session, event_ids: list[int]) -> None:
     _LOGGER.debug("Deleted %s events", deleted_rows)
 
 
+def _purge_old_states_checkpoints(session: Session, purge_before: datetime) -> None:
+    """Purge the states checkpoints older than purge_before."""
+    deleted_rows = (
+        session.query(StatesCheckpoints)
+        .filter(StatesCheckpoints.start < purge_before)
+        .delete(synchronize_session=False)
+    )
+    _LOGGER.debug("Deleted %s states checkpoints", deleted_rows)
+
+
 def _purge_old_recorder_runs(
     instance: Recorder, session: Session, purge_before: datetime
 ) -> None:
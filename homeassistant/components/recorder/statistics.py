@@ -1,8 +1,9 @@
 """Statistics helper."""
 from __future__ import annotations
 
+from bisect import bisect_left
 from collections import defaultdict
-from collections.abc import Callable, Iterable
+from collections.abc import Callable, Iterable, Iterator
 import contextlib
 import dataclasses
 from datetime import datetime, timedelta
@@ -41,7 +42,9 @@ from .models import (
     StatisticMetaData,
     StatisticResult,
     Statistics,
+    StatisticsDaily,
     StatisticsMeta,
+    StatisticsMonthly,
     StatisticsRuns,
     StatisticsShortTerm,
     process_timestamp,
@@ -74,6 +77,28 @@ QUERY_STATISTICS_SHORT_TERM = [
     StatisticsShortTerm.sum,
 ]
 
+QUERY_STATISTICS_DAILY = [
+    StatisticsDaily.metadata_id,
+    StatisticsDaily.start,
+    StatisticsDaily.mean,
+    StatisticsDaily.min,
+    StatisticsDaily.max,
+    StatisticsDaily.last_reset,
+    StatisticsDaily.state,
+    StatisticsDaily.sum,
+]
+
+QUERY_STATISTICS_MONTHLY = [
+    StatisticsMonthly.metadata_id,
+    StatisticsMonthly.start,
+    StatisticsMonthly.mean,
+    StatisticsMonthly.min,
+    StatisticsMonthly.max,
+    StatisticsMonthly.last_reset,
+    StatisticsMonthly.state,
+    StatisticsMonthly.sum,
+]
+
 QUERY_STATISTICS_SUMMARY_MEAN = [
     StatisticsShortTerm.metadata_id,
     func.avg(StatisticsShortTerm.mean),
@@ -122,6 +147,8 @@ MAX_DUPLICATES = 1000000
 STATISTICS_BAKERY = "recorder_statistics_bakery"
 STATISTICS_META_BAKERY = "recorder_statistics_meta_bakery"
 STATISTICS_SHORT_TERM_BAKERY = "recorder_statistics_short_term_bakery"
+STATISTICS_DAILY_BAKERY = "recorder_statistics_daily_bakery"
+STATISTICS_MONTHLY_BAKERY = "recorder_statistics_monthly_bakery"
 
 
 # Convert pressure and temperature statistics from the native unit used for statistics
@@ -180,6 +207,8 @@ def async_setup(hass: HomeAssistant) -> None:
     hass.data[STATISTICS_BAKERY] = baked.bakery()
     hass.data[STATISTICS_META_BAKERY] = baked.bakery()
     hass.data[STATISTICS_SHORT_TERM_BAKERY] = baked.bakery()
+    hass.data[STATISTICS_DAILY_BAKERY] = baked.bakery()
+    hass.data[STATISTICS_MONTHLY_BAKERY] = baked.bakery()
 
     def entity_id_changed(event: Event) -> None:
         """Handle entity_id changed."""
@@ -520,6 +549,168 @@ def compile_hourly_statistics(
     for metadata_id, stat in summary.items():
         session.add(Statistics.from_stats(metadata_id, stat))
 
+    # Roll the hour up into the statistics of its day and month
+    _compile_period_statistics(session, start_time)
+
+
+def _summarize_hourly_statistics(
+    session: scoped_session,
+    start_time: datetime,
+    end_time: datetime,
+    metadata_id: int | None,
+) -> dict[int, StatisticData]:
+    """Summarize the hourly statistics during start_time - end_time.
+
+    - average, min max is computed by a database query
+    - last_reset, state and sum is taken from the last hourly entry
+    """
+    summary: dict[int, StatisticData] = {}
+
+    mean_query = (
+        session.query(
+            Statistics.metadata_id,
+            func.avg(Statistics.mean),
+            func.min(Statistics.min),
+            func.max(Statistics.max),
+        )
+        .filter(Statistics.start >= start_time)
+        .filter(Statistics.start < end_time)
+    )
+    last_start_query = (
+        session.query(
+            Statistics.metadata_id,
+            func.max(Statistics.start).label("max_start"),
+        )
+        .filter(Statistics.start >= start_time)
+        .filter(Statistics.start < end_time)
+    )
+    if metadata_id is not None:
+        mean_query = mean_query.filter(Statistics.metadata_id == metadata_id)
+        last_start_query = last_start_query.filter(
+            Statistics.metadata_id == metadata_id
+        )
+
+    for meta_id, _mean, _min, _max in execute(
+        mean_query.group_by(Statistics.metadata_id)
+    ):
+        summary[meta_id] = {
+            "start": start_time,
+            "mean": _mean,
+            "min": _min,
+            "max": _max,
+        }
+
+    last_start_subquery = last_start_query.group_by(Statistics.metadata_id).subquery()
+    last_query = session.query(
+        Statistics.metadata_id,
+        Statistics.last_reset,
+        Statistics.state,
+        Statistics.sum,
+    ).join(
+        last_start_subquery,
+        (Statistics.metadata_id == last_start_subquery.c.metadata_id)
+        & (Statistics.start == last_start_subquery.c.max_start),
+    )
+    for meta_id, last_reset, state, _sum in execute(last_query):
+        summary[meta_id].update(
+            {
+                "last_reset": process_timestamp(last_reset),
+                "state": state,
+                "sum": _sum,
+            }
+        )
+
+    return summary
+
+
+def _compile_period_statistics(
+    session: scoped_session, hour_start: datetime, metadata_id: int | None = None
+) -> None:
+    """Update the daily and monthly statistics of the periods containing hour_start.
+
+    The day and month are summarized again from all their hourly statistics, this
+    is a couple of aggregate queries over indexed rows.
+    """
+    for table, period_start_end in (
+        (StatisticsDaily, day_start_end),
+        (StatisticsMonthly, month_start_end),
+    ):
+        start_time, end_time = period_start_end(hour_start)
+        summary = _summarize_hourly_statistics(
+            session, start_time, end_time, metadata_id
+        )
+        existing = dict(
+            execute(
+                session.query(table.metadata_id, table.id).filter(
+                    table.start == start_time
+                )
+            )
+        )
+        for meta_id, stat in summary.items():
+            if stat_id := existing.get(meta_id):
+                _update_statistics(session, table, stat_id, stat)
+            else:
+                _insert_statistics(session, table, meta_id, stat)
+
+
+def _rebuild_period_statistics(
+    session: scoped_session,
+    metadata_id: int,
+    first_start: datetime | None = None,
+    last_start: datetime | None = None,
+) -> None:
+    """Rebuild the daily and monthly statistics of a statistic.
+
+    Only the months containing first_start - last_start are rebuilt, or all of
+    them if omitted.
+    """
+    start_time = month_start_end(first_start)[0] if first_start else None
+    end_time = month_start_end(last_start)[1] if last_start else None
+
+    def filter_months(query: Any, table: Any) -> Any:
+        """Filter a query on the months being rebuilt."""
+        query = query.filter(table.metadata_id == metadata_id)
+        if start_time is not None:
+            query = query.filter(table.start >= start_time)
+        if end_time is not None:
+            query = query.filter(table.start < end_time)
+        return query
+
+    rows = execute(
+        filter_months(session.query(*QUERY_STATISTICS), Statistics).order_by(
+            Statistics.start
+        )
+    )
+
+    for table, period in (
+        (StatisticsDaily, "day"),
+        (StatisticsMonthly, "month"),
+    ):
+        filter_months(session.query(table), table).delete(synchronize_session=False)
+        if not rows:
+            continue
+        for start, _, _mean, _min, _max, last in _reduce_period_rows(rows, period):
+            _insert_statistics(
+                session,
+                table,
+                metadata_id,
+                {
+                    "start": start,
+                    "mean": _mean,
+                    "min": _min,
+                    "max": _max,
+                    "last_reset": process_timestamp(last.last_reset),
+                    "state": last.state,
+                    "sum": last.sum,
+                },
+            )
+
+
+def rebuild_period_statistics(session: scoped_session) -> None:
+    """Rebuild the daily and monthly statistics of all statistics."""
+    for (metadata_id,) in session.query(StatisticsMeta.id):
+        _rebuild_period_statistics(session, metadata_id)
+
 
 @retryable_database_job("statistics")
 def compile_statistics(instance: Recorder, start: datetime) -> bool:
@@ -573,7 +764,7 @@ def compile_statistics(instance: Recorder, start: datetime) -> bool:
 
 def _insert_statistics(
     session: scoped_session,
-    table: type[Statistics | StatisticsShortTerm],
+    table: type[Statistics | StatisticsShortTerm | StatisticsDaily | StatisticsMonthly],
     metadata_id: int,
     statistic: StatisticData,
 ) -> None:
@@ -590,7 +781,7 @@ def _insert_statistics(
 
 def _update_statistics(
     session: scoped_session,
-    table: type[Statistics | StatisticsShortTerm],
+    table: type[Statistics | StatisticsShortTerm | StatisticsDaily | StatisticsMonthly],
     stat_id: int,
     statistic: StatisticData,
 ) -> None:
@@ -787,7 +978,7 @@ def _statistics_during_period_query(
     statistic_ids: list[str] | None,
     bakery: Any,
     base_query: Iterable,
-    table: type[Statistics | StatisticsShortTerm],
+    table: type[Statistics | StatisticsShortTerm | StatisticsDaily | StatisticsMonthly],
 ) -> Callable:
     """Prepare a database query for statistics during a given period.
 
@@ -866,10 +1057,12 @@ def same_day(time1: datetime, time2: datetime) -> bool:
 
 def day_start_end(time: datetime) -> tuple[datetime, datetime]:
     """Return the start and end of the period (day) time is within."""
-    start = dt_util.as_utc(
-        dt_util.as_local(time).replace(hour=0, minute=0, second=0, microsecond=0)
+    start_local = dt_util.as_local(time).replace(
+        hour=0, minute=0, second=0, microsecond=0
     )
-    end = start + timedelta(days=1)
+    start = dt_util.as_utc(start_local)
+    # Days with a daylight saving time change don't last 24 hours
+    end = dt_util.as_utc(start_local + timedelta(days=1))
     return (start, end)
 
 
@@ -907,6 +1100,159 @@ def _reduce_statistics_per_month(
     return _reduce_statistics(stats, same_month, month_start_end, timedelta(days=31))
 
 
+def _next_day_start(start: datetime) -> datetime:
+    """Return the start of the day after the day starting at start."""
+    return dt_util.as_utc(dt_util.as_local(start) + timedelta(days=1))
+
+
+def _next_month_start(start: datetime) -> datetime:
+    """Return the start of the month after the month starting at start."""
+    return month_start_end(start)[1]
+
+
+_PERIOD_START_END: dict[str, tuple[Callable, Callable]] = {
+    "day": (day_start_end, _next_day_start),
+    "month": (month_start_end, _next_month_start),
+}
+
+
+def _reduce_period_rows(
+    rows: list, period: Literal["day", "month"]
+) -> Iterator[tuple[datetime, datetime, Any, Any, Any, Any]]:
+    """Reduce hourly rows sorted by start to daily or monthly statistics.
+
+    The rows are transposed to columns. The rows of a period are found by
+    bisecting the start column and each period is reduced from its slice of
+    the columns. Yields the start, end, mean, min and max of each period
+    together with its last row.
+    """
+    period_start_end, next_period_start = _PERIOD_START_END[period]
+    starts = [process_timestamp(row.start) for row in rows]
+    means = [row.mean for row in rows]
+    mins = [row.min for row in rows]
+    maxs = [row.max for row in rows]
+
+    idx = 0
+    while idx < len(starts):
+        start, end = period_start_end(starts[idx])
+        # Index of the first row of the next period
+        next_idx = bisect_left(starts, next_period_start(start), idx)
+        period_means = [val for val in means[idx:next_idx] if val is not None]
+        period_mins = [val for val in mins[idx:next_idx] if val is not None]
+        period_maxs = [val for val in maxs[idx:next_idx] if val is not None]
+        yield (
+            start,
+            end,
+            mean(period_means) if period_means else None,
+            min(period_mins) if period_mins else None,
+            max(period_maxs) if period_maxs else None,
+            rows[next_idx - 1],
+        )
+        idx = next_idx
+
+
+def _reduce_sorted_statistics(
+    hass: HomeAssistant,
+    session: scoped_session,
+    stats: list,
+    _metadata: dict[str, tuple[int, StatisticMetaData]],
+    table: type[Statistics | StatisticsShortTerm],
+    start_time: datetime | None,
+    period: Literal["day", "month"],
+) -> dict[str, list[dict[str, Any]]]:
+    """Reduce SQL results to daily or monthly statistics.
+
+    This gives the same result as _sorted_statistics_to_dict followed by
+    _reduce_statistics_per_day or _reduce_statistics_per_month, but without
+    creating a dict per hourly row.
+    """
+    result: dict[str, list[dict[str, Any]]] = {}
+    units = hass.config.units
+    metadata = dict(_metadata.values())
+
+    stats_at_start_time = _stats_at_start_time(session, stats, table, start_time)
+
+    for meta_id, group in groupby(stats, lambda stat: stat.metadata_id):  # type: ignore
+        unit = metadata[meta_id]["unit_of_measurement"]
+        statistic_id = metadata[meta_id]["statistic_id"]
+        convert: Callable[[Any, Any], Any] = UNIT_CONVERSIONS.get(
+            unit, lambda x, units: x
+        )
+        rows = list(chain(stats_at_start_time.get(meta_id, ()), group))
+        result[statistic_id] = [
+            {
+                "statistic_id": statistic_id,
+                "start": start.isoformat(),
+                "end": end.isoformat(),
+                "mean": convert(_mean, units) if _mean is not None else None,
+                "min": convert(_min, units) if _min is not None else None,
+                "max": convert(_max, units) if _max is not None else None,
+                "last_reset": process_timestamp_to_utc_isoformat(last.last_reset),
+                "state": convert(last.state, units),
+                "sum": convert(last.sum, units),
+            }
+            for start, end, _mean, _min, _max, last in _reduce_period_rows(rows, period)
+        ]
+
+    return result
+
+
+def _is_period_start(time: datetime, period: Literal["day", "month"]) -> bool:
+    """Return True if time is the start of a local day or month."""
+    time = dt_util.as_utc(time)
+    period_start_end, _ = _PERIOD_START_END[period]
+    return bool(period_start_end(time)[0] == time)
+
+
+def _rolled_up_statistics_during_period(
+    hass: HomeAssistant,
+    session: scoped_session,
+    start_time: datetime,
+    end_time: datetime | None,
+    statistic_ids: list[str] | None,
+    metadata: dict[str, tuple[int, StatisticMetaData]],
+    metadata_ids: list[int] | None,
+    period: Literal["day", "month"],
+) -> dict[str, list[dict[str, Any]]] | None:
+    """Return daily or monthly statistics from the rolled up tables.
+
+    Returns None if the rolled up statistics can't be used: the requested
+    period does not start and end on a period boundary, or the statistics
+    were rolled up in a different time zone.
+    """
+    if not _is_period_start(start_time, period) or (
+        end_time is not None and not _is_period_start(end_time, period)
+    ):
+        return None
+
+    if period == "day":
+        bakery = STATISTICS_DAILY_BAKERY
+        base_query = QUERY_STATISTICS_DAILY
+        table: type[StatisticsDaily | StatisticsMonthly] = StatisticsDaily
+    else:
+        bakery = STATISTICS_MONTHLY_BAKERY
+        base_query = QUERY_STATISTICS_MONTHLY
+        table = StatisticsMonthly
+
+    baked_query = _statistics_during_period_query(
+        hass, end_time, statistic_ids, bakery, base_query, table
+    )
+    stats = execute(
+        baked_query(session).params(
+            start_time=start_time, end_time=end_time, metadata_ids=metadata_ids
+        )
+    )
+    if not stats:
+        return {}
+    if not all(
+        _is_period_start(process_timestamp(stat.start), period) for stat in stats
+    ):
+        return None
+    return _sorted_statistics_to_dict(
+        hass, session, stats, statistic_ids, metadata, True, table, start_time
+    )
+
+
 def statistics_during_period(
     hass: HomeAssistant,
     start_time: datetime,
@@ -931,6 +1277,20 @@ def statistics_during_period(
         if statistic_ids is not None:
             metadata_ids = [metadata_id for metadata_id, _ in metadata.values()]
 
+        if period in ("day", "month"):
+            rolled_up = _rolled_up_statistics_during_period(
+                hass,
+                session,
+                start_time,
+                end_time,
+                statistic_ids,
+                metadata,
+                metadata_ids,
+                period,
+            )
+            if rolled_up is not None:
+                return rolled_up
+
         if period == "5minute":
             bakery = STATISTICS_SHORT_TERM_BAKERY
             base_query = QUERY_STATISTICS_SHORT_TERM
@@ -965,15 +1325,10 @@ def statistics_during_period(
                 start_time_as_datetime,
             )
 
-        result = _sorted_statistics_to_dict(
-            hass, session, stats, statistic_ids, metadata, True, table, start_time, True
+        return _reduce_sorted_statistics(
+            hass, session, stats, metadata, table, start_time, period
         )
 
-        if period == "day":
-            return _reduce_statistics_per_day(result)
-
-        return _reduce_statistics_per_month(result)
-
 
 def _get_last_statistics(
     hass: HomeAssistant,
@@ -1048,13 +1403,17 @@ def get_last_short_term_statistics(
 def _statistics_at_time(
     session: scoped_session,
     metadata_ids: set[int],
-    table: type[Statistics | StatisticsShortTerm],
+    table: type[Statistics | StatisticsShortTerm | StatisticsDaily | StatisticsMonthly],
     start_time: datetime,
 ) -> list | None:
     """Return last known statics, earlier than start_time, for the metadata_ids."""
     # Fetch metadata for the given (or all) statistic_ids
     if table == StatisticsShortTerm:
         base_query = QUERY_STATISTICS_SHORT_TERM
+    elif table == StatisticsDaily:
+        base_query = QUERY_STATISTICS_DAILY
+    elif table == StatisticsMonthly:
+        base_query = QUERY_STATISTICS_MONTHLY
     else:
         base_query = QUERY_STATISTICS
 
@@ -1077,6 +1436,37 @@ def _statistics_at_time(
     return execute(query)
 
 
+def _stats_at_start_time(
+    session: scoped_session,
+    stats: list,
+    table: type[Statistics | StatisticsShortTerm | StatisticsDaily | StatisticsMonthly],
+    start_time: datetime | None,
+) -> dict[int, tuple[Any]]:
+    """Return the last known statistics before start_time.
+
+    Only metadata IDs for which no data was available at the requested start time
+    are included.
+    """
+    need_stat_at_start_time = set()
+    stats_at_start_time = {}
+
+    # Identify metadata IDs for which no data was available at the requested start time
+    for meta_id, group in groupby(stats, lambda stat: stat.metadata_id):  # type: ignore
+        first_start_time = process_timestamp(next(group).start)
+        if start_time and first_start_time > start_time:
+            need_stat_at_start_time.add(meta_id)
+
+    # Fetch last known statistics for the needed metadata IDs
+    if need_stat_at_start_time:
+        assert start_time  # Can not be None if need_stat_at_start_time is not empty
+        tmp = _statistics_at_time(session, need_stat_at_start_time, table, start_time)
+        if tmp:
+            for stat in tmp:
+                stats_at_start_time[stat.metadata_id] = (stat,)
+
+    return stats_at_start_time
+
+
 def _sorted_statistics_to_dict(
     hass: HomeAssistant,
     session: scoped_session,
@@ -1084,7 +1474,7 @@ def _sorted_statistics_to_dict(
     statistic_ids: list[str] | None,
     _metadata: dict[str, tuple[int, StatisticMetaData]],
     convert_units: bool,
-    table: type[Statistics | StatisticsShortTerm],
+    table: type[Statistics | StatisticsShortTerm | StatisticsDaily | StatisticsMonthly],
     start_time: datetime | None,
     start_time_as_datetime: bool = False,
 ) -> dict[str, list[dict]]:
@@ -1092,8 +1482,6 @@ def _sorted_statistics_to_dict(
     result: dict = defaultdict(list)
     units = hass.config.units
     metadata = dict(_metadata.values())
-    need_stat_at_start_time = set()
-    stats_at_start_time = {}
 
     def no_conversion(val: Any, _: Any) -> float | None:
         """Return x."""
@@ -1104,19 +1492,7 @@ def _sorted_statistics_to_dict(
         for stat_id in statistic_ids:
             result[stat_id] = []
 
-    # Identify metadata IDs for which no data was available at the requested start time
-    for meta_id, group in groupby(stats, lambda stat: stat.metadata_id):  # type: ignore
-        first_start_time = process_timestamp(next(group).start)
-        if start_time and first_start_time > start_time:
-            need_stat_at_start_time.add(meta_id)
-
-    # Fetch last known statistics for the needed metadata IDs
-    if need_stat_at_start_time:
-        assert start_time  # Can not be None if need_stat_at_start_time is not empty
-        tmp = _statistics_at_time(session, need_stat_at_start_time, table, start_time)
-        if tmp:
-            for stat in tmp:
-                stats_at_start_time[stat.metadata_id] = (stat,)
+    stats_at_start_time = _stats_at_start_time(session, stats, table, start_time)
 
     # Append all statistic entries, and optionally do unit conversion
     for meta_id, group in groupby(stats, lambda stat: stat.metadata_id):  # type: ignore
@@ -1130,7 +1506,12 @@ def _sorted_statistics_to_dict(
         ent_results = result[meta_id]
         for db_state in chain(stats_at_start_time.get(meta_id, ()), group):
             start = process_timestamp(db_state.start)
-            end = start + table.duration
+            if table == StatisticsDaily:
+                end = _next_day_start(start)
+            elif table == StatisticsMonthly:
+                end = _next_month_start(start)
+            else:
+                end = start + table.duration
             ent_results.append(
                 {
                     "statistic_id": statistic_id,
@@ -1257,12 +1638,19 @@ def add_external_statistics(
         exception_filter=_filter_unique_constraint_integrity_error(instance),
     ) as session:
         metadata_id = _update_or_add_metadata(instance.hass, session, metadata)
+        starts = []
         for stat in statistics:
+            starts.append(stat["start"])
             if stat_id := _statistics_exists(
                 session, Statistics, metadata_id, stat["start"]
             ):
                 _update_statistics(session, Statistics, stat_id, stat)
             else:
                 _insert_statistics(session, Statistics, metadata_id, stat)
+        if starts:
+            # Flush first, so a duplicated row fails the flush and is handled by
+            # the exception filter instead of failing the queries of the rebuild
+            session.flush()
+            _rebuild_period_statistics(session, metadata_id, min(starts), max(starts))
 
     return True
@@ -45,7 +45,7 @@ from homeassistant.const import (
     VOLUME_CUBIC_FEET,
     VOLUME_CUBIC_METERS,
 )
-from homeassistant.core import HomeAssistant, State
+from homeassistant.core import Event, HomeAssistant, State
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.entity import entity_sources
 import homeassistant.util.dt as dt_util
@@ -132,6 +132,10 @@ UNIT_CONVERSIONS: dict[str, dict[str, Callable]] = {
     },
 }
 
+# Running statistics of sensors, fed by the recorder with recorded state changes
+DATA_ACCUMULATORS = "sensor_statistics_accumulators"
+STATISTICS_PERIOD = datetime.timedelta(minutes=5)
+
 # Keep track of entities for which a warning about decreasing value has been logged
 SEEN_DIP = "sensor_seen_total_increasing_dip"
 WARN_DIP = "sensor_warn_total_increasing_dip"
@@ -232,23 +236,7 @@ def _normalize_states(
         if fstates:
             all_units = _get_units(fstates)
             if len(all_units) > 1:
-                if WARN_UNSTABLE_UNIT not in hass.data:
-                    hass.data[WARN_UNSTABLE_UNIT] = set()
-                if entity_id not in hass.data[WARN_UNSTABLE_UNIT]:
-                    hass.data[WARN_UNSTABLE_UNIT].add(entity_id)
-                    extra = ""
-                    if old_metadata := old_metadatas.get(entity_id):
-                        extra = (
-                            " and matches the unit of already compiled statistics "
-                            f"({old_metadata[1]['unit_of_measurement']})"
-                        )
-                    _LOGGER.warning(
-                        "The unit of %s is changing, got multiple %s, generation of long term "
-                        "statistics will be suppressed unless the unit is stable%s",
-                        entity_id,
-                        all_units,
-                        extra,
-                    )
+                _warn_unstable_unit(hass, old_metadatas, entity_id, all_units)
                 return None, []
             unit = fstates[0][1].attributes.get(ATTR_UNIT_OF_MEASUREMENT)
         return unit, fstates
@@ -263,16 +251,7 @@ def _normalize_states(
         unit = state.attributes.get(ATTR_UNIT_OF_MEASUREMENT)
         # Exclude unsupported units from statistics
         if unit not in UNIT_CONVERSIONS[device_class]:
-            if WARN_UNSUPPORTED_UNIT not in hass.data:
-                hass.data[WARN_UNSUPPORTED_UNIT] = set()
-            if entity_id not in hass.data[WARN_UNSUPPORTED_UNIT]:
-                hass.data[WARN_UNSUPPORTED_UNIT].add(entity_id)
-                _LOGGER.warning(
-                    "%s has unit %s which is unsupported for device_class %s",
-                    entity_id,
-                    unit,
-                    device_class,
-                )
+            _warn_unsupported_unit(hass, entity_id, unit, device_class)
             continue
 
         fstates.append((UNIT_CONVERSIONS[device_class][unit](fstate), state))
@@ -280,6 +259,68 @@ def _normalize_states(
     return DEVICE_CLASS_UNITS[device_class], fstates
 
 
+def _normalize_state(
+    hass: HomeAssistant, state: State, device_class: str | None
+) -> tuple[str | None, float] | None:
+    """Normalize the unit of a single state.
+
+    Returns None if the state can't be used for statistics.
+    """
+    try:
+        fstate = _parse_float(state.state)
+    except ValueError:
+        return None
+    unit = state.attributes.get(ATTR_UNIT_OF_MEASUREMENT)
+    if device_class not in UNIT_CONVERSIONS:
+        return unit, fstate
+    if (convert := UNIT_CONVERSIONS[device_class].get(unit)) is None:
+        _warn_unsupported_unit(hass, state.entity_id, unit, device_class)
+        return None
+    return DEVICE_CLASS_UNITS[device_class], convert(fstate)
+
+
+def _warn_unsupported_unit(
+    hass: HomeAssistant, entity_id: str, unit: str | None, device_class: str
+) -> None:
+    """Log a warning once if a sensor has a unit unsupported for its device class."""
+    if WARN_UNSUPPORTED_UNIT not in hass.data:
+        hass.data[WARN_UNSUPPORTED_UNIT] = set()
+    if entity_id not in hass.data[WARN_UNSUPPORTED_UNIT]:
+        hass.data[WARN_UNSUPPORTED_UNIT].add(entity_id)
+        _LOGGER.warning(
+            "%s has unit %s which is unsupported for device_class %s",
+            entity_id,
+            unit,
+            device_class,
+        )
+
+
+def _warn_unstable_unit(
+    hass: HomeAssistant,
+    old_metadatas: dict[str, tuple[int, StatisticMetaData]],
+    entity_id: str,
+    all_units: set[str | None],
+) -> None:
+    """Log a warning once if the unit of a sensor changed during a period."""
+    if WARN_UNSTABLE_UNIT not in hass.data:
+        hass.data[WARN_UNSTABLE_UNIT] = set()
+    if entity_id not in hass.data[WARN_UNSTABLE_UNIT]:
+        hass.data[WARN_UNSTABLE_UNIT].add(entity_id)
+        extra = ""
+        if old_metadata := old_metadatas.get(entity_id):
+            extra = (
+                " and matches the unit of already compiled statistics "
+                f"({old_metadata[1]['unit_of_measurement']})"
+            )
+        _LOGGER.warning(
+            "The unit of %s is changing, got multiple %s, generation of long term "
+            "statistics will be suppressed unless the unit is stable%s",
+            entity_id,
+            all_units,
+            extra,
+        )
+
+
 def _suggest_report_issue(hass: HomeAssistant, entity_id: str) -> str:
     """Suggest to report an issue."""
     domain = entity_sources(hass).get(entity_id, {}).get("domain")
@@ -399,6 +440,258 @@ def _last_reset_as_utc_isoformat(last_reset_s: Any, entity_id: str) -> str | Non
     return dt_util.as_utc(last_reset).isoformat()
 
 
+def _period_start(time: datetime.datetime) -> datetime.datetime:
+    """Return the start of the 5-minute statistics period containing time."""
+    return time.replace(minute=time.minute - time.minute % 5, second=0, microsecond=0)
+
+
+class _PeriodStatistics:
+    """Running statistics of a sensor during a 5-minute period."""
+
+    __slots__ = (
+        "start",
+        "first_time",
+        "last_time",
+        "last_value",
+        "last_unit",
+        "last_state",
+        "min",
+        "max",
+        "accumulated",
+        "units",
+        "fstates",
+    )
+
+    def __init__(
+        self,
+        start: datetime.datetime,
+        time: datetime.datetime,
+        fstate: float,
+        unit: str | None,
+        state: State,
+        keep_states: bool,
+    ) -> None:
+        """Initialize the statistics with the first value of the period."""
+        self.start = start
+        self.first_time = time
+        self.last_time = time
+        self.last_value = fstate
+        self.last_unit = unit
+        self.last_state = state
+        self.min = fstate
+        self.max = fstate
+        # Sum of the values weighted by their duration in seconds
+        self.accumulated = 0.0
+        self.units = {unit}
+        # The states are only kept for sensors with a sum
+        self.fstates: list[tuple[float, State]] | None = (
+            [(fstate, state)] if keep_states else None
+        )
+
+    def add(
+        self, time: datetime.datetime, fstate: float, unit: str | None, state: State
+    ) -> None:
+        """Add a value to the statistics."""
+        self.accumulated += self.last_value * (time - self.last_time).total_seconds()
+        self.last_time = time
+        self.last_value = fstate
+        self.last_unit = unit
+        self.last_state = state
+        if fstate < self.min:
+            self.min = fstate
+        elif fstate > self.max:
+            self.max = fstate
+        self.units.add(unit)
+        if self.fstates is not None:
+            self.fstates.append((fstate, state))
+
+    def mean(self, end: datetime.datetime) -> float:
+        """Return the time weighted average of the period ending at end."""
+        accumulated = (
+            self.accumulated + self.last_value * (end - self.last_time).total_seconds()
+        )
+        return accumulated / (end - self.first_time).total_seconds()
+
+    def carry_over(self, start: datetime.datetime) -> _PeriodStatistics:
+        """Return the statistics of a later period starting with the last value."""
+        return _PeriodStatistics(
+            start,
+            start,
+            self.last_value,
+            self.last_unit,
+            self.last_state,
+            self.fstates is not None,
+        )
+
+
+class _SensorAccumulator:
+    """Running statistics of a sensor for the periods which are not compiled yet.
+
+    The statistics of a period can only be taken from the accumulator if the
+    value of the sensor was known since the start of the period, otherwise
+    they are compiled from the recorded history.
+    """
+
+    __slots__ = (
+        "device_class",
+        "keep_states",
+        "tracked_since",
+        "last_state",
+        "compiled_until",
+        "periods",
+        "last_period",
+        "compiled_period",
+        "last_sum",
+    )
+
+    def __init__(self, device_class: str | None, keep_states: bool) -> None:
+        """Initialize the accumulator."""
+        self.device_class = device_class
+        self.keep_states = keep_states
+        self.tracked_since: datetime.datetime | None = None
+        self.last_state: State | None = None
+        self.compiled_until: datetime.datetime | None = None
+        self.periods: dict[datetime.datetime, _PeriodStatistics] = {}
+        # The period holding the current value of the sensor
+        self.last_period: _PeriodStatistics | None = None
+        # The last compiled period, holds the value at the end of that period
+        self.compiled_period: _PeriodStatistics | None = None
+        # The last_reset, sum and state of the last compiled period
+        self.last_sum: tuple[str | None, float, float] | None = None
+
+    def add(self, hass: HomeAssistant, state: State) -> None:
+        """Add a state of the sensor."""
+        # The state the accumulator was started from is also recorded, states
+        # of earlier state changes may still be queued in the recorder
+        if (last_state := self.last_state) is not None and (
+            state is last_state or state.last_updated < last_state.last_updated
+        ):
+            return
+        self.last_state = state
+        if (normalized := _normalize_state(hass, state, self.device_class)) is None:
+            return
+        unit, fstate = normalized
+
+        time = state.last_updated
+        if self.tracked_since is None:
+            self.tracked_since = time
+        if self.compiled_until is not None and time < self.compiled_until:
+            # A late state of an already compiled period is the value at the
+            # start of the next period
+            time = self.compiled_until
+        start = _period_start(time)
+
+        if (last_period := self.last_period) is not None and last_period.start == start:
+            last_period.add(time, fstate, unit, state)
+            return
+        if last_period is None:
+            period = _PeriodStatistics(
+                start, time, fstate, unit, state, self.keep_states
+            )
+        else:
+            period = last_period.carry_over(start)
+            period.add(time, fstate, unit, state)
+        self.periods[start] = self.last_period = period
+
+    def pop_period(
+        self, start: datetime.datetime, end: datetime.datetime
+    ) -> _PeriodStatistics | None:
+        """Return the statistics of a period and forget about earlier periods.
+
+        Returns None if the statistics have to be compiled from the recorded
+        history instead, after a restart, a gap or when compiling a period
+        again.
+        """
+        if start != _period_start(start) or end != start + STATISTICS_PERIOD:
+            # Only periods on the 5-minute grid are tracked
+            return None
+        if self.compiled_until is not None and start < self.compiled_until:
+            return None
+
+        if (period := self.periods.get(start)) is None:
+            # No state changes during the period, carry over the value of the
+            # most recent earlier period
+            previous = self.compiled_period
+            for p_start, earlier_period in self.periods.items():
+                if p_start < start:
+                    previous = earlier_period
+            if previous is not None:
+                period = previous.carry_over(start)
+
+        for p_start in [p_start for p_start in self.periods if p_start <= start]:
+            del self.periods[p_start]
+        if period is not None:
+            self.compiled_period = period
+        if self.compiled_until != start:
+            self.last_sum = None
+        self.compiled_until = end
+
+        if self.tracked_since is None or self.tracked_since > start:
+            return None
+        return period
+
+
+def _get_accumulator(
+    hass: HomeAssistant, state: State
+) -> tuple[_SensorAccumulator | None, bool]:
+    """Return the running statistics of a sensor and if they were just created.
+
+    The running statistics are replaced when the statistics of the sensor change.
+    """
+    accumulators: dict[str, _SensorAccumulator] = hass.data.setdefault(
+        DATA_ACCUMULATORS, {}
+    )
+    entity_id = state.entity_id
+    if (state_class := state.attributes.get(ATTR_STATE_CLASS)) not in STATE_CLASSES:
+        accumulators.pop(entity_id, None)
+        return None, False
+
+    device_class = state.attributes.get(ATTR_DEVICE_CLASS)
+    keep_states = "sum" in DEVICE_CLASS_STATISTICS[state_class].get(
+        device_class, DEFAULT_STATISTICS[state_class]
+    )
+    accumulator = accumulators.get(entity_id)
+    if (
+        accumulator is None
+        or accumulator.device_class != device_class
+        or accumulator.keep_states != keep_states
+    ):
+        accumulator = accumulators[entity_id] = _SensorAccumulator(
+            device_class, keep_states
+        )
+        return accumulator, True
+    return accumulator, False
+
+
+def _record_state(hass: HomeAssistant, state: State) -> None:
+    """Add a state to the running statistics of a sensor."""
+    accumulator, created = _get_accumulator(hass, state)
+    if accumulator is None:
+        return
+    if (
+        not created
+        and not accumulator.keep_states
+        and state.last_changed != state.last_updated
+    ):
+        # Like the significant history, mean, min and max only use state changes
+        return
+    accumulator.add(hass, state)
+
+
+def record_state_change(hass: HomeAssistant, event: Event) -> None:
+    """Update the running statistics of a sensor.
+
+    Called by the recorder for each recorded state change.
+    Note: This is run in the recorder thread
+    """
+    if (new_state := event.data.get("new_state")) is None:
+        hass.data.get(DATA_ACCUMULATORS, {}).pop(event.data["entity_id"], None)
+        return
+    if new_state.domain != DOMAIN:
+        return
+    _record_state(hass, new_state)
+
+
 def compile_statistics(
     hass: HomeAssistant, start: datetime.datetime, end: datetime.datetime
 ) -> list[StatisticResult]:
@@ -426,9 +719,26 @@ def _compile_statistics(  # noqa: C901
         hass, session, statistic_ids=[i.entity_id for i in sensor_states]
     )
 
-    # Get history between start and end
+    # Use the running statistics of sensors tracked since the start of the period
+    accumulators: dict[str, _SensorAccumulator] = {}
+    periods: dict[str, _PeriodStatistics] = {}
+    for _state in sensor_states:
+        accumulator, created = _get_accumulator(hass, _state)
+        if accumulator is None:
+            continue
+        if created:
+            # Only start new running statistics from the state machine, state
+            # changes of tracked sensors may still be queued behind this task
+            accumulator.add(hass, _state)
+        accumulators[_state.entity_id] = accumulator
+        if (period := accumulator.pop_period(start, end)) is not None:
+            periods[_state.entity_id] = period
+
+    # Get history between start and end for the other sensors
     entities_full_history = [
-        i.entity_id for i in sensor_states if "sum" in wanted_statistics[i.entity_id]
+        i.entity_id
+        for i in sensor_states
+        if "sum" in wanted_statistics[i.entity_id] and i.entity_id not in periods
     ]
     history_list = {}
     if entities_full_history:
@@ -443,7 +753,7 @@ def _compile_statistics(  # noqa: C901
     entities_significant_history = [
         i.entity_id
         for i in sensor_states
-        if "sum" not in wanted_statistics[i.entity_id]
+        if "sum" not in wanted_statistics[i.entity_id] and i.entity_id not in periods
     ]
     if entities_significant_history:
         _history_list = history.get_significant_states_with_session(  # type: ignore
@@ -457,22 +767,30 @@ def _compile_statistics(  # noqa: C901
     # If there are no recent state changes, the sensor's state may already be pruned
     # from the recorder. Get the state from the state machine instead.
     for _state in sensor_states:
-        if _state.entity_id not in history_list:
+        if _state.entity_id not in history_list and _state.entity_id not in periods:
             history_list[_state.entity_id] = (_state,)
 
     for _state in sensor_states:  # pylint: disable=too-many-nested-blocks
         entity_id = _state.entity_id
-        if entity_id not in history_list:
-            continue
-
         state_class = _state.attributes[ATTR_STATE_CLASS]
         device_class = _state.attributes.get(ATTR_DEVICE_CLASS)
-        entity_history = history_list[entity_id]
-        unit, fstates = _normalize_states(
-            hass, session, old_metadatas, entity_history, device_class, entity_id
-        )
 
-        if not fstates:
+        fstates: list[tuple[float, State]] = []
+        if (period := periods.get(entity_id)) is not None:
+            if len(period.units) > 1:
+                _warn_unstable_unit(hass, old_metadatas, entity_id, period.units)
+                continue
+            unit = period.last_unit
+            if period.fstates is not None:
+                fstates = period.fstates
+        elif entity_id in history_list:
+            entity_history = history_list[entity_id]
+            unit, fstates = _normalize_states(
+                hass, session, old_metadatas, entity_history, device_class, entity_id
+            )
+            if not fstates:
+                continue
+        else:
             continue
 
         # Check metadata
@@ -506,119 +824,160 @@ def _compile_statistics(  # noqa: C901
 
         # Make calculations
         stat: StatisticData = {"start": start}
-        if "max" in wanted_statistics[entity_id]:
-            stat["max"] = max(*itertools.islice(zip(*fstates), 1))  # type: ignore[typeddict-item]
-        if "min" in wanted_statistics[entity_id]:
-            stat["min"] = min(*itertools.islice(zip(*fstates), 1))  # type: ignore[typeddict-item]
-
-        if "mean" in wanted_statistics[entity_id]:
-            stat["mean"] = _time_weighted_average(fstates, start, end)
+        if period is not None:
+            if "max" in wanted_statistics[entity_id]:
+                stat["max"] = period.max
+            if "min" in wanted_statistics[entity_id]:
+                stat["min"] = period.min
+            if "mean" in wanted_statistics[entity_id]:
+                stat["mean"] = period.mean(end)
+        else:
+            if "max" in wanted_statistics[entity_id]:
+                stat["max"] = max(*itertools.islice(zip(*fstates), 1))  # type: ignore[typeddict-item]
+            if "min" in wanted_statistics[entity_id]:
+                stat["min"] = min(*itertools.islice(zip(*fstates), 1))  # type: ignore[typeddict-item]
+            if "mean" in wanted_statistics[entity_id]:
+                stat["mean"] = _time_weighted_average(fstates, start, end)
 
         if "sum" in wanted_statistics[entity_id]:
-            last_reset = old_last_reset = None
-            new_state = old_state = None
-            _sum = 0.0
-            last_stats = statistics.get_last_short_term_statistics(
-                hass, 1, entity_id, False
+            last_sum = None
+            if accumulator := accumulators.get(entity_id):
+                last_sum, accumulator.last_sum = accumulator.last_sum, None
+            if (
+                sum_result := _compile_sum(
+                    hass, entity_id, state_class, fstates, last_sum
+                )
+            ) is None:
+                continue
+            if accumulator:
+                accumulator.last_sum = sum_result
+
+            last_reset, stat["sum"], stat["state"] = sum_result
+            if last_reset is not None:
+                stat["last_reset"] = dt_util.parse_datetime(last_reset)
+
+        result.append({"meta": meta, "stat": stat})
+
+    return result
+
+
+def _compile_sum(
+    hass: HomeAssistant,
+    entity_id: str,
+    state_class: str,
+    fstates: list[tuple[float, State]],
+    last_sum: tuple[str | None, float, float] | None,
+) -> tuple[str | None, float, float] | None:
+    """Compile the sum of a sensor.
+
+    Starts from last_sum, the last_reset, sum and state of the previous period, or
+    from the last compiled statistics if not known.
+    Returns the last_reset, sum and state, or None if there are no valid updates.
+    """
+    last_reset = old_last_reset = None
+    new_state = old_state = None
+    _sum = 0.0
+    if last_sum is None:
+        last_stats = statistics.get_last_short_term_statistics(
+            hass, 1, entity_id, False
+        )
+        if entity_id in last_stats:
+            last_sum = (
+                last_stats[entity_id][0]["last_reset"],
+                last_stats[entity_id][0]["sum"] or 0.0,
+                last_stats[entity_id][0]["state"],
             )
-            if entity_id in last_stats:
-                # We have compiled history for this sensor before, use that as a starting point
-                last_reset = old_last_reset = last_stats[entity_id][0]["last_reset"]
-                new_state = old_state = last_stats[entity_id][0]["state"]
-                _sum = last_stats[entity_id][0]["sum"] or 0.0
-
-            for fstate, state in fstates:
-
-                # Deprecated, will be removed in Home Assistant 2021.11
-                if (
-                    "last_reset" not in state.attributes
-                    and state_class == STATE_CLASS_MEASUREMENT
-                ):
-                    continue
-
-                reset = False
-                if (
-                    state_class != STATE_CLASS_TOTAL_INCREASING
-                    and (
-                        last_reset := _last_reset_as_utc_isoformat(
-                            state.attributes.get("last_reset"), entity_id
-                        )
-                    )
-                    != old_last_reset
-                    and last_reset is not None
+    if last_sum is not None:
+        # We have compiled history for this sensor before, use that as a starting point
+        last_reset = old_last_reset = last_sum[0]
+        _sum = last_sum[1]
+        new_state = old_state = last_sum[2]
+
+    for fstate, state in fstates:
+
+        # Deprecated, will be removed in Home Assistant 2021.11
+        if (
+            "last_reset" not in state.attributes
+            and state_class == STATE_CLASS_MEASUREMENT
+        ):
+            continue
+
+        reset = False
+        if (
+            state_class != STATE_CLASS_TOTAL_INCREASING
+            and (
+                last_reset := _last_reset_as_utc_isoformat(
+                    state.attributes.get("last_reset"), entity_id
+                )
+            )
+            != old_last_reset
+            and last_reset is not None
+        ):
+            if old_state is None:
+                _LOGGER.info(
+                    "Compiling initial sum statistics for %s, zero point set to %s",
+                    entity_id,
+                    fstate,
+                )
+            else:
+                _LOGGER.info(
+                    "Detected new cycle for %s, last_reset set to %s (old last_reset %s)",
+                    entity_id,
+                    last_reset,
+                    old_last_reset,
+                )
+            reset = True
+        elif old_state is None and last_reset is None:
+            reset = True
+            _LOGGER.info(
+                "Compiling initial sum statistics for %s, zero point set to %s",
+                entity_id,
+                fstate,
+            )
+        elif state_class == STATE_CLASS_TOTAL_INCREASING:
+            try:
+                if old_state is None or reset_detected(
+                    hass, entity_id, fstate, new_state, state
                 ):
-                    if old_state is None:
-                        _LOGGER.info(
-                            "Compiling initial sum statistics for %s, zero point set to %s",
-                            entity_id,
-                            fstate,
-                        )
-                    else:
-                        _LOGGER.info(
-                            "Detected new cycle for %s, last_reset set to %s (old last_reset %s)",
-                            entity_id,
-                            last_reset,
-                            old_last_reset,
-                        )
-                    reset = True
-                elif old_state is None and last_reset is None:
                     reset = True
                     _LOGGER.info(
-                        "Compiling initial sum statistics for %s, zero point set to %s",
+                        "Detected new cycle for %s, value dropped from %s to %s, "
+                        "triggered by state with last_updated set to %s",
                         entity_id,
+                        new_state,
+                        state.last_updated.isoformat(),
                         fstate,
                     )
-                elif state_class == STATE_CLASS_TOTAL_INCREASING:
-                    try:
-                        if old_state is None or reset_detected(
-                            hass, entity_id, fstate, new_state, state
-                        ):
-                            reset = True
-                            _LOGGER.info(
-                                "Detected new cycle for %s, value dropped from %s to %s, "
-                                "triggered by state with last_updated set to %s",
-                                entity_id,
-                                new_state,
-                                state.last_updated.isoformat(),
-                                fstate,
-                            )
-                    except HomeAssistantError:
-                        continue
-
-                if reset:
-                    # The sensor has been reset, update the sum
-                    if old_state is not None:
-                        _sum += new_state - old_state
-                    # ..and update the starting point
-                    new_state = fstate
-                    old_last_reset = last_reset
-                    # Force a new cycle for an existing sensor to start at 0
-                    if old_state is not None:
-                        old_state = 0.0
-                    else:
-                        old_state = new_state
-                else:
-                    new_state = fstate
-
-            # Deprecated, will be removed in Home Assistant 2021.11
-            if last_reset is None and state_class == STATE_CLASS_MEASUREMENT:
-                # No valid updates
+            except HomeAssistantError:
                 continue
 
-            if new_state is None or old_state is None:
-                # No valid updates
-                continue
+        if reset:
+            # The sensor has been reset, update the sum
+            if old_state is not None:
+                _sum += new_state - old_state
+            # ..and update the starting point
+            new_state = fstate
+            old_last_reset = last_reset
+            # Force a new cycle for an existing sensor to start at 0
+            if old_state is not None:
+                old_state = 0.0
+            else:
+                old_state = new_state
+        else:
+            new_state = fstate
 
-            # Update the sum with the last state
-            _sum += new_state - old_state
-            if last_reset is not None:
-                stat["last_reset"] = dt_util.parse_datetime(last_reset)
-            stat["sum"] = _sum
-            stat["state"] = new_state
+    # Deprecated, will be removed in Home Assistant 2021.11
+    if last_reset is None and state_class == STATE_CLASS_MEASUREMENT:
+        # No valid updates
+        return None
 
-        result.append({"meta": meta, "stat": stat})
+    if new_state is None or old_state is None:
+        # No valid updates
+        return None
 
-    return result
+    # Update the sum with the last state
+    _sum += new_state - old_state
+    return last_reset, _sum, new_state
 
 
 def list_statistic_ids(hass: HomeAssistant, statistic_type: str | None = None) -> dict:
@@ -14,12 +14,14 @@ import voluptuous as vol
 from homeassistant.components import websocket_api
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers import aiohttp_client, integration_platform
+from homeassistant.helpers.singleton import singleton
 from homeassistant.helpers.typing import ConfigType
 from homeassistant.loader import bind_hass
 
 _LOGGER = logging.getLogger(__name__)
 
 DOMAIN = "system_health"
+DATA_PLATFORMS_PROCESSED = "system_health_platforms_processed"
 
 INFO_CALLBACK_TIMEOUT = 5
 
@@ -47,11 +49,22 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     hass.components.websocket_api.async_register_command(handle_info)
     hass.data.setdefault(DOMAIN, {})
 
+    return True
+
+
+@singleton(DATA_PLATFORMS_PROCESSED)
+async def async_get_registrations(
+    hass: HomeAssistant,
+) -> dict[str, SystemHealthRegistration]:
+    """Return the registrations, importing the platforms on the first call.
+
+    The system health platforms are only needed when the info is requested,
+    so they are not imported during startup.
+    """
     await integration_platform.async_process_integration_platforms(
         hass, DOMAIN, _register_system_health_platform
     )
-
-    return True
+    return hass.data[DOMAIN]
 
 
 async def _register_system_health_platform(hass, integration_domain, platform):
@@ -94,7 +107,7 @@ async def handle_info(
     hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict
 ):
     """Handle an info request via a subscription."""
-    registrations: dict[str, SystemHealthRegistration] = hass.data[DOMAIN]
+    registrations = await async_get_registrations(hass)
     data = {}
     pending_info = {}
 
@@ -3,6 +3,7 @@ from __future__ import annotations
 
 import asyncio
 from collections.abc import Callable
+from dataclasses import asdict
 import json
 from typing import Any
 
@@ -18,7 +19,12 @@ from homeassistant.exceptions import (
     TemplateError,
     Unauthorized,
 )
-from homeassistant.helpers import config_validation as cv, entity, template
+from homeassistant.helpers import (
+    config_validation as cv,
+    entity,
+    poll_scheduler,
+    template,
+)
 from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.event import (
     TrackTemplate,
@@ -27,7 +33,11 @@ from homeassistant.helpers.event import (
 )
 from homeassistant.helpers.json import ExtendedJSONEncoder
 from homeassistant.helpers.service import async_get_all_descriptions
-from homeassistant.loader import IntegrationNotFound, async_get_integration
+from homeassistant.loader import (
+    DATA_IMPORT_TIMES,
+    IntegrationNotFound,
+    async_get_integration,
+)
 from homeassistant.setup import DATA_SETUP_TIME, async_get_loaded_integrations
 
 from . import const, decorators, messages
@@ -44,6 +54,7 @@ def async_register_commands(
     async_reg(hass, handle_call_service)
     async_reg(hass, handle_entity_source)
     async_reg(hass, handle_execute_script)
+    async_reg(hass, handle_executor_statistics)
     async_reg(hass, handle_get_config)
     async_reg(hass, handle_get_services)
     async_reg(hass, handle_get_states)
@@ -51,8 +62,10 @@ def async_register_commands(
     async_reg(hass, handle_integration_setup_info)
     async_reg(hass, handle_manifest_list)
     async_reg(hass, handle_ping)
+    async_reg(hass, handle_poll_statistics)
     async_reg(hass, handle_render_template)
     async_reg(hass, handle_subscribe_bootstrap_integrations)
+    async_reg(hass, handle_subscribe_entities)
     async_reg(hass, handle_subscribe_events)
     async_reg(hass, handle_subscribe_trigger)
     async_reg(hass, handle_test_condition)
@@ -94,7 +107,9 @@ def handle_subscribe_events(
             ):
                 return
 
-            connection.send_message(messages.cached_event_message(msg["id"], event))
+            connection.send_message(
+                messages.async_cached_event_message(hass, msg["id"], event)
+            )
 
     else:
 
@@ -104,7 +119,9 @@ def handle_subscribe_events(
             if event.event_type == EVENT_TIME_CHANGED:
                 return
 
-            connection.send_message(messages.cached_event_message(msg["id"], event))
+            connection.send_message(
+                messages.async_cached_event_message(hass, msg["id"], event)
+            )
 
     connection.subscriptions[msg["id"]] = hass.bus.async_listen(
         event_type, forward_events
@@ -136,6 +153,69 @@ def handle_subscribe_bootstrap_integrations(
     connection.send_message(messages.result_message(msg["id"]))
 
 
+@callback
+@decorators.websocket_command(
+    {
+        vol.Required("type"): "subscribe_entities",
+        vol.Optional("entity_ids"): cv.entity_ids,
+    }
+)
+def handle_subscribe_entities(
+    hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Handle subscribe entities command.
+
+    Sends compressed states of the entities, then only the changes.
+    """
+    entity_ids = msg.get("entity_ids")
+    entity_perm = connection.user.permissions.check_entity
+
+    @callback
+    def forward_entity_changes(event: Event) -> None:
+        """Forward entity state changes to websocket."""
+        connection.send_message(messages.cached_state_diff_message(msg["id"], event))
+
+    @callback
+    def can_read_entity(event: Event) -> bool:
+        """Filter out entities the user cannot read before serializing."""
+        return entity_perm(event.data["entity_id"], POLICY_READ)
+
+    connection.subscriptions[msg["id"]] = hass.bus.async_listen(
+        EVENT_STATE_CHANGED,
+        forward_entity_changes,
+        event_filter=can_read_entity,
+        entity_ids=entity_ids,
+    )
+    connection.send_message(messages.result_message(msg["id"]))
+
+    if entity_ids is None:
+        states = hass.states.async_all()
+    else:
+        states = [
+            state
+            for entity_id in entity_ids
+            if (state := hass.states.get(entity_id)) is not None
+        ]
+    if not connection.user.permissions.access_all_entities(POLICY_READ):
+        states = [
+            state for state in states if entity_perm(state.entity_id, POLICY_READ)
+        ]
+
+    connection.send_message(
+        messages.message_to_json(
+            messages.event_message(
+                msg["id"],
+                {
+                    messages.ENTITY_EVENT_ADD: {
+                        state.entity_id: messages.compressed_state_dict_add(state)
+                        for state in states
+                    }
+                },
+            )
+        )
+    )
+
+
 @callback
 @decorators.websocket_command(
     {
@@ -296,15 +376,65 @@ async def handle_integration_setup_info(
     hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
 ) -> None:
     """Handle integrations command."""
+    import_times = hass.data.get(DATA_IMPORT_TIMES, {})
     connection.send_result(
         msg["id"],
         [
-            {"domain": integration, "seconds": timedelta.total_seconds()}
+            {
+                "domain": integration,
+                "seconds": timedelta.total_seconds(),
+                "imports": import_times.get(integration, []),
+            }
             for integration, timedelta in hass.data[DATA_SETUP_TIME].items()
         ],
     )
 
 
+@callback
+@decorators.websocket_command({vol.Required("type"): "executor/statistics"})
+@decorators.require_admin
+def handle_executor_statistics(
+    hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Handle executor statistics command."""
+    connection.send_result(
+        msg["id"],
+        [
+            {
+                "executor": name,
+                "max_workers": executor.max_workers,
+                "queued_jobs": executor.queued_jobs,
+                "jobs": [
+                    {"owner": owner, **asdict(stats)}
+                    for owner, stats in executor.job_statistics().items()
+                ],
+            }
+            for name, executor in hass.async_get_executors().items()
+        ],
+    )
+
+
+@callback
+@decorators.websocket_command({vol.Required("type"): "poll/statistics"})
+@decorators.require_admin
+def handle_poll_statistics(
+    hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Handle poll statistics command."""
+    statistics = poll_scheduler.async_get(hass).async_get_statistics()
+    connection.send_result(
+        msg["id"],
+        [
+            {
+                "entity_id": entity_id,
+                **asdict(stats),
+                "mean_duration": stats.mean_duration,
+            }
+            for entity_id, stats in statistics.items()
+        ],
+    )
+
+
 @callback
 @decorators.websocket_command({vol.Required("type"): "ping"})
 def handle_ping(
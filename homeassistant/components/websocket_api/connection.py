@@ -24,7 +24,7 @@ class ActiveConnection:
         self,
         logger: WebSocketAdapter,
         hass: HomeAssistant,
-        send_message: Callable[[str | dict[str, Any]], None],
+        send_message: Callable[[str | dict[str, Any] | asyncio.Future[str]], None],
         user: User,
         refresh_token: RefreshToken,
     ) -> None:
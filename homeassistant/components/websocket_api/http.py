@@ -76,6 +76,15 @@ class WebSocketHandler:
                 if (message := await self._to_write.get()) is None:
                     break
 
+                # Events encoded in the executor are queued as futures
+                # to keep the order of the messages
+                if isinstance(message, asyncio.Future):
+                    try:
+                        message = await message
+                    except Exception:  # pylint: disable=broad-except
+                        self._logger.exception("Error encoding message")
+                        continue
+
                 self._logger.debug("Sending %s", message)
                 await self.wsock.send_str(message)
 
@@ -85,14 +94,16 @@ class WebSocketHandler:
             self._peak_checker_unsub = None
 
     @callback
-    def _send_message(self, message: str | dict[str, Any]) -> None:
+    def _send_message(
+        self, message: str | dict[str, Any] | asyncio.Future[str]
+    ) -> None:
         """Send a message to the client.
 
         Closes connection if the client is not reading the messages.
 
         Async friendly.
         """
-        if not isinstance(message, str):
+        if isinstance(message, dict):
             message = message_to_json(message)
 
         try:
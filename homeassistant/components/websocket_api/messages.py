@@ -1,13 +1,14 @@
 """Message templates for websocket commands."""
 from __future__ import annotations
 
+import asyncio
 from functools import lru_cache
 import logging
 from typing import Any, Final
 
 import voluptuous as vol
 
-from homeassistant.core import Event
+from homeassistant.core import Event, HomeAssistant, State, callback
 from homeassistant.helpers import config_validation as cv
 from homeassistant.util.json import (
     find_paths_unserializable_data,
@@ -28,8 +29,27 @@ MINIMAL_MESSAGE_SCHEMA: Final = vol.Schema(
 # Base schema to extend by message handlers
 BASE_COMMAND_MESSAGE_SCHEMA: Final = vol.Schema({vol.Required("id"): cv.positive_int})
 
-IDEN_TEMPLATE: Final = "__IDEN__"
-IDEN_JSON_TEMPLATE: Final = '"__IDEN__"'
+# Entities whose last event encoded larger than LARGE_EVENT_SIZE
+DATA_LARGE_EVENT_ENTITIES: Final = f"{const.DOMAIN}.large_event_entities"
+# Shared executor encodes of events in progress
+DATA_PENDING_EVENT_ENCODES: Final = f"{const.DOMAIN}.pending_event_encodes"
+
+LARGE_EVENT_SIZE: Final = 32768
+
+# Keys of the compressed states sent by subscribe_entities
+COMPRESSED_STATE_STATE: Final = "s"
+COMPRESSED_STATE_ATTRIBUTES: Final = "a"
+COMPRESSED_STATE_CONTEXT: Final = "c"
+COMPRESSED_STATE_LAST_CHANGED: Final = "lc"
+COMPRESSED_STATE_LAST_UPDATED: Final = "lu"
+
+# Keys of the entity events sent by subscribe_entities
+ENTITY_EVENT_ADD: Final = "a"
+ENTITY_EVENT_REMOVE: Final = "r"
+ENTITY_EVENT_CHANGE: Final = "c"
+
+STATE_DIFF_ADDITIONS: Final = "+"
+STATE_DIFF_REMOVALS: Final = "-"
 
 
 def result_message(iden: int, result: Any = None) -> dict[str, Any]:
@@ -61,32 +81,187 @@ def cached_event_message(iden: int, event: Event) -> str:
     all getting many of the same events (mostly state changed)
     we can avoid serializing the same data for each connection.
     """
-    return _cached_event_message(event).replace(IDEN_JSON_TEMPLATE, str(iden), 1)
+    return _event_message_with_iden(iden, _cached_event_message(event))
+
+
+@callback
+def async_cached_event_message(
+    hass: HomeAssistant, iden: int, event: Event
+) -> str | asyncio.Future[str]:
+    """Return an event message, encoding large events in the executor.
+
+    Events of entities whose previous event encoded to more than
+    LARGE_EVENT_SIZE are encoded in the executor. A future is returned for
+    those, all connections share the same encode.
+    """
+    if (entity_id := event.data.get("entity_id")) not in hass.data.get(
+        DATA_LARGE_EVENT_ENTITIES, ()
+    ):
+        body = _cached_event_message(event)
+        if entity_id is not None and body is not None and len(body) > LARGE_EVENT_SIZE:
+            hass.data.setdefault(DATA_LARGE_EVENT_ENTITIES, set()).add(entity_id)
+        return _event_message_with_iden(iden, body)
+
+    pending: dict[Event, asyncio.Future[str | None]] = hass.data.setdefault(
+        DATA_PENDING_EVENT_ENCODES, {}
+    )
+    if (encode := pending.get(event)) is None:
+        encode = pending[event] = hass.async_add_executor_job(
+            _cached_event_message, event
+        )
+
+        @callback
+        def _encode_done(encode: asyncio.Future[str | None]) -> None:
+            """Stop offloading once the entity produces small events again."""
+            del pending[event]
+            if encode.cancelled() or encode.exception() is not None:
+                return
+            if (body := encode.result()) is None or len(body) <= LARGE_EVENT_SIZE:
+                hass.data[DATA_LARGE_EVENT_ENTITIES].discard(entity_id)
+
+        encode.add_done_callback(_encode_done)
+
+    message: asyncio.Future[str] = hass.loop.create_future()
+
+    @callback
+    def _set_message(encode: asyncio.Future[str | None]) -> None:
+        """Splice the encoded event with the subscription id."""
+        if message.cancelled():
+            return
+        if encode.cancelled():
+            message.cancel()
+        elif (err := encode.exception()) is not None:
+            message.set_exception(err)
+        else:
+            message.set_result(_event_message_with_iden(iden, encode.result()))
+
+    encode.add_done_callback(_set_message)
+    return message
 
 
 @lru_cache(maxsize=128)
-def _cached_event_message(event: Event) -> str:
+def _cached_event_message(event: Event) -> str | None:
     """Cache and serialize the event to json.
 
-    The IDEN_TEMPLATE is used which will be replaced
-    with the actual iden in cached_event_message
+    Only the event is serialized, it is spliced into the message
+    with the subscription id by _event_message_with_iden.
     """
-    return message_to_json(event_message(IDEN_TEMPLATE, event))
+    return _payload_to_json(event)
+
+
+def _event_message_with_iden(iden: int, body: str | None) -> str:
+    """Return an event message from an event serialized to json."""
+    if body is None:
+        return message_to_json(
+            error_message(iden, const.ERR_UNKNOWN_ERROR, "Invalid JSON in response")
+        )
+    return f'{{"id":{iden},"type":"event","event":{body}}}'
+
+
+def cached_state_diff_message(iden: int, event: Event) -> str:
+    """Return an entity event message for a state_changed event.
+
+    Serialize to json once per message, like cached_event_message.
+    """
+    return _event_message_with_iden(iden, _cached_state_diff_message(event))
+
+
+@lru_cache(maxsize=128)
+def _cached_state_diff_message(event: Event) -> str | None:
+    """Cache and serialize the state diff of the event to json."""
+    return _payload_to_json(_state_diff_event(event))
+
+
+def _state_diff_event(event: Event) -> dict[str, Any]:
+    """Convert a state_changed event to an entity event."""
+    entity_id = event.data["entity_id"]
+    if (new_state := event.data["new_state"]) is None:
+        return {ENTITY_EVENT_REMOVE: [entity_id]}
+    if (old_state := event.data["old_state"]) is None:
+        return {ENTITY_EVENT_ADD: {entity_id: compressed_state_dict_add(new_state)}}
+    return {ENTITY_EVENT_CHANGE: {entity_id: _state_diff(old_state, new_state)}}
+
+
+def _compressed_context(state: State) -> str | dict[str, Any]:
+    """Return the context id, or the whole context if it has more than an id."""
+    context = state.context
+    if context.parent_id is None and context.user_id is None:
+        return context.id
+    return context.as_dict()
+
+
+def compressed_state_dict_add(state: State) -> dict[str, Any]:
+    """Return a compressed state with epoch timestamps.
+
+    last_changed is left out when it equals last_updated.
+    """
+    compressed = {
+        COMPRESSED_STATE_STATE: state.state,
+        COMPRESSED_STATE_ATTRIBUTES: dict(state.attributes),
+        COMPRESSED_STATE_CONTEXT: _compressed_context(state),
+        COMPRESSED_STATE_LAST_UPDATED: state.last_updated.timestamp(),
+    }
+    if state.last_changed != state.last_updated:
+        compressed[COMPRESSED_STATE_LAST_CHANGED] = state.last_changed.timestamp()
+    return compressed
+
+
+def _state_diff(old_state: State, new_state: State) -> dict[str, Any]:
+    """Return the changes between two states.
+
+    A changed last_changed is sent as lc and implies last_updated has the same
+    value, otherwise a changed last_updated is sent as lu.
+    """
+    additions: dict[str, Any] = {}
+    diff: dict[str, Any] = {STATE_DIFF_ADDITIONS: additions}
+    if old_state.state != new_state.state:
+        additions[COMPRESSED_STATE_STATE] = new_state.state
+    if old_state.last_changed != new_state.last_changed:
+        additions[COMPRESSED_STATE_LAST_CHANGED] = new_state.last_changed.timestamp()
+    elif old_state.last_updated != new_state.last_updated:
+        additions[COMPRESSED_STATE_LAST_UPDATED] = new_state.last_updated.timestamp()
+    if old_state.context.id != new_state.context.id:
+        additions[COMPRESSED_STATE_CONTEXT] = _compressed_context(new_state)
+
+    old_attributes = old_state.attributes
+    new_attributes = new_state.attributes
+    if old_attributes is new_attributes:
+        return diff
+
+    changed_attributes = {
+        key: value
+        for key, value in new_attributes.items()
+        if key not in old_attributes or old_attributes[key] != value
+    }
+    if changed_attributes:
+        additions[COMPRESSED_STATE_ATTRIBUTES] = changed_attributes
+    if removed_attributes := [
+        key for key in old_attributes if key not in new_attributes
+    ]:
+        diff[STATE_DIFF_REMOVALS] = {COMPRESSED_STATE_ATTRIBUTES: removed_attributes}
+    return diff
 
 
 def message_to_json(message: dict[str, Any]) -> str:
     """Serialize a websocket message to json."""
+    if (json_str := _payload_to_json(message)) is not None:
+        return json_str
+    return const.JSON_DUMP(
+        error_message(
+            message["id"], const.ERR_UNKNOWN_ERROR, "Invalid JSON in response"
+        )
+    )
+
+
+def _payload_to_json(payload: Any) -> str | None:
+    """Serialize to json, log and return None if it is not serializable."""
     try:
-        return const.JSON_DUMP(message)
+        return const.JSON_DUMP(payload)
     except (ValueError, TypeError):
         _LOGGER.error(
             "Unable to serialize to JSON. Bad data found at %s",
             format_unserializable_data(
-                find_paths_unserializable_data(message, dump=const.JSON_DUMP)
+                find_paths_unserializable_data(payload, dump=const.JSON_DUMP)
             ),
         )
-        return const.JSON_DUMP(
-            error_message(
-                message["id"], const.ERR_UNKNOWN_ERROR, "Invalid JSON in response"
-            )
-        )
+        return None
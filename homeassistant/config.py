@@ -34,6 +34,7 @@ from homeassistant.const import (
     CONF_CUSTOMIZE_DOMAIN,
     CONF_CUSTOMIZE_GLOB,
     CONF_ELEVATION,
+    CONF_EXECUTOR_POOLS,
     CONF_EXTERNAL_URL,
     CONF_ID,
     CONF_INTERNAL_URL,
@@ -65,7 +66,7 @@ from homeassistant.requirements import (
 )
 from homeassistant.util.package import is_docker_env
 from homeassistant.util.unit_system import IMPERIAL_SYSTEM, METRIC_SYSTEM
-from homeassistant.util.yaml import SECRET_YAML, Secrets, load_yaml
+from homeassistant.util.yaml import SECRET_YAML, Secrets, YamlCache, load_yaml
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -76,6 +77,7 @@ YAML_CONFIG_FILE = "configuration.yaml"
 VERSION_FILE = ".HA_VERSION"
 CONFIG_DIR_NAME = ".homeassistant"
 DATA_CUSTOMIZE = "hass_customize"
+DATA_YAML_CACHE = "yaml_cache"
 
 GROUP_CONFIG_PATH = "groups.yaml"
 AUTOMATION_CONFIG_PATH = "automations.yaml"
@@ -256,6 +258,9 @@ CORE_CONFIG_SCHEMA = vol.All(
             # pylint: disable=no-value-for-parameter
             vol.Optional(CONF_MEDIA_DIRS): cv.schema_with_slug_keys(vol.IsDir()),
             vol.Optional(CONF_LEGACY_TEMPLATES): cv.boolean,
+            vol.Optional(CONF_EXECUTOR_POOLS): {
+                cv.slug: vol.All(vol.Coerce(int), vol.Range(min=1))
+            },
             vol.Optional(CONF_CURRENCY): cv.currency,
         }
     ),
@@ -359,6 +364,7 @@ async def async_hass_config_yaml(hass: HomeAssistant) -> dict:
         load_yaml_config_file,
         hass.config.path(YAML_CONFIG_FILE),
         secrets,
+        hass.data.setdefault(DATA_YAML_CACHE, YamlCache()),
     )
     core_config = config.get(CONF_CORE, {})
     await merge_packages_config(hass, config, core_config.get(CONF_PACKAGES, {}))
@@ -366,15 +372,18 @@ async def async_hass_config_yaml(hass: HomeAssistant) -> dict:
 
 
 def load_yaml_config_file(
-    config_path: str, secrets: Secrets | None = None
+    config_path: str, secrets: Secrets | None = None, cache: YamlCache | None = None
 ) -> dict[Any, Any]:
     """Parse a YAML configuration file.
 
     Raises FileNotFoundError or HomeAssistantError.
 
+    Files that did not change since they were parsed into the cache are
+    not parsed again.
+
     This method needs to run in an executor.
     """
-    conf_dict = load_yaml(config_path, secrets)
+    conf_dict = load_yaml(config_path, secrets, cache)
 
     if not isinstance(conf_dict, dict):
         msg = (
@@ -553,6 +562,7 @@ async def async_process_ha_core_config(hass: HomeAssistant, config: dict) -> Non
         (CONF_EXTERNAL_URL, "external_url"),
         (CONF_MEDIA_DIRS, "media_dirs"),
         (CONF_LEGACY_TEMPLATES, "legacy_templates"),
+        (CONF_EXECUTOR_POOLS, "executor_pools"),
         (CONF_CURRENCY, "currency"),
     ):
         if key in config:
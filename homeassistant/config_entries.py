@@ -32,6 +32,7 @@ from homeassistant.helpers.typing import (
 )
 from homeassistant.setup import async_process_deps_reqs, async_setup_component
 from homeassistant.util.decorator import Registry
+from homeassistant.util.executor import current_job_owner
 import homeassistant.util.uuid as uuid_util
 
 if TYPE_CHECKING:
@@ -285,6 +286,7 @@ class ConfigEntry:
     ) -> None:
         """Set up an entry."""
         current_entry.set(self)
+        current_job_owner.set(self.domain)
         if self.source == SOURCE_IGNORE or self.disabled_by:
             return
 
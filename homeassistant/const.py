@@ -148,6 +148,7 @@ CONF_EVENT: Final = "event"
 CONF_EVENT_DATA: Final = "event_data"
 CONF_EVENT_DATA_TEMPLATE: Final = "event_data_template"
 CONF_EXCLUDE: Final = "exclude"
+CONF_EXECUTOR_POOLS: Final = "executor_pools"
 CONF_EXTERNAL_URL: Final = "external_url"
 CONF_FILENAME: Final = "filename"
 CONF_FILE_PATH: Final = "file_path"
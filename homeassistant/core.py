@@ -28,6 +28,7 @@ import yarl
 from homeassistant import async_timeout_backcompat, block_async_io, loader, util
 from homeassistant.const import (
     ATTR_DOMAIN,
+    ATTR_ENTITY_ID,
     ATTR_FRIENDLY_NAME,
     ATTR_NOW,
     ATTR_SECONDS,
@@ -67,6 +68,11 @@ from homeassistant.util.async_ import (
     shutdown_run_callback_threadsafe,
 )
 import homeassistant.util.dt as dt_util
+from homeassistant.util.executor import (
+    InterruptibleThreadPoolExecutor,
+    current_job_owner,
+    job_owner,
+)
 from homeassistant.util.timeout import TimeoutManager
 from homeassistant.util.unit_system import IMPERIAL_SYSTEM, METRIC_SYSTEM, UnitSystem
 import homeassistant.util.uuid as uuid_util
@@ -111,6 +117,9 @@ SOURCE_YAML = "yaml"
 # How long to wait until things that run on startup have to finish.
 TIMEOUT_EVENT_START = 15
 
+# Events which are not dispatched to MATCH_ALL listeners
+_MATCH_ALL_EXCLUDED_EVENTS = (EVENT_HOMEASSISTANT_CLOSE, EVENT_TIME_CHANGED)
+
 _LOGGER = logging.getLogger(__name__)
 
 
@@ -233,6 +242,8 @@ class HomeAssistant:
         self._stopped: asyncio.Event | None = None
         # Timeout handler for Core/Helper namespace
         self.timeout: TimeoutManager = TimeoutManager()
+        # Dedicated executors of integrations, see Config.executor_pools
+        self._integration_executors: dict[str, InterruptibleThreadPoolExecutor] = {}
 
     @property
     def is_running(self) -> bool:
@@ -372,7 +383,7 @@ class HomeAssistant:
             return None
         else:
             task = self.loop.run_in_executor(  # type: ignore
-                None, hassjob.target, *args
+                self._async_get_executor(hassjob.target), hassjob.target, *args
             )
 
         # If a task is scheduled
@@ -403,12 +414,45 @@ class HomeAssistant:
 
         return task
 
+    @callback
+    def _async_get_executor(
+        self, target: Callable[..., Any]
+    ) -> InterruptibleThreadPoolExecutor | None:
+        """Return the executor to run a job in, None for the default executor."""
+        if not (executor_pools := self.config.executor_pools):
+            return None
+        owner = job_owner(target)
+        if (max_workers := executor_pools.get(owner)) is None:
+            return None
+        if (executor := self._integration_executors.get(owner)) is None:
+            executor = InterruptibleThreadPoolExecutor(
+                thread_name_prefix=f"SyncWorker_{owner}", max_workers=max_workers
+            )
+            self._integration_executors[owner] = executor
+        return executor
+
+    @callback
+    def async_get_executors(self) -> dict[str, InterruptibleThreadPoolExecutor]:
+        """Return the instrumented executors by name.
+
+        The default executor is named default, the executors of integrations
+        are named after their domain.
+        """
+        executors = {}
+        default_executor = self.loop._default_executor  # type: ignore[attr-defined] # pylint: disable=protected-access
+        if isinstance(default_executor, InterruptibleThreadPoolExecutor):
+            executors["default"] = default_executor
+        executors.update(self._integration_executors)
+        return executors
+
     @callback
     def async_add_executor_job(
         self, target: Callable[..., T], *args: Any
     ) -> Awaitable[T]:
         """Add an executor job from within the event loop."""
-        task = self.loop.run_in_executor(None, target, *args)
+        task = self.loop.run_in_executor(
+            self._async_get_executor(target), target, *args
+        )
 
         # If a task is scheduled
         if self._track_task:
@@ -575,6 +619,15 @@ class HomeAssistant:
                 "Timed out waiting for shutdown stage 3 to complete, the shutdown will continue"
             )
 
+        if self._integration_executors:
+            await asyncio.gather(
+                *(
+                    self.loop.run_in_executor(None, executor.shutdown)
+                    for executor in self._integration_executors.values()
+                )
+            )
+            self._integration_executors.clear()
+
         self.exit_code = exit_code
         self.state = CoreState.stopped
 
@@ -669,6 +722,19 @@ class EventBus:
     def __init__(self, hass: HomeAssistant) -> None:
         """Initialize a new event bus."""
         self._listeners: dict[str, list[tuple[HassJob, Callable | None]]] = {}
+        # Copy-on-write dispatch tuples per event type with the MATCH_ALL
+        # listeners merged in. Event types without their own listeners are
+        # dispatched to _match_all_listeners.
+        self._dispatch: dict[str, tuple[tuple[HassJob, Callable | None], ...]] = {
+            event_type: () for event_type in _MATCH_ALL_EXCLUDED_EVENTS
+        }
+        self._match_all_listeners: tuple[tuple[HassJob, Callable | None], ...] = ()
+        # Listeners indexed by event type and the entity_id in the event data,
+        # these replace an event filter matching on the entity_id with one
+        # dict lookup per fired event.
+        self._entity_id_listeners: dict[
+            str, dict[str, tuple[tuple[HassJob, Callable | None], ...]]
+        ] = {}
         self._hass = hass
 
     @callback
@@ -677,7 +743,23 @@ class EventBus:
 
         This method must be run in the event loop.
         """
-        return {key: len(listeners) for key, listeners in self._listeners.items()}
+        listeners = {key: len(listeners) for key, listeners in self._listeners.items()}
+        for event_type, entity_id_listeners in self._entity_id_listeners.items():
+            # A listener indexed by several entity_ids is counted once
+            listeners[event_type] = listeners.get(event_type, 0) + len(
+                {job for jobs in entity_id_listeners.values() for job in jobs}
+            )
+        return listeners
+
+    @callback
+    def async_has_listeners(self, event_type: str) -> bool:
+        """Return if there are listeners for an event type.
+
+        MATCH_ALL listeners are not counted.
+
+        This method must be run in the event loop.
+        """
+        return event_type in self._listeners or event_type in self._entity_id_listeners
 
     @property
     def listeners(self) -> dict[str, int]:
@@ -714,20 +796,24 @@ class EventBus:
                 event_type, "event_type", MAX_LENGTH_EVENT_EVENT_TYPE
             )
 
-        listeners = self._listeners.get(event_type, [])
-
-        # EVENT_HOMEASSISTANT_CLOSE should go only to his listeners
-        match_all_listeners = self._listeners.get(MATCH_ALL)
-        if match_all_listeners is not None and event_type != EVENT_HOMEASSISTANT_CLOSE:
-            listeners = match_all_listeners + listeners
+        # EVENT_HOMEASSISTANT_CLOSE and EVENT_TIME_CHANGED should go only to
+        # their own listeners, they always have an entry in the dispatch table
+        listeners = self._dispatch.get(event_type, self._match_all_listeners)
 
         event = Event(event_type, event_data, origin, time_fired, context)
 
         if event_type != EVENT_TIME_CHANGED:
             _LOGGER.debug("Bus:Handling %s", event)
 
-        if not listeners:
-            return
+        if (
+            entity_id_listeners := self._entity_id_listeners.get(event_type)
+        ) is not None and isinstance(entity_id := event.data.get(ATTR_ENTITY_ID), str):
+            if entity_id in entity_id_listeners:
+                # Looked up again when run, so listeners added or removed by
+                # a listener of an earlier event apply to this event as well
+                self._hass.loop.call_soon(
+                    self._async_run_entity_id_listeners, event, entity_id
+                )
 
         for job, event_filter in listeners:
             if event_filter is not None:
@@ -739,6 +825,39 @@ class EventBus:
                     continue
             self._hass.async_add_hass_job(job, event)
 
+    @callback
+    def _async_run_entity_id_listeners(self, event: Event, entity_id: str) -> None:
+        """Run the jobs indexed by the entity_id of an event."""
+        if (
+            entity_id_listeners := self._entity_id_listeners.get(event.event_type)
+        ) is None:
+            return
+        for job, event_filter in entity_id_listeners.get(entity_id, ()):
+            try:
+                if event_filter is not None and not event_filter(event):
+                    continue
+                self._hass.async_run_hass_job(job, event)
+            except Exception:  # pylint: disable=broad-except
+                _LOGGER.exception("Error running job for %s", entity_id)
+
+    @callback
+    def _async_rebuild_dispatch(self, event_type: str) -> None:
+        """Rebuild the dispatch tuples after the listeners of event_type changed."""
+        if event_type == MATCH_ALL:
+            self._match_all_listeners = tuple(self._listeners.get(MATCH_ALL, ()))
+            for other_event_type in list(self._dispatch):
+                if other_event_type not in _MATCH_ALL_EXCLUDED_EVENTS:
+                    self._async_rebuild_dispatch(other_event_type)
+            return
+
+        listeners = self._listeners.get(event_type)
+        if event_type in _MATCH_ALL_EXCLUDED_EVENTS:
+            self._dispatch[event_type] = tuple(listeners or ())
+        elif listeners:
+            self._dispatch[event_type] = self._match_all_listeners + tuple(listeners)
+        else:
+            self._dispatch.pop(event_type, None)
+
     def listen(self, event_type: str, listener: Callable) -> CALLBACK_TYPE:
         """Listen for all events or events of a specific type.
 
@@ -761,6 +880,7 @@ class EventBus:
         event_type: str,
         listener: Callable,
         event_filter: Callable | None = None,
+        entity_ids: Iterable[str] | None = None,
     ) -> CALLBACK_TYPE:
         """Listen for all events or events of a specific type.
 
@@ -771,19 +891,44 @@ class EventBus:
         @callback that returns a boolean value, determines if the
         listener callable should run.
 
+        If entity_ids is passed, the listener only runs for events which have
+        one of entity_ids as entity_id in their data. These listeners are
+        looked up by entity_id, which is faster than an event_filter when
+        there are many of them. Not supported for ``MATCH_ALL``.
+
         This method must be run in the event loop.
         """
         if event_filter is not None and not is_callback(event_filter):
             raise HomeAssistantError(f"Event filter {event_filter} is not a callback")
         return self._async_listen_filterable_job(
-            event_type, (HassJob(listener), event_filter)
+            event_type, (HassJob(listener), event_filter), entity_ids
         )
 
     @callback
     def _async_listen_filterable_job(
-        self, event_type: str, filterable_job: tuple[HassJob, Callable | None]
+        self,
+        event_type: str,
+        filterable_job: tuple[HassJob, Callable | None],
+        entity_ids: Iterable[str] | None = None,
     ) -> CALLBACK_TYPE:
+        """Listen for events with an optional filter.
+
+        If entity_ids is passed, the job only runs for events of event_type
+        which have one of entity_ids as entity_id in their data. The bus
+        indexes these jobs by entity_id so a fired event only looks up the
+        jobs for its own entity_id instead of running a filter for each job.
+        """
+        if entity_ids is not None:
+            if event_type == MATCH_ALL:
+                raise HomeAssistantError(
+                    "Listening for entity_ids is not supported for MATCH_ALL"
+                )
+            return self._async_listen_entity_ids_job(
+                event_type, filterable_job, list(entity_ids)
+            )
+
         self._listeners.setdefault(event_type, []).append(filterable_job)
+        self._async_rebuild_dispatch(event_type)
 
         def remove_listener() -> None:
             """Remove the listener."""
@@ -791,6 +936,40 @@ class EventBus:
 
         return remove_listener
 
+    @callback
+    def _async_listen_entity_ids_job(
+        self,
+        event_type: str,
+        filterable_job: tuple[HassJob, Callable | None],
+        entity_ids: list[str],
+    ) -> CALLBACK_TYPE:
+        """Index a job by the entity_ids it listens for."""
+        entity_id_listeners = self._entity_id_listeners.setdefault(event_type, {})
+        for entity_id in entity_ids:
+            entity_id_listeners[entity_id] = entity_id_listeners.get(entity_id, ()) + (
+                filterable_job,
+            )
+
+        removed = False
+
+        def remove_listener() -> None:
+            """Remove the listener, removing it again does nothing."""
+            nonlocal removed
+            if removed:
+                return
+            removed = True
+            for entity_id in entity_ids:
+                jobs = list(entity_id_listeners[entity_id])
+                jobs.remove(filterable_job)
+                if jobs:
+                    entity_id_listeners[entity_id] = tuple(jobs)
+                else:
+                    del entity_id_listeners[entity_id]
+            if not entity_id_listeners:
+                del self._entity_id_listeners[event_type]
+
+        return remove_listener
+
     def listen_once(
         self, event_type: str, listener: Callable[[Event], None]
     ) -> CALLBACK_TYPE:
@@ -862,6 +1041,7 @@ class EventBus:
             # delete event_type list if empty
             if not self._listeners[event_type]:
                 self._listeners.pop(event_type)
+            self._async_rebuild_dispatch(event_type)
         except (KeyError, ValueError):
             # KeyError is key event_type listener did not exist
             # ValueError if listener did not exist within event_type
@@ -922,7 +1102,13 @@ class State:
 
         self.entity_id = entity_id.lower()
         self.state = state
-        self.attributes = MappingProxyType(attributes or {})
+        # Read only attributes are kept so writers passing the attributes
+        # of the previous state allow skipping the comparison.
+        self.attributes = (
+            attributes
+            if isinstance(attributes, MappingProxyType)
+            else MappingProxyType(attributes or {})
+        )
         self.last_updated = last_updated or dt_util.utcnow()
         self.last_changed = last_changed or self.last_updated
         self.context = context or Context()
@@ -1214,7 +1400,9 @@ class StateMachine:
             last_changed = None
         else:
             same_state = old_state.state == new_state and not force_update
-            same_attr = old_state.attributes == MappingProxyType(attributes)
+            same_attr = attributes is old_state.attributes or (
+                old_state.attributes == MappingProxyType(attributes)
+            )
             last_changed = old_state.last_changed if same_state else None
 
         if same_state and same_attr:
@@ -1532,6 +1720,7 @@ class ServiceRegistry:
         self, handler: Service, service_call: ServiceCall
     ) -> None:
         """Execute a service."""
+        current_job_owner.set(service_call.domain)
         if handler.job.job_type == HassJobType.Coroutinefunction:
             await handler.job.target(service_call)
         elif handler.job.job_type == HassJobType.Callback:
@@ -1586,6 +1775,9 @@ class Config:
         # Use legacy template behavior
         self.legacy_templates: bool = False
 
+        # Maximum worker threads of integrations with a dedicated executor
+        self.executor_pools: dict[str, int] = {}
+
     def distance(self, lat: float, lon: float) -> float | None:
         """Calculate distance from Home Assistant.
 
@@ -1792,9 +1984,16 @@ def _async_create_timer(hass: HomeAssistant) -> None:
         """Fire next time event."""
         now = dt_util.utcnow()
 
-        hass.bus.async_fire(
-            EVENT_TIME_CHANGED, {ATTR_NOW: now}, time_fired=now, context=timer_context
-        )
+        # The tick is opt-in, time based callbacks are run by the scheduler
+        # in helpers.event. Only listeners subscribed to EVENT_TIME_CHANGED
+        # itself receive it, MATCH_ALL listeners do not.
+        if hass.bus.async_has_listeners(EVENT_TIME_CHANGED):
+            hass.bus.async_fire(
+                EVENT_TIME_CHANGED,
+                {ATTR_NOW: now},
+                time_fired=now,
+                context=timer_context,
+            )
 
         # If we are more than a second late, a tick was missed
         if (late := monotonic() - target) > 1:
@@ -4,7 +4,7 @@ from __future__ import annotations
 from collections import OrderedDict
 import logging
 import time
-from typing import TYPE_CHECKING, Any, NamedTuple, cast
+from typing import TYPE_CHECKING, Any, Literal, NamedTuple, cast
 
 import attr
 
@@ -213,6 +213,8 @@ class DeviceRegistry:
     deleted_devices: dict[str, DeletedDeviceEntry]
     _registered_index: _DeviceIndex
     _deleted_index: _DeviceIndex
+    _area_id_index: dict[str, dict[str, Literal[True]]]
+    _config_entry_id_index: dict[str, dict[str, Literal[True]]]
 
     def __init__(self, hass: HomeAssistant) -> None:
         """Initialize the device registry."""
@@ -245,6 +247,25 @@ class DeviceRegistry:
             return None
         return self.devices[device_id]
 
+    @callback
+    def async_get_devices_for_area_id(self, area_id: str) -> list[DeviceEntry]:
+        """Get devices in an area."""
+        devices = self.devices
+        return [
+            devices[device_id] for device_id in self._area_id_index.get(area_id, ())
+        ]
+
+    @callback
+    def async_get_devices_for_config_entry_id(
+        self, config_entry_id: str
+    ) -> list[DeviceEntry]:
+        """Get devices of a config entry."""
+        devices = self.devices
+        return [
+            devices[device_id]
+            for device_id in self._config_entry_id_index.get(config_entry_id, ())
+        ]
+
     def _async_get_deleted_device(
         self,
         identifiers: set[tuple[str, str]],
@@ -266,6 +287,7 @@ class DeviceRegistry:
         else:
             devices_index = self._registered_index
             self.devices[device.id] = device
+            self._update_secondary_indexes(None, device)
 
         _add_device_to_index(devices_index, device)
 
@@ -277,27 +299,58 @@ class DeviceRegistry:
         else:
             devices_index = self._registered_index
             self.devices.pop(device.id)
+            self._update_secondary_indexes(device, None)
 
         _remove_device_from_index(devices_index, device)
 
     def _update_device(self, old_device: DeviceEntry, new_device: DeviceEntry) -> None:
         """Update a device and the index."""
         self.devices[new_device.id] = new_device
+        self._update_secondary_indexes(old_device, new_device)
 
         devices_index = self._registered_index
         _remove_device_from_index(devices_index, old_device)
         _add_device_to_index(devices_index, new_device)
 
+    def _update_secondary_indexes(
+        self, old_device: DeviceEntry | None, device: DeviceEntry | None
+    ) -> None:
+        """Update the area and config entry indexes for a changed device."""
+        device_id = cast(DeviceEntry, old_device or device).id
+        old_area_id = old_device and old_device.area_id
+        area_id = device and device.area_id
+        if old_area_id != area_id:
+            if old_area_id is not None:
+                _remove_from_secondary_index(
+                    self._area_id_index, old_area_id, device_id
+                )
+            if area_id is not None:
+                self._area_id_index.setdefault(area_id, {})[device_id] = True
+
+        old_config_entries = old_device.config_entries if old_device else set()
+        config_entries = device.config_entries if device else set()
+        for config_entry_id in old_config_entries - config_entries:
+            _remove_from_secondary_index(
+                self._config_entry_id_index, config_entry_id, device_id
+            )
+        for config_entry_id in config_entries - old_config_entries:
+            self._config_entry_id_index.setdefault(config_entry_id, {})[
+                device_id
+            ] = True
+
     def _clear_index(self) -> None:
         """Clear the index."""
         self._registered_index = _DeviceIndex(identifiers={}, connections={})
         self._deleted_index = _DeviceIndex(identifiers={}, connections={})
+        self._area_id_index = {}
+        self._config_entry_id_index = {}
 
     def _rebuild_index(self) -> None:
         """Create the index after loading devices."""
         self._clear_index()
         for device in self.devices.values():
             _add_device_to_index(self._registered_index, device)
+            self._update_secondary_indexes(None, device)
         for deleted_device in self.deleted_devices.values():
             _add_device_to_index(self._deleted_index, deleted_device)
 
@@ -672,8 +725,8 @@ class DeviceRegistry:
     def async_clear_config_entry(self, config_entry_id: str) -> None:
         """Clear config entry from registry entries."""
         now_time = time.time()
-        for device in list(self.devices.values()):
-            self._async_update_device(device.id, remove_config_entry_id=config_entry_id)
+        for dev_id in list(self._config_entry_id_index.get(config_entry_id, ())):
+            self._async_update_device(dev_id, remove_config_entry_id=config_entry_id)
         for deleted_device in list(self.deleted_devices.values()):
             config_entries = deleted_device.config_entries
             if config_entry_id not in config_entries:
@@ -713,9 +766,8 @@ class DeviceRegistry:
     @callback
     def async_clear_area_id(self, area_id: str) -> None:
         """Clear area id from registry entries."""
-        for dev_id, device in self.devices.items():
-            if area_id == device.area_id:
-                self._async_update_device(dev_id, area_id=None)
+        for dev_id in list(self._area_id_index.get(area_id, ())):
+            self._async_update_device(dev_id, area_id=None)
 
 
 @callback
@@ -743,7 +795,7 @@ async def async_get_registry(hass: HomeAssistant) -> DeviceRegistry:
 @callback
 def async_entries_for_area(registry: DeviceRegistry, area_id: str) -> list[DeviceEntry]:
     """Return entries that match an area."""
-    return [device for device in registry.devices.values() if device.area_id == area_id]
+    return registry.async_get_devices_for_area_id(area_id)
 
 
 @callback
@@ -751,11 +803,7 @@ def async_entries_for_config_entry(
     registry: DeviceRegistry, config_entry_id: str
 ) -> list[DeviceEntry]:
     """Return entries that match a config entry."""
-    return [
-        device
-        for device in registry.devices.values()
-        if config_entry_id in device.config_entries
-    ]
+    return registry.async_get_devices_for_config_entry_id(config_entry_id)
 
 
 @callback
@@ -905,6 +953,16 @@ def _add_device_to_index(
         devices_index.connections[connection] = device.id
 
 
+def _remove_from_secondary_index(
+    index: dict[str, dict[str, Literal[True]]], key: str, device_id: str
+) -> None:
+    """Remove a device from a secondary index."""
+    device_ids = index[key]
+    del device_ids[device_id]
+    if not device_ids:
+        del index[key]
+
+
 def _remove_device_from_index(
     devices_index: _DeviceIndex,
     device: DeviceEntry | DeletedDeviceEntry,
@@ -11,6 +11,7 @@ import logging
 import math
 import sys
 from timeit import default_timer as timer
+from types import MappingProxyType
 from typing import Any, Final, Literal, TypedDict, final
 
 import voluptuous as vol
@@ -44,6 +45,7 @@ from homeassistant.helpers.event import Event, async_track_entity_registry_updat
 from homeassistant.helpers.typing import StateType
 from homeassistant.loader import bind_hass
 from homeassistant.util import dt as dt_util, ensure_unique_string, slugify
+from homeassistant.util.executor import current_job_owner
 
 _LOGGER = logging.getLogger(__name__)
 SLOW_UPDATE_WARNING = 10
@@ -264,6 +266,14 @@ class Entity(ABC):
     # If entity is added to an entity platform
     _added = False
 
+    # Attributes of the last state write. The static part is rebuilt when
+    # one of the values in the key changes, which includes registry entry
+    # overrides and reloaded customizations.
+    _static_attributes_key: tuple[Any, ...] | None = None
+    _static_attributes: dict[str, Any]
+    _last_dynamic_attributes: dict[str, Any] | None = None
+    _last_attributes: MappingProxyType[str, Any] | None = None
+
     # Entity Properties
     _attr_assumed_state: bool = False
     _attr_attribution: str | None = None
@@ -518,6 +528,57 @@ class Entity(ABC):
         return str(state)
 
     @callback
+    def _build_static_attributes(self, static_key: tuple[Any, ...]) -> dict[str, Any]:
+        """Build the attributes which do not change with every state write.
+
+        Customized values are applied last and override all other attributes.
+        """
+        (
+            _,
+            unit_of_measurement,
+            assumed_state,
+            attribution,
+            device_class,
+            entity_picture,
+            icon,
+            name,
+            supported_features,
+            entity_id,
+            customize,
+            _,
+        ) = static_key
+        attr: dict[str, Any] = {}
+
+        if unit_of_measurement is not None:
+            attr[ATTR_UNIT_OF_MEASUREMENT] = unit_of_measurement
+
+        if assumed_state:
+            attr[ATTR_ASSUMED_STATE] = assumed_state
+
+        if attribution is not None:
+            attr[ATTR_ATTRIBUTION] = attribution
+
+        if device_class is not None:
+            attr[ATTR_DEVICE_CLASS] = str(device_class)
+
+        if entity_picture is not None:
+            attr[ATTR_ENTITY_PICTURE] = entity_picture
+
+        if icon is not None:
+            attr[ATTR_ICON] = icon
+
+        if name is not None:
+            attr[ATTR_FRIENDLY_NAME] = name
+
+        if supported_features is not None:
+            attr[ATTR_SUPPORTED_FEATURES] = supported_features
+
+        # Overwrite properties that have been set in the config file.
+        if customize is not None:
+            attr.update(customize.get(entity_id))
+
+        return attr
+
     def _async_write_ha_state(self) -> None:
         """Write the state to the state machine."""
         if self.registry_entry and self.registry_entry.disabled_by:
@@ -533,12 +594,15 @@ class Entity(ABC):
 
         start = timer()
 
-        attr = self.capability_attributes
-        attr = dict(attr) if attr else {}
+        # Copied so changes an entity makes to the same mapping in place do
+        # not also change the cached static key
+        if (capability_attr := self.capability_attributes) is not None:
+            capability_attr = dict(capability_attr)
 
         state = self._stringify_state()
+        dynamic_attr: dict[str, Any] | None = None
         if self.available:
-            attr.update(self.state_attributes or {})
+            dynamic_attr = dict(self.state_attributes or {})
             extra_state_attributes = self.extra_state_attributes
             # Backwards compatibility for "device_state_attributes" deprecated in 2021.4
             # Warning added in 2021.12, will be removed in 2022.4
@@ -556,36 +620,24 @@ class Entity(ABC):
                 self._deprecated_device_state_attributes_reported = True
             if extra_state_attributes is None:
                 extra_state_attributes = self.device_state_attributes
-            attr.update(extra_state_attributes or {})
-
-        unit_of_measurement = self.unit_of_measurement
-        if unit_of_measurement is not None:
-            attr[ATTR_UNIT_OF_MEASUREMENT] = unit_of_measurement
+            dynamic_attr.update(extra_state_attributes or {})
 
         entry = self.registry_entry
 
-        if assumed_state := self.assumed_state:
-            attr[ATTR_ASSUMED_STATE] = assumed_state
-
-        if (attribution := self.attribution) is not None:
-            attr[ATTR_ATTRIBUTION] = attribution
-
-        if (
-            device_class := (entry and entry.device_class) or self.device_class
-        ) is not None:
-            attr[ATTR_DEVICE_CLASS] = str(device_class)
-
-        if (entity_picture := self.entity_picture) is not None:
-            attr[ATTR_ENTITY_PICTURE] = entity_picture
-
-        if (icon := (entry and entry.icon) or self.icon) is not None:
-            attr[ATTR_ICON] = icon
-
-        if (name := (entry and entry.name) or self.name) is not None:
-            attr[ATTR_FRIENDLY_NAME] = name
-
-        if (supported_features := self.supported_features) is not None:
-            attr[ATTR_SUPPORTED_FEATURES] = supported_features
+        static_key = (
+            capability_attr,
+            self.unit_of_measurement,
+            self.assumed_state,
+            self.attribution,
+            (entry and entry.device_class) or self.device_class,
+            self.entity_picture,
+            (entry and entry.icon) or self.icon,
+            (entry and entry.name) or self.name,
+            self.supported_features,
+            self.entity_id,
+            self.hass.data.get(DATA_CUSTOMIZE),
+            self.hass.config.units,
+        )
 
         end = timer()
 
@@ -600,22 +652,43 @@ class Entity(ABC):
                 report_issue,
             )
 
-        # Overwrite properties that have been set in the config file.
-        if DATA_CUSTOMIZE in self.hass.data:
-            attr.update(self.hass.data[DATA_CUSTOMIZE].get(self.entity_id))
+        if (
+            self._last_attributes is not None
+            and static_key == self._static_attributes_key
+            and dynamic_attr == self._last_dynamic_attributes
+        ):
+            # Passing the attributes of the last write allows the state
+            # machine to skip comparing them
+            attributes = self._last_attributes
+        else:
+            if static_key != self._static_attributes_key:
+                self._static_attributes = self._build_static_attributes(static_key)
+                self._static_attributes_key = static_key
+
+            attr = dict(capability_attr) if capability_attr else {}
+            if dynamic_attr:
+                attr.update(dynamic_attr)
+            attr.update(self._static_attributes)
+            attributes = MappingProxyType(attr)
+            self._last_dynamic_attributes = dynamic_attr
+            self._last_attributes = attributes
 
         # Convert temperature if we detect one
         try:
-            unit_of_measure = attr.get(ATTR_UNIT_OF_MEASUREMENT)
+            unit_of_measure = attributes.get(ATTR_UNIT_OF_MEASUREMENT)
             units = self.hass.config.units
             if (
                 unit_of_measure in (TEMP_CELSIUS, TEMP_FAHRENHEIT)
                 and unit_of_measure != units.temperature_unit
             ):
+                # The converted attributes depend on the state
+                self._last_attributes = None
                 prec = len(state) - state.index(".") - 1 if "." in state else 0
                 temp = units.temperature(float(state), unit_of_measure)
                 state = str(round(temp) if prec == 0 else round(temp, prec))
-                attr[ATTR_UNIT_OF_MEASUREMENT] = units.temperature_unit
+                attributes = MappingProxyType(
+                    {**attributes, ATTR_UNIT_OF_MEASUREMENT: units.temperature_unit}
+                )
         except ValueError:
             # Could not convert state to float
             pass
@@ -628,7 +701,7 @@ class Entity(ABC):
             self._context_set = None
 
         self.hass.states.async_set(
-            self.entity_id, state, attr, self.force_update, self._context
+            self.entity_id, state, attributes, self.force_update, self._context
         )
 
     def schedule_update_ha_state(self, force_refresh: bool = False) -> None:
@@ -674,12 +747,21 @@ class Entity(ABC):
             await self.parallel_updates.acquire()
 
         try:
-            if hasattr(self, "async_update"):
-                task = self.hass.async_create_task(self.async_update())  # type: ignore
-            elif hasattr(self, "update"):
-                task = self.hass.async_add_executor_job(self.update)  # type: ignore
-            else:
-                return
+            # Attribute the executor jobs of the update to the integration
+            token = current_job_owner.set(
+                self.platform.platform_name if self.platform else None
+            )
+            try:
+                if hasattr(self, "async_update"):
+                    task = self.hass.async_create_task(
+                        self.async_update()  # type: ignore
+                    )
+                elif hasattr(self, "update"):
+                    task = self.hass.async_add_executor_job(self.update)  # type: ignore
+                else:
+                    return
+            finally:
+                current_job_owner.reset(token)
 
             if not warning:
                 await task
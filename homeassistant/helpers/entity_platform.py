@@ -4,7 +4,7 @@ from __future__ import annotations
 import asyncio
 from collections.abc import Callable, Coroutine, Iterable
 from contextvars import ContextVar
-from datetime import datetime, timedelta
+from datetime import timedelta
 from logging import Logger, getLogger
 from types import ModuleType
 from typing import TYPE_CHECKING, Any, Protocol
@@ -34,16 +34,18 @@ from homeassistant.exceptions import (
 )
 from homeassistant.setup import async_start_setup
 from homeassistant.util.async_ import run_callback_threadsafe
+from homeassistant.util.executor import current_job_owner
 
 from . import (
     config_validation as cv,
     device_registry as dev_reg,
     entity_registry as ent_reg,
+    poll_scheduler,
     service,
 )
 from .device_registry import DeviceRegistry
 from .entity_registry import EntityRegistry, RegistryEntryDisabler
-from .event import async_call_later, async_track_time_interval
+from .event import async_call_later
 from .typing import ConfigType, DiscoveryInfoType
 
 if TYPE_CHECKING:
@@ -98,11 +100,10 @@ class EntityPlatform:
         self._tasks: list[asyncio.Future] = []
         # Stop tracking tasks after setup is completed
         self._setup_complete = False
-        # Method to cancel the state change listener
-        self._async_unsub_polling: CALLBACK_TYPE | None = None
+        # Methods to stop polling the entities, by entity id
+        self._async_unsub_polling: dict[str, CALLBACK_TYPE] = {}
         # Method to cancel the retry of setup
         self._async_cancel_retry_setup: CALLBACK_TYPE | None = None
-        self._process_updates: asyncio.Lock | None = None
 
         self.parallel_updates: asyncio.Semaphore | None = None
 
@@ -228,6 +229,7 @@ class EntityPlatform:
         async_create_setup_task creates a coroutine that sets up platform.
         """
         current_platform.set(self)
+        current_job_owner.set(self.platform_name)
         logger = self.logger
         hass = self.hass
         full_name = f"{self.domain}.{self.platform_name}"
@@ -395,18 +397,24 @@ class EntityPlatform:
             )
             raise
 
-        if (
-            (self.config_entry and self.config_entry.pref_disable_polling)
-            or self._async_unsub_polling is not None
-            or not any(entity.should_poll for entity in self.entities.values())
+        if self.config_entry and self.config_entry.pref_disable_polling:
+            return
+
+        unsub_polling = self._async_unsub_polling
+        if not unsub_polling and not any(
+            entity.should_poll for entity in self.entities.values()
         ):
             return
 
-        self._async_unsub_polling = async_track_time_interval(
-            self.hass,
-            self._update_entity_states,
-            self.scan_interval,
-        )
+        # Once an entity of the platform polls, all of its entities are
+        # scheduled. The scheduler skips entities which do not poll when they
+        # are due, so entities which start polling later are updated too.
+        scheduler = poll_scheduler.async_get(self.hass)
+        for entity_id, entity in self.entities.items():
+            if entity_id not in unsub_polling:
+                unsub_polling[entity_id] = scheduler.async_schedule(
+                    entity, self.scan_interval
+                )
 
     async def _async_add_entity(  # noqa: C901
         self,
@@ -607,6 +615,12 @@ class EntityPlatform:
         def remove_entity_cb() -> None:
             """Remove entity from entities list."""
             self.entities.pop(entity_id)
+            unsub_polling = self._async_unsub_polling.pop(entity_id, None)
+            if unsub_polling is not None:
+                unsub_polling()
+            # Clean up polling if no longer needed
+            if not any(entity.should_poll for entity in self.entities.values()):
+                self.async_unsub_polling()
 
         entity.async_on_remove(remove_entity_cb)
 
@@ -632,9 +646,9 @@ class EntityPlatform:
     @callback
     def async_unsub_polling(self) -> None:
         """Stop polling."""
-        if self._async_unsub_polling is not None:
-            self._async_unsub_polling()
-            self._async_unsub_polling = None
+        for unsub_polling in self._async_unsub_polling.values():
+            unsub_polling()
+        self._async_unsub_polling.clear()
 
     async def async_destroy(self) -> None:
         """Destroy an entity platform.
@@ -648,13 +662,6 @@ class EntityPlatform:
         """Remove entity id from platform."""
         await self.entities[entity_id].async_remove()
 
-        # Clean up polling job if no longer needed
-        if self._async_unsub_polling is not None and not any(
-            entity.should_poll for entity in self.entities.values()
-        ):
-            self._async_unsub_polling()
-            self._async_unsub_polling = None
-
     async def async_extract_from_service(
         self, service_call: ServiceCall, expand_group: bool = True
     ) -> list[Entity]:
@@ -704,35 +711,6 @@ class EntityPlatform:
             self.platform_name, name, handle_service, schema
         )
 
-    async def _update_entity_states(self, now: datetime) -> None:
-        """Update the states of all the polling entities.
-
-        To protect from flooding the executor, we will update async entities
-        in parallel and other entities sequential.
-
-        This method must be run in the event loop.
-        """
-        if self._process_updates is None:
-            self._process_updates = asyncio.Lock()
-        if self._process_updates.locked():
-            self.logger.warning(
-                "Updating %s %s took longer than the scheduled update interval %s",
-                self.platform_name,
-                self.domain,
-                self.scan_interval,
-            )
-            return
-
-        async with self._process_updates:
-            tasks = []
-            for entity in self.entities.values():
-                if not entity.should_poll:
-                    continue
-                tasks.append(entity.async_update_ha_state(True))
-
-            if tasks:
-                await asyncio.gather(*tasks)
-
 
 current_platform: ContextVar[EntityPlatform | None] = ContextVar(
     "current_platform", default=None
@@ -12,7 +12,7 @@ from __future__ import annotations
 from collections import UserDict
 from collections.abc import Callable, Iterable, Mapping
 import logging
-from typing import TYPE_CHECKING, Any, cast
+from typing import TYPE_CHECKING, Any, Literal, cast
 
 import attr
 import voluptuous as vol
@@ -165,12 +165,33 @@ class EntityRegistryStore(storage.Store):
         return await _async_migrate(old_major_version, old_minor_version, old_data)
 
 
+def _update_index(
+    index: dict[str, dict[str, Literal[True]]],
+    key: str,
+    old_value: str | None,
+    new_value: str | None,
+) -> None:
+    """Move a key between two values of a secondary index."""
+    if old_value == new_value:
+        return
+    if old_value is not None:
+        keys = index[old_value]
+        del keys[key]
+        if not keys:
+            del index[old_value]
+    if new_value is not None:
+        index.setdefault(new_value, {})[key] = True
+
+
 class EntityRegistryItems(UserDict):
     """Container for entity registry items, maps entity_id -> entry.
 
     Maintains two additional indexes:
     - id -> entry
     - (domain, platform, unique_id) -> entry
+
+    And secondary indexes mapping device_id, area_id and config_entry_id to
+    the entity_ids of the entries referencing them.
     """
 
     def __init__(self) -> None:
@@ -178,28 +199,62 @@ class EntityRegistryItems(UserDict):
         super().__init__()
         self._entry_ids: dict[str, RegistryEntry] = {}
         self._index: dict[tuple[str, str, str], str] = {}
+        self._device_id_index: dict[str, dict[str, Literal[True]]] = {}
+        self._area_id_index: dict[str, dict[str, Literal[True]]] = {}
+        self._config_entry_id_index: dict[str, dict[str, Literal[True]]] = {}
 
     def __setitem__(self, key: str, entry: RegistryEntry) -> None:
         """Add an item."""
-        if key in self:
-            old_entry = self[key]
+        old_entry: RegistryEntry | None = self.data.get(key)
+        if old_entry is not None:
             del self._entry_ids[old_entry.id]
             del self._index[(old_entry.domain, old_entry.platform, old_entry.unique_id)]
         super().__setitem__(key, entry)
         self._entry_ids.__setitem__(entry.id, entry)
         self._index[(entry.domain, entry.platform, entry.unique_id)] = entry.entity_id
+        self._update_secondary_indexes(key, old_entry, entry)
 
     def __delitem__(self, key: str) -> None:
         """Remove an item."""
         entry = self[key]
         self._entry_ids.__delitem__(entry.id)
         self._index.__delitem__((entry.domain, entry.platform, entry.unique_id))
+        self._update_secondary_indexes(key, entry, None)
         super().__delitem__(key)
 
+    def _update_secondary_indexes(
+        self, key: str, old_entry: RegistryEntry | None, entry: RegistryEntry | None
+    ) -> None:
+        """Update the secondary indexes for a changed entry."""
+        _update_index(
+            self._device_id_index,
+            key,
+            old_entry and old_entry.device_id,
+            entry and entry.device_id,
+        )
+        _update_index(
+            self._area_id_index,
+            key,
+            old_entry and old_entry.area_id,
+            entry and entry.area_id,
+        )
+        _update_index(
+            self._config_entry_id_index,
+            key,
+            old_entry and old_entry.config_entry_id,
+            entry and entry.config_entry_id,
+        )
+
     def __getitem__(self, key: str) -> RegistryEntry:
         """Get an item."""
         return cast(RegistryEntry, super().__getitem__(key))
 
+    def copy(self) -> EntityRegistryItems:
+        """Return a copy which maintains its own indexes."""
+        items = EntityRegistryItems()
+        items.update(self)
+        return items
+
     def get_entity_id(self, key: tuple[str, str, str]) -> str | None:
         """Get entity_id from (domain, platform, unique_id)."""
         return self._index.get(key)
@@ -208,6 +263,32 @@ class EntityRegistryItems(UserDict):
         """Get entry from id."""
         return self._entry_ids.get(key)
 
+    def get_entries_for_device_id(
+        self, device_id: str, include_disabled_entities: bool = False
+    ) -> list[RegistryEntry]:
+        """Get entries for device."""
+        data = self.data
+        return [
+            entry
+            for entity_id in self._device_id_index.get(device_id, ())
+            if not (entry := data[entity_id]).disabled_by or include_disabled_entities
+        ]
+
+    def get_entries_for_area_id(self, area_id: str) -> list[RegistryEntry]:
+        """Get entries for area."""
+        data = self.data
+        return [data[entity_id] for entity_id in self._area_id_index.get(area_id, ())]
+
+    def get_entries_for_config_entry_id(
+        self, config_entry_id: str
+    ) -> list[RegistryEntry]:
+        """Get entries for config entry."""
+        data = self.data
+        return [
+            data[entity_id]
+            for entity_id in self._config_entry_id_index.get(config_entry_id, ())
+        ]
+
 
 class EntityRegistry:
     """Class to hold a registry of entities."""
@@ -681,19 +762,14 @@ class EntityRegistry:
     @callback
     def async_clear_config_entry(self, config_entry: str) -> None:
         """Clear config entry from registry entries."""
-        for entity_id in [
-            entity_id
-            for entity_id, entry in self.entities.items()
-            if config_entry == entry.config_entry_id
-        ]:
-            self.async_remove(entity_id)
+        for entry in self.entities.get_entries_for_config_entry_id(config_entry):
+            self.async_remove(entry.entity_id)
 
     @callback
     def async_clear_area_id(self, area_id: str) -> None:
         """Clear area id from registry entries."""
-        for entity_id, entry in self.entities.items():
-            if area_id == entry.area_id:
-                self._async_update_entity(entity_id, area_id=None)
+        for entry in self.entities.get_entries_for_area_id(area_id):
+            self._async_update_entity(entry.entity_id, area_id=None)
 
 
 @callback
@@ -723,12 +799,9 @@ def async_entries_for_device(
     registry: EntityRegistry, device_id: str, include_disabled_entities: bool = False
 ) -> list[RegistryEntry]:
     """Return entries that match a device."""
-    return [
-        entry
-        for entry in registry.entities.values()
-        if entry.device_id == device_id
-        and (not entry.disabled_by or include_disabled_entities)
-    ]
+    return registry.entities.get_entries_for_device_id(
+        device_id, include_disabled_entities
+    )
 
 
 @callback
@@ -736,7 +809,7 @@ def async_entries_for_area(
     registry: EntityRegistry, area_id: str
 ) -> list[RegistryEntry]:
     """Return entries that match an area."""
-    return [entry for entry in registry.entities.values() if entry.area_id == area_id]
+    return registry.entities.get_entries_for_area_id(area_id)
 
 
 @callback
@@ -744,11 +817,7 @@ def async_entries_for_config_entry(
     registry: EntityRegistry, config_entry_id: str
 ) -> list[RegistryEntry]:
     """Return entries that match a config entry."""
-    return [
-        entry
-        for entry in registry.entities.values()
-        if entry.config_entry_id == config_entry_id
-    ]
+    return registry.entities.get_entries_for_config_entry_id(config_entry_id)
 
 
 @callback
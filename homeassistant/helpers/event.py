@@ -7,6 +7,8 @@ import copy
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 import functools as ft
+import heapq
+import itertools
 import logging
 import time
 from typing import Any, Callable, List, cast
@@ -42,9 +44,6 @@ from homeassistant.loader import bind_hass
 from homeassistant.util import dt as dt_util
 from homeassistant.util.async_ import run_callback_threadsafe
 
-TRACK_STATE_CHANGE_CALLBACKS = "track_state_change_callbacks"
-TRACK_STATE_CHANGE_LISTENER = "track_state_change_listener"
-
 TRACK_STATE_ADDED_DOMAIN_CALLBACKS = "track_state_added_domain_callbacks"
 TRACK_STATE_ADDED_DOMAIN_LISTENER = "track_state_added_domain_listener"
 
@@ -54,6 +53,8 @@ TRACK_STATE_REMOVED_DOMAIN_LISTENER = "track_state_removed_domain_listener"
 TRACK_ENTITY_REGISTRY_UPDATED_CALLBACKS = "track_entity_registry_updated_callbacks"
 TRACK_ENTITY_REGISTRY_UPDATED_LISTENER = "track_entity_registry_updated_listener"
 
+TRACK_TIME_SCHEDULER = "track_time_scheduler"
+
 _ALL_LISTENER = "all"
 _DOMAINS_LISTENER = "domains"
 _ENTITIES_LISTENER = "entities"
@@ -238,63 +239,27 @@ def async_track_state_change_event(
     Unlike async_track_state_change, async_track_state_change_event
     passes the full event to the callback.
 
-    In order to avoid having to iterate a long list
-    of EVENT_STATE_CHANGED and fire and create a job
-    for each one, we keep a dict of entity ids that
-    care about the state change events so we can
-    do a fast dict lookup to route events.
+    The event bus indexes the listener by entity_id, so a state
+    change event only runs the listeners of its own entity_id.
     """
     if not (entity_ids := _async_string_to_lower_list(entity_ids)):
         return _remove_empty_listener
 
-    entity_callbacks = hass.data.setdefault(TRACK_STATE_CHANGE_CALLBACKS, {})
-
-    if TRACK_STATE_CHANGE_LISTENER not in hass.data:
-
-        @callback
-        def _async_state_change_filter(event: Event) -> bool:
-            """Filter state changes by entity_id."""
-            return event.data.get("entity_id") in entity_callbacks
-
-        @callback
-        def _async_state_change_dispatcher(event: Event) -> None:
-            """Dispatch state changes by entity_id."""
-            entity_id = event.data.get("entity_id")
-
-            if entity_id not in entity_callbacks:
-                return
-
-            for job in entity_callbacks[entity_id][:]:
-                try:
-                    hass.async_run_hass_job(job, event)
-                except Exception:  # pylint: disable=broad-except
-                    _LOGGER.exception(
-                        "Error while processing state change for %s", entity_id
-                    )
-
-        hass.data[TRACK_STATE_CHANGE_LISTENER] = hass.bus.async_listen(
-            EVENT_STATE_CHANGED,
-            _async_state_change_dispatcher,
-            event_filter=_async_state_change_filter,
-        )
-
     job = HassJob(action)
 
-    for entity_id in entity_ids:
-        entity_callbacks.setdefault(entity_id, []).append(job)
-
     @callback
-    def remove_listener() -> None:
-        """Remove state change listener."""
-        _async_remove_indexed_listeners(
-            hass,
-            TRACK_STATE_CHANGE_CALLBACKS,
-            TRACK_STATE_CHANGE_LISTENER,
-            entity_ids,
-            job,
-        )
+    def _async_state_change_dispatcher(event: Event) -> None:
+        """Run the action for a state change of a tracked entity."""
+        try:
+            hass.async_run_hass_job(job, event)
+        except Exception:  # pylint: disable=broad-except
+            _LOGGER.exception(
+                "Error while processing state change for %s", event.data["entity_id"]
+            )
 
-    return remove_listener
+    return hass.bus.async_listen(
+        EVENT_STATE_CHANGED, _async_state_change_dispatcher, entity_ids=entity_ids
+    )
 
 
 @callback
@@ -1237,52 +1202,148 @@ def async_track_point_in_time(
 track_point_in_time = threaded_listener_factory(async_track_point_in_time)
 
 
-@callback
-@bind_hass
-def async_track_point_in_utc_time(
-    hass: HomeAssistant,
-    action: HassJob | Callable[..., Awaitable[None] | None],
-    point_in_time: datetime,
-) -> CALLBACK_TYPE:
-    """Add a listener that fires once after a specific point in UTC time."""
-    # Ensure point_in_time is UTC
-    utc_point_in_time = dt_util.as_utc(point_in_time)
+class _ScheduledJob:
+    """A job waiting in the time tracker scheduler."""
 
-    # Since this is called once, we accept a HassJob so we can avoid
-    # having to figure out how to call the action every time its called.
-    cancel_callback: asyncio.TimerHandle | None = None
+    __slots__ = ("point_in_time", "job", "in_heap")
+
+    def __init__(self, point_in_time: datetime, job: HassJob) -> None:
+        """Initialize a scheduled job."""
+        self.point_in_time = point_in_time
+        self.job: HassJob | None = job
+        self.in_heap = True
+
+
+class _TimeTrackerScheduler:
+    """Run all point in time listeners from one heap and one loop timer.
+
+    Only the earliest job holds a timer on the event loop. Cancelled jobs
+    are left in the heap and skipped, the heap is compacted once they make
+    up more than half of it.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the scheduler."""
+        self._hass = hass
+        self._heap: list[tuple[float, int, _ScheduledJob]] = []
+        self._counter = itertools.count()
+        self._cancelled = 0
+        self._handle: asyncio.TimerHandle | None = None
+        self._handle_when: float | None = None
 
     @callback
-    def run_action(job: HassJob) -> None:
-        """Call the action."""
-        nonlocal cancel_callback
+    def async_schedule(self, point_in_time: datetime, job: HassJob) -> CALLBACK_TYPE:
+        """Schedule a job to run at a point in UTC time."""
+        when = point_in_time.timestamp()
+        scheduled = _ScheduledJob(point_in_time, job)
+        heapq.heappush(self._heap, (when, next(self._counter), scheduled))
+        if self._handle_when is None or when < self._handle_when:
+            self._async_arm(when, when - time.time())
 
-        now = time_tracker_utcnow()
+        @callback
+        def cancel() -> None:
+            """Cancel the scheduled job."""
+            if scheduled.job is None:
+                return
+            scheduled.job = None
+            # Jobs popped to run are no longer counted as cancelled heap entries
+            if not scheduled.in_heap:
+                return
+            self._cancelled += 1
+            if self._cancelled > len(self._heap) // 2:
+                self._async_compact()
+
+        return cancel
+
+    @callback
+    def _async_arm(self, when: float, delay: float) -> None:
+        """Arm the loop timer for the earliest job."""
+        if self._handle is not None:
+            self._handle.cancel()
+        self._handle_when = when
+        self._handle = self._hass.loop.call_later(delay, self._async_run_due)
+
+    @callback
+    def _async_compact(self) -> None:
+        """Drop cancelled jobs from the heap."""
+        self._heap = [item for item in self._heap if item[2].job is not None]
+        heapq.heapify(self._heap)
+        self._cancelled = 0
+
+    @callback
+    def _async_run_due(self) -> None:
+        """Run all jobs that are due and rearm the timer for the next one."""
+        self._handle = None
+        self._handle_when = None
+
+        now = time_tracker_utcnow().timestamp()
+        heap = self._heap
+        due: list[_ScheduledJob] = []
+        while heap and heap[0][0] <= now:
+            scheduled = heapq.heappop(heap)[2]
+            scheduled.in_heap = False
+            if scheduled.job is None:
+                self._cancelled -= 1
+            else:
+                due.append(scheduled)
+
+        # Jobs are collected before any of them run, so a job scheduling
+        # another for the current time does not starve the event loop.
+        for scheduled in due:
+            if (job := scheduled.job) is None:
+                # Cancelled by a job that ran before it
+                continue
+            scheduled.job = None
+            try:
+                self._hass.async_run_hass_job(job, scheduled.point_in_time)
+            except Exception:  # pylint: disable=broad-except
+                _LOGGER.exception("Error running scheduled job %s", job)
+
+        # Jobs that ran may have cancelled others and compacted the heap
+        heap = self._heap
+        while heap and heap[0][2].job is None:
+            heapq.heappop(heap)[2].in_heap = False
+            self._cancelled -= 1
+
+        if not heap or (
+            self._handle_when is not None and self._handle_when <= heap[0][0]
+        ):
+            return
 
         # Depending on the available clock support (including timer hardware
         # and the OS kernel) it can happen that we fire a little bit too early
         # as measured by utcnow(). That is bad when callbacks have assumptions
         # about the current time. Thus, we rearm the timer for the remaining
         # time.
-        if (delta := (utc_point_in_time - now).total_seconds()) > 0:
-            _LOGGER.debug("Called %f seconds too early, rearming", delta)
+        when = heap[0][0]
+        self._async_arm(when, when - now)
 
-            cancel_callback = hass.loop.call_later(delta, run_action, job)
-            return
 
-        hass.async_run_hass_job(job, utc_point_in_time)
+@callback
+def _async_get_time_tracker_scheduler(hass: HomeAssistant) -> _TimeTrackerScheduler:
+    """Return the time tracker scheduler, creating it on first use."""
+    if (scheduler := hass.data.get(TRACK_TIME_SCHEDULER)) is None:
+        scheduler = hass.data[TRACK_TIME_SCHEDULER] = _TimeTrackerScheduler(hass)
+    return cast(_TimeTrackerScheduler, scheduler)
 
-    job = action if isinstance(action, HassJob) else HassJob(action)
-    delta = utc_point_in_time.timestamp() - time.time()
-    cancel_callback = hass.loop.call_later(delta, run_action, job)
 
-    @callback
-    def unsub_point_in_time_listener() -> None:
-        """Cancel the call_later."""
-        assert cancel_callback is not None
-        cancel_callback.cancel()
+@callback
+@bind_hass
+def async_track_point_in_utc_time(
+    hass: HomeAssistant,
+    action: HassJob | Callable[..., Awaitable[None] | None],
+    point_in_time: datetime,
+) -> CALLBACK_TYPE:
+    """Add a listener that fires once after a specific point in UTC time."""
+    # Ensure point_in_time is UTC
+    utc_point_in_time = dt_util.as_utc(point_in_time)
 
-    return unsub_point_in_time_listener
+    # Since this is called once, we accept a HassJob so we can avoid
+    # having to figure out how to call the action every time its called.
+    job = action if isinstance(action, HassJob) else HassJob(action)
+    return _async_get_time_tracker_scheduler(hass).async_schedule(
+        utc_point_in_time, job
+    )
 
 
 track_point_in_utc_time = threaded_listener_factory(async_track_point_in_utc_time)
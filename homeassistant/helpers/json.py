@@ -1,7 +1,19 @@
 """Helpers to help with encoding Home Assistant objects in JSON."""
+from __future__ import annotations
+
+from collections.abc import Mapping
 import datetime
 import json
-from typing import Any
+from typing import Any, Final
+
+from homeassistant.util.json import json_dumps_stdlib
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
+
+JSON_BACKEND: Final = "json" if orjson is None else "orjson"
 
 
 class JSONEncoder(json.JSONEncoder):
@@ -40,3 +52,42 @@ class ExtendedJSONEncoder(JSONEncoder):
             return super().default(o)
         except TypeError:
             return {"__type": str(type(o)), "repr": repr(o)}
+
+
+def json_encoder_default(obj: Any) -> Any:
+    """Convert Home Assistant objects the native encoder does not handle.
+
+    Raise TypeError for anything else, like the stdlib encoder.
+    """
+    if isinstance(obj, set):
+        return list(obj)
+    if hasattr(obj, "as_dict"):
+        return obj.as_dict()
+    if isinstance(obj, datetime.datetime):
+        return obj.isoformat()
+    if isinstance(obj, Mapping):
+        # Like the attributes of states, which are read-only mapping proxies
+        return dict(obj)
+    if isinstance(obj, tuple):
+        # Named tuples are not serialized by the native encoder
+        return list(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def json_bytes(data: Any) -> bytes:
+    """Serialize data to compact json bytes.
+
+    NaN and infinite floats are serialized as null by both backends.
+    """
+    if orjson is None:
+        return json_dumps_stdlib(
+            data, default=json_encoder_default, separators=(",", ":")
+        ).encode("utf-8")
+    return orjson.dumps(
+        data, option=orjson.OPT_NON_STR_KEYS, default=json_encoder_default
+    )
+
+
+def json_dumps(data: Any) -> str:
+    """Serialize data to a compact json str."""
+    return json_bytes(data).decode("utf-8")
@@ -0,0 +1,181 @@
+"""Schedule the updates of polling entities."""
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass
+from datetime import timedelta
+import logging
+import random
+from typing import TYPE_CHECKING, cast
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+
+if TYPE_CHECKING:
+    from .entity import Entity
+
+DATA_POLL_SCHEDULER = "poll_scheduler"
+
+# Share of the scan interval over which the first update of entities is spread
+POLL_SPREAD = 0.9
+# Updates that fail or take longer than the scan interval multiply the delay
+# until the next update by this factor, up to MAX_BACKOFF times the interval
+BACKOFF_FACTOR = 2
+MAX_BACKOFF = 8
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@dataclass
+class PollStatistics:
+    """Class for keeping track of the updates of a polled entity.
+
+    Durations are in seconds. The backoff is the multiple of the scan
+    interval waited until the next update.
+    """
+
+    polls: int = 0
+    failures: int = 0
+    consecutive_failures: int = 0
+    backoff: float = 1
+    last_duration: float | None = None
+    max_duration: float | None = None
+    total_duration: float = 0
+
+    @property
+    def mean_duration(self) -> float | None:
+        """Return the mean duration of the updates."""
+        if not self.polls:
+            return None
+        return self.total_duration / self.polls
+
+
+class _PollEntry:
+    """An entity scheduled for polling."""
+
+    __slots__ = ("entity", "interval", "statistics", "timer", "cancelled")
+
+    def __init__(self, entity: Entity, interval: float) -> None:
+        """Initialize the entry."""
+        self.entity = entity
+        self.interval = interval
+        self.statistics = PollStatistics()
+        self.timer: asyncio.TimerHandle | None = None
+        self.cancelled = False
+
+
+class PollScheduler:
+    """Update polling entities on their own schedule.
+
+    Every entity is updated on its own timer instead of together with the
+    other entities of its platform. The first update of an entity is placed
+    at a random point of its scan interval, so updates of many entities are
+    spread over the interval instead of hitting the executor at once.
+    The next update is scheduled when an update finishes, so updates of an
+    entity never overlap. Entities whose updates fail or take longer than
+    the scan interval are backed off.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the scheduler."""
+        self.hass = hass
+        self._entries: dict[str, _PollEntry] = {}
+
+    @callback
+    def async_schedule(self, entity: Entity, interval: timedelta) -> CALLBACK_TYPE:
+        """Poll an entity every interval until the returned callback is called."""
+        entity_id = entity.entity_id
+        assert entity_id is not None
+        entry = _PollEntry(entity, interval.total_seconds())
+        self._entries[entity_id] = entry
+        delay = entry.interval * (1 - POLL_SPREAD * random.random())
+        self._async_schedule_next(entry, self.hass.loop.time() + delay)
+
+        @callback
+        def async_cancel() -> None:
+            """Stop polling the entity."""
+            entry.cancelled = True
+            if entry.timer is not None:
+                entry.timer.cancel()
+                entry.timer = None
+            if self._entries.get(entity_id) is entry:
+                del self._entries[entity_id]
+
+        return async_cancel
+
+    @callback
+    def async_get_statistics(self) -> dict[str, PollStatistics]:
+        """Return the update statistics of the polled entities."""
+        return {
+            entity_id: entry.statistics for entity_id, entry in self._entries.items()
+        }
+
+    @callback
+    def _async_schedule_next(self, entry: _PollEntry, when: float) -> None:
+        """Schedule the next update of an entry."""
+        entry.timer = self.hass.loop.call_at(when, self._async_poll, entry)
+
+    @callback
+    def _async_poll(self, entry: _PollEntry) -> None:
+        """Start the update of an entry."""
+        entry.timer = None
+        if entry.cancelled:
+            return
+        if not entry.entity.should_poll:
+            self._async_schedule_next(entry, self.hass.loop.time() + entry.interval)
+            return
+        self.hass.async_create_task(self._async_update(entry))
+
+    async def _async_update(self, entry: _PollEntry) -> None:
+        """Update an entity and schedule its next update."""
+        entity = entry.entity
+        stats = entry.statistics
+        loop_time = self.hass.loop.time
+        start = loop_time()
+        failed = False
+        try:
+            await entity.async_device_update()
+        except Exception:  # pylint: disable=broad-except
+            _LOGGER.exception("Update for %s fails", entity.entity_id)
+            failed = True
+        else:
+            if not entry.cancelled:
+                entity.async_write_ha_state()
+        finish = loop_time()
+
+        duration = finish - start
+        stats.polls += 1
+        stats.last_duration = duration
+        stats.total_duration += duration
+        if stats.max_duration is None or duration > stats.max_duration:
+            stats.max_duration = duration
+
+        if failed:
+            stats.failures += 1
+            stats.consecutive_failures += 1
+        else:
+            stats.consecutive_failures = 0
+
+        if failed or duration > entry.interval:
+            if not failed:
+                _LOGGER.warning(
+                    "Updating %s took longer than the scheduled update interval %s",
+                    entity.entity_id,
+                    timedelta(seconds=entry.interval),
+                )
+            stats.backoff = min(stats.backoff * BACKOFF_FACTOR, MAX_BACKOFF)
+        else:
+            stats.backoff = 1
+
+        if entry.cancelled:
+            return
+        # Keep the phase of the entity in the interval unless updates run late
+        delay = entry.interval * stats.backoff
+        self._async_schedule_next(entry, max(start + delay, finish + delay / 2))
+
+
+@callback
+def async_get(hass: HomeAssistant) -> PollScheduler:
+    """Get the poll scheduler."""
+    if (scheduler := hass.data.get(DATA_POLL_SCHEDULER)) is None:
+        scheduler = hass.data[DATA_POLL_SCHEDULER] = PollScheduler(hass)
+    return cast(PollScheduler, scheduler)
@@ -46,6 +46,7 @@ from homeassistant.loader import (
     bind_hass,
 )
 from homeassistant.util.async_ import gather_with_concurrency
+from homeassistant.util.executor import current_job_owner
 from homeassistant.util.yaml import load_yaml
 from homeassistant.util.yaml.loader import JSON_TYPE
 
@@ -357,30 +358,37 @@ def async_extract_referenced_entity_ids(
 
     # Find devices for this area
     selected.referenced_devices.update(selector.device_ids)
-    for device_entry in dev_reg.devices.values():
-        if device_entry.area_id in selector.area_ids:
-            selected.referenced_devices.add(device_entry.id)
+    for area_id in selector.area_ids:
+        selected.referenced_devices.update(
+            device_entry.id
+            for device_entry in dev_reg.async_get_devices_for_area_id(area_id)
+        )
 
     if not selector.area_ids and not selected.referenced_devices:
         return selected
 
-    for ent_entry in ent_reg.entities.values():
-        # Do not add config or diagnostic entities referenced by areas or devices
-        if ent_entry.entity_category in ENTITY_CATEGORIES:
-            continue
-
-        if (
-            # when area matches the target area
-            ent_entry.area_id in selector.area_ids
-            # when device matches a referenced devices with no explicitly set area
-            or (
+    entities = ent_reg.entities
+    # Add entities in the target areas
+    for area_id in selector.area_ids:
+        for ent_entry in entities.get_entries_for_area_id(area_id):
+            # Do not add config or diagnostic entities referenced by areas
+            if ent_entry.entity_category not in ENTITY_CATEGORIES:
+                selected.indirectly_referenced.add(ent_entry.entity_id)
+
+    # Add entities of the referenced devices
+    for device_id in selected.referenced_devices:
+        for ent_entry in entities.get_entries_for_device_id(device_id, True):
+            # Do not add config or diagnostic entities referenced by devices
+            if ent_entry.entity_category in ENTITY_CATEGORIES:
+                continue
+
+            if (
+                # when device matches a referenced device with no explicitly set area
                 not ent_entry.area_id
-                and ent_entry.device_id in selected.referenced_devices
-            )
-            # when device matches target device
-            or ent_entry.device_id in selector.device_ids
-        ):
-            selected.indirectly_referenced.add(ent_entry.entity_id)
+                # when device matches target device
+                or device_id in selector.device_ids
+            ):
+                selected.indirectly_referenced.add(ent_entry.entity_id)
 
     return selected
 
@@ -576,11 +584,7 @@ async def entity_service_call(
             else:
                 assert all_referenced is not None
                 entity_candidates.extend(
-                    [
-                        entity
-                        for entity in platform.entities.values()
-                        if entity.entity_id in all_referenced
-                    ]
+                    _get_platform_entities(platform.entities, all_referenced)
                 )
 
     elif target_all_entities:
@@ -599,12 +603,10 @@ async def entity_service_call(
         assert all_referenced is not None
 
         for platform in platforms:
-            platform_entities = []
-            for entity in platform.entities.values():
-
-                if entity.entity_id not in all_referenced:
-                    continue
-
+            platform_entities = _get_platform_entities(
+                platform.entities, all_referenced
+            )
+            for entity in platform_entities:
                 if not entity_perms(entity.entity_id, POLICY_CONTROL):
                     raise Unauthorized(
                         context=call.context,
@@ -612,8 +614,6 @@ async def entity_service_call(
                         permission=POLICY_CONTROL,
                     )
 
-                platform_entities.append(entity)
-
             entity_candidates.extend(platform_entities)
 
     if not target_all_entities:
@@ -648,6 +648,19 @@ async def entity_service_call(
     if not entities:
         return
 
+    if len(entities) == 1:
+        # Single entity calls are awaited directly to avoid creating tasks
+        entity = entities[0]
+        await entity.async_request_call(
+            _handle_entity_call(hass, entity, func, data, call.context)
+        )
+        if entity.should_poll:
+            # Context expires if the turn on commands took a long time.
+            # Set context again so it's there when we update
+            entity.async_set_context(call.context)
+            await entity.async_update_ha_state(True)
+        return
+
     done, pending = await asyncio.wait(
         [
             asyncio.create_task(
@@ -680,6 +693,21 @@ async def entity_service_call(
             future.result()  # pop exception if have
 
 
+def _get_platform_entities(
+    entities: dict[str, Entity], entity_ids: set[str]
+) -> list[Entity]:
+    """Return the entities of a platform with an entity_id in entity_ids.
+
+    Looks the entity ids up in the entities of the platform, or the other
+    way around when the platform has fewer entities than are targeted.
+    """
+    if len(entity_ids) < len(entities):
+        return [
+            entities[entity_id] for entity_id in entity_ids if entity_id in entities
+        ]
+    return [entity for entity in entities.values() if entity.entity_id in entity_ids]
+
+
 async def _handle_entity_call(
     hass: HomeAssistant,
     entity: Entity,
@@ -690,10 +718,19 @@ async def _handle_entity_call(
     """Handle calling service method."""
     entity.async_set_context(context)
 
-    if isinstance(func, str):
-        result = hass.async_run_job(partial(getattr(entity, func), **data))  # type: ignore
-    else:
-        result = hass.async_run_job(func, entity, data)
+    # Attribute the executor jobs of the call to the integration of the entity
+    token = current_job_owner.set(
+        entity.platform.platform_name if entity.platform else None
+    )
+    try:
+        if isinstance(func, str):
+            result = hass.async_run_job(
+                partial(getattr(entity, func), **data)  # type: ignore
+            )
+        else:
+            result = hass.async_run_job(func, entity, data)
+    finally:
+        current_job_owner.reset(token)
 
     # Guard because callback functions do not return a task when passed to async_run_job.
     if result is not None:
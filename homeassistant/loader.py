@@ -12,8 +12,12 @@ import functools as ft
 import importlib
 import json
 import logging
+import os
 import pathlib
+import stat
 import sys
+import threading
+import time
 from types import ModuleType
 from typing import TYPE_CHECKING, Any, Callable, Dict, TypedDict, TypeVar, cast
 
@@ -23,6 +27,7 @@ from awesomeversion import (
     AwesomeVersionStrategy,
 )
 
+from homeassistant.const import __version__
 from homeassistant.generated.dhcp import DHCP
 from homeassistant.generated.mqtt import MQTT
 from homeassistant.generated.ssdp import SSDP
@@ -30,9 +35,15 @@ from homeassistant.generated.usb import USB
 from homeassistant.generated.zeroconf import HOMEKIT, ZEROCONF
 from homeassistant.util.async_ import gather_with_concurrency
 
+try:
+    import resource
+except ImportError:  # pragma: no cover
+    resource = None  # type: ignore[assignment]
+
 # Typing imports that create a circular dependency
 if TYPE_CHECKING:
     from homeassistant.core import HomeAssistant
+    from homeassistant.helpers.storage import Store
 
 # mypy: disallow-any-generics
 
@@ -45,6 +56,8 @@ _LOGGER = logging.getLogger(__name__)
 DATA_COMPONENTS = "components"
 DATA_INTEGRATIONS = "integrations"
 DATA_CUSTOM_COMPONENTS = "custom_components"
+DATA_MANIFEST_INDEX = "manifest_index"
+DATA_IMPORT_TIMES = "import_times"
 PACKAGE_CUSTOM_COMPONENTS = "custom_components"
 PACKAGE_BUILTIN = "homeassistant.components"
 CUSTOM_WARNING = (
@@ -58,6 +71,23 @@ _UNDEF = object()  # Internal; not helpers.typing.UNDEFINED due to circular depe
 
 MAX_LOAD_CONCURRENTLY = 4
 
+MANIFEST_INDEX_STORAGE_KEY = "core.manifest_index"
+MANIFEST_INDEX_STORAGE_VERSION = 1
+MANIFEST_INDEX_SAVE_DELAY = 30
+
+
+class ImportTiming(TypedDict):
+    """Cost of importing an integration or one of its platforms.
+
+    memory is the increase of the peak resident set size in bytes, None when
+    the platform can't report it.
+    """
+
+    module: str
+    seconds: float
+    modules: int
+    memory: int | None
+
 
 class Manifest(TypedDict, total=False):
     """
@@ -100,6 +130,127 @@ def manifest_from_legacy_module(domain: str, module: ModuleType) -> Manifest:
     }
 
 
+class ManifestIndex:
+    """Cache of parsed manifest.json files and custom component directories.
+
+    A manifest is cached with the modification time of its file and a listing
+    of sub directories with the modification time of the directory, adding or
+    removing a component changes it. The index is persisted so the next start
+    only has to stat the files. Lookups happen in the executor.
+    """
+
+    def __init__(
+        self, store: Store | None = None, data: dict[str, Any] | None = None
+    ) -> None:
+        """Initialize the index from persisted data."""
+        self._store = store
+        self._lock = threading.Lock()
+        self._manifests: dict[str, tuple[int, Manifest]] = {}
+        self._directories: dict[str, tuple[int, list[str]]] = {}
+        # Built-in manifests may keep their modification time on upgrade
+        if data is not None and data.get("ha_version") == __version__:
+            self._manifests = {
+                path: (mtime, manifest)
+                for path, (mtime, manifest) in data["manifests"].items()
+            }
+            self._directories = {
+                path: (mtime, names)
+                for path, (mtime, names) in data["directories"].items()
+            }
+        self.dirty = False
+
+    def get_manifest(self, manifest_path: pathlib.Path) -> Manifest | None:
+        """Return the manifest at a path or None if there is no manifest file.
+
+        Raises ValueError if the manifest is not valid JSON.
+        """
+        try:
+            stat_result = manifest_path.stat()
+        except OSError:
+            return None
+        if not stat.S_ISREG(stat_result.st_mode):
+            return None
+
+        key = str(manifest_path)
+        with self._lock:
+            cached = self._manifests.get(key)
+        if cached is not None and cached[0] == stat_result.st_mtime_ns:
+            manifest = cached[1]
+        else:
+            manifest = cast(Manifest, json.loads(manifest_path.read_text()))
+            with self._lock:
+                self._manifests[key] = (stat_result.st_mtime_ns, manifest)
+                self.dirty = True
+        # The integration adds keys to its manifest
+        return cast(Manifest, dict(manifest))
+
+    def get_sub_directories(self, paths: list[str]) -> list[pathlib.Path]:
+        """Return all sub directories in a set of paths."""
+        sub_directories = []
+        for path in paths:
+            mtime = os.stat(path).st_mtime_ns
+            with self._lock:
+                cached = self._directories.get(path)
+            if cached is not None and cached[0] == mtime:
+                names = cached[1]
+            else:
+                with os.scandir(path) as entries:
+                    names = sorted(entry.name for entry in entries if entry.is_dir())
+                with self._lock:
+                    self._directories[path] = (mtime, names)
+                    self.dirty = True
+            sub_directories.extend(pathlib.Path(path) / name for name in names)
+        return sub_directories
+
+    def async_schedule_save(self) -> None:
+        """Schedule persisting the index if it changed.
+
+        Must be run in the event loop.
+        """
+        if self._store is not None and self.dirty:
+            self._store.async_delay_save(self.as_dict, MANIFEST_INDEX_SAVE_DELAY)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the data to persist."""
+        with self._lock:
+            self.dirty = False
+            return {
+                "ha_version": __version__,
+                "manifests": dict(self._manifests),
+                "directories": dict(self._directories),
+            }
+
+
+async def async_get_manifest_index(hass: HomeAssistant) -> ManifestIndex:
+    """Return the manifest index, loading it from storage the first time."""
+    if (index_or_evt := hass.data.get(DATA_MANIFEST_INDEX)) is None:
+        evt = hass.data[DATA_MANIFEST_INDEX] = asyncio.Event()
+
+        # pylint: disable-next=import-outside-toplevel
+        from homeassistant.exceptions import HomeAssistantError
+
+        # pylint: disable-next=import-outside-toplevel
+        from homeassistant.helpers.storage import Store
+
+        store = Store(hass, MANIFEST_INDEX_STORAGE_VERSION, MANIFEST_INDEX_STORAGE_KEY)
+        try:
+            data = await store.async_load()
+        except HomeAssistantError as err:
+            _LOGGER.warning("Ignoring invalid manifest index: %s", err)
+            data = None
+
+        index = ManifestIndex(store, cast(Dict[str, Any], data))
+        hass.data[DATA_MANIFEST_INDEX] = index
+        evt.set()
+        return index
+
+    if isinstance(index_or_evt, asyncio.Event):
+        await index_or_evt.wait()
+        return cast(ManifestIndex, hass.data[DATA_MANIFEST_INDEX])
+
+    return cast(ManifestIndex, index_or_evt)
+
+
 async def _async_get_custom_components(
     hass: HomeAssistant,
 ) -> dict[str, Integration]:
@@ -112,28 +263,25 @@ async def _async_get_custom_components(
     except ImportError:
         return {}
 
-    def get_sub_directories(paths: list[str]) -> list[pathlib.Path]:
-        """Return all sub directories in a set of paths."""
-        return [
-            entry
-            for path in paths
-            for entry in pathlib.Path(path).iterdir()
-            if entry.is_dir()
-        ]
-
+    manifest_index = await async_get_manifest_index(hass)
     dirs = await hass.async_add_executor_job(
-        get_sub_directories, custom_components.__path__
+        manifest_index.get_sub_directories, custom_components.__path__
     )
 
     integrations = await gather_with_concurrency(
         MAX_LOAD_CONCURRENTLY,
         *(
             hass.async_add_executor_job(
-                Integration.resolve_from_root, hass, custom_components, comp.name
+                Integration.resolve_from_root,
+                hass,
+                custom_components,
+                comp.name,
+                manifest_index,
             )
             for comp in dirs
         ),
     )
+    manifest_index.async_schedule_save()
 
     return {
         integration.domain: integration
@@ -292,23 +440,29 @@ class Integration:
 
     @classmethod
     def resolve_from_root(
-        cls, hass: HomeAssistant, root_module: ModuleType, domain: str
+        cls,
+        hass: HomeAssistant,
+        root_module: ModuleType,
+        domain: str,
+        manifest_index: ManifestIndex | None = None,
     ) -> Integration | None:
         """Resolve an integration from a root module."""
+        if manifest_index is None:
+            manifest_index = ManifestIndex()
         for base in root_module.__path__:  # type: ignore
             manifest_path = pathlib.Path(base) / domain / "manifest.json"
 
-            if not manifest_path.is_file():
-                continue
-
             try:
-                manifest = json.loads(manifest_path.read_text())
+                manifest = manifest_index.get_manifest(manifest_path)
             except ValueError as err:
                 _LOGGER.error(
                     "Error parsing manifest.json file at %s: %s", manifest_path, err
                 )
                 continue
 
+            if manifest is None:
+                continue
+
             integration = cls(
                 hass,
                 f"{root_module.__name__}.{domain}",
@@ -519,7 +673,7 @@ class Integration:
         """Return the component."""
         cache = self.hass.data.setdefault(DATA_COMPONENTS, {})
         if self.domain not in cache:
-            cache[self.domain] = importlib.import_module(self.pkg_path)
+            cache[self.domain] = self._import_module(self.domain, self.pkg_path)
         return cache[self.domain]  # type: ignore
 
     def get_platform(self, platform_name: str) -> ModuleType:
@@ -532,7 +686,36 @@ class Integration:
 
     def _import_platform(self, platform_name: str) -> ModuleType:
         """Import the platform."""
-        return importlib.import_module(f"{self.pkg_path}.{platform_name}")
+        return self._import_module(
+            f"{self.domain}.{platform_name}", f"{self.pkg_path}.{platform_name}"
+        )
+
+    def _import_module(self, name: str, module_path: str) -> ModuleType:
+        """Import a module and record what the import cost."""
+        if module_path in sys.modules:
+            return importlib.import_module(module_path)
+
+        modules_before = len(sys.modules)
+        memory_before = _peak_memory()
+        start = time.perf_counter()
+        module = importlib.import_module(module_path)
+        seconds = time.perf_counter() - start
+        memory = None
+        if memory_before is not None and (memory_after := _peak_memory()):
+            memory = memory_after - memory_before
+
+        import_times: dict[str, list[ImportTiming]] = self.hass.data.setdefault(
+            DATA_IMPORT_TIMES, {}
+        )
+        import_times.setdefault(self.domain, []).append(
+            ImportTiming(
+                module=name,
+                seconds=seconds,
+                modules=len(sys.modules) - modules_before,
+                memory=memory,
+            )
+        )
+        return module
 
     def __repr__(self) -> str:
         """Text representation of class."""
@@ -586,9 +769,12 @@ async def _async_get_integration(hass: HomeAssistant, domain: str) -> Integratio
 
     from homeassistant import components  # pylint: disable=import-outside-toplevel
 
-    if integration := await hass.async_add_executor_job(
-        Integration.resolve_from_root, hass, components, domain
-    ):
+    manifest_index = await async_get_manifest_index(hass)
+    integration = await hass.async_add_executor_job(
+        Integration.resolve_from_root, hass, components, domain, manifest_index
+    )
+    manifest_index.async_schedule_save()
+    if integration:
         return integration
 
     raise IntegrationNotFound(domain)
@@ -782,6 +968,15 @@ async def _async_component_dependencies(
     return loaded
 
 
+def _peak_memory() -> int | None:
+    """Return the peak resident set size of the process in bytes."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Reported in kilobytes on Linux and in bytes on macOS
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
 def _async_mount_config_dir(hass: HomeAssistant) -> bool:
     """Mount config dir in order to load custom_component.
 
@@ -6,9 +6,10 @@ import asyncio
 import collections
 from collections.abc import Callable
 from contextlib import suppress
-from datetime import datetime
+from datetime import datetime, timedelta
 import json
 import logging
+import tempfile
 from timeit import default_timer as timer
 from typing import TypeVar
 
@@ -16,7 +17,7 @@ from homeassistant import core
 from homeassistant.components.websocket_api.const import JSON_DUMP
 from homeassistant.const import ATTR_NOW, EVENT_STATE_CHANGED, EVENT_TIME_CHANGED
 from homeassistant.helpers.entityfilter import convert_include_exclude_filter
-from homeassistant.helpers.json import JSONEncoder
+from homeassistant.helpers.json import JSON_BACKEND, JSONEncoder, json_bytes
 from homeassistant.util import dt as dt_util
 
 # mypy: allow-untyped-calls, allow-untyped-defs, no-check-untyped-defs
@@ -119,6 +120,79 @@ async def fire_events_with_filter(hass):
     return timer() - start
 
 
+@benchmark
+async def fire_events_listener_scaling(hass):
+    """Fire 100k events with an increasing number of filtered listeners."""
+    events_to_fire = 10 ** 5
+    event_name = "benchmark_event"
+    total = 0.0
+
+    @core.callback
+    def event_filter(event):
+        """Filter event."""
+        return False
+
+    @core.callback
+    def listener(_):
+        """Handle event."""
+
+    unsubs = []
+    for listener_count in (1, 10, 100, 500):
+        while len(unsubs) < listener_count:
+            unsubs.append(
+                hass.bus.async_listen(event_name, listener, event_filter=event_filter)
+            )
+
+        start = timer()
+        for _ in range(events_to_fire):
+            hass.bus.async_fire(event_name)
+        await hass.async_block_till_done()
+        elapsed = timer() - start
+        total += elapsed
+
+        print(f"{listener_count} listeners: {events_to_fire / elapsed:.0f} events/sec")
+
+    for unsub in unsubs:
+        unsub()
+
+    return total
+
+
+@benchmark
+async def fire_events_entity_id_index(hass):
+    """Fire 100k state_changed events with 1000 entity_id indexed listeners."""
+    count = 0
+    events_to_fire = 10 ** 5
+
+    @core.callback
+    def listener(_):
+        """Handle event."""
+        nonlocal count
+        count += 1
+
+    for idx in range(1000):
+        hass.bus.async_listen(
+            EVENT_STATE_CHANGED, listener, entity_ids=[f"light.kitchen{idx}"]
+        )
+
+    event_data = {
+        "entity_id": "light.kitchen0",
+        "old_state": core.State("light.kitchen0", "off"),
+        "new_state": core.State("light.kitchen0", "on"),
+    }
+
+    start = timer()
+
+    for _ in range(events_to_fire):
+        hass.bus.async_fire(EVENT_STATE_CHANGED, event_data)
+
+    await hass.async_block_till_done()
+
+    assert count == events_to_fire
+
+    return timer() - start
+
+
 @benchmark
 async def time_changed_helper(hass):
     """Run a million events through time changed helper."""
@@ -147,6 +221,34 @@ async def time_changed_helper(hass):
     return timer() - start
 
 
+@benchmark
+async def track_point_in_time_scheduler(hass):
+    """Run 100k point in time listeners scheduled within one second."""
+    count = 0
+    event = asyncio.Event()
+    now = dt_util.utcnow()
+
+    @core.callback
+    def listener(_):
+        """Handle the scheduled job."""
+        nonlocal count
+        count += 1
+
+        if count == 10 ** 5:
+            event.set()
+
+    start = timer()
+
+    for idx in range(10 ** 5):
+        hass.helpers.event.async_track_point_in_utc_time(
+            listener, now + timedelta(microseconds=idx * 10)
+        )
+
+    await event.wait()
+
+    return timer() - start
+
+
 @benchmark
 async def state_changed_helper(hass):
     """Run a million events through state changed helper with 1000 entities."""
@@ -253,6 +355,126 @@ async def state_changed_event_filter_helper(hass):
     return timer() - start
 
 
+@benchmark
+async def recorder_state_changed(hass):
+    """Replay 10k state_changed events through the recorder against SQLite."""
+    # pylint: disable=import-outside-toplevel
+    from homeassistant.components import recorder
+    from homeassistant.components.recorder import migration
+
+    events_to_replay = 10 ** 4
+    commit_every = 100
+    attributes = {"unit_of_measurement": "W", "friendly_name": "Power"}
+    events = [
+        core.Event(
+            EVENT_STATE_CHANGED,
+            {
+                "entity_id": f"sensor.power_{idx % 100}",
+                "old_state": None,
+                "new_state": core.State(
+                    f"sensor.power_{idx % 100}", str(idx), attributes
+                ),
+            },
+        )
+        for idx in range(events_to_replay)
+    ]
+
+    def _replay(db_dir):
+        instance = recorder.Recorder(
+            hass,
+            auto_purge=False,
+            keep_days=10,
+            commit_interval=1,
+            uri=f"sqlite:///{db_dir}/benchmark.db",
+            db_max_retries=10,
+            db_retry_wait=3,
+            entity_filter=lambda entity_id: True,
+            exclude_t=[],
+        )
+        # pylint: disable=protected-access
+        instance._setup_connection()
+        migration.get_schema_version(instance)
+        instance._setup_run()
+
+        start = timer()
+        for idx, event in enumerate(events, 1):
+            instance._process_one_event(event)
+            if idx % commit_every == 0:
+                instance._commit_event_session_or_retry()
+        instance._commit_event_session_or_retry()
+        elapsed = timer() - start
+
+        instance._close_event_session()
+        instance._close_connection()
+        return elapsed
+
+    with tempfile.TemporaryDirectory() as db_dir:
+        elapsed = await hass.async_add_executor_job(_replay, db_dir)
+
+    print(f"Recorded {events_to_replay / elapsed:.0f} events/sec")
+    return elapsed
+
+
+@benchmark
+async def statistics_reduce_per_month(hass):
+    """Reduce 3 years of hourly statistics of 50 statistic ids to months."""
+    # pylint: disable=import-outside-toplevel
+    from homeassistant.components.recorder import statistics
+    from homeassistant.components.recorder.models import Statistics
+
+    row = collections.namedtuple(
+        "row", "metadata_id start mean min max last_reset state sum"
+    )
+    first_start = datetime(2019, 1, 1)
+    hours = 3 * 365 * 24
+    metadata = {
+        f"sensor.energy_{meta_id}": (
+            meta_id,
+            {
+                "statistic_id": f"sensor.energy_{meta_id}",
+                "unit_of_measurement": "kWh",
+            },
+        )
+        for meta_id in range(50)
+    }
+    rows = [
+        row(
+            meta_id,
+            first_start + timedelta(hours=hour),
+            hour % 24,
+            hour % 24 - 1,
+            hour % 24 + 1,
+            None,
+            hour,
+            hour,
+        )
+        for meta_id in range(50)
+        for hour in range(hours)
+    ]
+
+    def _reduce():
+        # pylint: disable=protected-access
+        start = timer()
+        by_row = statistics._reduce_statistics_per_month(
+            statistics._sorted_statistics_to_dict(
+                hass, None, rows, None, metadata, True, Statistics, None, True
+            )
+        )
+        by_row_elapsed = timer() - start
+
+        start = timer()
+        by_column = statistics._reduce_sorted_statistics(
+            hass, None, rows, metadata, Statistics, None, "month"
+        )
+        elapsed = timer() - start
+
+        assert len(by_row) == len(by_column)
+        print(f"Per row: {by_row_elapsed:.3f}s, columnar: {elapsed:.3f}s")
+        return elapsed
+
+    return await hass.async_add_executor_job(_reduce)
+
+
 @benchmark
 async def logbook_filtering_state(hass):
     """Filter state changes."""
@@ -391,6 +613,99 @@ async def json_serialize_states(hass):
     return timer() - start
 
 
+@benchmark
+async def json_serialize_state_changed_events(hass):
+    """Serialize 100k state_changed events with the stdlib and the json facade."""
+    attributes = {
+        "unit_of_measurement": "W",
+        "friendly_name": "Power",
+        "device_class": "power",
+        "state_class": "measurement",
+        "options": ["low", "medium", "high"],
+    }
+    events = [
+        core.Event(
+            EVENT_STATE_CHANGED,
+            {
+                "entity_id": "sensor.power",
+                "old_state": core.State("sensor.power", str(idx - 1), attributes),
+                "new_state": core.State("sensor.power", str(idx), attributes),
+            },
+        )
+        for idx in range(10 ** 5)
+    ]
+
+    start = timer()
+    for event in events:
+        json.dumps(event, cls=JSONEncoder, allow_nan=False).encode("utf-8")
+    stdlib = timer() - start
+
+    start = timer()
+    for event in events:
+        json_bytes(event)
+    elapsed = timer() - start
+
+    print(f"stdlib json: {stdlib:.3f}s, {JSON_BACKEND}: {elapsed:.3f}s")
+    return elapsed
+
+
+@benchmark
+async def entity_service_call_single_entity(hass):
+    """Call a service 10k times, each targeting one of 5000 entities."""
+    # pylint: disable=import-outside-toplevel
+    from homeassistant.helpers import entity_platform, service
+    from homeassistant.helpers.entity import Entity
+
+    count = 0
+    calls = 10 ** 4
+
+    class BenchmarkEntity(Entity):
+        """Entity counting service calls."""
+
+        _attr_should_poll = False
+
+        async def async_turn_on(self):
+            """Handle the service call."""
+            nonlocal count
+            count += 1
+
+    platform = entity_platform.EntityPlatform(
+        hass=hass,
+        logger=logging.getLogger(__name__),
+        domain="light",
+        platform_name="benchmark",
+        platform=None,
+        scan_interval=timedelta(seconds=30),
+        entity_namespace=None,
+    )
+    for idx in range(5000):
+        entity = BenchmarkEntity()
+        entity.hass = hass
+        entity.platform = platform
+        entity.entity_id = f"light.benchmark_{idx}"
+        platform.entities[entity.entity_id] = entity
+
+    service_calls = [
+        core.ServiceCall(
+            "light", "turn_on", {"entity_id": [f"light.benchmark_{idx % 5000}"]}
+        )
+        for idx in range(calls)
+    ]
+
+    with tempfile.TemporaryDirectory() as config_dir:
+        # Groups are expanded, which loads the group integration
+        hass.config.config_dir = config_dir
+
+        start = timer()
+        for call in service_calls:
+            await service.entity_service_call(hass, [platform], "async_turn_on", call)
+        elapsed = timer() - start
+
+    assert count == calls
+    print(f"{calls / elapsed:.0f} service calls/sec")
+    return elapsed
+
+
 def _create_state_changed_event_from_old_new(
     entity_id, event_time_fired, old_state, new_state
 ):
@@ -413,6 +728,7 @@ def _create_state_changed_event_from_old_new(
             "entity_id"
             "domain"
             "attributes"
+            "shared_attrs"
             "state_id",
             "old_state_id",
         ],
@@ -420,7 +736,8 @@ def _create_state_changed_event_from_old_new(
 
     row.event_type = EVENT_STATE_CHANGED
     row.event_data = "{}"
-    row.attributes = attributes_json
+    row.attributes = None
+    row.shared_attrs = attributes_json
     row.time_fired = event_time_fired
     row.state = new_state and new_state.get("state")
     row.entity_id = entity_id
@@ -20,6 +20,7 @@ from homeassistant.core import CALLBACK_TYPE
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.typing import ConfigType
 from homeassistant.util import dt as dt_util, ensure_unique_string
+from homeassistant.util.executor import current_job_owner
 
 # mypy: disallow-any-generics
 
@@ -147,6 +148,7 @@ async def _async_setup_component(
 
     This method is a coroutine.
     """
+    current_job_owner.set(domain)
 
     def log_error(msg: str, link: str | None = None) -> None:
         """Log helper."""
@@ -1,14 +1,20 @@
 """Executor util helpers."""
 from __future__ import annotations
 
-from concurrent.futures import ThreadPoolExecutor
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
 import contextlib
+from contextvars import ContextVar
+from dataclasses import dataclass, replace
+import functools
 import logging
 import queue
 import sys
-from threading import Thread
+from threading import Lock, Thread
 import time
 import traceback
+from types import ModuleType
+from typing import Any, TypeVar
 
 from homeassistant.util.thread import async_raise
 
@@ -20,6 +26,53 @@ _JOIN_ATTEMPTS = 10
 
 EXECUTOR_SHUTDOWN_TIMEOUT = 10
 
+_T = TypeVar("_T")
+
+# The integration executor jobs are submitted for, set by Home Assistant while
+# it runs the setup, services and entity updates of an integration
+current_job_owner: ContextVar[str | None] = ContextVar(
+    "current_job_owner", default=None
+)
+
+
+@dataclass
+class ExecutorJobStatistics:
+    """Class for keeping track of the jobs an owner ran in an executor.
+
+    Wait is the time a job spent queued before a worker picked it up, run
+    is the time the worker spent on it. Times are in seconds.
+    """
+
+    jobs: int = 0
+    total_wait: float = 0
+    max_wait: float = 0
+    total_run: float = 0
+    max_run: float = 0
+
+
+def job_owner(target: Callable[..., Any]) -> str:
+    """Return the integration or package that owns an executor job.
+
+    Jobs are attributed to the integration which submits them. Jobs submitted
+    outside of integration code are attributed to the integration that
+    defines the target, otherwise to the top level package of its module.
+    """
+    if (domain := current_job_owner.get()) is not None:
+        return domain
+    while isinstance(target, functools.partial):
+        target = target.func
+    owner = getattr(target, "__self__", None)
+    if owner is not None and not isinstance(owner, ModuleType):
+        module = type(owner).__module__
+    else:
+        module = getattr(target, "__module__", None) or ""
+    parts = module.split(".", 3)
+    if parts[0] == "homeassistant" and len(parts) > 2 and parts[1] == "components":
+        return parts[2]
+    if parts[0] == "custom_components" and len(parts) > 1:
+        return parts[1]
+    return parts[0]
+
 
 def _log_thread_running_at_shutdown(name: str, ident: int) -> None:
     """Log the stack of a thread that was still running at shutdown."""
@@ -60,7 +113,62 @@ def join_or_interrupt_threads(
 
 
 class InterruptibleThreadPoolExecutor(ThreadPoolExecutor):
-    """A ThreadPoolExecutor instance that will not deadlock on shutdown."""
+    """A ThreadPoolExecutor instance that will not deadlock on shutdown.
+
+    The queue wait and run time of every job is recorded by job owner.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Initialize the executor."""
+        super().__init__(*args, **kwargs)
+        self._job_statistics: dict[str, ExecutorJobStatistics] = {}
+        self._job_statistics_lock = Lock()
+
+    def submit(  # type: ignore[override]
+        self, fn: Callable[..., _T], /, *args: Any, **kwargs: Any
+    ) -> Future[_T]:
+        """Submit a job and record its statistics when it has run."""
+        owner = job_owner(fn)
+        queued = time.monotonic()
+
+        def _run_job() -> _T:
+            start = time.monotonic()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                self._record_job(owner, start - queued, time.monotonic() - start)
+
+        return super().submit(_run_job)
+
+    def _record_job(self, owner: str, wait: float, run: float) -> None:
+        """Record the statistics of a job."""
+        with self._job_statistics_lock:
+            if (stats := self._job_statistics.get(owner)) is None:
+                stats = self._job_statistics[owner] = ExecutorJobStatistics()
+            stats.jobs += 1
+            stats.total_wait += wait
+            stats.total_run += run
+            if wait > stats.max_wait:
+                stats.max_wait = wait
+            if run > stats.max_run:
+                stats.max_run = run
+
+    @property
+    def max_workers(self) -> int:
+        """Return the maximum number of worker threads."""
+        return self._max_workers  # type: ignore[attr-defined,no-any-return]
+
+    @property
+    def queued_jobs(self) -> int:
+        """Return the approximate number of jobs waiting for a worker."""
+        return self._work_queue.qsize()  # type: ignore[attr-defined]
+
+    def job_statistics(self) -> dict[str, ExecutorJobStatistics]:
+        """Return a copy of the job statistics by job owner."""
+        with self._job_statistics_lock:
+            return {
+                owner: replace(stats) for owner, stats in self._job_statistics.items()
+            }
 
     def shutdown(self, *args, **kwargs) -> None:  # type: ignore
         """Shutdown backport from cpython 3.9 with interrupt support added."""
@@ -3,8 +3,10 @@ from __future__ import annotations
 
 from collections import deque
 from collections.abc import Callable
+from functools import partial
 import json
 import logging
+import math
 from typing import Any
 
 from homeassistant.core import Event, State
@@ -12,6 +14,11 @@ from homeassistant.exceptions import HomeAssistantError
 
 from .file import write_utf8_file, write_utf8_file_atomic
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
+
 _LOGGER = logging.getLogger(__name__)
 
 
@@ -23,6 +30,84 @@ class WriteError(HomeAssistantError):
     """Error writing the data."""
 
 
+def json_loads(data: str | bytes) -> Any:
+    """Parse json.
+
+    Uses orjson when it is installed. Documents orjson rejects but the stdlib
+    parser accepts, like NaN written by older versions, are parsed by the
+    stdlib parser.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
+
+
+def _json_dumps_pretty(data: Any) -> str:
+    """Serialize data to indented json for files.
+
+    Like the stdlib encoder, sets, datetimes and dataclasses are not
+    serialized. NaN and infinite floats are written as null by both backends.
+    """
+    if orjson is None:
+        return json_dumps_stdlib(data, indent=2)
+    return orjson.dumps(
+        data,
+        option=orjson.OPT_INDENT_2
+        | orjson.OPT_NON_STR_KEYS
+        | orjson.OPT_PASSTHROUGH_DATACLASS
+        | orjson.OPT_PASSTHROUGH_DATETIME,
+    ).decode("utf-8")
+
+
+def json_dumps_stdlib(
+    data: Any, *, default: Callable[[Any], Any] | None = None, **kwargs: Any
+) -> str:
+    """Serialize data with the stdlib encoder the way orjson does.
+
+    The stdlib encoder can only write NaN and infinite floats as invalid json
+    tokens. Data holding them is encoded again with the floats replaced by
+    null, other data is encoded once.
+    """
+    try:
+        return json.dumps(
+            data, default=default, allow_nan=False, ensure_ascii=False, **kwargs
+        )
+    except ValueError as error:
+        if not str(error).startswith("Out of range float values"):
+            raise
+
+    if default is not None:
+        default = partial(_convert_replacing_non_finite_floats, default)
+    return json.dumps(
+        _replace_non_finite_floats(data),
+        default=default,
+        allow_nan=False,
+        ensure_ascii=False,
+        **kwargs,
+    )
+
+
+def _convert_replacing_non_finite_floats(
+    default: Callable[[Any], Any], obj: Any
+) -> Any:
+    """Convert an object with default and replace the non-finite floats."""
+    return _replace_non_finite_floats(default(obj))
+
+
+def _replace_non_finite_floats(data: Any) -> Any:
+    """Return data with NaN and infinite floats replaced by None."""
+    if isinstance(data, float):
+        return data if math.isfinite(data) else None
+    if isinstance(data, dict):
+        return {key: _replace_non_finite_floats(value) for key, value in data.items()}
+    if isinstance(data, (list, tuple)):
+        return [_replace_non_finite_floats(value) for value in data]
+    return data
+
+
 def load_json(filename: str, default: list | dict | None = None) -> list | dict:
     """Load JSON data from a file and return as dict or list.
 
@@ -30,7 +115,7 @@ def load_json(filename: str, default: list | dict | None = None) -> list | dict:
     """
     try:
         with open(filename, encoding="utf-8") as fdesc:
-            return json.loads(fdesc.read())  # type: ignore
+            return json_loads(fdesc.read())  # type: ignore
     except FileNotFoundError:
         # This is not a fatal error
         _LOGGER.debug("JSON file not found: %s", filename)
@@ -56,7 +141,10 @@ def save_json(
     Returns True on success.
     """
     try:
-        json_data = json.dumps(data, indent=4, cls=encoder)
+        if encoder is None:
+            json_data = _json_dumps_pretty(data)
+        else:
+            json_data = json.dumps(data, indent=4, cls=encoder)
     except TypeError as error:
         msg = f"Failed to serialize to JSON: {filename}. Bad data at {format_unserializable_data(find_paths_unserializable_data(data))}"
         _LOGGER.error(msg)
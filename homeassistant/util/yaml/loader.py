@@ -2,15 +2,25 @@
 from __future__ import annotations
 
 from collections import OrderedDict
-from collections.abc import Iterator
+from collections.abc import Callable, Iterator
+from copy import deepcopy
 import fnmatch
 import logging
 import os
 from pathlib import Path
+import threading
 from typing import Any, TextIO, TypeVar, Union, overload
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as FastestAvailableSafeLoader
+
+    HAS_C_LOADER = True
+except ImportError:
+    HAS_C_LOADER = False
+    from yaml import SafeLoader as FastestAvailableSafeLoader  # type: ignore[misc]
+
 from homeassistant.exceptions import HomeAssistantError
 
 from .const import SECRET_YAML
@@ -23,6 +33,88 @@ DICT_T = TypeVar("DICT_T", bound=dict)  # pylint: disable=invalid-name
 
 _LOGGER = logging.getLogger(__name__)
 
+# The files looked at by the cached loads in progress in this thread
+_RECORDING = threading.local()
+
+
+def _file_signature(path: str) -> tuple[int, int] | None:
+    """Return the modification time and size of a file or directory."""
+    try:
+        stat_result = os.stat(path)
+    except OSError:
+        return None
+    return stat_result.st_mtime_ns, stat_result.st_size
+
+
+def _recording_stack() -> list[dict[str, tuple[int, int] | None]]:
+    """Return the dependencies of the cached loads in progress."""
+    if (stack := getattr(_RECORDING, "stack", None)) is None:
+        stack = _RECORDING.stack = []
+    return stack
+
+
+def _add_dependencies(dependencies: dict[str, tuple[int, int] | None]) -> None:
+    """Add dependencies to the cached loads in progress."""
+    for recording in _recording_stack():
+        recording.update(dependencies)
+
+
+def _record_dependency(path: str | Path) -> None:
+    """Record a file or directory a cached load depends on."""
+    if _recording_stack():
+        path = os.path.abspath(path)
+        _add_dependencies({path: _file_signature(path)})
+
+
+class YamlCache:
+    """Cache of parsed YAML files.
+
+    An entry stays valid while the modification time and size of the file,
+    of the files and directories it includes and of the secrets files it
+    looked at do not change. Secrets are resolved at load, so they are part
+    of the cached result. Cached results are copied, callers may modify them.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the cache."""
+        self._lock = threading.Lock()
+        self._entries: dict[
+            str, tuple[dict[str, tuple[int, int] | None], JSON_TYPE]
+        ] = {}
+
+    def load(self, fname: str, load_func: Callable[[], JSON_TYPE]) -> JSON_TYPE:
+        """Return the parsed file, calling load_func if it changed."""
+        path = os.path.abspath(fname)
+        with self._lock:
+            entry = self._entries.get(path)
+        if entry is not None and all(
+            _file_signature(dependency) == signature
+            for dependency, signature in entry[0].items()
+        ):
+            _add_dependencies(entry[0])
+            return deepcopy(entry[1])
+
+        # Taken before reading, a change while loading invalidates the entry
+        dependencies = {path: _file_signature(path)}
+        stack = _recording_stack()
+        stack.append(dependencies)
+        try:
+            result = load_func()
+        finally:
+            stack.pop()
+        _add_dependencies(dependencies)
+
+        # Files which are not on disk can't be validated
+        if dependencies[path] is not None:
+            with self._lock:
+                self._entries[path] = (dependencies, deepcopy(result))
+        return result
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._entries.clear()
+
 
 class Secrets:
     """Store secrets while loading YAML."""
@@ -46,6 +138,8 @@ class Secrets:
                 # We went above the config dir
                 break
 
+            # A secrets file which is added later changes the result too
+            _record_dependency(secret_dir / SECRET_YAML)
             secrets = self._load_secret_yaml(secret_dir)
 
             if secret in secrets:
@@ -88,13 +182,46 @@ class Secrets:
         return secrets
 
 
+class FastSafeLoader(FastestAvailableSafeLoader):
+    """Loader class using libyaml when available.
+
+    The nodes still have the start mark which the file references use, the
+    libyaml parser does not track the line of every node.
+    """
+
+    def __init__(
+        self,
+        stream: Any,
+        secrets: Secrets | None = None,
+        cache: YamlCache | None = None,
+    ) -> None:
+        """Initialize a fast safe loader."""
+        super().__init__(stream)
+        # The C parser does not expose the name and stream of the reader
+        if isinstance(stream, str):
+            self.name = "<unicode string>"
+        elif isinstance(stream, bytes):
+            self.name = "<byte string>"
+        else:
+            self.name = getattr(stream, "name", "<file>")
+        self.stream = stream
+        self.secrets = secrets
+        self.cache = cache
+
+
 class SafeLineLoader(yaml.SafeLoader):
     """Loader class that keeps track of line numbers."""
 
-    def __init__(self, stream: Any, secrets: Secrets | None = None) -> None:
+    def __init__(
+        self,
+        stream: Any,
+        secrets: Secrets | None = None,
+        cache: YamlCache | None = None,
+    ) -> None:
         """Initialize a safe line loader."""
         super().__init__(stream)
         self.secrets = secrets
+        self.cache = cache
 
     def compose_node(self, parent: yaml.nodes.Node, index: int) -> yaml.nodes.Node:  # type: ignore[override]
         """Annotate a node with the first line it was seen."""
@@ -104,52 +231,88 @@ class SafeLineLoader(yaml.SafeLoader):
         return node
 
 
-def load_yaml(fname: str, secrets: Secrets | None = None) -> JSON_TYPE:
-    """Load a YAML file."""
+LoaderType = Union[FastSafeLoader, SafeLineLoader]
+
+
+def load_yaml(
+    fname: str, secrets: Secrets | None = None, cache: YamlCache | None = None
+) -> JSON_TYPE:
+    """Load a YAML file.
+
+    The parsed file is reused from cache if given and the file did not change.
+    """
+    if cache is not None:
+        return cache.load(fname, lambda: _load_yaml(fname, secrets, cache))
+    return _load_yaml(fname, secrets, None)
+
+
+def _load_yaml(
+    fname: str, secrets: Secrets | None, cache: YamlCache | None
+) -> JSON_TYPE:
+    """Read and parse a YAML file."""
     try:
         with open(fname, encoding="utf-8") as conf_file:
-            return parse_yaml(conf_file, secrets)
+            return parse_yaml(conf_file, secrets, cache)
     except UnicodeDecodeError as exc:
         _LOGGER.error("Unable to read file %s: %s", fname, exc)
         raise HomeAssistantError(exc) from exc
 
 
-def parse_yaml(content: str | TextIO, secrets: Secrets | None = None) -> JSON_TYPE:
+def parse_yaml(
+    content: str | TextIO,
+    secrets: Secrets | None = None,
+    cache: YamlCache | None = None,
+) -> JSON_TYPE:
     """Load a YAML file."""
     try:
-        # If configuration file is empty YAML returns None
-        # We convert that to an empty dict
-        return (
-            yaml.load(content, Loader=lambda stream: SafeLineLoader(stream, secrets))
-            or OrderedDict()
-        )
+        if HAS_C_LOADER:
+            try:
+                return _parse_yaml(FastSafeLoader, content, secrets, cache)
+            except yaml.YAMLError:
+                # Parse again with the line loader for the more detailed error
+                if not isinstance(content, str):
+                    content.seek(0)
+        return _parse_yaml(SafeLineLoader, content, secrets, cache)
     except yaml.YAMLError as exc:
         _LOGGER.error(str(exc))
         raise HomeAssistantError(exc) from exc
 
 
+def _parse_yaml(
+    loader: type[LoaderType],
+    content: str | TextIO,
+    secrets: Secrets | None,
+    cache: YamlCache | None,
+) -> JSON_TYPE:
+    """Load a YAML file with a loader class."""
+    # If configuration file is empty YAML returns None
+    # We convert that to an empty dict
+    return (
+        yaml.load(content, Loader=lambda stream: loader(stream, secrets, cache))
+        or OrderedDict()
+    )
+
+
 @overload
 def _add_reference(
-    obj: list | NodeListClass, loader: SafeLineLoader, node: yaml.nodes.Node
+    obj: list | NodeListClass, loader: LoaderType, node: yaml.nodes.Node
 ) -> NodeListClass:
     ...
 
 
 @overload
 def _add_reference(
-    obj: str | NodeStrClass, loader: SafeLineLoader, node: yaml.nodes.Node
+    obj: str | NodeStrClass, loader: LoaderType, node: yaml.nodes.Node
 ) -> NodeStrClass:
     ...
 
 
 @overload
-def _add_reference(
-    obj: DICT_T, loader: SafeLineLoader, node: yaml.nodes.Node
-) -> DICT_T:
+def _add_reference(obj: DICT_T, loader: LoaderType, node: yaml.nodes.Node) -> DICT_T:
     ...
 
 
-def _add_reference(obj, loader: SafeLineLoader, node: yaml.nodes.Node):  # type: ignore
+def _add_reference(obj, loader: LoaderType, node: yaml.nodes.Node):  # type: ignore
     """Add file reference information to an object."""
     if isinstance(obj, list):
         obj = NodeListClass(obj)
@@ -160,7 +323,7 @@ def _add_reference(obj, loader: SafeLineLoader, node: yaml.nodes.Node):  # type:
     return obj
 
 
-def _include_yaml(loader: SafeLineLoader, node: yaml.nodes.Node) -> JSON_TYPE:
+def _include_yaml(loader: LoaderType, node: yaml.nodes.Node) -> JSON_TYPE:
     """Load another YAML file and embeds it using the !include tag.
 
     Example:
@@ -169,7 +332,9 @@ def _include_yaml(loader: SafeLineLoader, node: yaml.nodes.Node) -> JSON_TYPE:
     """
     fname = os.path.join(os.path.dirname(loader.name), node.value)
     try:
-        return _add_reference(load_yaml(fname, loader.secrets), loader, node)
+        return _add_reference(
+            load_yaml(fname, loader.secrets, loader.cache), loader, node
+        )
     except FileNotFoundError as exc:
         raise HomeAssistantError(
             f"{node.start_mark}: Unable to read file {fname}."
@@ -184,6 +349,8 @@ def _is_file_valid(name: str) -> bool:
 def _find_files(directory: str, pattern: str) -> Iterator[str]:
     """Recursively load files in a directory."""
     for root, dirs, files in os.walk(directory, topdown=True):
+        # Adding or removing a file changes the directory
+        _record_dependency(root)
         dirs[:] = [d for d in dirs if _is_file_valid(d)]
         for basename in sorted(files):
             if _is_file_valid(basename) and fnmatch.fnmatch(basename, pattern):
@@ -191,9 +358,7 @@ def _find_files(directory: str, pattern: str) -> Iterator[str]:
                 yield filename
 
 
-def _include_dir_named_yaml(
-    loader: SafeLineLoader, node: yaml.nodes.Node
-) -> OrderedDict:
+def _include_dir_named_yaml(loader: LoaderType, node: yaml.nodes.Node) -> OrderedDict:
     """Load multiple files from directory as a dictionary."""
     mapping: OrderedDict = OrderedDict()
     loc = os.path.join(os.path.dirname(loader.name), node.value)
@@ -201,12 +366,12 @@ def _include_dir_named_yaml(
         filename = os.path.splitext(os.path.basename(fname))[0]
         if os.path.basename(fname) == SECRET_YAML:
             continue
-        mapping[filename] = load_yaml(fname, loader.secrets)
+        mapping[filename] = load_yaml(fname, loader.secrets, loader.cache)
     return _add_reference(mapping, loader, node)
 
 
 def _include_dir_merge_named_yaml(
-    loader: SafeLineLoader, node: yaml.nodes.Node
+    loader: LoaderType, node: yaml.nodes.Node
 ) -> OrderedDict:
     """Load multiple files from directory as a merged dictionary."""
     mapping: OrderedDict = OrderedDict()
@@ -214,26 +379,26 @@ def _include_dir_merge_named_yaml(
     for fname in _find_files(loc, "*.yaml"):
         if os.path.basename(fname) == SECRET_YAML:
             continue
-        loaded_yaml = load_yaml(fname, loader.secrets)
+        loaded_yaml = load_yaml(fname, loader.secrets, loader.cache)
         if isinstance(loaded_yaml, dict):
             mapping.update(loaded_yaml)
     return _add_reference(mapping, loader, node)
 
 
 def _include_dir_list_yaml(
-    loader: SafeLineLoader, node: yaml.nodes.Node
+    loader: LoaderType, node: yaml.nodes.Node
 ) -> list[JSON_TYPE]:
     """Load multiple files from directory as a list."""
     loc = os.path.join(os.path.dirname(loader.name), node.value)
     return [
-        load_yaml(f, loader.secrets)
+        load_yaml(f, loader.secrets, loader.cache)
         for f in _find_files(loc, "*.yaml")
         if os.path.basename(f) != SECRET_YAML
     ]
 
 
 def _include_dir_merge_list_yaml(
-    loader: SafeLineLoader, node: yaml.nodes.Node
+    loader: LoaderType, node: yaml.nodes.Node
 ) -> JSON_TYPE:
     """Load multiple files from directory as a merged list."""
     loc: str = os.path.join(os.path.dirname(loader.name), node.value)
@@ -241,13 +406,13 @@ def _include_dir_merge_list_yaml(
     for fname in _find_files(loc, "*.yaml"):
         if os.path.basename(fname) == SECRET_YAML:
             continue
-        loaded_yaml = load_yaml(fname, loader.secrets)
+        loaded_yaml = load_yaml(fname, loader.secrets, loader.cache)
         if isinstance(loaded_yaml, list):
             merged_list.extend(loaded_yaml)
     return _add_reference(merged_list, loader, node)
 
 
-def _ordered_dict(loader: SafeLineLoader, node: yaml.nodes.MappingNode) -> OrderedDict:
+def _ordered_dict(loader: LoaderType, node: yaml.nodes.MappingNode) -> OrderedDict:
     """Load YAML mappings into an ordered dictionary to preserve key order."""
     loader.flatten_mapping(node)
     nodes = loader.construct_pairs(node)
@@ -279,13 +444,13 @@ def _ordered_dict(loader: SafeLineLoader, node: yaml.nodes.MappingNode) -> Order
     return _add_reference(OrderedDict(nodes), loader, node)
 
 
-def _construct_seq(loader: SafeLineLoader, node: yaml.nodes.Node) -> JSON_TYPE:
+def _construct_seq(loader: LoaderType, node: yaml.nodes.Node) -> JSON_TYPE:
     """Add line number and file name to Load YAML sequence."""
     (obj,) = loader.construct_yaml_seq(node)
     return _add_reference(obj, loader, node)
 
 
-def _env_var_yaml(loader: SafeLineLoader, node: yaml.nodes.Node) -> str:
+def _env_var_yaml(loader: LoaderType, node: yaml.nodes.Node) -> str:
     """Load environment variables and embed it into the configuration YAML."""
     args = node.value.split()
 
@@ -298,7 +463,7 @@ def _env_var_yaml(loader: SafeLineLoader, node: yaml.nodes.Node) -> str:
     raise HomeAssistantError(node.value)
 
 
-def secret_yaml(loader: SafeLineLoader, node: yaml.nodes.Node) -> JSON_TYPE:
+def secret_yaml(loader: LoaderType, node: yaml.nodes.Node) -> JSON_TYPE:
     """Load secrets and embed it into the configuration YAML."""
     if loader.secrets is None:
         raise HomeAssistantError("Secrets not supported in this YAML file")
@@ -306,19 +471,19 @@ def secret_yaml(loader: SafeLineLoader, node: yaml.nodes.Node) -> JSON_TYPE:
     return loader.secrets.get(loader.name, node.value)
 
 
-SafeLineLoader.add_constructor("!include", _include_yaml)
-SafeLineLoader.add_constructor(
-    yaml.resolver.BaseResolver.DEFAULT_MAPPING_TAG, _ordered_dict
-)
-SafeLineLoader.add_constructor(
-    yaml.resolver.BaseResolver.DEFAULT_SEQUENCE_TAG, _construct_seq
-)
-SafeLineLoader.add_constructor("!env_var", _env_var_yaml)
-SafeLineLoader.add_constructor("!secret", secret_yaml)
-SafeLineLoader.add_constructor("!include_dir_list", _include_dir_list_yaml)
-SafeLineLoader.add_constructor("!include_dir_merge_list", _include_dir_merge_list_yaml)
-SafeLineLoader.add_constructor("!include_dir_named", _include_dir_named_yaml)
-SafeLineLoader.add_constructor(
-    "!include_dir_merge_named", _include_dir_merge_named_yaml
-)
-SafeLineLoader.add_constructor("!input", Input.from_node)
+def add_constructor(tag: str, constructor: Callable) -> None:
+    """Add a constructor for a tag to the loaders."""
+    FastSafeLoader.add_constructor(tag, constructor)
+    SafeLineLoader.add_constructor(tag, constructor)
+
+
+add_constructor("!include", _include_yaml)
+add_constructor(yaml.resolver.BaseResolver.DEFAULT_MAPPING_TAG, _ordered_dict)
+add_constructor(yaml.resolver.BaseResolver.DEFAULT_SEQUENCE_TAG, _construct_seq)
+add_constructor("!env_var", _env_var_yaml)
+add_constructor("!secret", secret_yaml)
+add_constructor("!include_dir_list", _include_dir_list_yaml)
+add_constructor("!include_dir_merge_list", _include_dir_merge_list_yaml)
+add_constructor("!include_dir_named", _include_dir_named_yaml)
+add_constructor("!include_dir_merge_named", _include_dir_merge_named_yaml)
+add_constructor("!input", Input.from_node)
@@ -45,6 +45,7 @@ REQUIRES = [
     "httpx==0.21.0",
     "ifaddr==0.1.7",
     "jinja2==3.0.3",
+    "orjson==3.6.5",
     "PyJWT==2.1.0",
     # PyJWT has loose dependency. We want the latest one.
     "cryptography==35.0.0",
@@ -1089,7 +1089,8 @@ async def flush_store(store):
 
 async def get_system_health_info(hass, domain):
     """Get system health info."""
-    return await hass.data["system_health"][domain].info_callback(hass)
+    registrations = await hass.components.system_health.async_get_registrations()
+    return await registrations[domain].info_callback(hass)
 
 
 def mock_integration(hass, module, built_in=True):
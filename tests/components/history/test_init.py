@@ -678,6 +678,73 @@ async def test_fetch_period_api_with_entity_glob_include(hass, hass_client):
     assert response_json[0][0]["entity_id"] == "light.kitchen"
 
 
+async def test_fetch_period_stream_api(hass, hass_client):
+    """Test the streamed history matches the fetch period view."""
+    await hass.async_add_executor_job(init_recorder_component, hass)
+    await async_setup_component(hass, "history", {})
+    await hass.async_add_executor_job(hass.data[recorder.DATA_INSTANCE].block_till_done)
+    start = dt_util.utcnow() - timedelta(hours=1)
+    hass.states.async_set("light.kitchen", "on", {"brightness": 100})
+    hass.states.async_set("light.cow", "on")
+    hass.states.async_set("light.kitchen", "off")
+    hass.states.async_set("light.kitchen", "on", {"brightness": 50})
+
+    await hass.async_block_till_done()
+
+    await hass.async_add_executor_job(trigger_db_commit, hass)
+    await hass.async_block_till_done()
+    await hass.async_add_executor_job(hass.data[recorder.DATA_INSTANCE].block_till_done)
+
+    client = await hass_client()
+    for params in ({}, {"minimal_response": ""}):
+        response = await client.get(
+            f"/api/history/period/{start.isoformat()}", params=params
+        )
+        assert response.status == HTTPStatus.OK
+        expected = sorted(await response.json(), key=lambda s: s[0]["entity_id"])
+
+        response = await client.get(
+            f"/api/history/stream/{start.isoformat()}", params=params
+        )
+        assert response.status == HTTPStatus.OK
+        assert await response.json() == expected
+
+
+async def test_fetch_period_stream_api_downsampled(hass, hass_client):
+    """Test the streamed history downsamples numeric states."""
+    await hass.async_add_executor_job(init_recorder_component, hass)
+    await async_setup_component(hass, "history", {})
+    await hass.async_add_executor_job(hass.data[recorder.DATA_INSTANCE].block_till_done)
+    start = dt_util.utcnow() - timedelta(hours=1)
+    for state in ("1", "2", "unavailable", "6"):
+        hass.states.async_set("sensor.power", state)
+
+    await hass.async_block_till_done()
+
+    await hass.async_add_executor_job(trigger_db_commit, hass)
+    await hass.async_block_till_done()
+    await hass.async_add_executor_job(hass.data[recorder.DATA_INSTANCE].block_till_done)
+
+    client = await hass_client()
+    response = await client.get(
+        f"/api/history/stream/{start.isoformat()}", params={"max_points": 1}
+    )
+    assert response.status == HTTPStatus.OK
+    response_json = await response.json()
+    assert len(response_json) == 1
+    points = response_json[0]
+    assert [(p["state"], p.get("min"), p.get("max")) for p in points] == [
+        (1.5, 1.0, 2.0),
+        ("unavailable", None, None),
+        (6.0, 6.0, 6.0),
+    ]
+
+    response = await client.get(
+        f"/api/history/stream/{start.isoformat()}", params={"max_points": 0}
+    )
+    assert response.status == HTTPStatus.BAD_REQUEST
+
+
 async def test_fetch_period_api_with_entity_glob_exclude(hass, hass_client):
     """Test the fetch period view for history."""
     await hass.async_add_executor_job(init_recorder_component, hass)
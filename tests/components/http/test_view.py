@@ -33,10 +33,19 @@ async def test_invalid_json(caplog):
     """Test trying to return invalid JSON."""
     view = HomeAssistantView()
 
+    bad_data = object()
     with pytest.raises(HTTPInternalServerError):
-        view.json(float("NaN"))
+        view.json(bad_data)
 
-    assert str(float("NaN")) in caplog.text
+    assert str(bad_data) in caplog.text
+
+
+async def test_nan_serialized_to_null():
+    """Test NaN floats are returned as null."""
+    view = HomeAssistantView()
+
+    response = view.json({"value": float("NaN")})
+    assert response.body == b'{"value":null}'
 
 
 async def test_handling_unauthorized(mock_request):
@@ -1,5 +1,6 @@
 """The tests for the logbook component."""
 # pylint: disable=protected-access,invalid-name
+import asyncio
 import collections
 from datetime import datetime, timedelta
 from http import HTTPStatus
@@ -288,6 +289,7 @@ def create_state_changed_event_from_old_new(
             "entity_id"
             "domain"
             "attributes"
+            "shared_attrs"
             "state_id",
             "old_state_id",
         ],
@@ -295,7 +297,8 @@ def create_state_changed_event_from_old_new(
 
     row.event_type = EVENT_STATE_CHANGED
     row.event_data = "{}"
-    row.attributes = attributes_json
+    row.attributes = None
+    row.shared_attrs = attributes_json
     row.time_fired = event_time_fired
     row.state = new_state and new_state.get("state")
     row.entity_id = entity_id
@@ -1874,6 +1877,207 @@ async def test_context_filter(hass, hass_client):
     assert response.status == HTTPStatus.BAD_REQUEST
 
 
+async def test_event_stream_history_and_live(hass, hass_ws_client):
+    """Test the historical entries are streamed in chunks before the live ones."""
+    await hass.async_add_executor_job(init_recorder_component, hass)
+    assert await async_setup_component(hass, "logbook", {})
+    await hass.async_add_executor_job(hass.data[recorder.DATA_INSTANCE].block_till_done)
+
+    entity_id = "switch.test"
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_START)
+    for state in range(5):
+        hass.states.async_set(entity_id, str(state))
+    await _async_commit_and_wait(hass)
+
+    start_time = dt_util.utcnow() - timedelta(hours=1)
+    client = await hass_ws_client()
+    with patch.object(logbook, "STREAM_CHUNK_SIZE", 2):
+        await client.send_json(
+            {
+                "id": 1,
+                "type": "logbook/event_stream",
+                "start_time": start_time.isoformat(),
+            }
+        )
+        response = await client.receive_json()
+        assert response["success"]
+
+        entries = []
+        partial_messages = 0
+        while True:
+            response = await client.receive_json()
+            assert response["id"] == 1
+            assert response["type"] == "event"
+            entries.extend(response["event"]["events"])
+            if not response["event"]["partial"]:
+                break
+            assert len(response["event"]["events"]) == 2
+            partial_messages += 1
+
+    assert partial_messages == 2
+    assert len(entries) == 5
+    assert entries[0]["message"] == "started"
+    _assert_entry(entries[1], entity_id=entity_id, state="1")
+    _assert_entry(entries[4], entity_id=entity_id, state="4")
+
+    hass.states.async_set(entity_id, "5")
+    hass.states.async_set("switch.other", STATE_ON, {"unit_of_measurement": "W"})
+    hass.states.async_set("sensor.power", "10", {"unit_of_measurement": "W"})
+    await hass.async_block_till_done()
+
+    response = await client.receive_json()
+    assert response["id"] == 1
+    assert "partial" not in response["event"]
+    assert len(response["event"]["events"]) == 1
+    _assert_entry(response["event"]["events"][0], entity_id=entity_id, state="5")
+
+    hass.states.async_set("switch.other", STATE_OFF)
+    await hass.async_block_till_done()
+    response = await client.receive_json()
+    _assert_entry(
+        response["event"]["events"][0], entity_id="switch.other", state=STATE_OFF
+    )
+
+    await client.send_json({"id": 2, "type": "unsubscribe_events", "subscription": 1})
+    response = await client.receive_json()
+    assert response["id"] == 2
+    assert response["success"]
+
+
+async def test_event_stream_entity_ids(hass, hass_ws_client):
+    """Test the stream only has entries for the requested entities."""
+    await hass.async_add_executor_job(init_recorder_component, hass)
+    assert await async_setup_component(hass, "logbook", {})
+    await hass.async_add_executor_job(hass.data[recorder.DATA_INSTANCE].block_till_done)
+
+    hass.states.async_set("switch.one", STATE_ON)
+    hass.states.async_set("switch.two", STATE_ON)
+    hass.states.async_set("switch.one", STATE_OFF)
+    hass.states.async_set("switch.two", STATE_OFF)
+    await _async_commit_and_wait(hass)
+
+    client = await hass_ws_client()
+    await client.send_json(
+        {
+            "id": 1,
+            "type": "logbook/event_stream",
+            "start_time": (dt_util.utcnow() - timedelta(hours=1)).isoformat(),
+            "entity_ids": ["switch.two"],
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    response = await client.receive_json()
+    assert response["event"]["partial"] is False
+    entries = response["event"]["events"]
+    assert len(entries) == 1
+    _assert_entry(entries[0], entity_id="switch.two", state=STATE_OFF)
+
+    hass.states.async_set("switch.one", STATE_ON)
+    hass.states.async_set("switch.two", STATE_ON)
+    await hass.async_block_till_done()
+    response = await client.receive_json()
+    entries = response["event"]["events"]
+    assert len(entries) == 1
+    _assert_entry(entries[0], entity_id="switch.two", state=STATE_ON)
+
+
+async def test_event_stream_past_end_time(hass, hass_ws_client):
+    """Test a stream ending in the past only sends the historical entries."""
+    await hass.async_add_executor_job(init_recorder_component, hass)
+    assert await async_setup_component(hass, "logbook", {})
+    await hass.async_add_executor_job(hass.data[recorder.DATA_INSTANCE].block_till_done)
+
+    hass.states.async_set("switch.one", STATE_ON)
+    hass.states.async_set("switch.one", STATE_OFF)
+    await _async_commit_and_wait(hass)
+    now = dt_util.utcnow()
+
+    client = await hass_ws_client()
+    await client.send_json(
+        {
+            "id": 1,
+            "type": "logbook/event_stream",
+            "start_time": (now - timedelta(hours=1)).isoformat(),
+            "end_time": now.isoformat(),
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    response = await client.receive_json()
+    assert response["event"]["partial"] is False
+    assert len(response["event"]["events"]) == 1
+
+    hass.states.async_set("switch.one", STATE_ON)
+    await hass.async_block_till_done()
+    await client.send_json({"id": 2, "type": "ping"})
+    response = await client.receive_json()
+    assert response["id"] == 2
+    assert response["type"] == "pong"
+
+
+async def test_event_stream_recorder_commit_timeout(hass, hass_ws_client, caplog):
+    """Test the stream is sent when the recorder does not commit in time."""
+    await hass.async_add_executor_job(init_recorder_component, hass)
+    assert await async_setup_component(hass, "logbook", {})
+    await hass.async_add_executor_job(hass.data[recorder.DATA_INSTANCE].block_till_done)
+
+    hass.states.async_set("switch.one", STATE_ON)
+    hass.states.async_set("switch.one", STATE_OFF)
+    await _async_commit_and_wait(hass)
+
+    async def _never_commits():
+        await asyncio.Event().wait()
+
+    client = await hass_ws_client()
+    with patch.object(logbook, "RECORDER_COMMIT_TIMEOUT", 0), patch.object(
+        hass.data[recorder.DATA_INSTANCE],
+        "async_block_till_done",
+        side_effect=_never_commits,
+    ):
+        await client.send_json(
+            {
+                "id": 1,
+                "type": "logbook/event_stream",
+                "start_time": (dt_util.utcnow() - timedelta(hours=1)).isoformat(),
+            }
+        )
+        response = await client.receive_json()
+        assert response["success"]
+        response = await client.receive_json()
+
+    assert response["event"]["partial"] is False
+    assert len(response["event"]["events"]) == 1
+    assert "The recorder did not commit within 0 seconds" in caplog.text
+
+
+async def test_event_stream_invalid_request(hass, hass_ws_client):
+    """Test invalid stream requests are rejected."""
+    await hass.async_add_executor_job(init_recorder_component, hass)
+    assert await async_setup_component(hass, "logbook", {})
+
+    client = await hass_ws_client()
+    await client.send_json(
+        {"id": 1, "type": "logbook/event_stream", "start_time": "invalid"}
+    )
+    response = await client.receive_json()
+    assert not response["success"]
+    assert response["error"]["code"] == "invalid_start_time"
+
+    await client.send_json(
+        {
+            "id": 2,
+            "type": "logbook/event_stream",
+            "start_time": dt_util.utcnow().isoformat(),
+            "entity_ids": ["switch.one"],
+            "context_id": "abc",
+        }
+    )
+    response = await client.receive_json()
+    assert not response["success"]
+    assert response["error"]["code"] == "invalid_request"
+
+
 async def _async_fetch_logbook(client, params=None):
     if params is None:
         params = {}
@@ -11,6 +11,7 @@ import voluptuous as vol
 from homeassistant.components import mqtt, websocket_api
 from homeassistant.components.mqtt import debug_info
 from homeassistant.components.mqtt.mixins import MQTT_ENTITY_DEVICE_INFO_SCHEMA
+from homeassistant.components.mqtt.models import ReceiveMessage
 from homeassistant.const import (
     EVENT_HOMEASSISTANT_STARTED,
     EVENT_HOMEASSISTANT_STOP,
@@ -837,6 +838,39 @@ async def test_subscribe_special_characters(hass, mqtt_mock, calls, record_calls
     assert calls[0][0].payload == payload
 
 
+async def test_received_messages_dispatched_in_batches(
+    hass, mqtt_mock, calls, record_calls
+):
+    """Test messages received by the network thread are dispatched in batches."""
+    await mqtt.async_subscribe(hass, "test-topic/#", record_calls)
+    await mqtt.async_subscribe(hass, "test-topic/+", record_calls, encoding=None)
+
+    with patch("homeassistant.components.mqtt.MAX_MESSAGE_BATCH", 2):
+        for idx in range(3):
+            mqtt_mock._mqtt_on_message(
+                None, None, ReceiveMessage(f"test-topic/{idx}", b"payload", 0, False)
+            )
+        await hass.async_block_till_done()
+
+        # The rest of the messages are dispatched in the next loop iteration
+        assert len(calls) == 4
+        await hass.async_block_till_done()
+
+    assert [(call[0].topic, call[0].payload) for call in calls] == [
+        ("test-topic/0", b"payload"),
+        ("test-topic/0", "payload"),
+        ("test-topic/1", b"payload"),
+        ("test-topic/1", "payload"),
+        ("test-topic/2", b"payload"),
+        ("test-topic/2", "payload"),
+    ]
+    metrics = mqtt_mock.ingest_metrics.as_dict()
+    assert metrics["messages"] == 3
+    assert metrics["batches"] == 2
+    assert metrics["max_batch_size"] == 2
+    assert metrics["last_batch_size"] == 1
+
+
 async def test_subscribe_same_topic(hass, mqtt_client_mock, mqtt_mock):
     """
     Test subscring to same topic twice and simulate retained messages.
@@ -1108,13 +1142,9 @@ async def test_delayed_birth_message(hass, mqtt_client_mock, mqtt_config):
     assert result
     await hass.async_block_till_done()
 
-    # Workaround: asynctest==0.13 fails on @functools.lru_cache
-    spec = dir(hass.data["mqtt"])
-    spec.remove("_matching_subscriptions")
-
     mqtt_component_mock = MagicMock(
         return_value=hass.data["mqtt"],
-        spec_set=spec,
+        spec_set=hass.data["mqtt"],
         wraps=hass.data["mqtt"],
     )
     mqtt_component_mock._mqttc = mqtt_client_mock
@@ -1427,6 +1457,15 @@ async def test_mqtt_ws_get_device_debug_info(
         ],
         "triggers": [],
     }
+    assert response["result"].pop("ingest").keys() == {
+        "messages",
+        "batches",
+        "messages_per_second",
+        "last_batch_size",
+        "max_batch_size",
+        "last_dispatch_latency",
+        "max_dispatch_latency",
+    }
     assert response["result"] == expected_result
 
 
@@ -0,0 +1,68 @@
+"""The tests for the MQTT topic trie."""
+import pytest
+
+from homeassistant.components.mqtt.topic_trie import TopicTrie
+
+
+@pytest.mark.parametrize(
+    "topic_filter,topic,matches",
+    [
+        ("test-topic", "test-topic", True),
+        ("test-topic", "test-topic/extra", False),
+        ("test/+/on", "test/bier/on", True),
+        ("test/+/on", "test/bier/off", False),
+        ("test/+/on", "test/on", False),
+        ("+", "test", True),
+        ("+", "/test", False),
+        ("+/+", "/test", True),
+        ("test/#", "test", True),
+        ("test/#", "test/bier/on", True),
+        ("test/#", "other/test", False),
+        ("#", "test/bier/on", True),
+        ("#", "$SYS/broker", False),
+        ("+/broker", "$SYS/broker", False),
+        ("$SYS/#", "$SYS/broker", True),
+        ("$SYS/+", "$SYS/broker", True),
+        ("test//+", "test//on", True),
+    ],
+)
+def test_matches(topic_filter, topic, matches):
+    """Test topic filters are matched with MQTT wildcard semantics."""
+    trie = TopicTrie()
+    trie.add(topic_filter, "value")
+    assert trie.matches(topic) == (["value"] if matches else [])
+
+
+def test_matches_multiple_filters():
+    """Test all matching topic filters are returned."""
+    trie = TopicTrie()
+    trie.add("home/+/temperature", "single")
+    trie.add("home/#", "multi")
+    trie.add("home/kitchen/temperature", "exact")
+    trie.add("home/kitchen/temperature", "exact_2")
+    trie.add("home/kitchen/humidity", "other")
+
+    assert sorted(trie.matches("home/kitchen/temperature")) == [
+        "exact",
+        "exact_2",
+        "multi",
+        "single",
+    ]
+
+
+def test_remove():
+    """Test removing values prunes the trie."""
+    trie = TopicTrie()
+    trie.add("home/+/temperature", "one")
+    trie.add("home/+/temperature", "two")
+
+    assert "home/+/temperature" in trie
+    assert trie.remove("home/+/temperature", "one") is True
+    assert trie.matches("home/kitchen/temperature") == ["two"]
+    assert trie.remove("home/+/temperature", "two") is False
+    assert "home/+/temperature" not in trie
+    assert trie.matches("home/kitchen/temperature") == []
+    assert trie._root.children == {}
+
+    with pytest.raises(ValueError):
+        trie.remove("home/+/temperature", "two")
@@ -7,6 +7,7 @@ from homeassistant.components.profiler import (
     CONF_SECONDS,
     SERVICE_DUMP_LOG_OBJECTS,
     SERVICE_LOG_EVENT_LOOP_SCHEDULED,
+    SERVICE_LOG_EXECUTOR_STATISTICS,
     SERVICE_LOG_THREAD_FRAMES,
     SERVICE_MEMORY,
     SERVICE_START,
@@ -185,3 +186,31 @@ async def test_log_scheduled(hass, caplog):
 
     assert await hass.config_entries.async_unload(entry.entry_id)
     await hass.async_block_till_done()
+
+
+async def test_log_executor_statistics(hass, caplog):
+    """Test we can log the job statistics of the executors."""
+    hass.config.executor_pools = {"tests": 1}
+
+    def test_executor():
+        """Test executor."""
+
+    await hass.async_add_executor_job(test_executor)
+
+    entry = MockConfigEntry(domain=DOMAIN)
+    entry.add_to_hass(hass)
+
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    assert hass.services.has_service(DOMAIN, SERVICE_LOG_EXECUTOR_STATISTICS)
+
+    await hass.services.async_call(DOMAIN, SERVICE_LOG_EXECUTOR_STATISTICS, {})
+    await hass.async_block_till_done()
+
+    assert "Executor [tests]: 1 max workers" in caplog.text
+    assert "Executor [tests] jobs of tests: 1 jobs" in caplog.text
+    caplog.clear()
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
@@ -1,14 +1,13 @@
 """Common test utils for working with recorder."""
-from datetime import timedelta
-
+# pylint: disable=protected-access
 from sqlalchemy import create_engine
 
 from homeassistant import core as ha
 from homeassistant.components import recorder
 from homeassistant.core import HomeAssistant
 from homeassistant.util import dt as dt_util
+from homeassistant.util.async_ import run_callback_threadsafe
 
-from tests.common import async_fire_time_changed, fire_time_changed
 from tests.components.recorder import models_schema_0
 
 DEFAULT_PURGE_TASKS = 3
@@ -30,9 +29,8 @@ async def async_wait_recording_done_without_instance(hass: HomeAssistant) -> Non
 
 def trigger_db_commit(hass: HomeAssistant) -> None:
     """Force the recorder to commit."""
-    for _ in range(recorder.DEFAULT_COMMIT_INTERVAL):
-        # We only commit on time change
-        fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=1))
+    # Queued from the event loop after the events fired so far
+    run_callback_threadsafe(hass.loop, async_trigger_db_commit, hass).result()
 
 
 async def async_wait_recording_done(
@@ -66,8 +64,12 @@ async def async_wait_purge_done(
 @ha.callback
 def async_trigger_db_commit(hass: HomeAssistant) -> None:
     """Fore the recorder to commit. Async friendly."""
-    for _ in range(recorder.DEFAULT_COMMIT_INTERVAL):
-        async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=1))
+    # Queue the commit directly, the commit timer may not be armed yet
+    # or the time may be mocked. It is scheduled with call_soon so it lands
+    # behind the listeners of events which are already being fired.
+    hass.loop.call_soon(
+        hass.data[recorder.DATA_INSTANCE]._async_commit, dt_util.utcnow()
+    )
 
 
 async def async_recorder_block_till_done(
@@ -6,7 +6,11 @@ import json
 from unittest.mock import patch, sentinel
 
 from homeassistant.components.recorder import history
-from homeassistant.components.recorder.models import process_timestamp
+from homeassistant.components.recorder.models import (
+    StatesCheckpoints,
+    process_timestamp,
+)
+from homeassistant.components.recorder.util import session_scope
 import homeassistant.core as ha
 from homeassistant.helpers.json import JSONEncoder
 import homeassistant.util.dt as dt_util
@@ -75,6 +79,47 @@ def test_get_states(hass_recorder):
     assert history.get_state(hass, time_before_recorder_ran, "demo.id") is None
 
 
+def test_get_states_from_checkpoint(hass_recorder):
+    """Test getting states at a point in time after a states checkpoint."""
+    hass = hass_recorder()
+    entity_ids = [f"test.point_in_time_{i}" for i in range(5)]
+
+    now = dt_util.utcnow()
+    with patch("homeassistant.components.recorder.dt_util.utcnow", return_value=now):
+        for i, entity_id in enumerate(entity_ids):
+            mock_state_change_event(hass, ha.State(entity_id, f"State {i}"))
+        wait_recording_done(hass)
+
+    # The first state of a new hour writes a checkpoint of the states before it
+    later = now + timedelta(hours=2)
+    checkpoint_start = later.replace(minute=0, second=0, microsecond=0)
+    with patch("homeassistant.components.recorder.dt_util.utcnow", return_value=later):
+        for i, entity_id in enumerate(entity_ids[:3]):
+            mock_state_change_event(hass, ha.State(entity_id, f"Later {i}"))
+        wait_recording_done(hass)
+
+    with session_scope(hass=hass) as session:
+        checkpoints = {
+            checkpoint.entity_id: process_timestamp(checkpoint.start)
+            for checkpoint in session.query(StatesCheckpoints)
+        }
+    assert checkpoints == {entity_id: checkpoint_start for entity_id in entity_ids}
+
+    point = later + timedelta(seconds=1)
+    expected = ["Later 0", "Later 1", "Later 2", "State 3", "State 4"]
+    states = sorted(history.get_states(hass, point), key=lambda s: s.entity_id)
+    assert [state.state for state in states] == expected
+    states = sorted(
+        history.get_states(hass, point, entity_ids[1:4]), key=lambda s: s.entity_id
+    )
+    assert [state.state for state in states] == expected[1:4]
+
+    # There is no checkpoint of the current run before the checkpoint start
+    point = checkpoint_start - timedelta(seconds=1)
+    states = sorted(history.get_states(hass, point), key=lambda s: s.entity_id)
+    assert [state.state for state in states] == [f"State {i}" for i in range(5)]
+
+
 def test_state_changes_during_period(hass_recorder):
     """Test state change during period."""
     hass = hass_recorder()
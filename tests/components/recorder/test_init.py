@@ -29,6 +29,7 @@ from homeassistant.components.recorder.const import DATA_INSTANCE
 from homeassistant.components.recorder.models import (
     Events,
     RecorderRuns,
+    StateAttributes,
     States,
     StatisticsRuns,
     process_timestamp,
@@ -38,6 +39,7 @@ from homeassistant.const import (
     EVENT_HOMEASSISTANT_FINAL_WRITE,
     EVENT_HOMEASSISTANT_STARTED,
     EVENT_HOMEASSISTANT_STOP,
+    EVENT_STATE_CHANGED,
     MATCH_ALL,
     STATE_LOCKED,
     STATE_UNLOCKED,
@@ -148,30 +150,150 @@ async def test_saving_state(
     assert state == _state_empty_context(hass, entity_id)
 
 
+async def test_saving_state_attributes(
+    hass: HomeAssistant, async_setup_recorder_instance: SetupRecorderInstanceT
+):
+    """Test the attributes of a state are recorded and read back."""
+    instance = await async_setup_recorder_instance(hass)
+
+    attributes = {"test_attr": [5, 10], "nested": {"on": True}, "nan": float("NaN")}
+    hass.states.async_set("test.recorder", "on", attributes)
+    await async_wait_recording_done(hass, instance)
+
+    with session_scope(hass=hass) as session:
+        db_state = session.query(States).one()
+        db_attributes = session.query(StateAttributes).one()
+        assert db_state.attributes_id == db_attributes.attributes_id
+        assert db_attributes.to_native() == {**attributes, "nan": None}
+        assert db_state.to_native().attributes == {**attributes, "nan": None}
+
+
 async def test_saving_many_states(
     hass: HomeAssistant, async_setup_recorder_instance: SetupRecorderInstanceT
 ):
-    """Test we expire after many commits."""
+    """Test saving many states over multiple commits."""
     instance = await async_setup_recorder_instance(hass)
 
     entity_id = "test.recorder"
     attributes = {"test_attr": 5, "test_attr_10": "nice"}
 
-    with patch.object(
-        hass.data[DATA_INSTANCE].event_session, "expire_all"
-    ) as expire_all, patch.object(recorder, "EXPIRE_AFTER_COMMITS", 2):
-        for _ in range(3):
-            hass.states.async_set(entity_id, "on", attributes)
-            await async_wait_recording_done(hass, instance)
-            hass.states.async_set(entity_id, "off", attributes)
-            await async_wait_recording_done(hass, instance)
-
-    assert expire_all.called
+    for _ in range(3):
+        hass.states.async_set(entity_id, "on", attributes)
+        await async_wait_recording_done(hass, instance)
+        hass.states.async_set(entity_id, "off", attributes)
+        await async_wait_recording_done(hass, instance)
 
     with session_scope(hass=hass) as session:
-        db_states = list(session.query(States))
+        db_states = list(session.query(States).order_by(States.state_id))
         assert len(db_states) == 6
         assert db_states[0].event_id > 0
+        assert db_states[0].old_state_id is None
+        for old_state, new_state in zip(db_states, db_states[1:]):
+            assert new_state.old_state_id == old_state.state_id
+
+
+# Databases other than SQLite insert rows one by one to get their primary keys
+@pytest.mark.parametrize("dialect_name", ["sqlite", "mysql"])
+async def test_saving_many_states_in_one_commit(
+    hass: HomeAssistant,
+    async_setup_recorder_instance: SetupRecorderInstanceT,
+    dialect_name,
+):
+    """Test states batched into a single commit are linked to their old state."""
+    instance = await async_setup_recorder_instance(hass)
+
+    attributes = {"test_attr": 5, "test_attr_10": "nice"}
+
+    with patch.object(instance.engine.dialect, "name", dialect_name):
+        for idx in range(10):
+            hass.states.async_set("test.recorder", str(idx), attributes)
+            hass.states.async_set("test.other", str(idx), attributes)
+            hass.bus.async_fire("test_event", {"idx": idx})
+        hass.states.async_remove("test.other")
+        hass.states.async_set("test.other", "back", attributes)
+        await async_wait_recording_done(hass, instance)
+
+    with session_scope(hass=hass) as session:
+        events = session.query(Events).filter(Events.event_type == "test_event")
+        assert events.count() == 10
+        for entity_id in ("test.recorder", "test.other"):
+            db_states = list(
+                session.query(States)
+                .filter(States.entity_id == entity_id)
+                .order_by(States.state_id)
+            )
+            assert db_states[0].old_state_id is None
+            assert all(db_state.event_id for db_state in db_states)
+            for old_state, new_state in zip(db_states[:10], db_states[1:10]):
+                assert new_state.old_state_id == old_state.state_id
+        removed, re_added = db_states[10:]
+        assert removed.state is None
+        assert removed.old_state_id == db_states[9].state_id
+        assert re_added.old_state_id is None
+        assert instance._old_states["test.other"] == re_added.state_id
+
+
+async def test_saving_events_keeps_arrival_order(
+    hass: HomeAssistant, async_setup_recorder_instance: SetupRecorderInstanceT
+):
+    """Test event ids follow the order events were fired in within a commit."""
+    instance = await async_setup_recorder_instance(hass)
+
+    for idx in range(3):
+        hass.bus.async_fire("test_event", {"idx": idx})
+        hass.states.async_set("test.recorder", str(idx))
+    await async_wait_recording_done(hass, instance)
+
+    with session_scope(hass=hass) as session:
+        events = list(
+            session.query(Events)
+            .filter(Events.event_type.in_(("test_event", EVENT_STATE_CHANGED)))
+            .order_by(Events.event_id)
+        )
+        assert [event.event_type for event in events] == [
+            "test_event",
+            EVENT_STATE_CHANGED,
+        ] * 3
+        db_states = list(session.query(States).order_by(States.state_id))
+        assert [db_state.event_id for db_state in db_states] == [
+            event.event_id
+            for event in events
+            if event.event_type == EVENT_STATE_CHANGED
+        ]
+
+
+async def test_saving_states_deduplicates_attributes(
+    hass: HomeAssistant, async_setup_recorder_instance: SetupRecorderInstanceT
+):
+    """Test states with identical attributes share one state_attributes row."""
+    instance = await async_setup_recorder_instance(hass)
+
+    entity_id = "test.recorder"
+    attributes = {"test_attr": 5, "test_attr_10": "nice"}
+    attributes2 = {"test_attr": 10, "test_attr_10": "mean"}
+
+    # The first two states are in the same commit, the third one will
+    # be found in the attributes id cache
+    hass.states.async_set(entity_id, "on", attributes)
+    hass.states.async_set(entity_id, "off", attributes)
+    await async_wait_recording_done(hass, instance)
+    hass.states.async_set(entity_id, "on", attributes)
+    hass.states.async_set(entity_id, "off", attributes2)
+    await async_wait_recording_done(hass, instance)
+
+    with session_scope(hass=hass) as session:
+        db_states = list(session.query(States).order_by(States.state_id))
+        assert len(db_states) == 4
+        assert all(db_state.attributes is None for db_state in db_states)
+        assert (
+            db_states[0].attributes_id
+            == db_states[1].attributes_id
+            == db_states[2].attributes_id
+        )
+        assert db_states[3].attributes_id != db_states[0].attributes_id
+        assert session.query(StateAttributes).count() == 2
+        assert db_states[0].to_native().attributes == attributes
+        assert db_states[3].to_native().attributes == attributes2
 
 
 async def test_saving_state_with_intermixed_time_changes(
@@ -200,6 +322,51 @@ async def test_saving_state_with_intermixed_time_changes(
         assert db_states[0].event_id > 0
 
 
+async def test_keep_alive_and_commit_run_on_timers(
+    hass: HomeAssistant, async_setup_recorder_instance: SetupRecorderInstanceT
+):
+    """Test the keep alive and the commit are driven by timers."""
+    instance = await async_setup_recorder_instance(hass)
+
+    hass.states.async_set("test.recorder", "on")
+    await hass.async_block_till_done()
+
+    with patch.object(instance, "_send_keep_alive") as send_keep_alive:
+        async_fire_time_changed(
+            hass, dt_util.utcnow() + timedelta(seconds=KEEPALIVE_TIME + 1)
+        )
+        await async_wait_recording_done(hass, instance)
+
+    assert len(send_keep_alive.mock_calls) == 1
+
+    with session_scope(hass=hass) as session:
+        assert session.query(States).count() == 1
+        # The time changed events fired by the test helper are never recorded
+        assert session.query(Events).filter_by(event_type="time_changed").count() == 0
+
+
+async def test_keep_alive_is_queued_once(hass: HomeAssistant, tmp_path):
+    """Test the keep alive timer does not flood the queue of a busy recorder."""
+    # Use file DB, in memory DB cannot do write locks.
+    config = {recorder.CONF_DB_URL: "sqlite:///" + str(tmp_path / "pytest.db")}
+    await async_init_recorder_component(hass, config)
+    await hass.async_block_till_done()
+    instance: Recorder = hass.data[DATA_INSTANCE]
+
+    with patch.object(instance, "_send_keep_alive") as send_keep_alive:
+        # Hold the recorder thread while the timer fires
+        await instance.lock_database()
+        instance._async_keep_alive(dt_util.utcnow())
+        instance._async_keep_alive(dt_util.utcnow())
+        assert instance.unlock_database()
+        await async_wait_recording_done(hass, instance)
+        assert len(send_keep_alive.mock_calls) == 1
+
+        instance._async_keep_alive(dt_util.utcnow())
+        await async_wait_recording_done(hass, instance)
+        assert len(send_keep_alive.mock_calls) == 2
+
+
 def test_saving_state_with_exception(hass, hass_recorder, caplog):
     """Test saving and restoring a state."""
     hass = hass_recorder()
@@ -208,17 +375,12 @@ def test_saving_state_with_exception(hass, hass_recorder, caplog):
     state = "restoring_from_db"
     attributes = {"test_attr": 5, "test_attr_10": "nice"}
 
-    def _throw_if_state_in_session(*args, **kwargs):
-        for obj in hass.data[DATA_INSTANCE].event_session:
-            if isinstance(obj, States):
-                raise OperationalError(
-                    "insert the state", "fake params", "forced to fail"
-                )
-
     with patch("time.sleep"), patch.object(
-        hass.data[DATA_INSTANCE].event_session,
-        "flush",
-        side_effect=_throw_if_state_in_session,
+        hass.data[DATA_INSTANCE],
+        "_insert_pending_events",
+        side_effect=OperationalError(
+            "insert the state", "fake params", "forced to fail"
+        ),
     ):
         hass.states.set(entity_id, "fail", attributes)
         wait_recording_done(hass)
@@ -246,17 +408,12 @@ def test_saving_state_with_sqlalchemy_exception(hass, hass_recorder, caplog):
     state = "restoring_from_db"
     attributes = {"test_attr": 5, "test_attr_10": "nice"}
 
-    def _throw_if_state_in_session(*args, **kwargs):
-        for obj in hass.data[DATA_INSTANCE].event_session:
-            if isinstance(obj, States):
-                raise SQLAlchemyError(
-                    "insert the state", "fake params", "forced to fail"
-                )
-
     with patch("time.sleep"), patch.object(
-        hass.data[DATA_INSTANCE].event_session,
-        "flush",
-        side_effect=_throw_if_state_in_session,
+        hass.data[DATA_INSTANCE],
+        "_insert_pending_events",
+        side_effect=SQLAlchemyError(
+            "insert the state", "fake params", "forced to fail"
+        ),
     ):
         hass.states.set(entity_id, "fail", attributes)
         wait_recording_done(hass)
@@ -288,8 +445,8 @@ async def test_force_shutdown_with_queue_of_writes_that_generate_exceptions(
     await async_wait_recording_done(hass, instance)
 
     with patch.object(instance, "db_retry_wait", 0.2), patch.object(
-        instance.event_session,
-        "flush",
+        instance,
+        "_insert_pending_events",
         side_effect=OperationalError(
             "insert the state", "fake params", "forced to fail"
         ),
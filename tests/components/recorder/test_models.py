@@ -9,6 +9,7 @@ from homeassistant.components.recorder.models import (
     Base,
     Events,
     RecorderRuns,
+    StateAttributes,
     States,
     process_timestamp,
     process_timestamp_to_utc_isoformat,
@@ -40,6 +41,55 @@ def test_from_event_to_db_state():
     assert state == States.from_event(event).to_native()
 
 
+def test_from_event_to_db_state_attributes():
+    """Test converting event to db state attributes."""
+    attrs = {"this_attr": True}
+    state = ha.State("sensor.temperature", "18", attrs)
+    event = ha.Event(
+        EVENT_STATE_CHANGED,
+        {"entity_id": "sensor.temperature", "old_state": None, "new_state": state},
+        context=state.context,
+    )
+    db_attrs = StateAttributes.from_event(event)
+    assert db_attrs.to_native() == attrs
+    assert db_attrs.hash == StateAttributes.hash_shared_attrs(db_attrs.shared_attrs)
+
+    deleted_event = ha.Event(
+        EVENT_STATE_CHANGED,
+        {"entity_id": "sensor.temperature", "old_state": state, "new_state": None},
+    )
+    assert StateAttributes.shared_attrs_from_event(deleted_event) == "{}"
+
+
+def test_row_from_event():
+    """Test converting events to rows for a bulk insert."""
+    state = ha.State("sensor.temperature", "18", {"unit_of_measurement": "°C"})
+    event = ha.Event(
+        EVENT_STATE_CHANGED,
+        {"entity_id": "sensor.temperature", "old_state": None, "new_state": state},
+        context=state.context,
+    )
+    event_row = Events.row_from_event(event, event_data="{}")
+    assert event_row["event_type"] == EVENT_STATE_CHANGED
+    assert event_row["event_data"] == "{}"
+    assert event_row["created"] == event.time_fired
+    assert event_row["context_id"] == state.context.id
+
+    state_row = States.row_from_event(event)
+    assert state_row["state"] == "18"
+    assert state_row["attributes"] is None
+    assert state_row["last_updated"] == state.last_updated
+
+    delete_event = ha.Event(
+        EVENT_STATE_CHANGED,
+        {"entity_id": "sensor.temperature", "old_state": state, "new_state": None},
+    )
+    delete_row = States.row_from_event(delete_event)
+    assert delete_row["state"] is None
+    assert delete_row["domain"] == "sensor"
+    assert delete_row["last_updated"] == delete_event.time_fired
+
+
 def test_from_event_to_delete_state():
     """Test converting deleting state event to db state."""
     event = ha.Event(
@@ -8,16 +8,21 @@ from sqlalchemy.exc import DatabaseError, OperationalError
 from sqlalchemy.orm.session import Session
 
 from homeassistant.components import recorder
-from homeassistant.components.recorder import PurgeTask
+from homeassistant.components.recorder import PurgeTask, purge
 from homeassistant.components.recorder.const import MAX_ROWS_TO_PURGE
 from homeassistant.components.recorder.models import (
     Events,
     RecorderRuns,
+    StateAttributes,
     States,
     StatisticsRuns,
     StatisticsShortTerm,
 )
-from homeassistant.components.recorder.purge import purge_old_data
+from homeassistant.components.recorder.purge import (
+    PurgeProgress,
+    purge_old_data,
+    purge_old_data_within_budget,
+)
 from homeassistant.components.recorder.util import session_scope
 from homeassistant.const import EVENT_STATE_CHANGED
 from homeassistant.core import HomeAssistant
@@ -91,6 +96,43 @@ async def test_purge_old_states(
         assert "test.recorder2" in instance._old_states
 
 
+async def test_purge_old_states_removes_unused_attributes(
+    hass: HomeAssistant, async_setup_recorder_instance: SetupRecorderInstanceT
+):
+    """Test deleting old states removes attributes no state refers to anymore."""
+    instance = await async_setup_recorder_instance(hass)
+
+    await _add_test_states(hass, instance)
+    hass.states.async_set("test.recorder3", "on", {"only_in_new": True})
+    await async_wait_recording_done(hass, instance)
+
+    with session_scope(hass=hass) as session:
+        attributes = session.query(StateAttributes)
+        assert attributes.count() == 2
+
+        # Purge everything, except the newest state of each entity
+        # which refer to the both attributes rows
+        purge_before = dt_util.utcnow() - timedelta(days=4)
+        purge_old_data(instance, purge_before, repack=False)
+        assert attributes.count() == 2
+
+    old_attributes_id = instance._state_attributes_ids.get(
+        '{"test_attr":5,"test_attr_10":"nice"}'
+    )
+    assert old_attributes_id is not None
+
+    with session_scope(hass=hass) as session:
+        # Remove all states referring to the shared attributes of test.recorder2
+        states = session.query(States).filter(States.attributes_id == old_attributes_id)
+        recorder.purge._purge_state_ids(
+            instance, session, {state.state_id for state in states}
+        )
+
+    with session_scope(hass=hass) as session:
+        assert session.query(StateAttributes).count() == 1
+    assert old_attributes_id not in instance._state_attributes_ids.values()
+
+
 async def test_purge_old_states_encouters_database_corruption(
     hass: HomeAssistant, async_setup_recorder_instance: SetupRecorderInstanceT
 ):
@@ -209,6 +251,109 @@ async def test_purge_old_events(
         assert events.count() == 2
 
 
+async def test_purge_old_data_within_budget(
+    hass: HomeAssistant, async_setup_recorder_instance: SetupRecorderInstanceT
+):
+    """Test purging in slices until the time budget is spent."""
+    instance = await async_setup_recorder_instance(hass)
+
+    await _add_test_events(hass, instance)
+
+    with session_scope(hass=hass) as session:
+        events = session.query(Events).filter(Events.event_type.like("EVENT_TEST%"))
+        assert events.count() == 6
+
+        purge_before = dt_util.utcnow() - timedelta(days=4)
+
+        # The budget is spent after the first slice
+        with patch.object(purge, "PURGE_TIME_BUDGET", 0):
+            finished = purge_old_data_within_budget(
+                instance, purge_before, repack=False, apply_filter=False
+            )
+        assert not finished
+        assert events.count() == 2
+        progress = instance.purge_progress.as_dict()
+        assert progress["rows_deleted"] == 4
+        assert progress["finished"] is False
+
+        finished = purge_old_data_within_budget(
+            instance, purge_before, repack=False, apply_filter=False
+        )
+        assert finished
+        assert events.count() == 2
+        progress = instance.purge_progress.as_dict()
+        assert progress["purge_before"] == purge_before.isoformat()
+        assert progress["rows_deleted"] == 4
+        assert progress["rows_remaining"] == 0
+        assert progress["eta"] == 0
+        assert progress["finished"] is True
+
+
+async def test_purge_slice_is_bounded_by_chunk_size(
+    hass: HomeAssistant, async_setup_recorder_instance: SetupRecorderInstanceT
+):
+    """Test a slice does not purge more events than the chunk size.
+
+    Events are not always recorded in the order they were fired, a newer event
+    between the events to purge must not widen the purged range.
+    """
+    instance = await async_setup_recorder_instance(hass)
+
+    utcnow = dt_util.utcnow()
+    eleven_days_ago = utcnow - timedelta(days=11)
+    await async_wait_recording_done(hass, instance)
+    with recorder.session_scope(hass=hass) as session:
+        for timestamp in (eleven_days_ago, utcnow, eleven_days_ago, eleven_days_ago):
+            session.add(
+                Events(
+                    event_type="EVENT_TEST_PURGE",
+                    event_data="{}",
+                    origin="LOCAL",
+                    created=timestamp,
+                    time_fired=timestamp,
+                )
+            )
+
+    purge_before = utcnow - timedelta(days=4)
+    with session_scope(hass=hass) as session:
+        events = session.query(Events).filter(Events.event_type == "EVENT_TEST_PURGE")
+        progress = PurgeProgress(purge_before, 3, chunk_size=2)
+        assert purge._count_events_to_purge(session, purge_before) == 3
+
+        assert not purge_old_data(instance, purge_before, False, progress=progress)
+        assert events.count() == 2
+        assert progress.rows_deleted == 2
+        assert progress.rows_remaining == 1
+
+        assert not purge_old_data(instance, purge_before, False, progress=progress)
+        assert purge_old_data(instance, purge_before, False, progress=progress)
+        assert events.count() == 1
+        assert progress.rows_deleted == 3
+        assert progress.rows_remaining == 0
+
+
+def test_purge_progress_adapts_chunk_size():
+    """Test the purge chunk size follows the duration of the slices."""
+    progress = PurgeProgress(dt_util.utcnow(), 100000)
+
+    progress.record_slice(progress.chunk_size, purge.PURGE_SLICE_TARGET / 4)
+    assert progress.chunk_size == MAX_ROWS_TO_PURGE * 2
+    # A slice which did not fill the chunk does not grow it
+    progress.record_slice(10, purge.PURGE_SLICE_TARGET / 4)
+    assert progress.chunk_size == MAX_ROWS_TO_PURGE * 2
+    progress.record_slice(progress.chunk_size, purge.PURGE_SLICE_TARGET * 2)
+    assert progress.chunk_size == MAX_ROWS_TO_PURGE
+    assert progress.rows_deleted == MAX_ROWS_TO_PURGE * 3 + 10
+    assert progress.rows_remaining == 100000 - MAX_ROWS_TO_PURGE * 3 - 10
+
+    for _ in range(20):
+        progress.record_slice(0, purge.PURGE_SLICE_TARGET * 2)
+    assert progress.chunk_size == purge.MIN_PURGE_CHUNK_SIZE
+    for _ in range(20):
+        progress.record_slice(progress.chunk_size, 0)
+    assert progress.chunk_size == purge.MAX_PURGE_CHUNK_SIZE
+
+
 async def test_purge_old_recorder_runs(
     hass: HomeAssistant, async_setup_recorder_instance: SetupRecorderInstanceT
 ):
@@ -1,6 +1,7 @@
 """The tests for sensor recorder platform."""
 # pylint: disable=protected-access,invalid-name
-from datetime import timedelta
+import collections
+from datetime import datetime, timedelta
 import importlib
 import json
 import sys
@@ -15,6 +16,8 @@ from homeassistant.components import recorder
 from homeassistant.components.recorder import SQLITE_URL_PREFIX, history, statistics
 from homeassistant.components.recorder.const import DATA_INSTANCE
 from homeassistant.components.recorder.models import (
+    StatisticsDaily,
+    StatisticsMonthly,
     StatisticsShortTerm,
     process_timestamp_to_utc_isoformat,
 )
@@ -669,6 +672,70 @@ def test_monthly_statistics(hass_recorder, caplog, timezone):
     dt_util.set_default_time_zone(dt_util.get_time_zone("UTC"))
 
 
+@pytest.mark.parametrize("period", ["day", "month"])
+def test_rolled_up_statistics(hass_recorder, period):
+    """Test daily and monthly statistics are read from the rolled up tables."""
+    dt_util.set_default_time_zone(dt_util.get_time_zone("Europe/Amsterdam"))
+
+    hass = hass_recorder()
+    wait_recording_done(hass)
+
+    # Four local days, including the daylight saving time change on October 31
+    zero = dt_util.as_utc(dt_util.parse_datetime("2021-10-29 00:00:00"))
+    external_statistics = [
+        {
+            "start": zero + timedelta(hours=hour),
+            "mean": hour % 7,
+            "min": hour % 5,
+            "max": hour % 11,
+            "last_reset": None,
+            "state": hour,
+            "sum": hour * 2,
+        }
+        for hour in range(97)
+    ]
+    external_metadata = {
+        "has_mean": True,
+        "has_sum": True,
+        "name": "Total imported energy",
+        "source": "test",
+        "statistic_id": "test:total_energy_import",
+        "unit_of_measurement": "kWh",
+    }
+
+    async_add_external_statistics(hass, external_metadata, external_statistics)
+    wait_recording_done(hass)
+    # Import some of the statistics again with different values
+    async_add_external_statistics(
+        hass,
+        external_metadata,
+        [{**stat, "mean": stat["mean"] + 1} for stat in external_statistics[30:40]],
+    )
+    wait_recording_done(hass)
+
+    with session_scope(hass=hass) as session:
+        assert session.query(StatisticsDaily).count() == 4
+        assert session.query(StatisticsMonthly).count() == 2
+
+    stats = statistics_during_period(hass, zero, period=period)
+    with patch.object(
+        statistics, "_rolled_up_statistics_during_period", return_value=None
+    ):
+        reduced_stats = statistics_during_period(hass, zero, period=period)
+    assert len(stats["test:total_energy_import"]) == (4 if period == "day" else 2)
+    assert stats == {
+        statistic_id: [{**stat, "mean": approx(stat["mean"])} for stat in stat_list]
+        for statistic_id, stat_list in reduced_stats.items()
+    }
+
+    # Rolling up an hour again with the database summary gives the same result
+    with session_scope(hass=hass) as session:
+        statistics._compile_period_statistics(session, zero + timedelta(hours=80))
+    assert statistics_during_period(hass, zero, period=period) == stats
+
+    dt_util.set_default_time_zone(dt_util.get_time_zone("UTC"))
+
+
 def _create_engine_test(*args, **kwargs):
     """Test version of create_engine that initializes with old schema.
 
@@ -1278,7 +1345,10 @@ def test_duplicate_statistics_handle_integrity_error(hass_recorder, caplog):
             hass, external_energy_metadata_1, external_energy_statistics_2
         )
         wait_recording_done(hass)
-        assert insert_statistics_mock.call_count == 3
+        # The daily and monthly statistics are rolled up with the same helper
+        assert [call.args[1] for call in insert_statistics_mock.call_args_list].count(
+            recorder.models.Statistics
+        ) == 3
 
     with session_scope(hass=hass) as session:
         tmp = session.query(recorder.models.Statistics).all()
@@ -1287,6 +1357,63 @@ def test_duplicate_statistics_handle_integrity_error(hass_recorder, caplog):
     assert "Blocked attempt to insert duplicated statistic rows" in caplog.text
 
 
+@pytest.mark.parametrize("period", ["day", "month"])
+async def test_reduce_sorted_statistics(hass, period):
+    """Test the columnar reduction matches reducing the statistics per row."""
+    dt_util.set_default_time_zone(dt_util.get_time_zone("Europe/Amsterdam"))
+    row = collections.namedtuple(
+        "row", "metadata_id start mean min max last_reset state sum"
+    )
+    metadata = {
+        "sensor.temperature": (
+            1,
+            {
+                "statistic_id": "sensor.temperature",
+                "unit_of_measurement": TEMP_CELSIUS,
+            },
+        ),
+        "sensor.energy": (
+            2,
+            {"statistic_id": "sensor.energy", "unit_of_measurement": "kWh"},
+        ),
+    }
+    # Hourly statistics spanning the daylight saving time changes of 2021
+    first_start = datetime(2021, 2, 20, 13)
+    rows = [
+        row(
+            meta_id,
+            first_start + timedelta(hours=hour),
+            hour % 7 if meta_id == 1 else None,
+            hour % 5 if meta_id == 1 else None,
+            hour % 11 if meta_id == 1 else None,
+            None,
+            None if meta_id == 1 else hour,
+            None if meta_id == 1 else hour * 2,
+        )
+        for meta_id in (1, 2)
+        for hour in range(300 * 24)
+    ]
+
+    by_row = statistics._sorted_statistics_to_dict(
+        hass, None, rows, None, metadata, True, statistics.Statistics, None, True
+    )
+    if period == "day":
+        by_row = statistics._reduce_statistics_per_day(by_row)
+    else:
+        by_row = statistics._reduce_statistics_per_month(by_row)
+
+    assert statistics._reduce_sorted_statistics(
+        hass, None, rows, metadata, statistics.Statistics, None, period
+    ) == {
+        statistic_id: [
+            {**stat, "mean": approx(stat["mean"])} if stat["mean"] is not None else stat
+            for stat in stats
+        ]
+        for statistic_id, stats in by_row.items()
+    }
+    dt_util.set_default_time_zone(dt_util.get_time_zone("UTC"))
+
+
 def record_states(hass):
     """Record some test states.
 
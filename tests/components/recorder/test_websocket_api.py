@@ -270,6 +270,30 @@ async def test_recorder_info(hass, hass_ws_client):
     }
 
 
+async def test_purge_progress(hass, hass_ws_client):
+    """Test getting the progress of the last purge."""
+    client = await hass_ws_client()
+    await async_init_recorder_component(hass)
+    await async_wait_recording_done_without_instance(hass)
+
+    await client.send_json({"id": 1, "type": "recorder/purge_progress"})
+    response = await client.receive_json()
+    assert response["success"]
+    assert response["result"] is None
+
+    purge_before = dt_util.utcnow()
+    await hass.services.async_call(recorder.DOMAIN, recorder.SERVICE_PURGE, {})
+    await hass.async_block_till_done()
+    await async_wait_recording_done_without_instance(hass)
+
+    await client.send_json({"id": 2, "type": "recorder/purge_progress"})
+    response = await client.receive_json()
+    assert response["success"]
+    assert response["result"]["finished"] is True
+    assert response["result"]["rows_remaining"] == 0
+    assert dt_util.parse_datetime(response["result"]["purge_before"]) < purge_before
+
+
 async def test_recorder_info_no_recorder(hass, hass_ws_client):
     """Test getting recorder status when recorder is not present."""
     client = await hass_ws_client()
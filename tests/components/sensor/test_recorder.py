@@ -21,6 +21,7 @@ from homeassistant.components.recorder.statistics import (
     statistics_during_period,
 )
 from homeassistant.components.recorder.util import session_scope
+from homeassistant.components.sensor import recorder as sensor_recorder
 from homeassistant.const import STATE_UNAVAILABLE
 from homeassistant.setup import setup_component
 import homeassistant.util.dt as dt_util
@@ -991,6 +992,114 @@ def test_compile_hourly_sum_statistics_total_increasing(
     assert "Detected new cycle for sensor.test1, value dropped" in caplog.text
 
 
+def test_compile_statistics_from_running_statistics(hass_recorder, caplog):
+    """Test compiling statistics of tracked sensors without querying history."""
+    period0 = dt_util.parse_datetime("2021-09-01T05:00:00+00:00")
+    period1 = period0 + timedelta(minutes=5)
+    period2 = period0 + timedelta(minutes=10)
+    hass = hass_recorder()
+    recorder = hass.data[DATA_INSTANCE]
+    setup_component(hass, "sensor", {})
+    seq = [10, 15, 20, 10, 30, 40, 50, 60, 70]
+    record_meter_states(
+        hass,
+        period0,
+        "sensor.energy",
+        {
+            "device_class": "energy",
+            "state_class": "total_increasing",
+            "unit_of_measurement": "kWh",
+        },
+        seq,
+    )
+    record_meter_states(hass, period0, "sensor.power", POWER_SENSOR_ATTRIBUTES, seq)
+
+    with patch(
+        "homeassistant.components.sensor.recorder.history.get_significant_states_with_session"
+    ) as mock_history:
+        for start in (period0, period1, period2):
+            recorder.do_adhoc_statistics(start=start)
+            wait_recording_done(hass)
+    assert mock_history.call_count == 0
+
+    stats = statistics_during_period(hass, period0, period="5minute")
+    assert [(stat["state"], stat["sum"]) for stat in stats["sensor.energy"]] == [
+        (approx(20), approx(10)),
+        (approx(40), approx(50)),
+        (approx(70), approx(80)),
+    ]
+    assert [
+        (stat["mean"], stat["min"], stat["max"]) for stat in stats["sensor.power"]
+    ] == [
+        (approx(15000), approx(10000), approx(20000)),
+        (approx(27500), approx(10000), approx(40000)),
+        (approx(60000), approx(40000), approx(70000)),
+    ]
+    assert "Error while processing event StatisticsTask" not in caplog.text
+
+
+def test_compile_statistics_with_queued_state_changes(hass_recorder):
+    """Test state changes queued behind the statistics task are not lost."""
+    period0 = dt_util.parse_datetime("2021-09-01T05:00:00+00:00")
+    period1 = period0 + timedelta(minutes=5)
+    hass = hass_recorder()
+    recorder = hass.data[DATA_INSTANCE]
+    setup_component(hass, "sensor", {})
+
+    def set_state(time, state):
+        """Set the state at a point in time."""
+        with patch(
+            "homeassistant.components.recorder.dt_util.utcnow", return_value=time
+        ):
+            hass.states.set("sensor.power", state, POWER_SENSOR_ATTRIBUTES)
+            wait_recording_done(hass)
+
+    set_state(period0, 10)
+    set_state(period0 + timedelta(minutes=1), 15)
+
+    # The state machine is ahead of the state changes the recorder processed
+    with patch(
+        "homeassistant.components.sensor.recorder.record_state_change"
+    ) as mock_record:
+        set_state(period1 + timedelta(minutes=1), 30)
+        set_state(period1 + timedelta(minutes=2), 40)
+        recorder.do_adhoc_statistics(start=period0)
+        wait_recording_done(hass)
+    for call in mock_record.mock_calls:
+        sensor_recorder.record_state_change(*call.args)
+
+    with patch(
+        "homeassistant.components.sensor.recorder.history.get_significant_states_with_session"
+    ) as mock_history:
+        recorder.do_adhoc_statistics(start=period1)
+        wait_recording_done(hass)
+    assert mock_history.call_count == 0
+
+    stats = statistics_during_period(hass, period0, period="5minute")
+    assert [
+        (stat["mean"], stat["min"], stat["max"]) for stat in stats["sensor.power"]
+    ] == [
+        (approx(14000), approx(10000), approx(15000)),
+        (approx(33000), approx(15000), approx(40000)),
+    ]
+
+
+def test_unrecorded_state_changes_are_not_tracked(hass_recorder, caplog):
+    """Test state changes which cannot be recorded are not passed to sensor."""
+    hass = hass_recorder()
+    setup_component(hass, "sensor", {})
+
+    with patch(
+        "homeassistant.components.sensor.recorder.record_state_change"
+    ) as mock_record:
+        hass.states.set(
+            "sensor.power", 10, {**POWER_SENSOR_ATTRIBUTES, "invalid": object()}
+        )
+        wait_recording_done(hass)
+    assert "State is not JSON serializable" in caplog.text
+    assert mock_record.call_count == 0
+
+
 @pytest.mark.parametrize(
     "device_class,unit,native_unit,factor",
     [("energy", "kWh", "kWh", 1)],
@@ -4,6 +4,7 @@ from unittest.mock import AsyncMock, Mock, patch
 
 from aiohttp.client_exceptions import ClientError
 
+from homeassistant import loader
 from homeassistant.components import system_health
 from homeassistant.setup import async_setup_component
 
@@ -53,8 +54,9 @@ async def test_info_endpoint_return_info(hass, hass_ws_client):
         return_value={"hello": True},
     ):
         assert await async_setup_component(hass, "system_health", {})
-
-    data = await gather_system_health_info(hass, hass_ws_client)
+        # The platforms are imported when the info is requested
+        assert "homeassistant.system_health" not in hass.data[loader.DATA_COMPONENTS]
+        data = await gather_system_health_info(hass, hass_ws_client)
 
     assert len(data) == 1
     data = data["homeassistant"]
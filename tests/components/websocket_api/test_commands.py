@@ -1,5 +1,6 @@
 """Tests for WebSocket API commands."""
 import datetime
+import logging
 from unittest.mock import ANY, patch
 
 from async_timeout import timeout
@@ -18,7 +19,8 @@ from homeassistant.core import Context, HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import entity
 from homeassistant.helpers.dispatcher import async_dispatcher_send
-from homeassistant.loader import async_get_integration
+from homeassistant.helpers.entity_component import EntityComponent
+from homeassistant.loader import DATA_IMPORT_TIMES, async_get_integration
 from homeassistant.setup import DATA_SETUP_TIME, async_setup_component
 
 from tests.common import MockEntity, MockEntityPlatform, async_mock_service
@@ -393,6 +395,85 @@ async def test_subscribe_unsubscribe_events(hass, websocket_client):
     assert sum(hass.bus.async_listeners().values()) == init_count
 
 
+async def test_subscribe_entities(hass, websocket_client):
+    """Test subscribe_entities sends compressed states and then diffs."""
+    hass.states.async_set("light.permitted", "off", {"color": "red"})
+    hass.states.async_set("light.other", "off")
+    original_state = hass.states.get("light.permitted")
+
+    await websocket_client.send_json(
+        {"id": 7, "type": "subscribe_entities", "entity_ids": ["light.permitted"]}
+    )
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert msg["type"] == const.TYPE_RESULT
+    assert msg["success"]
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert msg["type"] == "event"
+    assert msg["event"] == {
+        "a": {
+            "light.permitted": {
+                "a": {"color": "red"},
+                "c": original_state.context.id,
+                "lu": original_state.last_updated.timestamp(),
+                "s": "off",
+            }
+        }
+    }
+
+    hass.states.async_set("light.other", "on")
+    hass.states.async_set("light.permitted", "on", {"brightness": 100})
+    new_state = hass.states.get("light.permitted")
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert msg["type"] == "event"
+    assert msg["event"] == {
+        "c": {
+            "light.permitted": {
+                "+": {
+                    "a": {"brightness": 100},
+                    "c": new_state.context.id,
+                    "lc": new_state.last_changed.timestamp(),
+                    "s": "on",
+                },
+                "-": {"a": ["color"]},
+            }
+        }
+    }
+
+    hass.states.async_remove("light.permitted")
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert msg["type"] == "event"
+    assert msg["event"] == {"r": ["light.permitted"]}
+
+
+async def test_subscribe_entities_permissions(hass, hass_admin_user, websocket_client):
+    """Test subscribe_entities skips entities the user cannot read."""
+    hass_admin_user.mock_policy({"entities": {"entity_ids": {"light.permitted": True}}})
+    hass.states.async_set("light.permitted", "off")
+    hass.states.async_set("light.not_permitted", "off")
+
+    await websocket_client.send_json({"id": 7, "type": "subscribe_entities"})
+
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+
+    msg = await websocket_client.receive_json()
+    assert list(msg["event"]["a"]) == ["light.permitted"]
+
+    hass.states.async_set("light.not_permitted", "on")
+    hass.states.async_set("light.permitted", "on")
+
+    msg = await websocket_client.receive_json()
+    assert list(msg["event"]["c"]) == ["light.permitted"]
+
+
 async def test_get_states(hass, websocket_client):
     """Test get_states command."""
     hass.states.async_set("greeting.hello", "world")
@@ -528,15 +609,15 @@ async def test_states_filters_visible(hass, hass_admin_user, websocket_client):
     assert msg["result"][0]["entity_id"] == "test.entity"
 
 
-async def test_get_states_not_allows_nan(hass, websocket_client):
-    """Test get_states command not allows NaN floats."""
+async def test_get_states_converts_nan(hass, websocket_client):
+    """Test get_states command converts NaN floats to null."""
     hass.states.async_set("greeting.hello", "world", {"hello": float("NaN")})
 
     await websocket_client.send_json({"id": 5, "type": "get_states"})
 
     msg = await websocket_client.receive_json()
-    assert not msg["success"]
-    assert msg["error"]["code"] == const.ERR_UNKNOWN_ERROR
+    assert msg["success"]
+    assert msg["result"][0]["attributes"] == {"hello": None}
 
 
 async def test_subscribe_unsubscribe_events_whitelist(
@@ -1187,6 +1268,11 @@ async def test_integration_setup_info(hass, websocket_client, hass_admin_user):
         "august": datetime.timedelta(seconds=12.5),
         "isy994": datetime.timedelta(seconds=12.8),
     }
+    august_imports = [
+        {"module": "august", "seconds": 0.5, "modules": 12, "memory": 4096},
+        {"module": "august.lock", "seconds": 0.25, "modules": 1, "memory": None},
+    ]
+    hass.data[DATA_IMPORT_TIMES] = {"august": august_imports}
     await websocket_client.send_json({"id": 7, "type": "integration/setup_info"})
 
     msg = await websocket_client.receive_json()
@@ -1194,6 +1280,79 @@ async def test_integration_setup_info(hass, websocket_client, hass_admin_user):
     assert msg["type"] == const.TYPE_RESULT
     assert msg["success"]
     assert msg["result"] == [
-        {"domain": "august", "seconds": 12.5},
-        {"domain": "isy994", "seconds": 12.8},
+        {"domain": "august", "seconds": 12.5, "imports": august_imports},
+        {"domain": "isy994", "seconds": 12.8, "imports": []},
+    ]
+
+
+async def test_executor_statistics(hass, websocket_client, hass_admin_user):
+    """Test getting the job statistics of the executors."""
+    hass.config.executor_pools = {"tests": 2}
+
+    def test_executor():
+        """Test executor."""
+
+    await hass.async_add_executor_job(test_executor)
+
+    await websocket_client.send_json({"id": 7, "type": "executor/statistics"})
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert msg["type"] == const.TYPE_RESULT
+    assert msg["success"]
+    executors = {executor["executor"]: executor for executor in msg["result"]}
+    executor = executors["tests"]
+    assert executor["max_workers"] == 2
+    assert executor["queued_jobs"] == 0
+    assert executor["jobs"] == [
+        {
+            "owner": "tests",
+            "jobs": 1,
+            "total_wait": ANY,
+            "max_wait": ANY,
+            "total_run": ANY,
+            "max_run": ANY,
+        }
+    ]
+
+    hass_admin_user.groups = []
+    await websocket_client.send_json({"id": 8, "type": "executor/statistics"})
+
+    msg = await websocket_client.receive_json()
+    assert not msg["success"]
+    assert msg["error"]["code"] == const.ERR_UNAUTHORIZED
+
+
+async def test_poll_statistics(hass, websocket_client, hass_admin_user):
+    """Test getting the update statistics of polled entities."""
+    component = EntityComponent(
+        logging.getLogger(__name__), "test_domain", hass, datetime.timedelta(seconds=20)
+    )
+    await component.async_add_entities([MockEntity(should_poll=True, name="polled")])
+
+    await websocket_client.send_json({"id": 7, "type": "poll/statistics"})
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert msg["type"] == const.TYPE_RESULT
+    assert msg["success"]
+    assert msg["result"] == [
+        {
+            "entity_id": "test_domain.polled",
+            "polls": 0,
+            "failures": 0,
+            "consecutive_failures": 0,
+            "backoff": 1,
+            "last_duration": None,
+            "max_duration": None,
+            "total_duration": 0,
+            "mean_duration": None,
+        }
     ]
+
+    hass_admin_user.groups = []
+    await websocket_client.send_json({"id": 8, "type": "poll/statistics"})
+
+    msg = await websocket_client.receive_json()
+    assert not msg["success"]
+    assert msg["error"]["code"] == const.ERR_UNAUTHORIZED
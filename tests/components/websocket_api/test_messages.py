@@ -1,7 +1,11 @@
 """Test Websocket API messages module."""
 
+import asyncio
+
 from homeassistant.components.websocket_api.messages import (
+    LARGE_EVENT_SIZE,
     _cached_event_message as lru_event_cache,
+    async_cached_event_message,
     cached_event_message,
     message_to_json,
 )
@@ -78,18 +82,81 @@ async def test_cached_event_message_with_different_idens(hass):
     assert cache_info.currsize == 1
 
 
+async def test_cached_event_message_splices_iden(hass):
+    """Test the cached event is spliced into a message with the iden."""
+    events = []
+
+    @callback
+    def _event_listener(event):
+        events.append(event)
+
+    hass.bus.async_listen(EVENT_STATE_CHANGED, _event_listener)
+
+    hass.states.async_set("light.window", "on")
+    await hass.async_block_till_done()
+
+    assert cached_event_message(2, events[0]) == message_to_json(
+        {"id": 2, "type": "event", "event": events[0]}
+    )
+
+
+async def test_async_cached_event_message_offloads_large_events(hass):
+    """Test events of entities with large events are encoded in the executor."""
+    events = []
+
+    @callback
+    def _event_listener(event):
+        events.append(event)
+
+    hass.bus.async_listen(EVENT_STATE_CHANGED, _event_listener)
+
+    hass.states.async_set("sensor.large", "1", {"data": "x" * LARGE_EVENT_SIZE})
+    hass.states.async_set("sensor.large", "2", {"data": "x" * LARGE_EVENT_SIZE})
+    hass.states.async_set("sensor.large", "3")
+    hass.states.async_set("sensor.large", "4")
+    hass.states.async_set("sensor.large", "5")
+    await hass.async_block_till_done()
+
+    lru_event_cache.cache_clear()
+
+    msg = async_cached_event_message(hass, 2, events[0])
+    assert msg == cached_event_message(2, events[0])
+
+    msg0 = async_cached_event_message(hass, 2, events[1])
+    msg1 = async_cached_event_message(hass, 3, events[1])
+    assert isinstance(msg0, asyncio.Future)
+    assert await msg0 == cached_event_message(2, events[1])
+    assert await msg1 == cached_event_message(3, events[1])
+
+    # The encode is shared between the connections
+    assert lru_event_cache.cache_info().misses == 2
+
+    # The old state of the third event still holds the large attributes
+    msg = async_cached_event_message(hass, 2, events[2])
+    assert isinstance(msg, asyncio.Future)
+    assert await msg == cached_event_message(2, events[2])
+
+    # Once the entity is small again it is encoded right away
+    msg = async_cached_event_message(hass, 2, events[3])
+    assert isinstance(msg, asyncio.Future)
+    assert await msg == cached_event_message(2, events[3])
+    assert async_cached_event_message(hass, 2, events[4]) == cached_event_message(
+        2, events[4]
+    )
+
+
 async def test_message_to_json(caplog):
     """Test we can serialize websocket messages."""
 
     json_str = message_to_json({"id": 1, "message": "xyz"})
 
-    assert json_str == '{"id": 1, "message": "xyz"}'
+    assert json_str == '{"id":1,"message":"xyz"}'
 
     json_str2 = message_to_json({"id": 1, "message": _Unserializeable()})
 
     assert (
         json_str2
-        == '{"id": 1, "type": "result", "success": false, "error": {"code": "unknown_error", "message": "Invalid JSON in response"}}'
+        == '{"id":1,"type":"result","success":false,"error":{"code":"unknown_error","message":"Invalid JSON in response"}}'
     )
     assert "Unable to serialize to JSON" in caplog.text
 
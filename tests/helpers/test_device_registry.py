@@ -635,6 +635,44 @@ async def test_removing_area_id(registry):
     assert entry_w_area != entry_wo_area
 
 
+async def test_entries_for_area_and_config_entry(registry):
+    """Test looking up devices by area and config entry follows updates."""
+    entry = registry.async_get_or_create(
+        config_entry_id="123",
+        identifiers={("bridgeid", "0123")},
+    )
+    other_entry = registry.async_get_or_create(
+        config_entry_id="456",
+        identifiers={("bridgeid", "4567")},
+    )
+    entry = registry.async_update_device(entry.id, area_id="kitchen")
+
+    assert device_registry.async_entries_for_area(registry, "kitchen") == [entry]
+    assert device_registry.async_entries_for_config_entry(registry, "123") == [entry]
+
+    other_entry = registry.async_update_device(
+        other_entry.id, area_id="kitchen", add_config_entry_id="123"
+    )
+    assert device_registry.async_entries_for_area(registry, "kitchen") == [
+        entry,
+        other_entry,
+    ]
+    assert device_registry.async_entries_for_config_entry(registry, "123") == [
+        entry,
+        other_entry,
+    ]
+
+    registry.async_clear_area_id("kitchen")
+    assert device_registry.async_entries_for_area(registry, "kitchen") == []
+
+    registry.async_clear_config_entry("123")
+    assert device_registry.async_entries_for_config_entry(registry, "123") == []
+    assert device_registry.async_entries_for_config_entry(registry, "456") == [
+        registry.async_get(other_entry.id)
+    ]
+    assert registry.async_get(entry.id) is None
+
+
 async def test_deleted_device_removing_area_id(registry):
     """Make sure we can clear area id of deleted device."""
     entry = registry.async_get_or_create(
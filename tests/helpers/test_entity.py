@@ -7,6 +7,7 @@ from unittest.mock import MagicMock, PropertyMock, patch
 
 import pytest
 
+from homeassistant.config import DATA_CUSTOMIZE
 from homeassistant.const import (
     ATTR_ATTRIBUTION,
     ATTR_DEVICE_CLASS,
@@ -15,6 +16,7 @@ from homeassistant.const import (
 )
 from homeassistant.core import Context, HomeAssistantError
 from homeassistant.helpers import entity, entity_registry
+from homeassistant.helpers.entity_values import EntityValues
 
 from tests.common import (
     MockConfigEntry,
@@ -829,3 +831,82 @@ async def test_entity_category_property(hass):
     )
     mock_entity2.entity_id = "hello.world"
     assert mock_entity2.entity_category == "config"
+
+
+async def test_unchanged_attributes_are_reused(hass):
+    """Test writing unchanged attributes passes the previous attributes."""
+    ent = entity.Entity()
+    ent.hass = hass
+    ent.entity_id = "hello.world"
+    ent._attr_icon = "mdi:one"
+    ent._attr_extra_state_attributes = {"extra": 1}
+
+    ent._attr_state = "1"
+    ent.async_write_ha_state()
+    first = hass.states.get("hello.world")
+
+    ent._attr_state = "2"
+    ent.async_write_ha_state()
+    second = hass.states.get("hello.world")
+    assert second.state == "2"
+    assert second.attributes is first.attributes
+
+    ent._attr_extra_state_attributes = {"extra": 2}
+    ent.async_write_ha_state()
+    third = hass.states.get("hello.world")
+    assert third is not second
+    assert third.attributes == {"extra": 2, "icon": "mdi:one"}
+
+    ent._attr_icon = "mdi:two"
+    ent.async_write_ha_state()
+    assert hass.states.get("hello.world").attributes == {
+        "extra": 2,
+        "icon": "mdi:two",
+    }
+
+
+async def test_customize_reload_updates_attributes(hass):
+    """Test reloaded customizations are applied to unchanged entities."""
+    ent = entity.Entity()
+    ent.hass = hass
+    ent.entity_id = "hello.world"
+    ent._attr_name = "Hello"
+
+    hass.data[DATA_CUSTOMIZE] = EntityValues({"hello.world": {"hidden": True}})
+    ent.async_write_ha_state()
+    state = hass.states.get("hello.world")
+    assert state.attributes == {"friendly_name": "Hello", "hidden": True}
+
+    hass.data[DATA_CUSTOMIZE] = EntityValues(
+        {"hello.world": {"friendly_name": "Customized"}}
+    )
+    ent.async_write_ha_state()
+    state = hass.states.get("hello.world")
+    assert state.attributes == {"friendly_name": "Customized"}
+
+
+async def test_capability_attributes_changed_in_place(hass):
+    """Test capability attributes changed in place are written."""
+
+    class CapabilityEntity(entity.Entity):
+        """Entity which keeps its capability attributes in one dict."""
+
+        def __init__(self):
+            """Initialize the entity."""
+            self.capabilities = {"min": 1}
+
+        @property
+        def capability_attributes(self):
+            """Return the capability attributes."""
+            return self.capabilities
+
+    ent = CapabilityEntity()
+    ent.hass = hass
+    ent.entity_id = "hello.world"
+
+    ent.async_write_ha_state()
+    assert hass.states.get("hello.world").attributes == {"min": 1}
+
+    ent.capabilities["min"] = 2
+    ent.async_write_ha_state()
+    assert hass.states.get("hello.world").attributes == {"min": 2}
@@ -57,6 +57,26 @@ async def test_polling_only_updates_entities_it_should_poll(hass):
     assert poll_ent.async_update.called
 
 
+async def test_polling_updates_entities_which_start_polling(hass):
+    """Test entities which start polling after they were added are polled."""
+    component = EntityComponent(_LOGGER, DOMAIN, hass, timedelta(seconds=20))
+
+    later_poll_ent = MockEntity(should_poll=False)
+    later_poll_ent.async_update = Mock()
+    poll_ent = MockEntity(should_poll=True)
+
+    await component.async_add_entities([later_poll_ent, poll_ent])
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=20))
+    await hass.async_block_till_done()
+    assert not later_poll_ent.async_update.called
+
+    later_poll_ent._values["should_poll"] = True
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=40))
+    await hass.async_block_till_done()
+    assert later_poll_ent.async_update.called
+
+
 async def test_polling_disabled_by_config_entry(hass):
     """Test the polling of only updated entities."""
     entity_platform = MockEntityPlatform(hass)
@@ -65,7 +85,7 @@ async def test_polling_disabled_by_config_entry(hass):
     poll_ent = MockEntity(should_poll=True)
 
     await entity_platform.async_add_entities([poll_ent])
-    assert entity_platform._async_unsub_polling is None
+    assert not entity_platform._async_unsub_polling
 
 
 async def test_polling_updates_entities_with_exception(hass):
@@ -150,8 +170,8 @@ async def test_update_state_adds_entities_with_update_before_add_false(hass):
     assert not ent.update.called
 
 
-@patch("homeassistant.helpers.entity_platform.async_track_time_interval")
-async def test_set_scan_interval_via_platform(mock_track, hass):
+@patch("homeassistant.helpers.poll_scheduler.PollScheduler.async_schedule")
+async def test_set_scan_interval_via_platform(mock_schedule, hass):
     """Test the setting of the scan interval via platform."""
 
     def platform_setup(hass, config, add_entities, discovery_info=None):
@@ -168,8 +188,8 @@ async def test_set_scan_interval_via_platform(mock_track, hass):
     component.setup({DOMAIN: {"platform": "platform"}})
 
     await hass.async_block_till_done()
-    assert mock_track.called
-    assert timedelta(seconds=30) == mock_track.call_args[0][2]
+    assert mock_schedule.called
+    assert timedelta(seconds=30) == mock_schedule.call_args[0][1]
 
 
 async def test_adding_entities_with_generator_and_thread_callback(hass):
@@ -715,7 +735,7 @@ async def test_stop_shutdown_cancels_retry_setup_and_interval_listener(hass):
     await ent_platform.async_shutdown()
 
     assert len(mock_call_later.return_value.mock_calls) == 1
-    assert ent_platform._async_unsub_polling is None
+    assert not ent_platform._async_unsub_polling
     assert ent_platform._async_cancel_retry_setup is None
 
 
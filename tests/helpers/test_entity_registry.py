@@ -1,6 +1,7 @@
 """Tests for the Entity Registry."""
 from unittest.mock import patch
 
+import attr
 import pytest
 import voluptuous as vol
 
@@ -1083,6 +1084,54 @@ def test_entity_registry_items():
     assert entities.get_entry(entry2.id) is None
 
 
+def test_entity_registry_items_secondary_indexes():
+    """Test the EntityRegistryItems container indexes device, area and config entry."""
+    entities = er.EntityRegistryItems()
+    entry1 = er.RegistryEntry(
+        "test.entity1",
+        "1234",
+        "hue",
+        area_id="kitchen",
+        config_entry_id="entry",
+        device_id="device",
+    )
+    entry2 = er.RegistryEntry(
+        "test.entity2",
+        "2345",
+        "hue",
+        config_entry_id="entry",
+        device_id="device",
+        disabled_by=er.RegistryEntryDisabler.USER,
+    )
+    entities["test.entity1"] = entry1
+    entities["test.entity2"] = entry2
+
+    assert entities.get_entries_for_device_id("device") == [entry1]
+    assert entities.get_entries_for_device_id("device", True) == [entry1, entry2]
+    assert entities.get_entries_for_area_id("kitchen") == [entry1]
+    assert entities.get_entries_for_config_entry_id("entry") == [entry1, entry2]
+
+    entry1_moved = entities["test.entity1"] = attr.evolve(
+        entry1, area_id="living_room", device_id=None
+    )
+    assert entities.get_entries_for_device_id("device", True) == [entry2]
+    assert entities.get_entries_for_area_id("kitchen") == []
+    assert entities.get_entries_for_area_id("living_room") == [entry1_moved]
+    assert entities.get_entries_for_config_entry_id("entry") == [entry1_moved, entry2]
+
+    copied = entities.copy()
+    del entities["test.entity2"]
+    assert entities.get_entries_for_config_entry_id("entry") == [entry1_moved]
+    assert entities.get_entries_for_device_id("device", True) == []
+    assert copied.get_entries_for_device_id("device", True) == [entry2]
+
+    entities.pop("test.entity1")
+    assert entities.get_entries_for_config_entry_id("entry") == []
+    assert entities._device_id_index == {}
+    assert entities._area_id_index == {}
+    assert entities._config_entry_id_index == {}
+
+
 async def test_deprecated_disabled_by_str(hass, registry, caplog):
     """Test deprecated str use of disabled_by converts to enum and logs a warning."""
     entry = registry.async_get_or_create(
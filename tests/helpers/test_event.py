@@ -16,6 +16,7 @@ from homeassistant.core import callback
 from homeassistant.exceptions import TemplateError
 from homeassistant.helpers.entity_registry import EVENT_ENTITY_REGISTRY_UPDATED
 from homeassistant.helpers.event import (
+    TRACK_TIME_SCHEDULER,
     TrackStates,
     TrackTemplate,
     TrackTemplateResult,
@@ -126,6 +127,87 @@ async def test_track_point_in_time_drift_rearm(hass):
     assert len(specific_runs) == 1
 
 
+async def test_track_point_in_time_shares_one_loop_timer(hass):
+    """Test point in time listeners are run from a single loop timer."""
+    now = dt_util.utcnow()
+    runs = []
+
+    with patch.object(hass.loop, "call_later", wraps=hass.loop.call_later) as mock:
+        for seconds in (30, 10, 20, 40):
+            async_track_point_in_utc_time(
+                hass,
+                callback(lambda x, seconds=seconds: runs.append(seconds)),
+                now + timedelta(seconds=seconds),
+            )
+        unsub = async_track_point_in_utc_time(
+            hass, callback(lambda x: runs.append(25)), now + timedelta(seconds=25)
+        )
+
+    # Only a job earlier than the armed one moves the timer
+    assert len(mock.mock_calls) == 2
+    unsub()
+
+    async_fire_time_changed(hass, now + timedelta(seconds=35))
+    await hass.async_block_till_done()
+    assert runs == [10, 20, 30]
+
+    async_fire_time_changed(hass, now + timedelta(seconds=40))
+    await hass.async_block_till_done()
+    assert runs == [10, 20, 30, 40]
+
+
+async def test_track_point_in_time_scheduled_from_job(hass):
+    """Test a job scheduled while jobs run does not run in the same batch."""
+    now = dt_util.utcnow()
+    runs = []
+
+    @callback
+    def reschedule(point_in_time):
+        runs.append(point_in_time)
+        if len(runs) == 1:
+            async_track_point_in_utc_time(hass, reschedule, point_in_time)
+
+    async_track_point_in_utc_time(hass, reschedule, now + timedelta(seconds=5))
+
+    # Fire a bit late, the loop timer may be armed a few microseconds after
+    # the mocked time
+    async_fire_time_changed(hass, now + timedelta(seconds=5.5))
+    assert len(runs) == 1
+
+    await hass.async_block_till_done()
+    async_fire_time_changed(hass, now + timedelta(seconds=6))
+    await hass.async_block_till_done()
+    assert len(runs) == 2
+
+
+async def test_track_point_in_time_cancel_due_sibling(hass, caplog):
+    """Test a job can cancel another job due at the same time."""
+    now = dt_util.utcnow()
+    point_in_time = now + timedelta(seconds=5)
+    runs = []
+
+    @callback
+    def cancel_sibling(_):
+        runs.append("first")
+        unsub_sibling()
+
+    async_track_point_in_utc_time(hass, cancel_sibling, point_in_time)
+    unsub_sibling = async_track_point_in_utc_time(
+        hass, callback(lambda _: runs.append("sibling")), point_in_time
+    )
+
+    async_fire_time_changed(hass, point_in_time + timedelta(seconds=0.5))
+    await hass.async_block_till_done()
+
+    assert runs == ["first"]
+    assert "Error running scheduled job" not in caplog.text
+    scheduler = hass.data[TRACK_TIME_SCHEDULER]
+    assert scheduler._cancelled == 0
+
+    unsub_sibling()
+    assert scheduler._cancelled == 0
+
+
 async def test_track_state_change_from_to_state_match(hass):
     """Test track_state_change with from and to state matchers."""
     from_and_to_state_runs = []
@@ -1,11 +1,28 @@
 """Test Home Assistant remote methods and classes."""
 import datetime
+from unittest.mock import patch
 
 import pytest
 
 from homeassistant import core
-from homeassistant.helpers.json import ExtendedJSONEncoder, JSONEncoder
+from homeassistant.helpers import json as json_helper
+from homeassistant.helpers.json import (
+    ExtendedJSONEncoder,
+    JSONEncoder,
+    json_bytes,
+    json_dumps,
+    json_encoder_default,
+)
 from homeassistant.util import dt as dt_util
+from homeassistant.util.json import json_loads
+
+
+@pytest.fixture(params=(True, False), ids=("orjson", "json"))
+def json_backend(request):
+    """Run a test with orjson and with the stdlib fallback."""
+    orjson = json_helper.orjson if request.param else None
+    with patch.object(json_helper, "orjson", orjson):
+        yield
 
 
 @pytest.mark.parametrize("encoder", (JSONEncoder, ExtendedJSONEncoder))
@@ -64,3 +81,45 @@ def test_extended_json_encoder(hass):
     # Default method falls back to repr(o)
     o = object()
     assert ha_json_enc.default(o) == {"__type": str(type(o)), "repr": repr(o)}
+
+
+def test_json_dumps_home_assistant_objects(json_backend):
+    """Test the json facade serializes Home Assistant objects."""
+    now = dt_util.utcnow()
+    state = core.State("test.test", "hello", last_changed=now, last_updated=now)
+
+    assert json_loads(json_dumps(state)) == json_loads(JSONEncoder().encode(state))
+    assert json_loads(json_dumps({"now": now, "ids": {"one"}, 1: "one"})) == {
+        "now": now.isoformat(),
+        "ids": ["one"],
+        "1": "one",
+    }
+
+
+def test_json_dumps_compact(json_backend):
+    """Test the json facade produces compact output."""
+    assert json_bytes({"a": [1, 2], "b": "é"}) == '{"a":[1,2],"b":"é"}'.encode()
+    assert json_dumps({"a": [1, 2]}) == '{"a":[1,2]}'
+
+
+def test_json_dumps_non_finite_floats_as_null(json_backend):
+    """Test NaN and infinite floats are serialized as null by both backends."""
+    assert json_dumps([float("NaN"), float("inf"), float("-inf"), 1.5]) == (
+        "[null,null,null,1.5]"
+    )
+
+
+def test_json_dumps_mapping_proxies(json_backend):
+    """Test the attributes of states are serialized as objects."""
+    state = core.State("test.test", "hello", {"nan": float("NaN"), "one": 1})
+
+    assert json_dumps(state.attributes) == '{"nan":null,"one":1}'
+    assert json_loads(json_dumps(state))["attributes"] == {"nan": None, "one": 1}
+
+
+def test_json_encoder_default_raises(json_backend):
+    """Test the facade raises TypeError on unsupported types."""
+    with pytest.raises(TypeError):
+        json_encoder_default(object())
+    with pytest.raises(TypeError):
+        json_dumps({"bad": object()})
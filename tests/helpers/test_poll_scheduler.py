@@ -0,0 +1,117 @@
+"""Tests for the poll scheduler helper."""
+from datetime import timedelta
+import logging
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from homeassistant.helpers import poll_scheduler
+from homeassistant.helpers.entity_component import EntityComponent
+import homeassistant.util.dt as dt_util
+
+from tests.common import MockEntity, async_fire_time_changed
+
+_LOGGER = logging.getLogger(__name__)
+DOMAIN = "test_domain"
+
+
+@pytest.fixture
+def mock_random():
+    """Place the first update of entities at the end of the interval."""
+    with patch(
+        "homeassistant.helpers.poll_scheduler.random.random", return_value=0
+    ) as mock:
+        yield mock
+
+
+async def test_first_updates_are_spread(hass, mock_random):
+    """Test the first updates of entities are spread over the interval."""
+    component = EntityComponent(_LOGGER, DOMAIN, hass, timedelta(seconds=20))
+    early_ent = MockEntity(should_poll=True)
+    early_ent.async_update = AsyncMock()
+    late_ent = MockEntity(should_poll=True)
+    late_ent.async_update = AsyncMock()
+
+    mock_random.side_effect = [1, 0]
+    await component.async_add_entities([early_ent, late_ent])
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=10))
+    await hass.async_block_till_done()
+
+    assert early_ent.async_update.called
+    assert not late_ent.async_update.called
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=20))
+    await hass.async_block_till_done()
+
+    assert late_ent.async_update.called
+
+
+async def test_failing_updates_are_backed_off(hass, mock_random):
+    """Test entities with failing updates are polled less often."""
+    component = EntityComponent(_LOGGER, DOMAIN, hass, timedelta(seconds=20))
+    ent = MockEntity(should_poll=True)
+    ent.async_update = AsyncMock(side_effect=ValueError)
+
+    await component.async_add_entities([ent])
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=20))
+    await hass.async_block_till_done()
+
+    assert len(ent.async_update.mock_calls) == 1
+    stats = poll_scheduler.async_get(hass).async_get_statistics()[ent.entity_id]
+    assert stats.failures == 1
+    assert stats.consecutive_failures == 1
+    assert stats.backoff == 2
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=30))
+    await hass.async_block_till_done()
+
+    assert len(ent.async_update.mock_calls) == 1
+
+    ent.async_update.side_effect = None
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=40))
+    await hass.async_block_till_done()
+
+    assert len(ent.async_update.mock_calls) == 2
+    assert stats.failures == 1
+    assert stats.consecutive_failures == 0
+    assert stats.backoff == 1
+
+
+async def test_poll_statistics(hass, mock_random):
+    """Test the update statistics of polled entities."""
+    component = EntityComponent(_LOGGER, DOMAIN, hass, timedelta(seconds=20))
+    ent = MockEntity(should_poll=True)
+    ent.async_update = AsyncMock()
+
+    await component.async_add_entities([ent])
+
+    stats = poll_scheduler.async_get(hass).async_get_statistics()[ent.entity_id]
+    assert stats.polls == 0
+    assert stats.mean_duration is None
+
+    for seconds in (20, 40):
+        async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=seconds))
+        await hass.async_block_till_done()
+
+    assert stats.polls == 2
+    assert stats.failures == 0
+    assert stats.last_duration is not None
+    assert stats.max_duration >= stats.mean_duration >= 0
+
+
+async def test_removed_entity_is_not_polled(hass, mock_random):
+    """Test removing an entity stops polling it."""
+    component = EntityComponent(_LOGGER, DOMAIN, hass, timedelta(seconds=20))
+    ent = MockEntity(should_poll=True)
+    ent.async_update = AsyncMock()
+
+    await component.async_add_entities([ent])
+    await ent.async_remove()
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=20))
+    await hass.async_block_till_done()
+
+    assert not ent.async_update.called
+    assert ent.entity_id not in poll_scheduler.async_get(hass).async_get_statistics()
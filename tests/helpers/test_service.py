@@ -557,6 +557,41 @@ async def test_call_with_sync_func(hass, mock_entities):
     assert test_service_mock.call_count == 1
 
 
+async def test_call_single_entity_without_tasks(hass, mock_entities):
+    """Test a service call targeting a single entity does not create tasks."""
+    test_service_mock = AsyncMock(return_value=None)
+    entity = mock_entities["light.kitchen"]
+    with patch.object(entity, "async_update_ha_state") as mock_update, patch(
+        "homeassistant.helpers.service.asyncio.create_task"
+    ) as mock_create_task:
+        await service.entity_service_call(
+            hass,
+            [Mock(entities=mock_entities)],
+            test_service_mock,
+            ha.ServiceCall(
+                "test_domain", "test_service", {"entity_id": "light.kitchen"}
+            ),
+        )
+
+    assert not mock_create_task.called
+    assert [call[0][0] for call in test_service_mock.call_args_list] == [entity]
+    assert not mock_update.called
+
+    entity._values["should_poll"] = True
+    with patch.object(entity, "async_update_ha_state") as mock_update:
+        await service.entity_service_call(
+            hass,
+            [Mock(entities=mock_entities)],
+            test_service_mock,
+            ha.ServiceCall(
+                "test_domain", "test_service", {"entity_id": "light.kitchen"}
+            ),
+        )
+
+    assert test_service_mock.call_count == 2
+    mock_update.assert_called_once_with(True)
+
+
 async def test_call_with_sync_attr(hass, mock_entities):
     """Test invoking sync service calls."""
     mock_method = mock_entities["light.kitchen"].sync_method = Mock(return_value=None)
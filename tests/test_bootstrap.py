@@ -2,6 +2,7 @@
 # pylint: disable=protected-access
 import asyncio
 import glob
+import itertools
 import os
 from unittest.mock import Mock, patch
 
@@ -336,6 +337,147 @@ async def test_setup_after_deps_not_present(hass):
     assert order == ["root", "second_dep"]
 
 
+@pytest.mark.parametrize("load_registries", [False])
+async def test_setup_does_not_wait_for_unrelated_stage_1(hass):
+    """Test integrations start without waiting for unrelated stage 1 setups."""
+    assert "cloud" in bootstrap.STAGE_1_INTEGRATIONS
+    order = []
+    normal_integration_set_up = asyncio.Event()
+
+    def gen_domain_setup(domain):
+        async def async_setup(hass, config):
+            if domain == "cloud":
+                await normal_integration_set_up.wait()
+            order.append(domain)
+            if domain == "normal_integration":
+                normal_integration_set_up.set()
+            return True
+
+        return async_setup
+
+    mock_integration(
+        hass, MockModule(domain="cloud", async_setup=gen_domain_setup("cloud"))
+    )
+    mock_integration(
+        hass, MockModule(domain="a_dep", async_setup=gen_domain_setup("a_dep"))
+    )
+    mock_integration(
+        hass,
+        MockModule(
+            domain="normal_integration",
+            dependencies=["a_dep"],
+            async_setup=gen_domain_setup("normal_integration"),
+        ),
+    )
+
+    await bootstrap._async_set_up_integrations(
+        hass, {"cloud": {}, "normal_integration": {}}
+    )
+
+    assert order == ["a_dep", "normal_integration", "cloud"]
+
+
+@pytest.mark.parametrize("load_registries", [False])
+async def test_stage_1_does_not_wait_for_stage_2_after_dependencies(hass):
+    """Test stage 1 does not wait for after dependencies in stage 2."""
+    assert "cloud" in bootstrap.STAGE_1_INTEGRATIONS
+    order = []
+    cloud_set_up = asyncio.Event()
+
+    def gen_domain_setup(domain):
+        async def async_setup(hass, config):
+            if domain == "normal_integration":
+                await cloud_set_up.wait()
+            order.append(domain)
+            if domain == "cloud":
+                cloud_set_up.set()
+            return True
+
+        return async_setup
+
+    mock_integration(
+        hass,
+        MockModule(
+            domain="cloud",
+            dependencies=["stage_1_dep"],
+            async_setup=gen_domain_setup("cloud"),
+        ),
+    )
+    mock_integration(
+        hass,
+        MockModule(
+            domain="stage_1_dep",
+            async_setup=gen_domain_setup("stage_1_dep"),
+            partial_manifest={"after_dependencies": ["normal_integration"]},
+        ),
+    )
+    mock_integration(
+        hass,
+        MockModule(
+            domain="normal_integration",
+            async_setup=gen_domain_setup("normal_integration"),
+        ),
+    )
+
+    with patch.object(bootstrap, "SETUP_TIMEOUT", 1):
+        await bootstrap._async_set_up_integrations(
+            hass, {"cloud": {}, "normal_integration": {}}
+        )
+
+    assert order == ["stage_1_dep", "cloud", "normal_integration"]
+
+
+@pytest.mark.parametrize("load_registries", [False])
+async def test_setup_critical_path(hass):
+    """Test the setup critical path is recorded."""
+
+    def gen_domain_setup(domain):
+        async def async_setup(hass, config):
+            return True
+
+        return async_setup
+
+    mock_integration(
+        hass, MockModule(domain="root", async_setup=gen_domain_setup("root"))
+    )
+    mock_integration(
+        hass,
+        MockModule(
+            domain="first_dep",
+            async_setup=gen_domain_setup("first_dep"),
+            partial_manifest={"after_dependencies": ["root"]},
+        ),
+    )
+    mock_integration(
+        hass,
+        MockModule(
+            domain="second_dep",
+            dependencies=["first_dep"],
+            async_setup=gen_domain_setup("second_dep"),
+        ),
+    )
+    mock_integration(
+        hass, MockModule(domain="other", async_setup=gen_domain_setup("other"))
+    )
+
+    with patch(
+        "homeassistant.bootstrap.monotonic", side_effect=itertools.count().__next__
+    ):
+        await bootstrap._async_set_up_integrations(
+            hass, {"root": {}, "second_dep": {}, "other": {}}
+        )
+
+    critical_path = hass.data[bootstrap.DATA_SETUP_CRITICAL_PATH]
+    assert [step["domain"] for step in critical_path] == [
+        "root",
+        "first_dep",
+        "second_dep",
+    ]
+    starts = [step["start"] for step in critical_path]
+    assert starts == sorted(starts)
+    assert all(step["seconds"] > 0 for step in critical_path)
+
+
 @pytest.fixture
 def mock_is_virtual_env():
     """Mock enable logging."""
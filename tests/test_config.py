@@ -506,6 +506,7 @@ async def test_loading_configuration(hass):
             "media_dirs": {"mymedia": "/usr"},
             "legacy_templates": True,
             "currency": "EUR",
+            "executor_pools": {"camera": 4},
         },
     )
 
@@ -524,6 +525,7 @@ async def test_loading_configuration(hass):
     assert hass.config.config_source == config_util.SOURCE_YAML
     assert hass.config.legacy_templates is True
     assert hass.config.currency == "EUR"
+    assert hass.config.executor_pools == {"camera": 4}
 
 
 async def test_loading_configuration_temperature_unit(hass):
@@ -6,6 +6,7 @@ import functools
 import logging
 import os
 from tempfile import TemporaryDirectory
+import threading
 from unittest.mock import MagicMock, Mock, PropertyMock, patch
 
 import pytest
@@ -33,12 +34,14 @@ from homeassistant.const import (
 )
 import homeassistant.core as ha
 from homeassistant.exceptions import (
+    HomeAssistantError,
     InvalidEntityFormatError,
     InvalidStateError,
     MaxLengthExceeded,
     ServiceNotFound,
 )
 import homeassistant.util.dt as dt_util
+from homeassistant.util.executor import current_job_owner
 from homeassistant.util.unit_system import METRIC_SYSTEM
 
 from tests.common import async_capture_events, async_mock_service
@@ -279,6 +282,43 @@ async def test_async_add_job_pending_tasks_executor(hass):
     assert len(call_count) == 2
 
 
+async def test_integration_executor_pools(hass):
+    """Test jobs of integrations with an executor pool run in their own executor."""
+    hass.config.executor_pools = {"tests": 1}
+    thread_names = []
+
+    def test_executor():
+        """Test executor."""
+        thread_names.append(threading.current_thread().name)
+
+    await hass.async_add_executor_job(test_executor)
+    hass.async_add_job(test_executor)
+    await hass.async_block_till_done()
+
+    assert len(thread_names) == 2
+    assert all(name.startswith("SyncWorker_tests") for name in thread_names)
+
+    executor = hass.async_get_executors()["tests"]
+    assert executor.max_workers == 1
+    assert executor.job_statistics()["tests"].jobs == 2
+
+    hass.config.executor_pools = {}
+    await hass.async_add_executor_job(test_executor)
+    assert not thread_names[-1].startswith("SyncWorker_tests")
+
+
+async def test_integration_executor_pools_attribute_calling_integration(hass):
+    """Test jobs are attributed to the integration which submits them."""
+    hass.config.executor_pools = {"my_integration": 1}
+
+    current_job_owner.set("my_integration")
+    thread = await hass.async_add_executor_job(threading.current_thread)
+
+    assert thread.name.startswith("SyncWorker_my_integration")
+    executor = hass.async_get_executors()["my_integration"]
+    assert executor.job_statistics()["my_integration"].jobs == 1
+
+
 async def test_async_add_job_pending_tasks_callback(hass):
     """Run a callback in pending tasks."""
     call_count = []
@@ -431,6 +471,156 @@ async def test_eventbus_filtered_listener(hass):
     unsub()
 
 
+async def test_eventbus_match_all_merged_at_subscribe(hass):
+    """Test MATCH_ALL listeners are dispatched together with typed listeners."""
+    calls = []
+
+    @ha.callback
+    def typed_listener(event):
+        """Mock typed listener."""
+        calls.append(("typed", event.event_type))
+
+    @ha.callback
+    def match_all_listener(event):
+        """Mock match all listener."""
+        calls.append(("all", event.event_type))
+
+    unsub_typed = hass.bus.async_listen("test", typed_listener)
+    unsub_all = hass.bus.async_listen(MATCH_ALL, match_all_listener)
+
+    hass.bus.async_fire("test")
+    hass.bus.async_fire("other")
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_CLOSE)
+    await hass.async_block_till_done()
+
+    assert calls == [("all", "test"), ("typed", "test"), ("all", "other")]
+
+    calls.clear()
+    unsub_all()
+    hass.bus.async_fire("test")
+    hass.bus.async_fire("other")
+    await hass.async_block_till_done()
+
+    assert calls == [("typed", "test")]
+
+    calls.clear()
+    unsub_typed()
+    hass.bus.async_fire("test")
+    await hass.async_block_till_done()
+
+    assert calls == []
+
+
+async def test_eventbus_time_changed_not_dispatched_to_match_all(hass):
+    """Test MATCH_ALL listeners do not receive time changed events."""
+    calls = []
+
+    @ha.callback
+    def listener(event):
+        """Mock listener."""
+        calls.append(event.event_type)
+
+    unsub_all = hass.bus.async_listen(MATCH_ALL, listener)
+    assert not hass.bus.async_has_listeners(EVENT_TIME_CHANGED)
+
+    unsub_time = hass.bus.async_listen(EVENT_TIME_CHANGED, listener)
+    assert hass.bus.async_has_listeners(EVENT_TIME_CHANGED)
+
+    hass.bus.async_fire(EVENT_TIME_CHANGED)
+    await hass.async_block_till_done()
+
+    assert calls == [EVENT_TIME_CHANGED]
+
+    unsub_time()
+    assert not hass.bus.async_has_listeners(EVENT_TIME_CHANGED)
+    hass.bus.async_fire(EVENT_TIME_CHANGED)
+    await hass.async_block_till_done()
+
+    assert calls == [EVENT_TIME_CHANGED]
+    unsub_all()
+
+
+async def test_eventbus_remove_listener_while_firing(hass):
+    """Test removing a listener while firing does not skip other listeners."""
+    calls = []
+    unsubs = []
+
+    @ha.callback
+    def event_filter(event):
+        """Remove the first listener while filtering."""
+        unsubs.pop(0)()
+        return True
+
+    @ha.callback
+    def listener(event):
+        """Mock listener."""
+        calls.append(event)
+
+    unsubs.append(hass.bus.async_listen("test", listener, event_filter=event_filter))
+    unsubs.append(hass.bus.async_listen("test", listener))
+
+    hass.bus.async_fire("test")
+    await hass.async_block_till_done()
+
+    assert len(calls) == 2
+
+
+async def test_eventbus_entity_id_indexed_listener(hass):
+    """Test listeners indexed by entity_id."""
+    calls = []
+
+    @ha.callback
+    def listener(event):
+        """Mock listener."""
+        calls.append(event.data["entity_id"])
+
+    old_count = hass.bus.async_listeners().get("test", 0)
+    unsub = hass.bus.async_listen(
+        "test", listener, entity_ids=["light.kitchen", "light.bed"]
+    )
+    assert hass.bus.async_listeners()["test"] == old_count + 1
+
+    hass.bus.async_fire("test", {"entity_id": "light.kitchen"})
+    hass.bus.async_fire("test", {"entity_id": "light.other"})
+    hass.bus.async_fire("test", {"entity_id": ["light.kitchen"]})
+    hass.bus.async_fire("test", {})
+    hass.bus.async_fire("test", {"entity_id": "light.bed"})
+    await hass.async_block_till_done()
+
+    assert calls == ["light.kitchen", "light.bed"]
+
+    unsub()
+    hass.bus.async_fire("test", {"entity_id": "light.kitchen"})
+    await hass.async_block_till_done()
+
+    assert calls == ["light.kitchen", "light.bed"]
+    assert hass.bus.async_listeners().get("test", 0) == old_count
+
+    with pytest.raises(HomeAssistantError):
+        hass.bus.async_listen(MATCH_ALL, listener, entity_ids=["light.kitchen"])
+
+
+async def test_eventbus_entity_id_indexed_listener_remove_twice(hass, caplog):
+    """Test removing an indexed listener twice does nothing."""
+    calls = []
+
+    @ha.callback
+    def listener(event):
+        """Mock listener."""
+        calls.append(event.data["entity_id"])
+
+    unsub = hass.bus.async_listen("test", listener, entity_ids=["light.kitchen"])
+    unsub()
+    hass.bus.async_listen("test", listener, entity_ids=["light.kitchen"])
+    unsub()
+
+    hass.bus.async_fire("test", {"entity_id": "light.kitchen"})
+    await hass.async_block_till_done()
+
+    assert calls == ["light.kitchen"]
+    assert "Unable to remove unknown job listener" not in caplog.text
+
+
 async def test_eventbus_unsubscribe_listener(hass):
     """Test unsubscribe listener from returned function."""
     calls = []
@@ -1151,6 +1341,38 @@ def test_timer_out_of_sync(mock_monotonic, loop):
     assert abs(target - 14.2) < 0.001
 
 
+@patch("homeassistant.core.monotonic")
+def test_timer_without_time_changed_listeners(mock_monotonic, loop):
+    """Test the timer does not fire time changed events nobody listens to."""
+    hass = MagicMock()
+    hass.bus.async_has_listeners.return_value = False
+    funcs = []
+    orig_callback = ha.callback
+
+    def mock_callback(func):
+        funcs.append(func)
+        return orig_callback(func)
+
+    mock_monotonic.side_effect = 10.2, 10.8, 11.3
+
+    with patch.object(ha, "callback", mock_callback), patch(
+        "homeassistant.core.dt_util.utcnow",
+        return_value=datetime(2018, 12, 31, 3, 4, 5, 333333),
+    ):
+        ha._async_create_timer(hass)
+
+    delay, callback, target = hass.loop.call_later.mock_calls[0][1]
+
+    with patch(
+        "homeassistant.core.dt_util.utcnow",
+        return_value=datetime(2018, 12, 31, 3, 4, 6, 100000),
+    ):
+        callback(target)
+
+    assert len(hass.bus.async_fire.mock_calls) == 0
+    assert len(hass.loop.call_later.mock_calls) == 2
+
+
 async def test_hass_start_starts_the_timer(loop):
     """Test when hass starts, it starts the timer."""
     hass = ha.HomeAssistant()
@@ -1,4 +1,7 @@
 """Test to verify that we can load components."""
+from datetime import timedelta
+import os
+import sys
 from unittest.mock import patch
 
 import pytest
@@ -6,8 +9,9 @@ import pytest
 from homeassistant import core, loader
 from homeassistant.components import http, hue
 from homeassistant.components.hue import light as hue_light
+import homeassistant.util.dt as dt_util
 
-from tests.common import MockModule, mock_integration
+from tests.common import MockModule, async_fire_time_changed, mock_integration
 
 
 async def test_component_dependencies(hass):
@@ -546,3 +550,106 @@ async def test_validation(hass):
     """Test we raise if invalid domain passed in."""
     with pytest.raises(ValueError):
         await loader.async_get_integration(hass, "some.thing")
+
+
+def test_manifest_index(tmp_path):
+    """Test manifests are cached until their file changes."""
+    component_dir = tmp_path / "test_component"
+    component_dir.mkdir()
+    manifest_path = component_dir / "manifest.json"
+    manifest_path.write_text('{"domain": "test_component", "name": "Test"}')
+
+    index = loader.ManifestIndex()
+    assert index.get_manifest(manifest_path)["name"] == "Test"
+    assert index.dirty
+
+    data = index.as_dict()
+    assert not index.dirty
+    index = loader.ManifestIndex(data=data)
+    with patch("pathlib.Path.read_text") as mock_read_text:
+        assert index.get_manifest(manifest_path)["name"] == "Test"
+    assert not mock_read_text.called
+    assert not index.dirty
+
+    manifest_path.write_text('{"domain": "test_component", "name": "Changed"}')
+    stat_result = manifest_path.stat()
+    os.utime(manifest_path, ns=(stat_result.st_atime_ns, stat_result.st_mtime_ns + 1))
+    assert index.get_manifest(manifest_path)["name"] == "Changed"
+    assert index.dirty
+
+    assert index.get_manifest(tmp_path / "missing" / "manifest.json") is None
+
+    manifest_path.write_text("invalid")
+    os.utime(manifest_path, ns=(stat_result.st_atime_ns, stat_result.st_mtime_ns + 2))
+    with pytest.raises(ValueError):
+        index.get_manifest(manifest_path)
+
+    # Manifests are not reused across Home Assistant versions
+    data["ha_version"] = "0.1"
+    assert loader.ManifestIndex(data=data).as_dict()["manifests"] == {}
+
+
+def test_manifest_index_sub_directories(tmp_path):
+    """Test the sub directory listing is cached until the directory changes."""
+    (tmp_path / "comp_1").mkdir()
+    (tmp_path / "file.txt").write_text("")
+
+    index = loader.ManifestIndex()
+    assert index.get_sub_directories([str(tmp_path)]) == [tmp_path / "comp_1"]
+
+    index = loader.ManifestIndex(data=index.as_dict())
+    with patch("os.scandir") as mock_scandir:
+        assert index.get_sub_directories([str(tmp_path)]) == [tmp_path / "comp_1"]
+    assert not mock_scandir.called
+
+    (tmp_path / "comp_2").mkdir()
+    stat_result = os.stat(tmp_path)
+    os.utime(tmp_path, ns=(stat_result.st_atime_ns, stat_result.st_mtime_ns + 1))
+    assert index.get_sub_directories([str(tmp_path)]) == [
+        tmp_path / "comp_1",
+        tmp_path / "comp_2",
+    ]
+
+
+async def test_manifest_index_is_persisted(hass, hass_storage):
+    """Test the manifests used to resolve integrations are stored."""
+    await loader.async_get_integration(hass, "hue")
+
+    index = await loader.async_get_manifest_index(hass)
+    assert index.dirty
+    index.async_schedule_save()
+    async_fire_time_changed(
+        hass, dt_util.utcnow() + timedelta(seconds=loader.MANIFEST_INDEX_SAVE_DELAY)
+    )
+    await hass.async_block_till_done()
+    assert not index.dirty
+
+    data = hass_storage[loader.MANIFEST_INDEX_STORAGE_KEY]["data"]
+    assert data["ha_version"] == core.__version__
+    assert any(
+        path.endswith(os.path.join("hue", "manifest.json"))
+        for path in data["manifests"]
+    )
+
+
+async def test_import_times(hass, enable_custom_integrations):
+    """Test the cost of importing integrations and platforms is recorded."""
+    integration = await loader.async_get_integration(hass, "test_package")
+
+    with patch.dict(sys.modules):
+        for name in list(sys.modules):
+            if name.startswith("custom_components.test_package"):
+                del sys.modules[name]
+        integration.get_component()
+
+    import_times = hass.data[loader.DATA_IMPORT_TIMES]["test_package"]
+    assert len(import_times) == 1
+    assert import_times[0]["module"] == "test_package"
+    assert import_times[0]["seconds"] > 0
+    # The package and its const module
+    assert import_times[0]["modules"] == 2
+
+    # Modules which were imported before are not recorded
+    integration = await loader.async_get_integration(hass, "http")
+    assert integration.get_component() is http
+    assert "http" not in hass.data[loader.DATA_IMPORT_TIMES]
@@ -1,13 +1,18 @@
 """Test Home Assistant executor util."""
 
 import concurrent.futures
+import functools
 import time
 from unittest.mock import patch
 
 import pytest
 
 from homeassistant.util import executor
-from homeassistant.util.executor import InterruptibleThreadPoolExecutor
+from homeassistant.util.executor import (
+    InterruptibleThreadPoolExecutor,
+    current_job_owner,
+    job_owner,
+)
 
 
 async def test_executor_shutdown_can_interrupt_threads(caplog):
@@ -89,3 +94,60 @@ async def test_overall_timeout_reached(caplog):
     assert finish - start < 1
 
     iexecutor.shutdown()
+
+
+def test_job_owner():
+    """Test executor jobs are attributed to their integration."""
+
+    class Entity:
+        def update(self):
+            return
+
+    Entity.__module__ = "homeassistant.components.demo.sensor"
+
+    def _custom_job():
+        return
+
+    _custom_job.__module__ = "custom_components.my_integration"
+
+    assert job_owner(Entity().update) == "demo"
+    assert job_owner(functools.partial(Entity().update)) == "demo"
+    assert job_owner(_custom_job) == "my_integration"
+    assert job_owner(time.sleep) == "time"
+    assert job_owner(job_owner) == "homeassistant"
+
+    # Jobs submitted by an integration are attributed to it
+    token = current_job_owner.set("other")
+    try:
+        assert job_owner(time.sleep) == "other"
+        assert job_owner(Entity().update) == "other"
+    finally:
+        current_job_owner.reset(token)
+
+
+async def test_job_statistics():
+    """Test the executor records the statistics of jobs by owner."""
+
+    iexecutor = InterruptibleThreadPoolExecutor(max_workers=1)
+
+    def _sleep_in_executor():
+        time.sleep(0.05)
+
+    futures = [iexecutor.submit(_sleep_in_executor) for _ in range(2)]
+    futures.append(iexecutor.submit(time.sleep, 0))
+    for future in futures:
+        future.result()
+
+    job_statistics = iexecutor.job_statistics()
+    assert set(job_statistics) == {"tests", "time"}
+    stats = job_statistics["tests"]
+    assert stats.jobs == 2
+    assert stats.max_run >= 0.05
+    assert stats.total_run >= 0.1
+    # The second job waited for the first one to finish
+    assert stats.max_wait >= 0.04
+    assert job_statistics["time"].jobs == 1
+    assert iexecutor.max_workers == 1
+    assert iexecutor.queued_jobs == 0
+
+    iexecutor.shutdown()
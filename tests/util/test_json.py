@@ -7,12 +7,13 @@ import os
 import sys
 from tempfile import mkdtemp
 import unittest
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 import pytest
 
 from homeassistant.core import Event, State
 from homeassistant.exceptions import HomeAssistantError
+from homeassistant.util import json as json_util
 from homeassistant.util.json import (
     SerializationError,
     find_paths_unserializable_data,
@@ -88,6 +89,23 @@ def test_save_bad_data():
     )
 
 
+@pytest.mark.parametrize("use_orjson", (True, False))
+def test_save_non_finite_floats_as_null(use_orjson):
+    """Test NaN and infinite floats are saved as null by both backends."""
+    fname = _path_for("test7")
+    with patch.object(json_util, "orjson", json_util.orjson if use_orjson else None):
+        save_json(fname, {"nan": float("NaN"), "inf": float("inf"), "one": 1.0})
+    assert load_json(fname) == {"nan": None, "inf": None, "one": 1.0}
+
+
+def test_load_nan_written_by_stdlib():
+    """Test loading json with NaN as written by older versions."""
+    fname = _path_for("test8")
+    with open(fname, "w") as fh:
+        fh.write('{"value": NaN}')
+    assert math.isnan(load_json(fname)["value"])
+
+
 def test_load_bad_data():
     """Test error from trying to load unserialisable data."""
     fname = _path_for("test5")
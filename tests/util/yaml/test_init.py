@@ -445,3 +445,88 @@ def test_input():
     """Test loading inputs."""
     data = {"hello": yaml.Input("test_name")}
     assert yaml.parse_yaml(yaml.dump(data)) == data
+
+
+def test_parse_yaml_fallback_on_error():
+    """Test syntax errors are reported by the line tracking loader."""
+    assert yaml_loader.parse_yaml("key:\n  nested: value\n")["key"].__line__ == 1
+
+    with patch.object(
+        yaml_loader, "_parse_yaml", wraps=yaml_loader._parse_yaml
+    ) as mock_parse, pytest.raises(HomeAssistantError):
+        yaml_loader.parse_yaml("key: [value")
+
+    assert [call.args[0] for call in mock_parse.call_args_list] == [
+        yaml_loader.FastSafeLoader,
+        yaml_loader.SafeLineLoader,
+    ]
+
+
+def test_yaml_cache(tmp_path):
+    """Test unchanged files are loaded from the cache."""
+    config_file = tmp_path / YAML_CONFIG_FILE
+    config_file.write_text("key:\n  nested: value\n")
+    cache = yaml.YamlCache()
+
+    first = yaml.load_yaml(str(config_file), cache=cache)
+    with patch.object(yaml_loader, "_parse_yaml") as mock_parse:
+        second = yaml.load_yaml(str(config_file), cache=cache)
+    assert not mock_parse.called
+    assert first == second == {"key": {"nested": "value"}}
+    assert second["key"].__config_file__ == str(config_file)
+
+    # Results are copies
+    second["key"]["nested"] = "changed"
+    assert yaml.load_yaml(str(config_file), cache=cache) == first
+
+    cache.clear()
+    with patch.object(yaml_loader, "_parse_yaml") as mock_parse:
+        yaml.load_yaml(str(config_file), cache=cache)
+    assert mock_parse.called
+
+
+def test_yaml_cache_invalidated_by_include(tmp_path):
+    """Test changing an included file invalidates the cache."""
+    config_file = tmp_path / YAML_CONFIG_FILE
+    config_file.write_text("key: !include included.yaml\n")
+    included_file = tmp_path / "included.yaml"
+    included_file.write_text("value: 1\n")
+    cache = yaml.YamlCache()
+
+    assert yaml.load_yaml(str(config_file), cache=cache) == {"key": {"value": 1}}
+
+    included_file.write_text("value: 22\n")
+    assert yaml.load_yaml(str(config_file), cache=cache) == {"key": {"value": 22}}
+
+
+def test_yaml_cache_invalidated_by_include_dir(tmp_path):
+    """Test adding a file to an included directory invalidates the cache."""
+    config_file = tmp_path / YAML_CONFIG_FILE
+    config_file.write_text("key: !include_dir_merge_list packages\n")
+    (tmp_path / "packages").mkdir()
+    (tmp_path / "packages" / "one.yaml").write_text("- one\n")
+    cache = yaml.YamlCache()
+
+    assert yaml.load_yaml(str(config_file), cache=cache) == {"key": ["one"]}
+
+    (tmp_path / "packages" / "two.yaml").write_text("- two\n")
+    assert sorted(yaml.load_yaml(str(config_file), cache=cache)["key"]) == [
+        "one",
+        "two",
+    ]
+
+
+def test_yaml_cache_invalidated_by_secrets(tmp_path):
+    """Test adding a secrets file closer to the config invalidates the cache."""
+    (tmp_path / "packages").mkdir()
+    config_file = tmp_path / "packages" / "package.yaml"
+    config_file.write_text("password: !secret password\n")
+    (tmp_path / yaml.SECRET_YAML).write_text("password: root\n")
+    secrets = yaml.Secrets(tmp_path)
+    cache = yaml.YamlCache()
+
+    assert yaml.load_yaml(str(config_file), secrets, cache) == {"password": "root"}
+
+    (tmp_path / "packages" / yaml.SECRET_YAML).write_text("password: package\n")
+    secrets = yaml.Secrets(tmp_path)
+    assert yaml.load_yaml(str(config_file), secrets, cache) == {"password": "package"}